@@ -3,6 +3,10 @@
 このパッケージは金融商品シンボルのパース、バリデーション、
 正規化機能を提供する。
 
+公開 API は PEP 562 のモジュールレベル ``__getattr__`` により遅延ロードされる。
+``import marketsymbol`` 自体はサブモジュールを読み込まず、
+属性への初回アクセス時に該当モジュールのみをインポートする。
+
 Example:
     >>> from marketsymbol import parse_symbol
     >>> s = parse_symbol("XJPX:7203")
@@ -16,35 +20,183 @@ Example:
     'XJPX:7203'
 """
 
-from marketsymbol.adapter import AdapterRegistry, BaseAdapter
-from marketsymbol.enums import AssetClass, OptionType
-from marketsymbol.errors import (
-    ErrorCode,
-    SymbolError,
-    SymbolParseError,
-    SymbolValidationError,
-)
-from marketsymbol.parser import normalize_symbol, parse_symbol
-from marketsymbol.symbol import (
-    EquitySymbol,
-    FutureSymbol,
-    OptionSymbol,
-    Symbol,
-)
+# typing のインポートコストを避けるため TYPE_CHECKING は自前で定義する
+# (mypy は TYPE_CHECKING という名前の定数を特別扱いする)
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from marketsymbol.adapter import AdapterRegistry, BaseAdapter
+    from marketsymbol.bloom import SymbolBloomFilter
+    from marketsymbol.bulk import BulkValidationResult, validate_symbols
+    from marketsymbol.chain import ChainParser
+    from marketsymbol.cli import main
+    from marketsymbol.container import SymbolDict, SymbolSet
+    from marketsymbol.csvstream import CsvTransformResult, transform_csv
+    from marketsymbol.enums import AssetClass, OptionType
+    from marketsymbol.errors import (
+        ErrorCode,
+        SymbolError,
+        SymbolParseError,
+        SymbolPolicyWarning,
+        SymbolValidationError,
+    )
+    from marketsymbol.exchange import ExchangePlugin, ExchangeRegistry
+    from marketsymbol.extsort import SymbolChange, diff_symbols, sort_symbols
+    from marketsymbol.grammar import Grammar, GrammarRegistry
+    from marketsymbol.parser import (
+        normalize_symbol,
+        parse_equity,
+        parse_future,
+        parse_option,
+        parse_symbol,
+    )
+    from marketsymbol.pattern import SymbolPattern
+    from marketsymbol.policy import ParserPolicy, PolicyMode
+    from marketsymbol.pool import SymbolPool
+    from marketsymbol.query import PlanStep, QueryPlan, SymbolUniverse
+    from marketsymbol.router import SubscriptionRouter
+    from marketsymbol.scan import SymbolMatch, find_symbols, iter_symbols
+    from marketsymbol.shard import ShardPartitioner, symbol_fingerprint
+    from marketsymbol.symbol import (
+        EquitySymbol,
+        FutureSymbol,
+        OptionSymbol,
+        Symbol,
+    )
+    from marketsymbol.view import SymbolView
 
 __all__ = [
     "AdapterRegistry",
     "AssetClass",
     "BaseAdapter",
+    "BulkValidationResult",
+    "ChainParser",
+    "CsvTransformResult",
     "EquitySymbol",
     "ErrorCode",
+    "ExchangePlugin",
+    "ExchangeRegistry",
     "FutureSymbol",
+    "Grammar",
+    "GrammarRegistry",
     "OptionSymbol",
     "OptionType",
+    "ParserPolicy",
+    "PlanStep",
+    "PolicyMode",
+    "QueryPlan",
+    "ShardPartitioner",
+    "SubscriptionRouter",
     "Symbol",
+    "SymbolBloomFilter",
+    "SymbolChange",
+    "SymbolDict",
     "SymbolError",
+    "SymbolMatch",
     "SymbolParseError",
+    "SymbolPattern",
+    "SymbolPolicyWarning",
+    "SymbolPool",
+    "SymbolSet",
+    "SymbolUniverse",
     "SymbolValidationError",
+    "SymbolView",
+    "diff_symbols",
+    "find_symbols",
+    "iter_symbols",
+    "main",
     "normalize_symbol",
+    "parse_equity",
+    "parse_future",
+    "parse_option",
     "parse_symbol",
+    "sort_symbols",
+    "symbol_fingerprint",
+    "transform_csv",
+    "validate_symbols",
 ]
+
+# 公開名 -> 定義元モジュール
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AdapterRegistry": "marketsymbol.adapter",
+    "BaseAdapter": "marketsymbol.adapter",
+    "SymbolBloomFilter": "marketsymbol.bloom",
+    "BulkValidationResult": "marketsymbol.bulk",
+    "validate_symbols": "marketsymbol.bulk",
+    "ChainParser": "marketsymbol.chain",
+    # コンソールスクリプト (pyproject.toml の marketsymbol = "marketsymbol:main")
+    "main": "marketsymbol.cli",
+    "SymbolDict": "marketsymbol.container",
+    "SymbolSet": "marketsymbol.container",
+    "CsvTransformResult": "marketsymbol.csvstream",
+    "transform_csv": "marketsymbol.csvstream",
+    "AssetClass": "marketsymbol.enums",
+    "OptionType": "marketsymbol.enums",
+    "ErrorCode": "marketsymbol.errors",
+    "SymbolError": "marketsymbol.errors",
+    "SymbolParseError": "marketsymbol.errors",
+    "SymbolPolicyWarning": "marketsymbol.errors",
+    "SymbolValidationError": "marketsymbol.errors",
+    "ExchangePlugin": "marketsymbol.exchange",
+    "ExchangeRegistry": "marketsymbol.exchange",
+    "SymbolChange": "marketsymbol.extsort",
+    "diff_symbols": "marketsymbol.extsort",
+    "sort_symbols": "marketsymbol.extsort",
+    "Grammar": "marketsymbol.grammar",
+    "GrammarRegistry": "marketsymbol.grammar",
+    "normalize_symbol": "marketsymbol.parser",
+    "parse_equity": "marketsymbol.parser",
+    "parse_future": "marketsymbol.parser",
+    "parse_option": "marketsymbol.parser",
+    "parse_symbol": "marketsymbol.parser",
+    "SymbolPattern": "marketsymbol.pattern",
+    "ParserPolicy": "marketsymbol.policy",
+    "PolicyMode": "marketsymbol.policy",
+    "SymbolPool": "marketsymbol.pool",
+    "PlanStep": "marketsymbol.query",
+    "QueryPlan": "marketsymbol.query",
+    "SymbolUniverse": "marketsymbol.query",
+    "SubscriptionRouter": "marketsymbol.router",
+    "SymbolMatch": "marketsymbol.scan",
+    "find_symbols": "marketsymbol.scan",
+    "iter_symbols": "marketsymbol.scan",
+    "ShardPartitioner": "marketsymbol.shard",
+    "symbol_fingerprint": "marketsymbol.shard",
+    "EquitySymbol": "marketsymbol.symbol",
+    "FutureSymbol": "marketsymbol.symbol",
+    "OptionSymbol": "marketsymbol.symbol",
+    "Symbol": "marketsymbol.symbol",
+    "SymbolView": "marketsymbol.view",
+}
+
+
+def __getattr__(name: str) -> object:
+    """公開属性を初回アクセス時にロードする (PEP 562).
+
+    ロードした値はモジュールの名前空間にキャッシュし、
+    2回目以降のアクセスでは ``__getattr__`` を経由しない。
+
+    Args:
+        name: 属性名.
+
+    Returns:
+        定義元モジュールの属性値.
+
+    Raises:
+        AttributeError: 公開 API に存在しない属性の場合.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """遅延ロード対象の公開属性を含む属性一覧を返す."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,8 @@
+"""``python -m marketsymbol`` のエントリポイント (marketsymbol.cli を実行する)."""
+
+import sys
+
+from marketsymbol.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,10 +25,17 @@ Example:
 from __future__ import annotations
 
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from marketsymbol.instrumentation import INSTRUMENTATION
+from marketsymbol.metrics import METRICS
+from marketsymbol.tracing import TRACER, TracedOperation, TraceEvent
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from marketsymbol.enums import AssetClass
     from marketsymbol.symbol import Symbol
 
@@ -86,6 +93,22 @@ class BaseAdapter(ABC):
         """
         ...
 
+    def check_supported(self, symbol: Symbol) -> None:
+        """symbol の資産クラスをサポートしているか検査する.
+
+        from_symbol の前に呼び出し、サポート外の資産クラスを変換できない値
+        (ValueError) として扱う場合に使う。
+
+        Args:
+            symbol: 統一シンボルオブジェクト
+
+        Raises:
+            ValueError: 資産クラスが supported_asset_classes に含まれない場合
+        """
+        if symbol.asset_class not in self.supported_asset_classes:
+            msg = f"Unsupported asset class: {symbol.asset_class.value}"
+            raise ValueError(msg)
+
 
 class AdapterRegistry:
     """スレッドセーフなアダプターレジストリ.
@@ -118,6 +141,15 @@ class AdapterRegistry:
         self._lock = threading.Lock()
         self._adapters: dict[str, BaseAdapter] = {}
 
+    def __getstate__(self) -> dict[str, BaseAdapter]:
+        """pickle 用: 登録済みのアダプターのみを保存する (ロックは保存できない)."""
+        return self._adapters
+
+    def __setstate__(self, state: dict[str, BaseAdapter]) -> None:
+        """pickle 用: アダプターを復元し、ロックを再生成する."""
+        self._lock = threading.Lock()
+        self._adapters = state
+
     def register(self, vendor: str, adapter: BaseAdapter) -> None:
         """アダプターを登録.
 
@@ -180,3 +212,90 @@ class AdapterRegistry:
             msg = f"No adapter registered for '{vendor}'"
             raise KeyError(msg)
         return adapter
+
+    def to_symbol(self, vendor: str, vendor_symbol: str) -> Symbol:
+        """登録済みアダプターでベンダー固有シンボルを統一シンボルに変換.
+
+        メトリクス計測・トレーシングが有効な場合は変換を計測・記録する。
+
+        Args:
+            vendor: ベンダー識別名
+            vendor_symbol: ベンダー固有のシンボル文字列
+
+        Returns:
+            統一シンボルオブジェクト
+
+        Raises:
+            KeyError: ベンダーが未登録の場合
+            ValueError: 変換できない形式の場合
+        """
+        adapter = self.get_or_raise(vendor)
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return _observe_conversion(
+                vendor, TracedOperation.TO_SYMBOL, adapter.to_symbol, vendor_symbol
+            )
+        return adapter.to_symbol(vendor_symbol)
+
+    def from_symbol(self, vendor: str, symbol: Symbol) -> str:
+        """登録済みアダプターで統一シンボルをベンダー固有シンボルに変換.
+
+        メトリクス計測・トレーシングが有効な場合は変換を計測・記録する。
+
+        Args:
+            vendor: ベンダー識別名
+            symbol: 統一シンボルオブジェクト
+
+        Returns:
+            ベンダー固有のシンボル文字列
+
+        Raises:
+            KeyError: ベンダーが未登録の場合
+            ValueError: 変換できないシンボルの場合
+            TypeError: シンボルの資産クラスがサポート外の場合
+        """
+        adapter = self.get_or_raise(vendor)
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return _observe_conversion(
+                vendor, TracedOperation.FROM_SYMBOL, adapter.from_symbol, symbol
+            )
+        return adapter.from_symbol(symbol)
+
+
+def _observe_conversion[T, R](
+    vendor: str,
+    operation: TracedOperation,
+    convert: Callable[[T], R],
+    value: T,
+) -> R:
+    """convert(value) を実行し、処理時間をメトリクス・トレースに記録する."""
+    start = time.perf_counter_ns()
+    failed = False
+    result: R | None = None
+    try:
+        result = convert(value)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        if METRICS.enabled:
+            METRICS.record_conversion(
+                vendor,
+                to_symbol=operation is TracedOperation.TO_SYMBOL,
+                failed=failed,
+                elapsed_ns=elapsed,
+            )
+        if TRACER.active:
+            # to_symbol は結果の Symbol、from_symbol は入力の Symbol の資産クラス
+            symbol = result if operation is TracedOperation.TO_SYMBOL else value
+            TRACER.emit(
+                TraceEvent(
+                    operation,
+                    value,
+                    elapsed,
+                    asset_class=getattr(symbol, "asset_class", None),
+                    failed=failed,
+                    vendor=vendor,
+                )
+            )
+    return result
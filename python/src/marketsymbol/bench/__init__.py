@@ -0,0 +1,38 @@
+"""marketsymbol のベンチマークスイート.
+
+``python -m marketsymbol.bench`` で実行し、ns/op・ops/s・p50/p99 を出力する。
+結果は JSON に書き出し、コミット済みのベースラインと許容幅付きで比較できる。
+
+Example:
+    $ python -m marketsymbol.bench --filter parse_symbol --compare
+    $ python -m marketsymbol.bench --output results.json
+    $ python -m marketsymbol.bench --update-baseline
+"""
+
+from marketsymbol.bench.cases import default_cases
+from marketsymbol.bench.runner import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    Comparison,
+    ComparisonStatus,
+    compare_reports,
+    run_benchmarks,
+    run_case,
+)
+
+__all__ = [
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_TOLERANCE",
+    "BenchmarkCase",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "Comparison",
+    "ComparisonStatus",
+    "compare_reports",
+    "default_cases",
+    "run_benchmarks",
+    "run_case",
+]
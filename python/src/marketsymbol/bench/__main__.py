@@ -0,0 +1,211 @@
+"""ベンチマークスイートのコマンドラインエントリポイント.
+
+``python -m marketsymbol.bench --help`` で使い方を表示する。
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from marketsymbol.bench.cases import default_cases
+from marketsymbol.bench.memory import (
+    DEFAULT_DISTINCT,
+    DEFAULT_REFERENCES,
+    run_container_benchmarks,
+    run_memory_benchmarks,
+)
+from marketsymbol.bench.query import DEFAULT_SIZES, run_query_benchmarks
+from marketsymbol.bench.runner import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_SAMPLE_TIME_NS,
+    DEFAULT_SAMPLES,
+    DEFAULT_TOLERANCE,
+    BenchmarkReport,
+    BenchmarkResult,
+    ComparisonStatus,
+    compare_reports,
+    run_benchmarks,
+)
+
+_NS_PER_MS = 1_000_000
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを構築する."""
+    parser = argparse.ArgumentParser(
+        prog="python -m marketsymbol.bench",
+        description="marketsymbol benchmark suite",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        metavar="SUBSTRING",
+        help="run only cases whose name contains SUBSTRING (repeatable)",
+    )
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help=(
+            "measure bytes per held symbol with and without SymbolPool, and per "
+            "entry of Symbol sets/dicts and SymbolSet/SymbolDict, and exit"
+        ),
+    )
+    parser.add_argument(
+        "--memory-references",
+        type=int,
+        default=DEFAULT_REFERENCES,
+        help=(
+            "symbol references held by --memory; distinct symbols scale "
+            "proportionally, containers hold this many distinct symbols "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--query",
+        action="store_true",
+        help=("measure indexed SymbolUniverse queries against full scans and exit"),
+    )
+    parser.add_argument(
+        "--query-size",
+        type=int,
+        action="append",
+        metavar="N",
+        help=(
+            "symbols in the universe for --query (repeatable; default: "
+            + ", ".join(f"{size:,}" for size in DEFAULT_SIZES)
+            + ")"
+        ),
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help=f"samples per case (default: {DEFAULT_SAMPLES})",
+    )
+    parser.add_argument(
+        "--sample-time-ms",
+        type=float,
+        default=DEFAULT_SAMPLE_TIME_NS / _NS_PER_MS,
+        help="target duration of one sample in milliseconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="write results as JSON to this path"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="baseline JSON path (default: bundled baseline.json)",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="compare against the baseline; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"allowed relative slowdown (default: {DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="overwrite the baseline with the results of this run",
+    )
+    return parser
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    """1ケースの結果を1行で出力する."""
+    print(
+        f"{result.name:<36} {result.ns_per_op:>11.1f} ns/op "
+        f"{result.ops_per_sec:>13,.0f} ops/s "
+        f"p50 {result.p50_ns:>10.1f} ns  p99 {result.p99_ns:>10.1f} ns",
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """ベンチマークを実行する.
+
+    Args:
+        argv: コマンドライン引数 (None の場合は sys.argv[1:]).
+
+    Returns:
+        終了コード (回帰を検出した場合は 1).
+    """
+    args = _build_parser().parse_args(argv)
+
+    if args.memory:
+        references = args.memory_references
+        distinct = max(1, references // (DEFAULT_REFERENCES // DEFAULT_DISTINCT))
+        for memory in run_memory_benchmarks(references, distinct):
+            print(
+                f"{memory.name:<36} {memory.bytes_per_symbol:>11.1f} bytes/symbol "
+                f"({memory.references:,} references, {memory.distinct:,} distinct)"
+            )
+        for memory in run_container_benchmarks(references):
+            print(
+                f"{memory.name:<36} {memory.bytes_per_symbol:>11.1f} bytes/entry "
+                f"({memory.references:,} entries)"
+            )
+        return 0
+
+    if args.query:
+        for size in args.query_size or DEFAULT_SIZES:
+            build_ns, results = run_query_benchmarks(size)
+            build_ms = build_ns / _NS_PER_MS
+            print(f"{'query.build':<36} {build_ms:>11.1f} ms ({size:,} symbols)")
+            for query in results:
+                scan_ms = (query.scan_ns or 0) / _NS_PER_MS
+                indexed_ms = query.indexed_ns / _NS_PER_MS
+                print(
+                    f"{query.name:<36} {indexed_ms:>11.3f} ms "
+                    f"(scan {scan_ms:>10.1f} ms, {query.rows:,} rows)",
+                    flush=True,
+                )
+        return 0
+
+    cases = [
+        case
+        for case in default_cases()
+        if not args.filter or any(f in case.name for f in args.filter)
+    ]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    report = run_benchmarks(
+        cases,
+        samples=args.samples,
+        sample_time_ns=int(args.sample_time_ms * _NS_PER_MS),
+        progress=_print_result,
+    )
+
+    if args.output is not None:
+        report.dump(args.output)
+    if args.update_baseline:
+        report.dump(args.baseline)
+
+    if not args.compare:
+        return 0
+
+    baseline = BenchmarkReport.load(args.baseline)
+    comparisons = compare_reports(report, baseline, tolerance=args.tolerance)
+    print(f"\ncomparison against {args.baseline} (tolerance {args.tolerance:.0%})")
+    for comparison in comparisons:
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}x"
+        print(f"{comparison.name:<36} {ratio:>8}  {comparison.status.value}")
+    regressions = [c for c in comparisons if c.status is ComparisonStatus.REGRESSION]
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
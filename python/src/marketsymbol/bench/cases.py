@@ -0,0 +1,929 @@
+"""ベンチマークケース定義.
+
+ケース名は 'グループ.詳細' 形式とし、--filter でグループ単位に選択できる。
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import io
+import random
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from marketsymbol.adapter import AdapterRegistry, BaseAdapter
+from marketsymbol.bench.query import QUERIES, synthetic_symbols
+from marketsymbol.bench.runner import BenchmarkCase
+from marketsymbol.bloom import SymbolBloomFilter
+from marketsymbol.bulk import validate_symbols
+from marketsymbol.chain import ChainParser
+from marketsymbol.cli import main as cli_main
+from marketsymbol.container import SymbolDict, SymbolSet
+from marketsymbol.csvstream import canonicalize, transform_csv
+from marketsymbol.enums import AssetClass, OptionType
+from marketsymbol.errors import SymbolParseError
+from marketsymbol.exchange import ExchangePlugin, ExchangeRegistry
+from marketsymbol.extsort import diff_symbols, sort_symbols
+from marketsymbol.grammar import BUILTIN_GRAMMARS, Grammar, GrammarRegistry
+from marketsymbol.metrics import disable_metrics, enable_metrics, reset_metrics
+from marketsymbol.parser import (
+    normalize_symbol,
+    parse_equity,
+    parse_future,
+    parse_option,
+    parse_symbol,
+)
+from marketsymbol.pattern import SymbolPattern
+from marketsymbol.policy import ParserPolicy
+from marketsymbol.pool import SymbolPool
+from marketsymbol.query import SymbolUniverse
+from marketsymbol.router import SubscriptionRouter
+from marketsymbol.scan import find_symbols
+from marketsymbol.shard import ShardPartitioner, symbol_fingerprint
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+from marketsymbol.tracing import HistogramHook, add_trace_hook, clear_trace_hooks
+from marketsymbol.view import SymbolView
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Container
+
+    from marketsymbol.extsort import SymbolChange
+    from marketsymbol.symbol import Symbol
+
+# 資産クラスごとの代表的な正常系シンボル
+VALID_SYMBOLS: dict[str, str] = {
+    "equity": "XJPX:7203",
+    "future": "XJPX:NK:20250314:F",
+    "option": "XJPX:N225O:20250314:C:42000",
+    "series": "XJPX:N225O:20250314:O",
+}
+
+# エラーコードごとの代表的な異常系シンボル
+INVALID_SYMBOLS: dict[str, str] = {
+    "segment_count": "XJPX:NK:20250314",
+    "exchange": "XX:7203",
+    "code": "XJPX:72-03",
+    "expiry_format": "XJPX:NK:2025031:F",
+    "date": "XJPX:NK:20250230:F",
+    "option_type": "XJPX:NK:20250314:X",
+    "strike": "XJPX:NK:20250314:C:ABC",
+    "too_long": "XJPX:" + "A" * 100,
+}
+
+# normalize_symbol の入力バリエーション
+NORMALIZE_INPUTS: dict[str, str] = {
+    "ascii": "XJPX:7203",
+    "lowercase": "xjpx:7203",
+    "fullwidth": "ＸＪＰＸ：７２０３",  # noqa: RUF001
+    "whitespace": "  XJPX:7203  ",
+}
+
+
+class _BenchAdapter(BaseAdapter):
+    """AdapterRegistry 計測用の最小アダプター."""
+
+    @property
+    def supported_asset_classes(self) -> frozenset[AssetClass]:
+        return frozenset({AssetClass.EQUITY})
+
+    def to_symbol(self, vendor_symbol: str) -> Symbol:
+        code, _ = vendor_symbol.split(".")
+        return EquitySymbol(exchange="XJPX", code=code)
+
+    def from_symbol(self, symbol: Symbol) -> str:
+        return f"{symbol.code}.T"
+
+
+def _sample_symbols() -> dict[str, Symbol]:
+    """計測用の Symbol オブジェクトを返す."""
+    return {
+        "equity": EquitySymbol(exchange="XJPX", code="7203"),
+        "future": FutureSymbol(exchange="XJPX", code="NK", expiry="20250314"),
+        "option": OptionSymbol(
+            exchange="XJPX",
+            code="N225O",
+            expiry="20250314",
+            option_type=OptionType.CALL,
+            strike=42000,
+        ),
+    }
+
+
+def _fixed(
+    func: Callable[..., object], *args: object, **kwargs: object
+) -> Callable[[], Callable[[], object]]:
+    """func を固定引数で呼び出す callable を返す setup を生成する."""
+
+    def setup() -> Callable[[], object]:
+        return partial(func, *args, **kwargs)
+
+    return setup
+
+
+def _lazy(
+    func: Callable[..., object], *fixtures: Callable[[], object], **kwargs: object
+) -> Callable[[], Callable[[], object]]:
+    """fixtures の戻り値を引数として func を呼び出す callable を返す setup を生成する.
+
+    fixtures の構築はケースの選択時ではなく setup の実行時に行う。
+    """
+
+    def setup() -> Callable[[], object]:
+        return partial(func, *(fixture() for fixture in fixtures), **kwargs)
+
+    return setup
+
+
+def _method(
+    fixture: Callable[[], object], name: str, *args: object
+) -> Callable[[], Callable[[], object]]:
+    """fixture の戻り値の属性 name を固定引数で呼び出す callable を返す setup を生成する.
+
+    fixture の構築はケースの選択時ではなく setup の実行時に行う。
+    """
+
+    def setup() -> Callable[[], object]:
+        return partial(getattr(fixture(), name), *args)
+
+    return setup
+
+
+def _parse_failure(
+    raw: str, parse: Callable[[str], Symbol] = parse_symbol
+) -> Callable[[], object]:
+    """エラーになる raw を parse でパースして例外を捕捉する callable を返す."""
+
+    def run() -> object:
+        try:
+            return parse(raw)
+        except SymbolParseError as e:
+            return e.error_code
+
+    return run
+
+
+def _mixed_batch(size: int) -> list[str]:
+    """正常系 4 : 異常系 1 の割合で混在させたシンボル文字列のリストを返す."""
+    pool = [*VALID_SYMBOLS.values()] * 2 + [*INVALID_SYMBOLS.values()]
+    return [pool[i % len(pool)] for i in range(size)]
+
+
+def _transform_csv(text: str) -> object:
+    """CSV 文字列の symbol 列を canonicalize で変換する."""
+    return transform_csv(
+        io.StringIO(text),
+        io.StringIO(),
+        {"symbol": canonicalize},
+        rejects=io.StringIO(),
+    )
+
+
+def _parse_all(symbols: list[str]) -> int:
+    """parse_symbol を try/except で呼び出し、有効な件数を返す."""
+    valid = 0
+    for raw in symbols:
+        try:
+            parse_symbol(raw)
+        except SymbolParseError:
+            continue
+        valid += 1
+    return valid
+
+
+def _view_route(raw: str | bytes) -> object:
+    """SymbolView を生成し、振り分けに使う取引所と資産クラスのみを参照する."""
+    view = SymbolView(raw)
+    return view.exchange, view.asset_class
+
+
+def _view_materialize(raw: str | bytes) -> object:
+    """SymbolView を生成して Symbol を取り出す."""
+    return SymbolView(raw).materialize()
+
+
+def _option_chain(size: int) -> list[str]:
+    """同一の限月の C / P を strike 順に並べたオプションチェーンを返す."""
+    return [
+        f"XJPX:N225O:20250314:{'CP'[i % 2]}:{30000 + 125 * (i // 2)}"
+        for i in range(size)
+    ]
+
+
+def _parse_chain(symbols: list[str]) -> object:
+    """新しい ChainParser でチェーン全体をパースする (最初の1件はミス)."""
+    return ChainParser().parse_all(symbols)
+
+
+def _pattern_filter(
+    pattern: SymbolPattern, items: list[Symbol] | list[str]
+) -> list[Symbol]:
+    """SymbolPattern で絞り込む."""
+    return list(pattern.filter(items))
+
+
+def _fnmatch_filter(symbols: list[Symbol], pattern: str) -> list[Symbol]:
+    """str(symbol) に対する fnmatch で絞り込む (SymbolPattern の比較対象)."""
+    return [s for s in symbols if fnmatch.fnmatchcase(str(s), pattern)]
+
+
+def _subscription_patterns(size: int) -> list[str]:
+    """購読パターンを返す (個別銘柄 8 : 限月・種別 1 : strike の範囲 1)."""
+    patterns = []
+    for i in range(size):
+        strike = 30000 + 125 * (i % 400)
+        if i % 10 == 8:
+            patterns.append(f"XJPX:N225O:2025{1 + i % 12:02d}*:{'CP'[i % 2]}:*")
+        elif i % 10 == 9:
+            patterns.append(f"*:N225O:20250314:*:{strike}-{strike + 1000}")
+        else:
+            patterns.append(f"XJPX:N225O:20250314:{'CP'[i % 2]}:{strike}")
+    return patterns
+
+
+def _route_all(router: SubscriptionRouter, symbols: list[Symbol]) -> int:
+    """全シンボルをルーティングし、購読者の延べ数を返す."""
+    route = router.route
+    return sum(len(route(symbol)) for symbol in symbols)
+
+
+def _routing(
+    subscriptions: int, symbols: Callable[[], list[Symbol]]
+) -> Callable[[], Callable[[], object]]:
+    """購読を登録したルーターで symbols() をルーティングする setup を生成する.
+
+    購読の登録はケースの選択時ではなく setup の実行時に行う。
+    """
+
+    def setup() -> Callable[[], object]:
+        router = SubscriptionRouter()
+        for i, pattern in enumerate(_subscription_patterns(subscriptions)):
+            router.subscribe(i, pattern)
+        return partial(_route_all, router, symbols())
+
+    return setup
+
+
+def _match_all(patterns: list[SymbolPattern], symbols: list[Symbol]) -> int:
+    """全シンボルを全パターンと照合し、一致の延べ数を返す (ルーターの比較対象)."""
+    return sum(pattern.matches(symbol) for symbol in symbols for pattern in patterns)
+
+
+def _count_contained(container: Container[object], items: list[Any]) -> int:
+    """items のうち container に含まれるものの数を返す."""
+    return sum(item in container for item in items)
+
+
+def _count_parsed(symbols: set[Symbol], raws: list[str]) -> int:
+    """raws をパースした Symbol のうち symbols に含まれるものの数を返す."""
+    return sum(parse_symbol(raw) in symbols for raw in raws)
+
+
+def _lookup_all(symbols: SymbolDict[int], raws: list[str]) -> int:
+    """raws の値を引いた合計を返す."""
+    return sum(symbols[raw] for raw in raws)
+
+
+def _fingerprint_all(symbols: list[Symbol]) -> list[int]:
+    """全ての Symbol のフィンガープリントを返す."""
+    return [symbol_fingerprint(symbol) for symbol in symbols]
+
+
+def _sort_lines(lines: list[str], run_lines: int) -> list[str]:
+    """lines を外部ソートした結果を返す."""
+    return list(sort_symbols(lines, run_lines=run_lines))
+
+
+def _diff_lines(old: list[str], new: list[str], run_lines: int) -> list[SymbolChange]:
+    """old と new の差分を返す."""
+    return list(diff_symbols(old, new, run_lines=run_lines))
+
+
+def _run_cli(argv: list[str], text: str) -> int:
+    """text を標準入力として main(argv) を実行する (標準出力はメモリ上で破棄する)."""
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(text)
+    try:
+        with redirect_stdout(io.StringIO()):
+            return cli_main(argv)
+    finally:
+        sys.stdin = stdin
+
+
+# 以下のフィクスチャは最初に選択されたケースの setup で構築し、ケース間で共有する
+
+
+@lru_cache(maxsize=1)
+def _batch() -> list[str]:
+    """正常系と異常系が混在する 1,000 件のシンボル文字列を返す."""
+    return _mixed_batch(1000)
+
+
+@lru_cache(maxsize=1)
+def _batch_table() -> str:
+    """_batch() を symbol 列とする CSV 文字列を返す."""
+    return "id,symbol,name\n" + "".join(
+        f"{i},{raw},name{i}\n" for i, raw in enumerate(_batch())
+    )
+
+
+@lru_cache(maxsize=1)
+def _batch_input() -> str:
+    """_batch() を1行1シンボルとしたコマンドラインツールの入力を返す."""
+    return "".join(f"{raw}\n" for raw in _batch())
+
+
+@lru_cache(maxsize=1)
+def _log() -> str:
+    """約 64KB のログ (行の 1/4 にシンボル) を返す."""
+    return "".join(
+        f"2025-03-14T09:00:{i % 60:02d} order {i} filled qty=3 price:42000 "
+        + (f"{VALID_SYMBOLS['option']}\n" if i % 4 == 0 else "ok\n")
+        for i in range(1000)
+    )
+
+
+@lru_cache(maxsize=1)
+def _chain() -> list[str]:
+    """1,000 件のオプションチェーンのシンボル文字列を返す."""
+    return _option_chain(1000)
+
+
+@lru_cache(maxsize=1)
+def _chain_symbols() -> list[Symbol]:
+    """_chain() をパースした Symbol を返す."""
+    return [parse_symbol(raw) for raw in _chain()]
+
+
+@lru_cache(maxsize=1)
+def _chain_head() -> list[Symbol]:
+    """_chain_symbols() の先頭 100 件を返す."""
+    return _chain_symbols()[:100]
+
+
+def _chain_pattern() -> SymbolPattern:
+    """_chain() のうち C の 4xxxx に一致するパターンを返す."""
+    return SymbolPattern("XJPX:N225O:202503*:C:40000-49999")
+
+
+def _linear_patterns() -> list[SymbolPattern]:
+    """全パターンの照合の比較対象とする 1,000 件の購読パターンを返す."""
+    return [SymbolPattern(pattern) for pattern in _subscription_patterns(1000)]
+
+
+@lru_cache(maxsize=1)
+def _chain_set() -> SymbolSet:
+    """_chain() の SymbolSet を返す."""
+    return SymbolSet(_chain())
+
+
+def _chain_builtin_set() -> set[Symbol]:
+    """_chain_symbols() の set を返す."""
+    return set(_chain_symbols())
+
+
+def _chain_dict() -> SymbolDict[int]:
+    """_chain() の各シンボルに番号を対応させた SymbolDict を返す."""
+    return SymbolDict((raw, i) for i, raw in enumerate(_chain()))
+
+
+def _chain_half_set() -> SymbolSet:
+    """_chain_symbols() の1つおきの SymbolSet を返す."""
+    return SymbolSet(_chain_symbols()[::2])
+
+
+@lru_cache(maxsize=1)
+def _chain_bloom() -> SymbolBloomFilter:
+    """_chain() を登録した SymbolBloomFilter を返す."""
+    return SymbolBloomFilter.from_symbols(_chain())
+
+
+def _absent_chain() -> list[str]:
+    """_chain() の限月の年を変えた (登録していない) 1,000 件を返す."""
+    return [raw.replace(":2025", ":2026", 1) for raw in _chain()]
+
+
+@lru_cache(maxsize=1)
+def _unsorted() -> list[Symbol]:
+    """順不同に並べた 10,000 件の Symbol を返す."""
+    symbols = synthetic_symbols(10_000)
+    random.Random(0).shuffle(symbols)
+    return symbols
+
+
+@lru_cache(maxsize=1)
+def _unsorted_lines() -> list[str]:
+    """_unsorted() を1行1シンボルとした行を返す."""
+    return [f"{symbol}\n" for symbol in _unsorted()]
+
+
+def _changed_lines() -> list[str]:
+    """_unsorted_lines() の先頭 1,000 行を除いた行を返す."""
+    return _unsorted_lines()[1_000:]
+
+
+@lru_cache(maxsize=1)
+def _universe(size: int) -> SymbolUniverse:
+    """合成した size 件の SymbolUniverse を返す (検索のケース間で共有する)."""
+    return SymbolUniverse(synthetic_symbols(size))
+
+
+def _universe_query(
+    size: int, criteria: dict[str, Any]
+) -> Callable[[], Callable[[], object]]:
+    """size 件の SymbolUniverse で criteria の検索を行う setup を生成する.
+
+    インデックスの構築はケースの選択時ではなく setup の実行時に行う。
+    """
+
+    def setup() -> Callable[[], object]:
+        return partial(_universe(size).query, **criteria)
+
+    return setup
+
+
+def _registry(vendors: int) -> AdapterRegistry:
+    """vendors 個のアダプターを登録したレジストリを返す."""
+    registry = AdapterRegistry()
+    for i in range(vendors):
+        registry.register(f"vendor{i}", _BenchAdapter())
+    return registry
+
+
+def _exchange_registry(exchanges: int) -> ExchangeRegistry:
+    """XJPX 以外の exchanges 個の取引所にプラグインを登録したレジストリを返す."""
+    registry = ExchangeRegistry()
+    for i in range(exchanges):
+        registry.register(f"XA{chr(65 + i // 26)}{chr(65 + i % 26)}", ExchangePlugin())
+    return registry
+
+
+def _grammar_registry(extra: bool) -> GrammarRegistry:
+    """組み込みの文法 (extra の場合は 6 個を追加して計 10 個) のレジストリを返す.
+
+    追加の文法は組み込みと同じセグメント数 (タイプ識別子の追加) と
+    組み込みにないセグメント数 (3, 6) に振り分ける。
+    """
+    registry = GrammarRegistry(BUILTIN_GRAMMARS)
+    if not extra:
+        return registry
+    equity, future, _, option = BUILTIN_GRAMMARS
+    six_segments = (*option.fields, None)
+    grammars = [
+        Grammar("weekly_future", future.fields, future.build, 3, frozenset("W")),
+        Grammar("mini_future", future.fields, future.build, 3, frozenset("M")),
+        Grammar("exotic_option", option.fields, option.build, 3, frozenset("X")),
+        Grammar("short_future", future.fields[:3], future.build),
+        Grammar("listed_a", six_segments, equity.build, 5, frozenset("A")),
+        Grammar("listed_b", six_segments, equity.build, 5, frozenset("B")),
+    ]
+    for grammar in grammars:
+        registry.register(grammar)
+    return registry
+
+
+def _plugin_exchange_registry() -> ExchangeRegistry:
+    """XJPX にプラグインを登録したレジストリを返す."""
+    registry = ExchangeRegistry()
+    registry.register("XJPX", ExchangePlugin())
+    return registry
+
+
+class _CompiledPolicies(NamedTuple):
+    """既知の取引所・商品コードを指定した ParserPolicy のパース関数."""
+
+    strict: Callable[[str], Symbol]
+    warn: Callable[[str], Symbol]
+
+
+def _compiled_policies() -> _CompiledPolicies:
+    """strict / warn の ParserPolicy をコンパイルしたパース関数を返す."""
+    known = {"known_exchanges": ["XJPX"], "known_codes": ["NK", "N225O"]}
+    return _CompiledPolicies(
+        ParserPolicy.strict(**known).compile(), ParserPolicy.warn(**known).compile()
+    )
+
+
+def _policy_failure(raw: str) -> Callable[[], object]:
+    """strict の ParserPolicy でエラーになる raw をパースして例外を捕捉する callable を返す."""
+    return _parse_failure(raw, _compiled_policies().strict)
+
+
+def _sample_pool() -> SymbolPool:
+    """_sample_symbols() を登録した SymbolPool を返す."""
+    pool = SymbolPool()
+    pool.intern_all(_sample_symbols().values())
+    return pool
+
+
+def _register_fresh() -> object:
+    """空のレジストリを生成して1件登録する."""
+    registry = AdapterRegistry()
+    registry.register("vendor", _BenchAdapter())
+    return registry
+
+
+def _with_metrics(
+    setup: Callable[[], Callable[[], object]],
+) -> Callable[[], Callable[[], object]]:
+    """メトリクス計測を有効にしてから setup を呼ぶ setup を生成する."""
+
+    def setup_with_metrics() -> Callable[[], object]:
+        reset_metrics()
+        enable_metrics()
+        return setup()
+
+    return setup_with_metrics
+
+
+def _metrics_teardown() -> None:
+    """メトリクス計測を無効化してリセットする."""
+    disable_metrics()
+    reset_metrics()
+
+
+def _with_tracing(
+    setup: Callable[[], Callable[[], object]],
+) -> Callable[[], Callable[[], object]]:
+    """HistogramHook を登録してから setup を呼ぶ setup を生成する."""
+
+    def setup_with_tracing() -> Callable[[], object]:
+        clear_trace_hooks()
+        add_trace_hook(HistogramHook())
+        return setup()
+
+    return setup_with_tracing
+
+
+def default_cases() -> list[BenchmarkCase]:
+    """組み込みのベンチマークケース一覧を返す."""
+    cases = [
+        BenchmarkCase(f"normalize_symbol.{name}", _fixed(normalize_symbol, raw))
+        for name, raw in NORMALIZE_INPUTS.items()
+    ]
+    cases += [
+        BenchmarkCase(f"parse_symbol.{name}", _fixed(parse_symbol, raw))
+        for name, raw in VALID_SYMBOLS.items()
+    ]
+    cases += [
+        BenchmarkCase(f"parse_symbol.error.{name}", partial(_parse_failure, raw))
+        for name, raw in INVALID_SYMBOLS.items()
+    ]
+    # 資産クラスを限定したパース関数 (セグメント数による分岐なし)
+    cases += [
+        BenchmarkCase(
+            "parse_equity.equity", _fixed(parse_equity, VALID_SYMBOLS["equity"])
+        ),
+        BenchmarkCase(
+            "parse_future.future", _fixed(parse_future, VALID_SYMBOLS["future"])
+        ),
+        BenchmarkCase(
+            "parse_option.option", _fixed(parse_option, VALID_SYMBOLS["option"])
+        ),
+        BenchmarkCase(
+            "parse_option.series", _fixed(parse_option, VALID_SYMBOLS["series"])
+        ),
+    ]
+
+    cases += [
+        BenchmarkCase(
+            "construct.equity",
+            _fixed(EquitySymbol, exchange="XJPX", code="7203"),
+        ),
+        BenchmarkCase(
+            "construct.future",
+            _fixed(FutureSymbol, exchange="XJPX", code="NK", expiry="20250314"),
+        ),
+        BenchmarkCase(
+            "construct.option",
+            _fixed(
+                OptionSymbol,
+                exchange="XJPX",
+                code="N225O",
+                expiry="20250314",
+                option_type=OptionType.CALL,
+                strike=42000,
+            ),
+        ),
+    ]
+
+    symbols = _sample_symbols()
+    cases += [
+        BenchmarkCase(f"str.{name}", _fixed(str, symbol))
+        for name, symbol in symbols.items()
+    ]
+    cases += [
+        BenchmarkCase(f"hash.{name}", _fixed(hash, symbol))
+        for name, symbol in symbols.items()
+    ]
+
+    registry = partial(_registry, 8)
+    cases += [
+        BenchmarkCase("registry.get", _method(registry, "get", "vendor3")),
+        BenchmarkCase(
+            "registry.get_or_raise", _method(registry, "get_or_raise", "vendor3")
+        ),
+        BenchmarkCase("registry.list", _method(registry, "list")),
+        BenchmarkCase("registry.register", _fixed(_register_fresh)),
+        BenchmarkCase(
+            "registry.to_symbol", _method(registry, "to_symbol", "vendor3", "7203.T")
+        ),
+        BenchmarkCase(
+            "registry.from_symbol",
+            _method(registry, "from_symbol", "vendor3", symbols["equity"]),
+        ),
+    ]
+
+    # 一括バリデーション (1,000 行あたり) と parse_symbol のループの比較
+    cases += [
+        BenchmarkCase("bulk.validate_symbols.1k", _lazy(validate_symbols, _batch)),
+        BenchmarkCase(
+            "bulk.validate_symbols.asset_classes.1k",
+            _lazy(validate_symbols, _batch, asset_classes=True),
+        ),
+        BenchmarkCase("bulk.parse_symbol_loop.1k", _lazy(_parse_all, _batch)),
+    ]
+
+    # CSV のシンボル列の変換 (1,000 行、繰り返しの値はメモ化)
+    cases.append(
+        BenchmarkCase("csvstream.canonicalize.1k", _lazy(_transform_csv, _batch_table))
+    )
+
+    # テキスト中のシンボルの抽出 (約 64KB のログ、行の 1/4 にシンボル)
+    cases += [
+        BenchmarkCase("scan.find_symbols.log_64k", _lazy(find_symbols, _log)),
+        BenchmarkCase(
+            "scan.find_symbols.log_64k.exchanges",
+            _lazy(find_symbols, _log, exchanges=frozenset({"XJPX"})),
+        ),
+    ]
+
+    # パターンによる絞り込み (1,000 件のオプションチェーンのうち C の 4xxxx、
+    # fnmatch は同じ結果となるパターンでの比較対象)
+    cases += [
+        BenchmarkCase(
+            "pattern.filter.symbols.1k",
+            _lazy(_pattern_filter, _chain_pattern, _chain_symbols),
+        ),
+        BenchmarkCase(
+            "pattern.filter.raw.1k", _lazy(_pattern_filter, _chain_pattern, _chain)
+        ),
+        BenchmarkCase(
+            "pattern.fnmatch.symbols.1k",
+            _lazy(_fnmatch_filter, _chain_symbols, pattern="XJPX:N225O:202503*:C:4*"),
+        ),
+    ]
+
+    # 購読のルーティング (10,000 件の購読、1,000 件のオプションチェーン)。
+    # linear_scan は全パターンの照合による比較対象 (1,000 件の購読、100 件)
+    cases += [
+        BenchmarkCase("router.route.10k_subs.1k", _routing(10_000, _chain_symbols)),
+        BenchmarkCase(
+            "router.linear_scan.1k_subs.100",
+            _lazy(_match_all, _linear_patterns, _chain_head),
+        ),
+    ]
+
+    # シンボル文字列・Symbol による SymbolSet / SymbolDict の参照と集合演算
+    # (1,000 件のオプションチェーン、set.contains.parse_symbol はパースして
+    # Symbol の set を引く比較対象)
+    cases += [
+        BenchmarkCase(
+            "container.symbol_set.contains.raw.1k",
+            _lazy(_count_contained, _chain_set, _chain),
+        ),
+        BenchmarkCase(
+            "container.symbol_set.contains.symbol.1k",
+            _lazy(_count_contained, _chain_set, _chain_symbols),
+        ),
+        BenchmarkCase(
+            "container.set.contains.parse_symbol.1k",
+            _lazy(_count_parsed, _chain_builtin_set, _chain),
+        ),
+        BenchmarkCase(
+            "container.symbol_dict.getitem.raw.1k",
+            _lazy(_lookup_all, _chain_dict, _chain),
+        ),
+        BenchmarkCase(
+            "container.symbol_set.intersection.1k",
+            _lazy(SymbolSet.intersection, _chain_set, _chain_half_set),
+        ),
+    ]
+
+    # 同じ 1,000 件の SymbolBloomFilter による判定 (container.symbol_set と比較する)。
+    # absent は登録していない 1,000 件 (大半は最初の数ビットで判定できる)
+    cases += [
+        BenchmarkCase(
+            "bloom.contains.raw.1k", _lazy(_count_contained, _chain_bloom, _chain)
+        ),
+        BenchmarkCase(
+            "bloom.contains.symbol.1k",
+            _lazy(_count_contained, _chain_bloom, _chain_symbols),
+        ),
+        BenchmarkCase(
+            "bloom.contains.absent.1k",
+            _lazy(_count_contained, _chain_bloom, _absent_chain),
+        ),
+    ]
+
+    # 同じ 1,000 件の Symbol のフィンガープリントと 64 シャードへの分割
+    # (chain はチェーンごとのシャード番号をメモ化する)
+    cases += [
+        BenchmarkCase(
+            "shard.symbol_fingerprint.1k", _lazy(_fingerprint_all, _chain_symbols)
+        ),
+        BenchmarkCase(
+            "shard.partition.symbol.1k",
+            _lazy(ShardPartitioner(64).partition, _chain_symbols),
+        ),
+        BenchmarkCase(
+            "shard.partition.chain.1k",
+            _lazy(ShardPartitioner(64, group="chain").partition, _chain_symbols),
+        ),
+    ]
+
+    # 10,000 件の Symbol (順不同) の整列。sort_key はキャッシュ済みのキー、
+    # operators は比較演算子、key_str は文字列の辞書順 (strike の数値順とならない)
+    cases += [
+        BenchmarkCase(
+            "sort.sort_key.10k", _lazy(sorted, _unsorted, key=attrgetter("sort_key"))
+        ),
+        BenchmarkCase("sort.operators.10k", _lazy(sorted, _unsorted)),
+        BenchmarkCase("sort.key_str.10k", _lazy(sorted, _unsorted, key=str)),
+    ]
+
+    # 同じ 10,000 行の外部ソートと差分。in_memory は1つのラン、
+    # runs は 2,500 行ずつの 4 つのランを一時ファイルに書き出してマージする
+    cases += [
+        BenchmarkCase(
+            "extsort.sort_symbols.in_memory.10k",
+            _lazy(_sort_lines, _unsorted_lines, run_lines=10_000),
+        ),
+        BenchmarkCase(
+            "extsort.sort_symbols.runs.10k",
+            _lazy(_sort_lines, _unsorted_lines, run_lines=2_500),
+        ),
+        BenchmarkCase(
+            "extsort.diff_symbols.runs.10k",
+            _lazy(_diff_lines, _unsorted_lines, _changed_lines, run_lines=2_500),
+        ),
+    ]
+
+    # インデックスを用いた検索 (100,000 件、1M / 10M 件は --query で計測する)
+    cases += [
+        BenchmarkCase(f"{name}.100k", _universe_query(100_000, criteria))
+        for name, criteria in QUERIES.items()
+    ]
+
+    # コマンドラインツールの main (1,000 行、標準入出力はメモリ上のバッファ)
+    cases += [
+        BenchmarkCase(
+            f"cli.{command}.{output_format}.1k",
+            _lazy(
+                partial(_run_cli, [command, "--format", output_format, "--quiet"]),
+                _batch_input,
+            ),
+        )
+        for command, output_format in (
+            ("validate", "text"),
+            ("parse", "text"),
+            ("parse", "jsonl"),
+            ("parse", "csv"),
+        )
+    ]
+
+    # 列指向パース (NumPy がインストールされている場合のみ)
+    if find_spec("numpy") is not None:
+        from marketsymbol.columnar import parse_columns
+
+        cases.append(
+            BenchmarkCase("columnar.parse_columns.1k", _lazy(parse_columns, _batch))
+        )
+
+    # オプションチェーン (1,000 件) の接頭辞メモ化パースと parse_symbol のループの比較
+    cases += [
+        BenchmarkCase("chain.parse_all.1k", _lazy(_parse_chain, _chain)),
+        BenchmarkCase("chain.parse_symbol_loop.1k", _lazy(_parse_all, _chain)),
+    ]
+
+    # SymbolView (振り分け用のフィールドのみ参照) と Symbol の取り出し
+    option = VALID_SYMBOLS["option"]
+    cases += [
+        BenchmarkCase("view.route.option", _fixed(_view_route, option)),
+        BenchmarkCase("view.route.option.bytes", _fixed(_view_route, option.encode())),
+        BenchmarkCase("view.materialize.option", _fixed(_view_materialize, option)),
+    ]
+
+    # 取引所プラグインの振り分け (未登録の XJPX は汎用の経路、登録数に依存しない)
+    cases += [
+        BenchmarkCase(
+            "exchange.generic.option",
+            _method(partial(_exchange_registry, 0), "parse", option),
+        ),
+        BenchmarkCase(
+            "exchange.generic.option.64_plugins",
+            _method(partial(_exchange_registry, 64), "parse", option),
+        ),
+        BenchmarkCase(
+            "exchange.plugin.option",
+            _method(_plugin_exchange_registry, "parse", option),
+        ),
+    ]
+
+    # 文法の振り分け表 (組み込みの文法のみと 10 個の文法で同じ処理量)
+    builtin_grammars = partial(_grammar_registry, extra=False)
+    many_grammars = partial(_grammar_registry, extra=True)
+    cases += [
+        BenchmarkCase(
+            "grammar.builtin.option", _method(builtin_grammars, "parse", option)
+        ),
+        BenchmarkCase(
+            "grammar.10_grammars.option", _method(many_grammars, "parse", option)
+        ),
+        BenchmarkCase(
+            "grammar.10_grammars.equity",
+            _method(many_grammars, "parse", VALID_SYMBOLS["equity"]),
+        ),
+    ]
+
+    # ParserPolicy をコンパイルしたパース関数 (既知の値に含まれる入力)
+    cases += [
+        BenchmarkCase(
+            "policy.strict.future",
+            _method(_compiled_policies, "strict", VALID_SYMBOLS["future"]),
+        ),
+        BenchmarkCase(
+            "policy.strict.option", _method(_compiled_policies, "strict", option)
+        ),
+        BenchmarkCase(
+            "policy.warn.option", _method(_compiled_policies, "warn", option)
+        ),
+        BenchmarkCase(
+            "policy.strict.error.unknown_exchange",
+            partial(_policy_failure, "XOSE:N225O:20250314:C:42000"),
+        ),
+    ]
+
+    # SymbolPool (登録済みの銘柄に対するヒット時)
+    cases += [
+        BenchmarkCase(
+            "pool.intern.option", _method(_sample_pool, "intern", symbols["option"])
+        ),
+        BenchmarkCase(
+            "pool.parse.option", _method(_sample_pool, "parse", VALID_SYMBOLS["option"])
+        ),
+    ]
+
+    # メトリクス有効時のオーバーヘッド (無効時は上記ケースと同一経路)
+    cases += [
+        BenchmarkCase(
+            f"metrics.parse_symbol.{name}",
+            _with_metrics(_fixed(parse_symbol, VALID_SYMBOLS[name])),
+            _metrics_teardown,
+        )
+        for name in ("equity", "option")
+    ]
+    cases += [
+        BenchmarkCase(
+            "metrics.parse_symbol.error.exchange",
+            _with_metrics(partial(_parse_failure, INVALID_SYMBOLS["exchange"])),
+            _metrics_teardown,
+        ),
+        BenchmarkCase(
+            "metrics.registry.to_symbol",
+            _with_metrics(_method(registry, "to_symbol", "vendor3", "7203.T")),
+            _metrics_teardown,
+        ),
+    ]
+
+    # トレーシング (HistogramHook 登録時) のオーバーヘッド
+    cases += [
+        BenchmarkCase(
+            f"tracing.parse_symbol.{name}",
+            _with_tracing(_fixed(parse_symbol, VALID_SYMBOLS[name])),
+            clear_trace_hooks,
+        )
+        for name in ("equity", "option")
+    ]
+    cases += [
+        BenchmarkCase(
+            "tracing.parse_symbol.error.exchange",
+            _with_tracing(partial(_parse_failure, INVALID_SYMBOLS["exchange"])),
+            clear_trace_hooks,
+        ),
+        BenchmarkCase(
+            "tracing.normalize_symbol.ascii",
+            _with_tracing(_fixed(normalize_symbol, NORMALIZE_INPUTS["ascii"])),
+            clear_trace_hooks,
+        ),
+        BenchmarkCase(
+            "tracing.registry.to_symbol",
+            _with_tracing(_method(registry, "to_symbol", "vendor3", "7203.T")),
+            clear_trace_hooks,
+        ),
+    ]
+
+    return cases
@@ -0,0 +1,170 @@
+"""Symbol 保持時のメモリ使用量の計測.
+
+同一銘柄への参照を多数保持する状況 (オプションチェーンの板など) を模し、
+SymbolPool の有無による1参照あたりのバイト数を tracemalloc で計測する。
+リスト自体のポインタ (8 バイト/参照) も含む。
+
+異なる銘柄を集合・辞書に保持する場合の1件あたりのバイト数
+(Symbol の set / dict と SymbolSet / SymbolDict) も計測する。
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from marketsymbol.container import SymbolDict, SymbolSet, _raw_key
+from marketsymbol.parser import parse_symbol
+from marketsymbol.pool import SymbolPool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# 既定の参照数と異なり銘柄数
+DEFAULT_REFERENCES = 100_000
+DEFAULT_DISTINCT = 1_000
+
+# 集合・辞書に保持する既定の銘柄数
+DEFAULT_ENTRIES = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryResult:
+    """1ケース分のメモリ計測結果.
+
+    Attributes:
+        name: ケース名.
+        references: 保持した Symbol 参照の数.
+        distinct: 異なり銘柄数.
+        total_bytes: 保持に要したバイト数.
+    """
+
+    name: str
+    references: int
+    distinct: int
+    total_bytes: int
+
+    @property
+    def bytes_per_symbol(self) -> float:
+        """1参照あたりのバイト数を返す."""
+        return self.total_bytes / self.references
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 互換の dict を返す."""
+        return {
+            "references": self.references,
+            "distinct": self.distinct,
+            "total_bytes": self.total_bytes,
+            "bytes_per_symbol": self.bytes_per_symbol,
+        }
+
+
+def option_chain_symbols(references: int, distinct: int) -> list[str]:
+    """distinct 銘柄のオプションシンボル文字列を references 件並べて返す.
+
+    各要素は別オブジェクトの文字列とし、入力側の共有が結果に影響しないようにする。
+    """
+    expiries = ("20250314", "20250411", "20250509", "20250613")
+    return [
+        "".join(
+            (
+                "XJPX:N225O:",
+                expiries[(i % distinct) % len(expiries)],
+                ":C:" if (i % distinct) % 2 else ":P:",
+                str(30000 + 125 * (i % distinct)),
+            )
+        )
+        for i in range(references)
+    ]
+
+
+def measure_memory(
+    name: str, build: Callable[[list[str]], object], raws: list[str]
+) -> MemoryResult:
+    """build(raws) が返すオブジェクトの保持に要したバイト数を計測する.
+
+    build の実行中に確保され、戻り値から参照されて残っているメモリを数える。
+    参照数は raws の件数とする。
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        held = build(raws)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del held
+    return MemoryResult(
+        name=name,
+        references=len(raws),
+        distinct=len(set(raws)),
+        total_bytes=after - before,
+    )
+
+
+def _parse_all(raws: list[str]) -> object:
+    """プールを使わずにパースした Symbol のリストを返す."""
+    return [parse_symbol(raw) for raw in raws]
+
+
+def _parse_pooled(raws: list[str]) -> object:
+    """SymbolPool 経由でパースした Symbol のリストとプールを返す.
+
+    プール自体のメモリも計測対象に含めるため、結果と一緒に返す。
+    """
+    pool = SymbolPool()
+    return [pool.parse(raw) for raw in raws], pool
+
+
+def run_memory_benchmarks(
+    references: int = DEFAULT_REFERENCES, distinct: int = DEFAULT_DISTINCT
+) -> list[MemoryResult]:
+    """SymbolPool なし/ありの1参照あたりのバイト数を計測する."""
+    raws = option_chain_symbols(references, distinct)
+    return [
+        measure_memory("memory.parse_symbol", _parse_all, raws),
+        measure_memory("memory.pool.parse", _parse_pooled, raws),
+    ]
+
+
+def _symbol_set(raws: list[str]) -> object:
+    """パースした Symbol の set を返す."""
+    return {parse_symbol(raw) for raw in raws}
+
+
+def _symbol_dict(raws: list[str]) -> object:
+    """パースした Symbol をキーとする dict を返す."""
+    return {parse_symbol(raw): i for i, raw in enumerate(raws)}
+
+
+def _packed_set(raws: list[str]) -> object:
+    """シンボル文字列から構築した SymbolSet を返す.
+
+    キーの変換のメモ化 (件数に上限のあるプロセス全体のキャッシュ) は
+    計測に含めない。
+    """
+    symbols = SymbolSet(raws)
+    _raw_key.cache_clear()
+    return symbols
+
+
+def _packed_dict(raws: list[str]) -> object:
+    """シンボル文字列から構築した SymbolDict を返す (メモ化は計測に含めない)."""
+    symbols = SymbolDict((raw, i) for i, raw in enumerate(raws))
+    _raw_key.cache_clear()
+    return symbols
+
+
+def run_container_benchmarks(entries: int = DEFAULT_ENTRIES) -> list[MemoryResult]:
+    """異なる entries 銘柄を保持する集合・辞書の1件あたりのバイト数を計測する."""
+    raws = option_chain_symbols(entries, entries)
+    return [
+        measure_memory("memory.set.parse_symbol", _symbol_set, raws),
+        measure_memory("memory.symbol_set", _packed_set, raws),
+        measure_memory("memory.dict.parse_symbol", _symbol_dict, raws),
+        measure_memory("memory.symbol_dict", _packed_dict, raws),
+    ]
@@ -0,0 +1,168 @@
+"""大規模なシンボルの集合に対する検索の計測.
+
+SymbolUniverse に合成したシンボル (株式・先物・オプション) を登録し、
+インデックスの構築時間と、代表的な複合条件の検索時間を、インデックスを使わない
+全件の走査 (同じ条件の述語による絞り込み) と比較する。
+
+既定の件数は 1,000,000 件と 10,000,000 件。Symbol を全て保持するため、
+10,000,000 件では数 GB のメモリを要する。
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from marketsymbol.enums import AssetClass, OptionType
+from marketsymbol.parser import _equity, _future, _option
+from marketsymbol.query import SymbolUniverse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marketsymbol.symbol import Symbol
+
+# 既定の件数
+DEFAULT_SIZES = (1_000_000, 10_000_000)
+
+# 合成するシンボルの構成要素
+_EXCHANGES = ("XJPX", "XJPX", "XJPX", "XOSE")
+_FUTURE_CODES = ("NK", "NKM", "TOPX")
+_OPTION_CODES = ("N225O", "N225W", "TOPXO", "NKVIO")
+_EXPIRIES = tuple(
+    f"{year}{month:02d}14" for year in range(2024, 2028) for month in range(1, 13)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryResult:
+    """1つの条件の検索の計測結果.
+
+    Attributes:
+        name: ケース名.
+        size: 登録したシンボル数.
+        rows: 該当した件数.
+        indexed_ns: インデックスを用いた検索の時間 (ナノ秒).
+        scan_ns: 全件の走査の時間 (ナノ秒、計測しない場合は None).
+    """
+
+    name: str
+    size: int
+    rows: int
+    indexed_ns: int
+    scan_ns: int | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 互換の dict を返す."""
+        return {
+            "size": self.size,
+            "rows": self.rows,
+            "indexed_ns": self.indexed_ns,
+            "scan_ns": self.scan_ns,
+        }
+
+
+def synthetic_symbols(size: int) -> list[Symbol]:
+    """株式 2 : 先物 1 : オプション 7 の割合で合成した Symbol のリストを返す.
+
+    検査済みの値から直接生成する (パースは計測に含めない)。
+    """
+    symbols: list[Symbol] = []
+    append = symbols.append
+    for i in range(size):
+        kind = i % 10
+        exchange = _EXCHANGES[i % len(_EXCHANGES)]
+        if kind < 2:
+            append(_equity(exchange, str(1000 + (i // 10) % 9000)))
+            continue
+        expiry = _EXPIRIES[(i // 10) % len(_EXPIRIES)]
+        if kind == 2:
+            append(_future(exchange, _FUTURE_CODES[(i // 10) % 3], expiry))
+            continue
+        strike = 20000 + 125 * ((i // 7) % 240)
+        append(
+            _option(exchange, _OPTION_CODES[(i // 3) % 4], expiry, "CP"[i % 2], strike)
+        )
+    return symbols
+
+
+# 計測する条件 (ケース名 -> query の引数)
+QUERIES: dict[str, dict[str, Any]] = {
+    "query.n225o_q1_puts_strike": {
+        "exchange": "XJPX",
+        "code": "N225O",
+        "expiry": ("20250101", "20250331"),
+        "option_type": OptionType.PUT,
+        "strike": (30000, 35000),
+    },
+    "query.futures_2025": {
+        "asset_class": AssetClass.FUTURE,
+        "expiry": ("20250101", "20251231"),
+    },
+    "query.exchange_code": {"exchange": "XOSE", "code": "7203"},
+    "query.strike_point": {"strike": 32000, "option_type": OptionType.CALL},
+}
+
+
+def _elapsed[T](func: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, int]:
+    """func を1回実行し、戻り値と経過時間 (ナノ秒) を返す."""
+    start = time.perf_counter_ns()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter_ns() - start
+
+
+def _matches(symbol: Symbol, criteria: dict[str, Any]) -> bool:
+    """Symbol が全ての条件 (値の一致、またはタプルの範囲) に該当するかを返す."""
+    for name, value in criteria.items():
+        actual = getattr(symbol, name, None)
+        if actual is None:
+            return False
+        if isinstance(value, tuple):
+            low, high = value
+            if not low <= actual <= high:
+                return False
+        elif actual != value:
+            return False
+    return True
+
+
+def _scan(universe: SymbolUniverse, criteria: dict[str, Any]) -> list[Symbol]:
+    """インデックスを使わずに、全件を条件で絞り込む."""
+    return [s for s in universe if _matches(s, criteria)]
+
+
+def run_query_benchmarks(
+    size: int, *, scan: bool = True, repeat: int = 5
+) -> tuple[int, list[QueryResult]]:
+    """size 件のシンボルで検索を計測する.
+
+    Args:
+        size: 登録するシンボル数
+        scan: 全件の走査も計測するかどうか (結果がインデックスと一致することも確認する)
+        repeat: 検索を繰り返す回数 (最小の時間を採用する)
+
+    Returns:
+        インデックスの構築時間 (ナノ秒) と条件ごとの計測結果
+    """
+    universe, build_ns = _elapsed(SymbolUniverse, synthetic_symbols(size))
+    results = []
+    for name, criteria in QUERIES.items():
+        timings = [_elapsed(universe.query, **criteria) for _ in range(repeat)]
+        rows = timings[0][0]
+        scan_ns = None
+        if scan:
+            scanned, scan_ns = _elapsed(_scan, universe, criteria)
+            if scanned != rows:
+                msg = f"{name}: indexed query and scan disagree"
+                raise AssertionError(msg)
+        results.append(
+            QueryResult(
+                name=name,
+                size=size,
+                rows=len(rows),
+                indexed_ns=min(ns for _, ns in timings),
+                scan_ns=scan_ns,
+            )
+        )
+    return build_ns, results
@@ -0,0 +1,354 @@
+"""ベンチマークの実行と結果比較.
+
+各ケースはバッチ (inner_loops 回の呼び出し) 単位で計測し、
+バッチあたりの平均をサンプルとして p50/p99 を求める。
+マシン性能の差を吸収するため、固定の Python ワークロードで
+キャリブレーション値を計測し、ベースラインとの比較時に正規化する。
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# 結果 JSON のスキーマバージョン
+SCHEMA_VERSION = 1
+
+# コミット済みベースラインの既定パス
+DEFAULT_BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# ベースライン比較の既定許容幅 (0.25 = 正規化後 25% までの劣化を許容)
+DEFAULT_TOLERANCE = 0.25
+
+# 既定のサンプル数とサンプルあたりの目標時間
+DEFAULT_SAMPLES = 50
+DEFAULT_SAMPLE_TIME_NS = 1_000_000
+
+# キャリブレーション用ワークロードの反復回数
+_CALIBRATION_LOOPS = 10_000
+_CALIBRATION_SAMPLES = 20
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    """ベンチマークケース.
+
+    Attributes:
+        name: ケース名 ('group.detail' 形式).
+        setup: 計測対象の引数なし callable を返すファクトリ.
+            オブジェクト生成などの準備は setup 内で済ませる。
+        teardown: 計測後に呼ばれる後処理 (setup で変更した状態の復元など).
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    teardown: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """ベンチマーク1ケースの計測結果.
+
+    Attributes:
+        name: ケース名.
+        ns_per_op: 1呼び出しあたりの平均時間 (ナノ秒).
+        p50_ns: バッチ平均の中央値 (ナノ秒).
+        p99_ns: バッチ平均の 99 パーセンタイル (ナノ秒).
+        samples: サンプル数.
+        inner_loops: 1サンプルあたりの呼び出し回数.
+    """
+
+    name: str
+    ns_per_op: float
+    p50_ns: float
+    p99_ns: float
+    samples: int
+    inner_loops: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        """1秒あたりの呼び出し回数を返す."""
+        return _NS_PER_SECOND / self.ns_per_op if self.ns_per_op else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict を返す."""
+        return {
+            "ns_per_op": round(self.ns_per_op, 2),
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "p50_ns": round(self.p50_ns, 2),
+            "p99_ns": round(self.p99_ns, 2),
+            "samples": self.samples,
+            "inner_loops": self.inner_loops,
+        }
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    """ベンチマーク実行全体の結果.
+
+    Attributes:
+        calibration_ns: キャリブレーションワークロードの所要時間 (ナノ秒).
+        results: ケース名 -> 計測結果.
+        environment: 実行環境の情報.
+    """
+
+    calibration_ns: float
+    results: dict[str, BenchmarkResult] = field(default_factory=dict)
+    environment: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict を返す."""
+        return {
+            "schema": SCHEMA_VERSION,
+            "environment": self.environment,
+            "calibration_ns": round(self.calibration_ns, 2),
+            "results": {name: r.to_dict() for name, r in self.results.items()},
+        }
+
+    def dump(self, path: Path) -> None:
+        """結果を JSON ファイルに書き出す."""
+        text = json.dumps(self.to_dict(), indent=2, sort_keys=True)
+        path.write_text(text + "\n", encoding="utf-8")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkReport:
+        """to_dict() 形式の dict から復元する.
+
+        Raises:
+            ValueError: スキーマバージョンが一致しない場合.
+        """
+        if data.get("schema") != SCHEMA_VERSION:
+            msg = f"Unsupported benchmark schema: {data.get('schema')!r}"
+            raise ValueError(msg)
+        results = {
+            name: BenchmarkResult(
+                name=name,
+                ns_per_op=float(r["ns_per_op"]),
+                p50_ns=float(r["p50_ns"]),
+                p99_ns=float(r["p99_ns"]),
+                samples=int(r["samples"]),
+                inner_loops=int(r["inner_loops"]),
+            )
+            for name, r in data["results"].items()
+        }
+        return cls(
+            calibration_ns=float(data["calibration_ns"]),
+            results=results,
+            environment=dict(data.get("environment", {})),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkReport:
+        """JSON ファイルから読み込む."""
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+class ComparisonStatus(Enum):
+    """ベースライン比較の判定."""
+
+    OK = "ok"
+    """許容幅内."""
+
+    REGRESSION = "regression"
+    """許容幅を超えて遅くなった."""
+
+    IMPROVED = "improved"
+    """許容幅を超えて速くなった."""
+
+    NEW = "new"
+    """ベースラインに存在しないケース."""
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """ベースラインとの比較結果.
+
+    Attributes:
+        name: ケース名.
+        status: 判定.
+        ratio: 正規化後の現在値 / ベースライン値 (NEW の場合は None).
+    """
+
+    name: str
+    status: ComparisonStatus
+    ratio: float | None
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """ソート済みリストの fraction 分位点を返す (最近傍法)."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _time_batch(func: Callable[[], object], loops: int) -> int:
+    """func を loops 回呼び出した所要時間 (ナノ秒) を返す."""
+    iterator = range(loops)
+    start = time.perf_counter_ns()
+    for _ in iterator:
+        func()
+    return time.perf_counter_ns() - start
+
+
+def _calibrate_loops(func: Callable[[], object], sample_time_ns: int) -> int:
+    """1サンプルが sample_time_ns 以上になる呼び出し回数を求める."""
+    loops = 1
+    while True:
+        if _time_batch(func, loops) >= sample_time_ns:
+            return loops
+        loops *= 2
+
+
+def _calibration_workload() -> int:
+    """マシン性能の基準となる固定ワークロード."""
+    total = 0
+    for i in range(_CALIBRATION_LOOPS):
+        total += len(str(i))
+    return total
+
+
+def measure_calibration() -> float:
+    """キャリブレーションワークロードの所要時間 (最小値, ナノ秒) を返す."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return float(
+            min(
+                _time_batch(_calibration_workload, 1)
+                for _ in range(_CALIBRATION_SAMPLES)
+            )
+        )
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def run_case(
+    case: BenchmarkCase,
+    *,
+    samples: int = DEFAULT_SAMPLES,
+    sample_time_ns: int = DEFAULT_SAMPLE_TIME_NS,
+) -> BenchmarkResult:
+    """1ケースを計測する.
+
+    計測中は timeit と同様に GC を無効化する。
+
+    Args:
+        case: ベンチマークケース.
+        samples: サンプル数.
+        sample_time_ns: 1サンプルあたりの目標時間 (ナノ秒).
+
+    Returns:
+        計測結果.
+    """
+    func = case.setup()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = _calibrate_loops(func, sample_time_ns)
+        per_op = sorted(_time_batch(func, loops) / loops for _ in range(samples))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if case.teardown is not None:
+            case.teardown()
+    return BenchmarkResult(
+        name=case.name,
+        ns_per_op=sum(per_op) / len(per_op),
+        p50_ns=_percentile(per_op, 0.50),
+        p99_ns=_percentile(per_op, 0.99),
+        samples=samples,
+        inner_loops=loops,
+    )
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase],
+    *,
+    samples: int = DEFAULT_SAMPLES,
+    sample_time_ns: int = DEFAULT_SAMPLE_TIME_NS,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> BenchmarkReport:
+    """複数ケースを計測してレポートを返す.
+
+    Args:
+        cases: ベンチマークケース.
+        samples: ケースごとのサンプル数.
+        sample_time_ns: 1サンプルあたりの目標時間 (ナノ秒).
+        progress: ケース完了ごとに呼ばれるコールバック.
+
+    Returns:
+        ベンチマークレポート.
+    """
+    report = BenchmarkReport(
+        calibration_ns=measure_calibration(),
+        environment={
+            "python": platform.python_version(),
+            "implementation": sys.implementation.name,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+    )
+    for case in cases:
+        result = run_case(case, samples=samples, sample_time_ns=sample_time_ns)
+        report.results[case.name] = result
+        if progress is not None:
+            progress(result)
+    return report
+
+
+def compare_reports(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Comparison]:
+    """現在の結果をベースラインと比較する.
+
+    外れ値の影響を抑えるため各ケースの p50 で比較する。
+    p50 をそれぞれのキャリブレーション値で割って正規化し、
+    その比が 1 + tolerance を超えれば REGRESSION、
+    1 - tolerance を下回れば IMPROVED と判定する。
+
+    Args:
+        current: 現在の計測結果.
+        baseline: ベースライン.
+        tolerance: 許容幅 (0.25 = 25%).
+
+    Returns:
+        current の各ケースの比較結果.
+
+    Raises:
+        ValueError: tolerance が負の場合.
+    """
+    if tolerance < 0:
+        msg = f"tolerance must be non-negative: {tolerance}"
+        raise ValueError(msg)
+
+    scale = baseline.calibration_ns / current.calibration_ns
+    comparisons: list[Comparison] = []
+    for name, result in current.results.items():
+        base = baseline.results.get(name)
+        if base is None:
+            comparisons.append(Comparison(name, ComparisonStatus.NEW, None))
+            continue
+        ratio = result.p50_ns * scale / base.p50_ns
+        if ratio > 1 + tolerance:
+            status = ComparisonStatus.REGRESSION
+        elif ratio < 1 - tolerance:
+            status = ComparisonStatus.IMPROVED
+        else:
+            status = ComparisonStatus.OK
+        comparisons.append(Comparison(name, status, ratio))
+    return comparisons
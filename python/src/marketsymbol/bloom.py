@@ -0,0 +1,273 @@
+"""巨大なシンボルの集合に対する確率的なメンバーシップ判定 (Bloom フィルター).
+
+SymbolBloomFilter は取引対象の銘柄 (数千万件) のような集合を、1件あたり
+約 10 ビット (誤検出率 1% の場合) のビット列で表す。``in`` は集合に含まれる
+シンボルに対して必ず True を返し、含まれないシンボルに対しては誤検出率の
+確率で True を返す (偽陰性はない)。fallback に正確な集合 (SymbolSet など) を
+指定すると、フィルターが True を返した場合のみその集合で確認する。
+
+ハッシュはプロセス・プラットフォームによらず同じ値となる (PYTHONHASHSEED に
+依存しない)。シンボルの正規の文字列表現の UTF-8 バイト列の BLAKE2b
+(digest_size=16) を下位・上位 8 バイトずつ little endian の整数 h1, h2 とし、
+i 番目 (0 始まり) のビット位置を ``(h1 + i * (h2 | 1)) % ビット数`` とする
+(二重ハッシュ)。ビット位置 p はビット列の ``p // 8`` バイト目の
+``1 << (p % 8)`` のビットとなる。
+
+ビット列は16バイトのヘッダー (マジック ``b"MSBF"``、バージョン、ハッシュ数、
+ビット数) に続けて1つのバッファに保持する。buffer のバイト列をファイルや
+共有メモリ (multiprocessing.shared_memory、mmap) に書き出し、各プロセスで
+from_buffer によりコピーせずに参照できる。
+
+ASCII のシンボル文字列の判定はパースせずに正規の文字列表現を求める。
+大文字変換と前後の空白の除去 (NFKC 正規化は ASCII を変えない) に加え、
+strike は parse_symbol と同じく int() で変換した値とする (``+42000``、
+``4_2000``、``042000`` は ``42000``)。ASCII 以外の文字列は parse_symbol で
+パースする。無効なシンボル文字列は集合に含まれないシンボルとして扱う
+(ASCII の場合は誤検出率の確率で True となる)。
+
+Example:
+    >>> from marketsymbol import SymbolBloomFilter
+    >>> bloom = SymbolBloomFilter.from_symbols(
+    ...     ["XJPX:7203", "XJPX:N225O:20250314:C:42000"], error_rate=0.001
+    ... )
+    >>> "xjpx:7203" in bloom
+    True
+    >>> "XJPX:N225O:20250314:C:042000" in bloom
+    True
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from hashlib import blake2b as _blake2b
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.errors import SymbolError
+from marketsymbol.parser import _OPTION_SEGMENT_COUNT, parse_symbol
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Container, Iterable
+
+    from marketsymbol.symbol import Symbol
+
+# 誤検出率の既定値
+ERROR_RATE: Final = 0.01
+
+# ヘッダー: マジック, バージョン, ハッシュ数, 予約 (2バイト), ビット数
+_HEADER = struct.Struct("<4sBBxxQ")
+_MAGIC = b"MSBF"
+_VERSION = 1
+
+# 128 ビットのハッシュ値から h1 を取り出すマスク
+_LOW_MASK = (1 << 64) - 1
+
+# ハッシュ数の上限 (ヘッダーの1バイト)
+_MAX_HASHES = 255
+
+_SYMBOL_TYPES = (EquitySymbol, FutureSymbol, OptionSymbol)
+
+
+class SymbolBloomFilter:
+    """シンボルの集合を表す Bloom フィルター.
+
+    生成は from_symbols (要素から大きさを決める)、コンストラクタ (容量を指定)、
+    from_buffer (書き出したバイト列を参照) のいずれかで行う。
+    """
+
+    __slots__ = ("_bit_count", "_bits", "_buffer", "_fallback", "_hash_count")
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        error_rate: float = ERROR_RATE,
+        fallback: Container[object] | None = None,
+    ) -> None:
+        """capacity 件で誤検出率が error_rate となる空のフィルターを生成する.
+
+        Args:
+            capacity: 登録する件数の見込み (超えると誤検出率が上がる)
+            error_rate: capacity 件を登録した時点の誤検出率 (0 より大きく 1 未満)
+            fallback: フィルターが True を返した場合に確認する正確な集合。
+                正規の文字列表現で判定する (SymbolSet、正規の文字列表現の set など)。
+
+        Raises:
+            ValueError: capacity が 1 未満、または error_rate が範囲外の場合
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            msg = "capacity must be >= 1 and error_rate must be between 0 and 1"
+            raise ValueError(msg)
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        bit_count = -(-bit_count // 8) * 8
+        hash_count = min(_MAX_HASHES, max(1, round(bit_count / capacity * math.log(2))))
+        buffer = bytearray(_HEADER.size + bit_count // 8)
+        _HEADER.pack_into(buffer, 0, _MAGIC, _VERSION, hash_count, bit_count)
+        self._attach(memoryview(buffer), fallback)
+
+    @classmethod
+    def from_symbols(
+        cls,
+        symbols: Iterable[Symbol | str],
+        *,
+        error_rate: float = ERROR_RATE,
+        fallback: Container[object] | None = None,
+    ) -> SymbolBloomFilter:
+        """symbols を登録したフィルターを生成する (容量は symbols の件数).
+
+        Raises:
+            SymbolParseError: 無効なシンボル文字列を含む場合
+        """
+        items = symbols if isinstance(symbols, list | tuple) else list(symbols)
+        bloom = cls(max(1, len(items)), error_rate=error_rate, fallback=fallback)
+        bloom.update(items)
+        return bloom
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: Buffer, *, fallback: Container[object] | None = None
+    ) -> SymbolBloomFilter:
+        """書き出したバイト列 (buffer の内容) を参照するフィルターを生成する.
+
+        buffer はコピーしない。bytes や読み取り専用の mmap の場合は add できない。
+
+        Args:
+            buffer: ヘッダーとビット列 (bytes, bytearray, mmap, 共有メモリの buf など)
+            fallback: フィルターが True を返した場合に確認する正確な集合
+
+        Raises:
+            ValueError: ヘッダーが不正、または buffer の長さがビット数と一致しない場合
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < _HEADER.size:
+            msg = "buffer is too short for a SymbolBloomFilter header"
+            raise ValueError(msg)
+        magic, version, hash_count, bit_count = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            msg = f"Not a SymbolBloomFilter buffer (magic {magic!r}, version {version})"
+            raise ValueError(msg)
+        if (
+            hash_count < 1
+            or bit_count < 1
+            or len(view) != _HEADER.size + bit_count // 8
+        ):
+            msg = f"Invalid SymbolBloomFilter buffer size: {len(view)} bytes"
+            raise ValueError(msg)
+        bloom = cls.__new__(cls)
+        bloom._attach(view, fallback)
+        return bloom
+
+    def _attach(self, view: memoryview, fallback: Container[object] | None) -> None:
+        """ヘッダーとビット列のバッファを設定する."""
+        hash_count: int
+        bit_count: int
+        _, _, hash_count, bit_count = _HEADER.unpack_from(view)
+        self._hash_count = hash_count
+        self._bit_count = bit_count
+        self._buffer = view
+        self._bits = view[_HEADER.size :]
+        self._fallback = fallback
+
+    @property
+    def buffer(self) -> memoryview:
+        """ヘッダーとビット列のバッファ (from_buffer で復元できる)."""
+        return self._buffer
+
+    @property
+    def bit_count(self) -> int:
+        """ビット数."""
+        return self._bit_count
+
+    @property
+    def hash_count(self) -> int:
+        """1件あたりに設定・確認するビットの数."""
+        return self._hash_count
+
+    def add(self, item: Symbol | str) -> None:
+        """Symbol またはシンボル文字列を登録する.
+
+        Raises:
+            SymbolParseError: 無効なシンボル文字列の場合
+            TypeError: Symbol・str 以外の場合
+        """
+        if isinstance(item, str):
+            item = parse_symbol(item)
+        elif not isinstance(item, _SYMBOL_TYPES):
+            msg = f"Expected Symbol or str, got {type(item).__name__}"
+            raise TypeError(msg)
+        bits = self._bits
+        for position in self._positions(str(item)):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, items: Iterable[Symbol | str]) -> None:
+        """複数の Symbol またはシンボル文字列を登録する."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: object) -> bool:
+        """集合に含まれる可能性があるかを返す (fallback がある場合は正確な判定).
+
+        Symbol・str 以外は False を返す。
+        """
+        if isinstance(item, str):
+            text = _canonical_text(item)
+            if text is None:
+                return False
+        elif isinstance(item, _SYMBOL_TYPES):
+            text = str(item)
+        else:
+            return False
+        # 未登録のシンボルの大半は最初の数ビットで判定できるため、位置を順に求める
+        h1, h2 = _hashes(text)
+        bits = self._bits
+        bit_count = self._bit_count
+        for _ in range(self._hash_count):
+            position = h1 % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            h1 += h2
+        return self._fallback is None or text in self._fallback
+
+    def __reduce__(self) -> tuple[object, ...]:
+        """pickle ではバッファの内容をコピーする (共有する場合は from_buffer を使う)."""
+        return _restore, (bytes(self._buffer), self._fallback)
+
+    def _positions(self, text: str) -> list[int]:
+        """正規の文字列表現のビット位置を返す."""
+        h1, h2 = _hashes(text)
+        bit_count = self._bit_count
+        return [(h1 + i * h2) % bit_count for i in range(self._hash_count)]
+
+
+def _restore(data: bytes, fallback: Container[object] | None) -> SymbolBloomFilter:
+    """pickle したフィルターを書き込み可能なバッファに復元する."""
+    return SymbolBloomFilter.from_buffer(bytearray(data), fallback=fallback)
+
+
+def _hashes(text: str) -> tuple[int, int]:
+    """正規の文字列表現の二重ハッシュの h1, h2 (h2 は奇数) を返す."""
+    value = int.from_bytes(_blake2b(text.encode(), digest_size=16).digest(), "little")
+    return value & _LOW_MASK, value >> 64 | 1
+
+
+def _canonical_text(raw: str) -> str | None:
+    """シンボル文字列の正規の文字列表現を返す.
+
+    ASCII の文字列は NFKC 正規化とフィールドの検査を省略し、strike のみ
+    parse_symbol と同じく int() で変換する。ASCII 以外の文字列はパースし、
+    無効な場合は None を返す。
+    """
+    if not raw.isascii():
+        try:
+            return str(parse_symbol(raw))
+        except SymbolError:
+            return None
+    text = raw.strip().upper()
+    if text.count(":") == _OPTION_SEGMENT_COUNT - 1:
+        head, _, strike = text.rpartition(":")
+        try:
+            return f"{head}:{int(strike)}"
+        except ValueError:
+            return text
+    return text
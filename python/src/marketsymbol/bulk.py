@@ -0,0 +1,181 @@
+"""大量のシンボル文字列の一括バリデーション.
+
+validate_symbols は各行の判定結果を ErrorCode の序数 (0 は有効) の
+array('B') として返す。Symbol オブジェクトの生成と例外の送出を行わないため、
+parse_symbol を try/except で呼び出すより高速で、1行あたり1バイトで保持できる。
+
+判定は parse_symbol と同じ正規化・検査 (parser の _normalize, _segment_failure)
+を共有するため、エラーコードは parse_symbol が送出する
+SymbolParseError.error_code と一致する。
+
+序数の対応:
+
+- エラーコード: 0 = 有効、n = E00n (例: E007 -> 7)
+- 資産クラス: 0 = なし (無効な行)、1 = equity、2 = future、3 = option
+
+Example:
+    >>> from marketsymbol import ErrorCode, validate_symbols
+    >>> result = validate_symbols(["XJPX:7203", "XX:7203"])
+    >>> list(result.error_codes)
+    [0, 7]
+    >>> result.error_code(1) is ErrorCode.UNKNOWN_EXCHANGE
+    True
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.enums import AssetClass
+from marketsymbol.errors import ErrorCode
+from marketsymbol.parser import _normalize, _segment_failure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# 有効な行のエラーコード序数
+VALID: Final = 0
+
+# 序数 -> ErrorCode (インデックス 0 は有効を表す None)
+ERROR_CODES: Final[tuple[ErrorCode | None, ...]] = (
+    None,
+    *sorted(ErrorCode, key=lambda code: int(code.value[1:])),
+)
+
+# 序数 -> AssetClass (インデックス 0 は無効な行を表す None)
+ASSET_CLASSES: Final[tuple[AssetClass | None, ...]] = (
+    None,
+    AssetClass.EQUITY,
+    AssetClass.FUTURE,
+    AssetClass.OPTION,
+)
+
+_ERROR_ORDINALS = {code: i for i, code in enumerate(ERROR_CODES) if code is not None}
+_TOO_LONG = _ERROR_ORDINALS[ErrorCode.SYMBOL_TOO_LONG]
+_EMPTY = _ERROR_ORDINALS[ErrorCode.INVALID_SEGMENT_COUNT]
+_EQUITY = ASSET_CLASSES.index(AssetClass.EQUITY)
+_FUTURE = ASSET_CLASSES.index(AssetClass.FUTURE)
+_OPTION = ASSET_CLASSES.index(AssetClass.OPTION)
+
+# 株式のセグメント数
+_EQUITY_SEGMENT_COUNT = 2
+
+
+@dataclass(frozen=True, slots=True)
+class BulkValidationResult:
+    """validate_symbols の結果.
+
+    Attributes:
+        error_codes: 行ごとのエラーコード序数 (0 は有効).
+        asset_classes: 行ごとの資産クラス序数 (0 は無効な行)。
+            validate_symbols(..., asset_classes=False) の場合は None.
+    """
+
+    error_codes: array[int]
+    asset_classes: array[int] | None
+
+    def __len__(self) -> int:
+        """行数を返す."""
+        return len(self.error_codes)
+
+    @property
+    def valid_count(self) -> int:
+        """有効な行数を返す."""
+        return self.error_codes.count(VALID)
+
+    @property
+    def invalid_count(self) -> int:
+        """無効な行数を返す."""
+        return len(self.error_codes) - self.valid_count
+
+    def is_valid(self, index: int) -> bool:
+        """index 行目が有効かどうかを返す."""
+        return self.error_codes[index] == VALID
+
+    def error_code(self, index: int) -> ErrorCode | None:
+        """index 行目のエラーコードを返す (有効な行は None)."""
+        return ERROR_CODES[self.error_codes[index]]
+
+    def asset_class(self, index: int) -> AssetClass | None:
+        """index 行目の資産クラスを返す (無効な行は None).
+
+        Raises:
+            ValueError: 資産クラスを記録していない場合.
+        """
+        if self.asset_classes is None:
+            msg = "asset classes were not recorded (use asset_classes=True)"
+            raise ValueError(msg)
+        return ASSET_CLASSES[self.asset_classes[index]]
+
+    def error_counts(self) -> dict[ErrorCode, int]:
+        """ErrorCode 別の無効な行数を返す (0 件のコードは含まない)."""
+        counts: dict[ErrorCode, int] = {}
+        for ordinal, code in enumerate(ERROR_CODES):
+            if code is not None:
+                count = self.error_codes.count(ordinal)
+                if count:
+                    counts[code] = count
+        return counts
+
+    def invalid_indices(self) -> list[int]:
+        """無効な行のインデックスを昇順で返す."""
+        return [i for i, ordinal in enumerate(self.error_codes) if ordinal]
+
+
+def validate_symbols(
+    symbols: Iterable[str], *, asset_classes: bool = False
+) -> BulkValidationResult:
+    """シンボル文字列を一括でバリデーションする.
+
+    各行の判定は parse_symbol と一致する (有効/無効、エラーコード、資産クラス)。
+    Symbol オブジェクトの生成と SymbolParseError の送出は行わない。
+
+    Args:
+        symbols: シンボル文字列のイテラブル (ストリームでも可).
+        asset_classes: True の場合、有効な行の資産クラスも記録する.
+
+    Returns:
+        行ごとの判定結果.
+
+    Raises:
+        TypeError: str 以外の要素が含まれる場合 (parse_symbol と同様).
+    """
+    codes = array("B")
+    tags = array("B") if asset_classes else None
+    add_code = codes.append
+    add_tag = tags.append if tags is not None else None
+    normalize = _normalize
+    segment_failure = _segment_failure
+    ordinals = _ERROR_ORDINALS
+
+    for raw in symbols:
+        if not isinstance(raw, str):
+            raise TypeError(f"Expected str, got {type(raw).__name__}")
+        if len(raw) > MAX_SYMBOL_LENGTH:
+            code = _TOO_LONG
+        else:
+            normalized = normalize(raw)
+            if not normalized:
+                code = _EMPTY
+            else:
+                segments = normalized.split(":")
+                failure = segment_failure(segments)
+                if failure is None:
+                    add_code(VALID)
+                    if add_tag is not None:
+                        if len(segments) == _EQUITY_SEGMENT_COUNT:
+                            add_tag(_EQUITY)
+                        elif segments[3] == "F":
+                            add_tag(_FUTURE)
+                        else:
+                            add_tag(_OPTION)
+                    continue
+                code = ordinals[failure.error_code]
+        add_code(code)
+        if add_tag is not None:
+            add_tag(0)
+
+    return BulkValidationResult(codes, tags)
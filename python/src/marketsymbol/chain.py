@@ -0,0 +1,173 @@
+"""オプションチェーン向けの接頭辞メモ化パーサー.
+
+オプションチェーンのスナップショットでは、``XJPX:N225O:20250314:`` のように
+取引所・コード・限月が共通で、タイプと strike のみが異なるシンボルが連続する。
+ChainParser は直近に検査した (exchange, code, expiry) の接頭辞を小さなキャッシュに
+保持し、ヒットした場合はタイプ識別子と strike のみを検査する。
+
+結果 (Symbol の値・エラーコード・メッセージ) は parse_symbol と一致する。
+接頭辞が検査済みのため、parse_symbol の検査順序でも最初に失敗しうるのは
+タイプ識別子と strike のみとなる。ヒット時は Symbol の __post_init__ による
+再検査も省く (pickle からの復元と同じく、検査済みの値を直接設定する)。
+
+メトリクス計測 (metrics) またはトレーシング (tracing) が有効な場合は
+parse_symbol に委譲し、計測に含める (キャッシュは使わない)。
+
+Example:
+    >>> from marketsymbol import ChainParser
+    >>> parser = ChainParser()
+    >>> symbols = parser.parse_all(
+    ...     ["XJPX:N225O:20250314:C:42000", "XJPX:N225O:20250314:P:42000"]
+    ... )
+    >>> parser.hits, parser.misses
+    (1, 1)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.constants import MIN_STRIKE
+from marketsymbol.instrumentation import INSTRUMENTATION
+from marketsymbol.parser import (
+    _build_symbol,
+    _check_input,
+    _future,
+    _normalize,
+    _option,
+    _segment_failure,
+    _split,
+    _type_failure,
+    parse_symbol,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marketsymbol.symbol import Symbol
+
+# 既定で保持する接頭辞の数 (同時に流れる限月・原資産の数を想定)
+DEFAULT_CAPACITY: Final = 16
+
+# セグメント数の定数
+_EQUITY_SEGMENT_COUNT = 2
+_FUTURE_SEGMENT_COUNT = 4
+_OPTION_SEGMENT_COUNT = 5
+
+
+class ChainParser:
+    """接頭辞 (exchange, code, expiry) の検査結果をメモ化するパーサー.
+
+    キャッシュは登録順に最大 capacity 件を保持し、超えた場合は
+    最も古い接頭辞を破棄する。1つのフィードを1スレッドで処理する用途を想定し、
+    スレッド間では共有しない。
+    """
+
+    __slots__ = ("_capacity", "_prefixes", "hits", "misses")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """空のキャッシュでパーサーを生成する.
+
+        Args:
+            capacity: 保持する接頭辞の最大数.
+
+        Raises:
+            ValueError: capacity が1未満の場合.
+        """
+        if capacity < 1:
+            msg = f"capacity must be >= 1, got {capacity}"
+            raise ValueError(msg)
+        self._capacity = capacity
+        # (exchange, code, expiry) -> 検査済みの (exchange, code, expiry)
+        self._prefixes: dict[tuple[str, str, str], tuple[str, str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """保持している接頭辞の数を返す."""
+        return len(self._prefixes)
+
+    @property
+    def capacity(self) -> int:
+        """保持する接頭辞の最大数を返す."""
+        return self._capacity
+
+    def parse(self, raw: str) -> Symbol:
+        """シンボル文字列をパースする (parse_symbol と同じ結果).
+
+        Raises:
+            TypeError: raw が str でない場合.
+            SymbolParseError: パース失敗時.
+        """
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return parse_symbol(raw)
+        _check_input(raw)
+        segments = _split(_normalize(raw), raw)
+        count = len(segments)
+        if count in (_OPTION_SEGMENT_COUNT, _FUTURE_SEGMENT_COUNT):
+            prefix = self._prefixes.get((segments[0], segments[1], segments[2]))
+            if prefix is not None:
+                self.hits += 1
+                return _build_from_prefix(prefix, segments, raw)
+
+        self.misses += 1
+        failure = _segment_failure(segments)
+        if failure is not None:
+            raise failure.to_parse_error(raw)
+        symbol = _build_symbol(segments)
+        if count != _EQUITY_SEGMENT_COUNT:
+            self._remember((segments[0], segments[1], segments[2]))
+        return symbol
+
+    def parse_all(self, raws: Iterable[str]) -> list[Symbol]:
+        """各シンボル文字列をパースしたリストを返す.
+
+        Raises:
+            TypeError: str 以外の要素が含まれる場合.
+            SymbolParseError: いずれかのパースに失敗した場合.
+        """
+        parse = self.parse
+        return [parse(raw) for raw in raws]
+
+    def clear(self) -> None:
+        """キャッシュした接頭辞と統計をすべて破棄する."""
+        self._prefixes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, prefix: tuple[str, str, str]) -> None:
+        """検査済みの接頭辞を登録し、容量を超えた分を古い順に破棄する."""
+        prefixes = self._prefixes
+        prefixes[prefix] = prefix
+        if len(prefixes) > self._capacity:
+            del prefixes[next(iter(prefixes))]
+
+
+def _build_from_prefix(
+    prefix: tuple[str, str, str], segments: list[str], raw: str
+) -> Symbol:
+    """検査済みの接頭辞と残りのセグメントから Symbol を生成する.
+
+    タイプ識別子と strike のみを parse_symbol と同じ規則で検査する。
+
+    Raises:
+        SymbolParseError: タイプ識別子・strike が不正な場合.
+    """
+    exchange, code, expiry = prefix
+    type_indicator = segments[3]
+    if len(segments) == _OPTION_SEGMENT_COUNT and type_indicator in ("C", "P"):
+        # チェーンの大半を占める C / P (strike あり) は int() の結果で直接判定する
+        try:
+            strike = int(segments[4])
+        except ValueError:
+            strike = 0
+        if strike >= MIN_STRIKE:
+            return _option(exchange, code, expiry, type_indicator, strike)
+
+    strike_str = segments[4] if len(segments) == _OPTION_SEGMENT_COUNT else None
+    failure = _type_failure(type_indicator, strike_str)
+    if failure is not None:
+        raise failure.to_parse_error(raw)
+    if type_indicator == "F":
+        return _future(exchange, code, expiry)
+    return _option(exchange, code, expiry, type_indicator, None)
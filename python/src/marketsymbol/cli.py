@@ -0,0 +1,716 @@
+"""marketsymbol コマンドラインツール.
+
+``marketsymbol <command> [FILE ...]`` で1行1シンボルのファイル (省略時・``-`` は
+標準入力) を処理し、結果を標準出力に書き出す。``marketsymbol --help`` で
+使い方を表示する。
+
+コマンド:
+
+- normalize: シンボル文字列を正規化する
+- validate: シンボル文字列を検査する (validate_symbols による一括検査)
+- parse: シンボル文字列をパースし、正規の文字列表現またはフィールドを出力する
+- convert: ベンダーアダプターでベンダー固有シンボルと統一シンボルを変換する
+- sort: シンボルを全順序で整列し、重複を除いて出力する (外部ソート)
+- diff: 2つのファイルを外部ソートし、追加・削除・変更なしのシンボルを出力する
+
+入力は CHUNK_LINES 行ずつのチャンクに分割して処理し、出力もチャンク単位で
+まとめて書き出す。``--jobs N`` ではチャンクを N 個のワーカープロセスに分配し、
+入力順に出力する (未処理のチャンクは ジョブ数 x 2 個までに制限するため、
+入力の大きさによらずメモリ使用量は一定)。
+
+出力形式 (``--format``):
+
+- text: 成功した行の結果のみを出力し、失敗した行は ``FILE:LINE: CODE: MESSAGE``
+  として標準エラー出力に書き出す
+- jsonl / csv: 全ての行を line, input, コマンドごとの列, error_code, message の
+  レコードとして出力する
+
+sort / diff は extsort モジュールで入力を --run-lines 行ずつのランに分けて整列・
+マージするため、メモリに収まらない大きさのファイルも扱える。diff の text 形式は
+``+SYMBOL`` (追加), ``-SYMBOL`` (削除), `` SYMBOL`` (変更なし) の行を出力する。
+
+最後に ErrorCode ごとの失敗件数を標準エラー出力に書き出し、失敗した行がある場合は
+終了コード 1 を返す。
+
+Example:
+    $ marketsymbol validate symbols.txt --jobs 8
+    $ cat symbols.txt | marketsymbol parse --format jsonl
+    $ marketsymbol convert --vendor mypackage.adapters:BloombergAdapter vendor.txt
+    $ marketsymbol diff --changes-only yesterday.txt today.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+from collections import Counter, deque
+from contextlib import ExitStack
+from importlib import import_module
+from importlib.metadata import entry_points
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from marketsymbol.adapter import BaseAdapter
+from marketsymbol.bulk import validate_symbols
+from marketsymbol.errors import REJECTED_ERRORS, FailureRecord, SymbolError
+from marketsymbol.extsort import (
+    ADDED,
+    REMOVED,
+    RUN_LINES,
+    UNCHANGED,
+    diff_symbols,
+    sort_symbols,
+)
+from marketsymbol.parser import normalize_symbol, parse_symbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from multiprocessing.pool import AsyncResult, Pool
+
+    from marketsymbol.extsort import SymbolChange
+
+# 1チャンクあたりの行数の既定値
+CHUNK_LINES: Final = 10_000
+
+# ベンダーアダプターを登録するエントリポイントのグループ名
+ADAPTER_ENTRY_POINT_GROUP: Final = "marketsymbol.adapters"
+
+# 入力ファイルの読み込みバッファのサイズ (バイト)
+_READ_BUFFER_SIZE = 1 << 20
+
+# 標準入力を表すファイル名
+_STDIN = "-"
+
+# ワーカー1つあたりの未処理チャンク数の上限
+_PENDING_PER_JOB = 2
+
+# JSON Lines のエンコーダー (json.dumps は呼び出しごとにエンコーダーを生成するため共有する)
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+# エラー集計のコード列の最小幅
+_SUMMARY_CODE_WIDTH = 6
+
+# 終了コード
+_EXIT_OK = 0
+_EXIT_FAILURES = 1
+_EXIT_USAGE = 2
+
+# diff の text 形式の差分の種類ごとの行頭の記号
+_DIFF_MARKS: Final = {ADDED: "+", REMOVED: "-", UNCHANGED: " "}
+
+# コマンド -> 出力列 (line, input, error_code, message を除く)
+_FIELDS: Final[dict[str, tuple[str, ...]]] = {
+    "normalize": ("normalized",),
+    "validate": ("valid",),
+    "parse": (
+        "symbol",
+        "asset_class",
+        "exchange",
+        "code",
+        "expiry",
+        "option_type",
+        "strike",
+    ),
+    "convert": ("output",),
+}
+
+
+class _LineError(NamedTuple):
+    """標準エラー出力に報告する失敗した行."""
+
+    line: int
+    failure: FailureRecord
+
+
+class _Job(NamedTuple):
+    """ワーカープロセスに渡す処理内容 (pickle 可能な値のみ)."""
+
+    command: str
+    output_format: str
+    vendor: str | None = None
+    from_symbol: bool = False
+
+
+class _Chunk(NamedTuple):
+    """入力のチャンク."""
+
+    source: str
+    start: int  # 先頭行の行番号 (1始まり)
+    lines: list[str]
+
+
+class _ChunkResult(NamedTuple):
+    """チャンクの処理結果."""
+
+    source: str
+    output: str
+    errors: list[_LineError]
+    counts: Counter[str]  # 失敗した行のコード別の件数
+    lines: int
+
+
+# 1行の処理結果 (出力列の値、または失敗)
+type _Outcome = tuple[object, ...] | FailureRecord
+
+
+def load_adapter(vendor: str) -> BaseAdapter:
+    """ベンダー名またはインポートパスからアダプターを読み込む.
+
+    Args:
+        vendor: ``marketsymbol.adapters`` エントリポイントの名前、または
+            ``module:attribute`` 形式のインポートパス。参照先が BaseAdapter の
+            サブクラスの場合は引数なしでインスタンス化する。
+
+    Returns:
+        アダプターインスタンス
+
+    Raises:
+        LookupError: エントリポイントが見つからない場合
+        ImportError: モジュールをインポートできない場合
+        AttributeError: モジュールに属性が存在しない場合
+        TypeError: 参照先が BaseAdapter でない場合
+    """
+    target: object
+    if ":" in vendor:
+        module_name, _, attribute = vendor.partition(":")
+        target = getattr(import_module(module_name), attribute)
+    else:
+        matches = entry_points(group=ADAPTER_ENTRY_POINT_GROUP, name=vendor)
+        if not matches:
+            msg = (
+                f"Unknown vendor: {vendor!r} (no {ADAPTER_ENTRY_POINT_GROUP!r} "
+                "entry point; use module:attribute to load an adapter directly)"
+            )
+            raise LookupError(msg)
+        target = matches[vendor].load()
+    adapter = target() if isinstance(target, type) else target
+    if not isinstance(adapter, BaseAdapter):
+        msg = f"{vendor!r} is not a BaseAdapter (got {type(adapter).__name__})"
+        raise TypeError(msg)
+    return adapter
+
+
+def _normalize_lines(lines: list[str]) -> list[_Outcome]:
+    """normalize: 正規化した文字列."""
+    return [(normalize_symbol(raw),) for raw in lines]
+
+
+def _validate_lines(lines: list[str]) -> list[_Outcome]:
+    """validate: 一括検査し、無効な行のみパースしてメッセージを得る."""
+    outcomes: list[_Outcome] = []
+    for raw, ordinal in zip(lines, validate_symbols(lines).error_codes, strict=True):
+        if not ordinal:
+            outcomes.append((True,))
+            continue
+        try:
+            parse_symbol(raw)
+        except SymbolError as e:
+            outcomes.append(FailureRecord.from_error(e))
+    return outcomes
+
+
+def _parse_lines(lines: list[str]) -> list[_Outcome]:
+    """parse: 正規の文字列表現とフィールド."""
+    outcomes: list[_Outcome] = []
+    for raw in lines:
+        try:
+            symbol = parse_symbol(raw)
+        except SymbolError as e:
+            outcomes.append(FailureRecord.from_error(e))
+            continue
+        option_type = getattr(symbol, "option_type", None)
+        outcomes.append(
+            (
+                str(symbol),
+                symbol.asset_class.value,
+                symbol.exchange,
+                symbol.code,
+                getattr(symbol, "expiry", None),
+                None if option_type is None else option_type.value,
+                getattr(symbol, "strike", None),
+            )
+        )
+    return outcomes
+
+
+def _converter(adapter: BaseAdapter, from_symbol: bool) -> Callable[[str], str]:
+    """convert の1行の変換関数を返す."""
+    if from_symbol:
+
+        def convert(raw: str) -> str:
+            symbol = parse_symbol(raw)
+            adapter.check_supported(symbol)
+            return adapter.from_symbol(symbol)
+
+        return convert
+    return lambda raw: str(adapter.to_symbol(raw))
+
+
+def _convert_lines(convert: Callable[[str], str], lines: list[str]) -> list[_Outcome]:
+    """convert: アダプターで変換した文字列 (アダプターの例外は失敗として記録)."""
+    outcomes: list[_Outcome] = []
+    for raw in lines:
+        try:
+            outcomes.append((convert(raw),))
+        except REJECTED_ERRORS as e:
+            outcomes.append(FailureRecord.from_error(e))
+    return outcomes
+
+
+class _Processor:
+    """チャンクを処理して出力形式の文字列にまとめる."""
+
+    def __init__(self, job: _Job) -> None:
+        """処理内容からコマンドの関数と出力列を決定する."""
+        self._format = job.output_format
+        self._fields = _FIELDS[job.command]
+        # 失敗した行の出力列の値 (validate は valid=false、他は空)
+        self._failed_values: tuple[object, ...] = (
+            (False,) if job.command == "validate" else (None,) * len(self._fields)
+        )
+        # text 形式で成功した行を出力するか (validate は失敗した行のみを報告する)
+        self._text_rows = job.command != "validate"
+        self._run: Callable[[list[str]], list[_Outcome]]
+        if job.command == "convert":
+            if job.vendor is None:
+                msg = "convert requires a vendor"
+                raise ValueError(msg)
+            convert = _converter(load_adapter(job.vendor), job.from_symbol)
+            self._run = lambda lines: _convert_lines(convert, lines)
+        else:
+            self._run = {
+                "normalize": _normalize_lines,
+                "validate": _validate_lines,
+                "parse": _parse_lines,
+            }[job.command]
+
+    def process(self, chunk: _Chunk) -> _ChunkResult:
+        """チャンクを処理する."""
+        outcomes = self._run(chunk.lines)
+        counts: Counter[str] = Counter(
+            outcome.code for outcome in outcomes if isinstance(outcome, FailureRecord)
+        )
+        errors: list[_LineError] = []
+        if self._format == "text":
+            rows: list[str] = []
+            for line, outcome in enumerate(outcomes, chunk.start):
+                if isinstance(outcome, FailureRecord):
+                    errors.append(_LineError(line, outcome))
+                elif self._text_rows:
+                    rows.append(f"{outcome[0]}\n")
+            output = "".join(rows)
+        else:
+            records = [
+                (line, raw, *self._failed_values, *outcome)
+                if isinstance(outcome, FailureRecord)
+                else (line, raw, *outcome, None, None)
+                for line, (raw, outcome) in enumerate(
+                    zip(chunk.lines, outcomes, strict=True), chunk.start
+                )
+            ]
+            output = self._jsonl(records) if self._format == "jsonl" else _csv(records)
+        return _ChunkResult(chunk.source, output, errors, counts, len(chunk.lines))
+
+    def _jsonl(self, records: list[tuple[object, ...]]) -> str:
+        """レコードを JSON Lines にする."""
+        header = _header(self._fields)
+        # 出力列の値は str / int / bool / None のみのため、既定の変換のみで足りる
+        return "".join(
+            f"{_encode_json(dict(zip(header, record, strict=True)))}\n"
+            for record in records
+        )
+
+
+def _header(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """jsonl / csv 形式の出力列の見出し."""
+    return ("line", "input", *fields, "error_code", "message")
+
+
+def _csv(records: Iterable[tuple[object, ...]]) -> str:
+    """レコードを CSV にする."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(records)
+    return buffer.getvalue()
+
+
+def _read_chunks(paths: list[str], chunk_lines: int) -> Iterator[_Chunk]:
+    """入力を chunk_lines 行ずつのチャンクとして読み込む (末尾の改行は除く)."""
+    for path in paths:
+        if path == _STDIN:
+            yield from _file_chunks("<stdin>", sys.stdin, chunk_lines)
+            continue
+        with Path(path).open(
+            encoding="utf-8", errors="replace", buffering=_READ_BUFFER_SIZE
+        ) as f:
+            yield from _file_chunks(path, f, chunk_lines)
+
+
+def _file_chunks(source: str, f: Iterable[str], chunk_lines: int) -> Iterator[_Chunk]:
+    """ファイルオブジェクトをチャンクに分割する."""
+    start = 1
+    lines = iter(f)
+    while chunk := [line.rstrip("\n") for line in islice(lines, chunk_lines)]:
+        yield _Chunk(source, start, chunk)
+        start += len(chunk)
+
+
+# ワーカープロセスの処理器 (_init_worker で初期化)
+_worker_processor: _Processor | None = None
+
+
+def _init_worker(job: _Job) -> None:
+    """ワーカープロセスの処理器を初期化する."""
+    global _worker_processor
+    _worker_processor = _Processor(job)
+
+
+def _process_in_worker(chunk: _Chunk) -> _ChunkResult:
+    """ワーカープロセスでチャンクを処理する."""
+    if _worker_processor is None:
+        msg = "worker is not initialized"
+        raise RuntimeError(msg)
+    return _worker_processor.process(chunk)
+
+
+def _run_parallel(
+    job: _Job, chunks: Iterable[_Chunk], jobs: int
+) -> Iterator[_ChunkResult]:
+    """チャンクをワーカープロセスで処理し、入力順に結果を返す."""
+    # spawn はマルチスレッドのプロセスからも安全に起動でき、全プラットフォームで同じ挙動
+    context = multiprocessing.get_context("spawn")
+    pool: Pool
+    with context.Pool(jobs, initializer=_init_worker, initargs=(job,)) as pool:
+        pending: deque[AsyncResult[_ChunkResult]] = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_process_in_worker, (chunk,)))
+            if len(pending) >= jobs * _PENDING_PER_JOB:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def _open_input(stack: ExitStack, name: str) -> tuple[str, Iterable[str]]:
+    """入力ファイルを開き、エラーの報告に使う入力名と行のイテラブルを返す."""
+    if name == _STDIN:
+        return "<stdin>", sys.stdin
+    path = Path(name)
+    return name, stack.enter_context(
+        path.open(encoding="utf-8", errors="replace", buffering=_READ_BUFFER_SIZE)
+    )
+
+
+class _ErrorReporter:
+    """sort / diff のパースできない行を集計し、標準エラー出力に報告する."""
+
+    def __init__(self, sources: dict[str, str], *, quiet: bool) -> None:
+        """extsort の入力名 -> 報告する入力名と、報告するかどうかを設定する."""
+        self.counts: Counter[str] = Counter()
+        self._sources = sources
+        self._quiet = quiet
+
+    def __call__(self, source: str, line: int, error: SymbolError) -> None:
+        """パースできない行を記録する."""
+        failure = FailureRecord.from_error(error)
+        self.counts[failure.code] += 1
+        if not self._quiet:
+            print(
+                f"{self._sources.get(source, source)}:{line}: "
+                f"{failure.code}: {failure.message}",
+                file=sys.stderr,
+            )
+
+
+def _run_sort(args: argparse.Namespace, stack: ExitStack) -> tuple[str, _ErrorReporter]:
+    """sort: 入力を整列して出力し、集計の文と失敗の記録を返す."""
+    source, lines = _open_input(stack, args.file)
+    reporter = _ErrorReporter({}, quiet=args.quiet)
+    symbols = sort_symbols(
+        lines,
+        run_lines=args.run_lines,
+        tmpdir=args.tmpdir,
+        source=source,
+        on_error=reporter,
+    )
+    written = 0
+    out = sys.stdout
+    for symbol in symbols:
+        out.write(f"{symbol}\n")
+        written += 1
+    return f"{written:,} symbols", reporter
+
+
+def _run_diff(args: argparse.Namespace, stack: ExitStack) -> tuple[str, _ErrorReporter]:
+    """diff: 2つの入力の差分を出力し、集計の文と失敗の記録を返す."""
+    old_source, old = _open_input(stack, args.old)
+    new_source, new = _open_input(stack, args.new)
+    reporter = _ErrorReporter({"old": old_source, "new": new_source}, quiet=args.quiet)
+    changes = diff_symbols(
+        old,
+        new,
+        unchanged=not args.changes_only,
+        run_lines=args.run_lines,
+        tmpdir=args.tmpdir,
+        on_error=reporter,
+    )
+    counts: Counter[str] = Counter()
+    out = sys.stdout
+    if args.format == "csv":
+        out.write(_csv([("status", "symbol")]))
+    change: SymbolChange
+    for change in changes:
+        counts[change.status] += 1
+        if args.format == "text":
+            out.write(f"{_DIFF_MARKS[change.status]}{change.symbol}\n")
+        elif args.format == "jsonl":
+            out.write(
+                f"{_encode_json({'status': change.status, 'symbol': change.symbol})}\n"
+            )
+        else:
+            out.write(_csv([(change.status, change.symbol)]))
+    summary = ", ".join(
+        f"{counts[status]:,} {status}" for status in (ADDED, REMOVED, UNCHANGED)
+    )
+    return summary, reporter
+
+
+def _output_error(error: OSError) -> int:
+    """入出力のエラーを報告し、終了コードを返す."""
+    if isinstance(error, BrokenPipeError):
+        # 出力先が閉じられた (例: head へのパイプ): 終了時のフラッシュで再発させない
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return _EXIT_FAILURES
+    print(f"marketsymbol: error: {error}", file=sys.stderr)
+    return _EXIT_USAGE
+
+
+def _main_external(args: argparse.Namespace) -> int:
+    """sort / diff コマンドを実行する."""
+    run = _run_sort if args.command == "sort" else _run_diff
+    try:
+        with ExitStack() as stack:
+            summary, reporter = run(args, stack)
+        sys.stdout.flush()
+    except OSError as e:
+        return _output_error(e)
+    counts = reporter.counts
+    if not args.quiet:
+        print(
+            f"marketsymbol {args.command}: {summary}, {counts.total():,} failed",
+            file=sys.stderr,
+        )
+        _print_error_counts(counts)
+    return _EXIT_FAILURES if counts else _EXIT_OK
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを構築する."""
+    parser = argparse.ArgumentParser(
+        prog="marketsymbol",
+        description="Normalize, validate, parse and convert market symbols",
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "files",
+        nargs="*",
+        default=[_STDIN],
+        metavar="FILE",
+        help="input files with one symbol per line ('-' or none: stdin)",
+    )
+    common.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "jsonl", "csv"),
+        default="text",
+        help="output format (default: %(default)s)",
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="worker processes; 0 uses all CPUs (default: %(default)s)",
+    )
+    common.add_argument(
+        "--chunk-lines",
+        type=int,
+        default=CHUNK_LINES,
+        metavar="N",
+        help="lines per chunk of work (default: %(default)s)",
+    )
+    common.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="do not report failed lines or the error summary on stderr",
+    )
+    commands.add_parser("normalize", parents=[common], help="normalize symbol strings")
+    commands.add_parser(
+        "validate",
+        parents=[common],
+        help="validate symbol strings (text output prints failures only)",
+    )
+    commands.add_parser(
+        "parse", parents=[common], help="parse symbol strings into their fields"
+    )
+    convert = commands.add_parser(
+        "convert", parents=[common], help="convert symbols with a vendor adapter"
+    )
+    convert.add_argument(
+        "--vendor",
+        required=True,
+        metavar="NAME",
+        help=(
+            f"adapter name registered in the {ADAPTER_ENTRY_POINT_GROUP!r} "
+            "entry point group, or module:attribute"
+        ),
+    )
+    convert.add_argument(
+        "--from-symbol",
+        action="store_true",
+        help="convert unified symbols to vendor symbols (default: vendor to unified)",
+    )
+    external = argparse.ArgumentParser(add_help=False)
+    external.add_argument(
+        "--run-lines",
+        type=int,
+        default=RUN_LINES,
+        metavar="N",
+        help="input lines sorted in memory per run (default: %(default)s)",
+    )
+    external.add_argument(
+        "--tmpdir",
+        metavar="DIR",
+        help="directory for temporary run files (default: system temp directory)",
+    )
+    external.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="do not report failed lines or the summary on stderr",
+    )
+    sort = commands.add_parser(
+        "sort",
+        parents=[external],
+        help="sort symbols in canonical order and drop duplicates",
+    )
+    sort.add_argument(
+        "file",
+        nargs="?",
+        default=_STDIN,
+        metavar="FILE",
+        help="input file with one symbol per line ('-' or none: stdin)",
+    )
+    diff = commands.add_parser(
+        "diff",
+        parents=[external],
+        help="list symbols added to, removed from or kept in a symbol file",
+    )
+    diff.add_argument("old", metavar="OLD", help="old symbol file ('-': stdin)")
+    diff.add_argument("new", metavar="NEW", help="new symbol file ('-': stdin)")
+    diff.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "jsonl", "csv"),
+        default="text",
+        help="output format (default: %(default)s)",
+    )
+    diff.add_argument(
+        "--changes-only",
+        action="store_true",
+        help="omit symbols present in both files",
+    )
+    return parser
+
+
+def _print_summary(command: str, lines: int, counts: Counter[str]) -> None:
+    """行数・成功件数とコード別の失敗件数を標準エラー出力に書き出す."""
+    failed = counts.total()
+    print(
+        f"marketsymbol {command}: {lines:,} lines, {lines - failed:,} ok, "
+        f"{failed:,} failed",
+        file=sys.stderr,
+    )
+    _print_error_counts(counts)
+
+
+def _print_error_counts(counts: Counter[str]) -> None:
+    """コード別の失敗件数を標準エラー出力に書き出す."""
+    # ErrorCode のない例外のクラス名も揃えて表示する
+    width = max((_SUMMARY_CODE_WIDTH, *map(len, counts)))
+    for code, count in sorted(counts.items()):
+        print(f"  {code:<{width}} {count:>12,}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """コマンドラインツールを実行する.
+
+    Args:
+        argv: コマンドライン引数 (None の場合は sys.argv[1:]).
+
+    Returns:
+        終了コード (失敗した行がある場合は 1、引数・入力のエラーは 2).
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command in ("sort", "diff"):
+        if args.run_lines < 1:
+            parser.error("--run-lines must be >= 1")
+        return _main_external(args)
+    if args.jobs < 0 or args.chunk_lines < 1:
+        parser.error("--jobs must be >= 0 and --chunk-lines must be >= 1")
+    job = _Job(
+        args.command,
+        args.format,
+        getattr(args, "vendor", None),
+        getattr(args, "from_symbol", False),
+    )
+    jobs = args.jobs or os.cpu_count() or 1
+    chunks = _read_chunks(args.files, args.chunk_lines)
+    results: Iterable[_ChunkResult]
+    try:
+        # アダプターの読み込みエラーはワーカーの起動前に報告する
+        # (並列処理ではワーカーが読み込むため、ここでは読み込めることのみ検証する)
+        if jobs == 1:
+            results = map(_Processor(job).process, chunks)
+        else:
+            if job.vendor is not None:
+                load_adapter(job.vendor)
+            results = _run_parallel(job, chunks, jobs)
+    except (ImportError, AttributeError, LookupError, TypeError) as e:
+        parser.error(str(e))
+    out = sys.stdout
+    lines = 0
+    counts: Counter[str] = Counter()
+    try:
+        if args.format == "csv":
+            out.write(_csv([_header(_FIELDS[args.command])]))
+        for result in results:
+            out.write(result.output)
+            lines += result.lines
+            counts.update(result.counts)
+            if not args.quiet:
+                for error in result.errors:
+                    print(
+                        f"{result.source}:{error.line}: "
+                        f"{error.failure.code}: {error.failure.message}",
+                        file=sys.stderr,
+                    )
+        out.flush()
+    except OSError as e:
+        return _output_error(e)
+    if not args.quiet:
+        _print_summary(args.command, lines, counts)
+    return _EXIT_FAILURES if counts else _EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
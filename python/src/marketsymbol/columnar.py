@@ -0,0 +1,520 @@
+"""NumPy による列指向 (カラムナー) の一括パース.
+
+大量のシンボル文字列をパースし、フィールドごとの NumPy 配列として返す。
+Symbol オブジェクトは生成しない。NumPy はオプションの依存関係
+(``pip install marketsymbol[numpy]``) で、このモジュールを
+インポートしたときにのみ必要となる。
+
+列の値と判定は parse_symbol と一致する。ASCII のみで構成され、
+内部に空白を含まない行 (通常のシンボル) は文字コードの2次元配列に対する
+ベクトル演算で検査する (長さ・文字種・限月の数字/月/日・strike の数字)。
+それ以外の行 (全角文字、内部の空白、符号付きの strike など) は
+parse_symbol と同じ正規化・検査を1行ずつ適用する。
+
+列:
+
+- error_code (uint8): エラーコード序数 (0 = 有効, n = E00n)
+- asset_class (uint8): 資産クラス序数 (0 = 無効, 1 = equity, 2 = future, 3 = option)
+- exchange (str): 取引所コード (無効な行は空文字列)
+- code (str): 証券/商品コード (無効な行は空文字列)
+- expiry (datetime64[D]): 限月 (株式・無効な行は NaT)
+- option_type (U1): 'C' / 'P' / 'O' (株式・先物・無効な行は空文字列)
+- strike (int64): 権利行使価格 (strike なし・無効な行は 0)
+
+序数は marketsymbol.bulk の ERROR_CODES / ASSET_CLASSES と共通。
+
+Example:
+    >>> from marketsymbol.columnar import parse_columns
+    >>> columns = parse_columns(["XJPX:N225O:20250314:C:42000", "XX:7203"])
+    >>> columns["strike"].tolist()
+    [42000, 0]
+    >>> columns["error_code"].tolist()
+    [0, 7]
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    msg = (
+        "marketsymbol.columnar requires NumPy; "
+        "install it with 'pip install marketsymbol[numpy]'"
+    )
+    raise ImportError(msg) from e
+
+from marketsymbol.bulk import ASSET_CLASSES, ERROR_CODES
+from marketsymbol.constants import (
+    EXPIRY_LENGTH,
+    MAX_CODE_LENGTH,
+    MAX_SYMBOL_LENGTH,
+    MIC_LENGTH,
+    MIN_CODE_LENGTH,
+    MIN_STRIKE,
+)
+from marketsymbol.enums import AssetClass
+from marketsymbol.errors import ErrorCode
+from marketsymbol.parser import _normalize, _segment_failure
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+# 列名 (structured array のフィールド順)
+COLUMNS = (
+    "error_code",
+    "asset_class",
+    "exchange",
+    "code",
+    "expiry",
+    "option_type",
+    "strike",
+)
+
+_ERROR_ORDINALS = {code: i for i, code in enumerate(ERROR_CODES) if code is not None}
+_E001 = _ERROR_ORDINALS[ErrorCode.FUTURE_WITH_STRIKE]
+_E002 = _ERROR_ORDINALS[ErrorCode.OPTION_WITHOUT_STRIKE]
+_E003 = _ERROR_ORDINALS[ErrorCode.INVALID_EXPIRY_FORMAT]
+_E004 = _ERROR_ORDINALS[ErrorCode.INVALID_SEGMENT_COUNT]
+_E005 = _ERROR_ORDINALS[ErrorCode.INVALID_DATE]
+_E006 = _ERROR_ORDINALS[ErrorCode.INVALID_OPTION_TYPE]
+_E007 = _ERROR_ORDINALS[ErrorCode.UNKNOWN_EXCHANGE]
+_E008 = _ERROR_ORDINALS[ErrorCode.INVALID_CODE]
+_E009 = _ERROR_ORDINALS[ErrorCode.INVALID_STRIKE_VALUE]
+_E010 = _ERROR_ORDINALS[ErrorCode.SYMBOL_TOO_LONG]
+_EQUITY = ASSET_CLASSES.index(AssetClass.EQUITY)
+_FUTURE = ASSET_CLASSES.index(AssetClass.FUTURE)
+_OPTION = ASSET_CLASSES.index(AssetClass.OPTION)
+
+# str.strip() が除去する ASCII 空白文字
+_ASCII_WHITESPACE = np.array([9, 10, 11, 12, 13, 28, 29, 30, 31, 32], dtype=np.uint8)
+
+# ASCII 文字コード
+_ASCII_LIMIT = 0x80
+_COLON = ord(":")
+_ZERO, _NINE = ord("0"), ord("9")
+_UPPER_A, _UPPER_Z = ord("A"), ord("Z")
+_LOWER_A, _LOWER_Z = ord("a"), ord("z")
+_CASE_OFFSET = _LOWER_A - _UPPER_A
+_CALL, _PUT, _SERIES, _FUTURE_TYPE = (ord(c) for c in "CPOF")
+# int() が数字以外に受け付ける ASCII 文字 (1行ずつの検査に回す)
+_INT_SYMBOLS = np.array([ord(c) for c in "+-_"], dtype=np.uint8)
+
+# int64 に必ず収まる strike の桁数
+_MAX_VECTOR_STRIKE_DIGITS = 18
+
+# 平年の各月の日数 (インデックス 0 はダミー)
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_FEBRUARY = 2
+_MONTHS_PER_YEAR = 12
+
+# セグメント数
+_EQUITY_SEGMENTS = 2
+_FUTURE_SEGMENTS = 4
+_OPTION_SEGMENTS = 5
+
+
+def parse_columns(symbols: Sequence[str] | NDArray[Any]) -> dict[str, NDArray[Any]]:
+    """シンボル文字列を一括パースし、列名 -> 配列の dict を返す.
+
+    Args:
+        symbols: シンボル文字列のシーケンス、または NumPy の文字列配列
+            (dtype 'U' または ASCII/UTF-8 の固定長バイト列 'S')。
+            固定長配列の末尾の NUL は NumPy の仕様どおりパディングとして扱う。
+
+    Returns:
+        列名 (COLUMNS) -> 行数と同じ長さの配列.
+
+    Raises:
+        TypeError: str 以外の要素が含まれる場合 (parse_symbol と同様).
+        OverflowError: 有効な strike が int64 に収まらない場合.
+    """
+    texts, lengths, exact = _as_code_points(symbols)
+    rows = len(lengths)
+    columns = _Columns(rows)
+
+    # 長さが正確でない行の長さは1行ずつの検査で確認する
+    too_long = exact & (lengths > MAX_SYMBOL_LENGTH)
+    columns.error_code[too_long] = _E010
+    fallback = ~too_long & ~exact
+    if texts.shape[1]:
+        fallback |= ~too_long & (texts >= _ASCII_LIMIT).any(axis=1)
+    vector_rows = np.flatnonzero(~too_long & ~fallback)
+    if len(vector_rows):
+        width = min(texts.shape[1], MAX_SYMBOL_LENGTH)
+        chars = texts[vector_rows, :width].astype(np.uint8)
+        rejected = _parse_vectorized(chars, lengths[vector_rows], vector_rows, columns)
+        fallback[rejected] = True
+
+    for row in np.flatnonzero(fallback).tolist():
+        columns.parse_row(row, _decode(symbols, row))
+    return columns.to_dict()
+
+
+def parse_structured(symbols: Sequence[str] | NDArray[Any]) -> NDArray[Any]:
+    """シンボル文字列を一括パースし、structured array を返す.
+
+    フィールドは COLUMNS の順。値は parse_columns と同じ。
+    """
+    columns = parse_columns(symbols)
+    dtype = np.dtype([(name, columns[name].dtype) for name in COLUMNS])
+    result = np.empty(len(columns["error_code"]), dtype=dtype)
+    for name in COLUMNS:
+        result[name] = columns[name]
+    return result
+
+
+class _Columns:
+    """出力列のバッファ (文字列列は最後に文字列配列へ変換する)."""
+
+    def __init__(self, rows: int) -> None:
+        self.error_code = np.zeros(rows, dtype=np.uint8)
+        self.asset_class = np.zeros(rows, dtype=np.uint8)
+        self.exchange = np.zeros((rows, MIC_LENGTH), dtype=np.uint8)
+        self.code = np.zeros((rows, MAX_CODE_LENGTH), dtype=np.uint8)
+        self.expiry = np.full(rows, np.datetime64("NaT", "D"), dtype="datetime64[D]")
+        self.option_type = np.zeros(rows, dtype=np.uint8)
+        self.strike = np.zeros(rows, dtype=np.int64)
+        # 1行ずつ検査した行のうち、ASCII 固定幅で表せない値 (行 -> 値)
+        self.wide_exchange: dict[int, str] = {}
+        self.wide_code: dict[int, str] = {}
+
+    def parse_row(self, row: int, raw: str) -> None:
+        """parse_symbol と同じ正規化・検査で1行を処理する."""
+        if len(raw) > MAX_SYMBOL_LENGTH:
+            self.error_code[row] = _E010
+            return
+        normalized = _normalize(raw)
+        if not normalized:
+            self.error_code[row] = _E004
+            return
+        segments = normalized.split(":")
+        failure = _segment_failure(segments)
+        if failure is not None:
+            self.error_code[row] = _ERROR_ORDINALS[failure.error_code]
+            return
+
+        exchange, code = segments[0], segments[1]
+        self._set_text(self.exchange, self.wide_exchange, row, exchange)
+        self._set_text(self.code, self.wide_code, row, code)
+        if len(segments) == _EQUITY_SEGMENTS:
+            self.asset_class[row] = _EQUITY
+            return
+
+        expiry, type_indicator = segments[2], segments[3]
+        # 限月の数字は \d (ASCII 以外の数字を含む) で検査済みのため int() で変換する
+        year, month, day = int(expiry[:4]), int(expiry[4:6]), int(expiry[6:])
+        self.expiry[row] = np.datetime64(f"{year:04d}-{month:02d}-{day:02d}")
+        if type_indicator == "F":
+            self.asset_class[row] = _FUTURE
+            return
+        self.asset_class[row] = _OPTION
+        self.option_type[row] = ord(type_indicator)
+        if len(segments) == _OPTION_SEGMENTS:
+            strike = int(segments[4])
+            if strike > np.iinfo(np.int64).max:
+                msg = f"strike {strike} in row {row} does not fit in int64"
+                raise OverflowError(msg)
+            self.strike[row] = strike
+
+    @staticmethod
+    def _set_text(
+        target: NDArray[np.uint8], wide: dict[int, str], row: int, value: str
+    ) -> None:
+        """ASCII 固定幅に収まる値はバッファに、それ以外は wide に格納する."""
+        if value.isascii() and len(value) <= target.shape[1]:
+            encoded = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+            target[row, : len(encoded)] = encoded
+        else:
+            wide[row] = value
+
+    @staticmethod
+    def _text_column(
+        buffer: NDArray[np.uint8], wide: dict[int, str]
+    ) -> NDArray[np.str_]:
+        """文字コードのバッファを文字列配列に変換する."""
+        column = np.ascontiguousarray(buffer).view(f"S{buffer.shape[1]}")[:, 0]
+        texts = column.astype(f"U{buffer.shape[1]}")
+        if wide:
+            width = max(buffer.shape[1], *(len(value) for value in wide.values()))
+            texts = texts.astype(f"U{width}")
+            for row, value in wide.items():
+                texts[row] = value
+        return texts
+
+    def to_dict(self) -> dict[str, NDArray[Any]]:
+        """列名 -> 配列の dict を返す."""
+        option_type = self.option_type.reshape(-1, 1)
+        return {
+            "error_code": self.error_code,
+            "asset_class": self.asset_class,
+            "exchange": self._text_column(self.exchange, self.wide_exchange),
+            "code": self._text_column(self.code, self.wide_code),
+            "expiry": self.expiry,
+            "option_type": self._text_column(option_type, {}),
+            "strike": self.strike,
+        }
+
+
+def _as_code_points(
+    symbols: Sequence[str] | NDArray[Any],
+) -> tuple[NDArray[Any], NDArray[np.int64], NDArray[np.bool_]]:
+    """入力を (文字コードの2次元配列, 行ごとの長さ, 長さが正確か) に変換する.
+
+    シーケンス入力で NumPy への変換により末尾の NUL が失われた行と、
+    バイト列の配列で ASCII 以外のバイトを含む行 (長さが UTF-8 のバイト数となる) は
+    長さが正確でないため、1行ずつの検査に回す。
+    """
+    codes: NDArray[Any]
+    if isinstance(symbols, np.ndarray):
+        if symbols.dtype.kind == "S":
+            array = np.ascontiguousarray(symbols.reshape(-1))
+            codes = array.view(np.uint8).reshape(len(array), array.dtype.itemsize)
+        elif symbols.dtype.kind == "U":
+            array = np.ascontiguousarray(symbols.reshape(-1))
+            codes = array.view(np.uint32).reshape(len(array), array.dtype.itemsize // 4)
+        else:
+            msg = f"Expected str or bytes array, got dtype {symbols.dtype}"
+            raise TypeError(msg)
+        lengths = np.char.str_len(array).astype(np.int64)
+        if symbols.dtype.kind == "S":
+            return codes, lengths, ~(codes >= _ASCII_LIMIT).any(axis=1)
+        return codes, lengths, np.ones(len(array), dtype=np.bool_)
+
+    for kind in set(map(type, symbols)):
+        if not issubclass(kind, str):
+            raise TypeError(f"Expected str, got {kind.__name__}")
+    array = np.array(symbols, dtype=np.str_).reshape(-1)
+    codes = array.view(np.uint32).reshape(len(array), array.dtype.itemsize // 4)
+    lengths = np.fromiter(map(len, symbols), dtype=np.int64, count=len(symbols))
+    exact = np.char.str_len(array) == lengths
+    return codes, lengths, exact
+
+
+def _decode(symbols: Sequence[str] | NDArray[Any], row: int) -> str:
+    """row 行目の入力を str として返す (バイト列は UTF-8 として復号する)."""
+    value = symbols[row]
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _field(
+    chars: NDArray[np.uint8],
+    starts: NDArray[np.int64],
+    ends: NDArray[np.int64],
+    width: int,
+) -> tuple[NDArray[np.uint8], NDArray[np.int64]]:
+    """各行の [start, end) を先頭 width 文字の固定幅配列として取り出す.
+
+    Returns:
+        (文字コード (長さ以降は 0), フィールド長).
+    """
+    lengths = ends - starts
+    offsets = np.arange(width)
+    index = np.minimum(starts[:, None] + offsets, chars.shape[1] - 1)
+    field = np.take_along_axis(chars, index, axis=1)
+    field[offsets >= lengths[:, None]] = 0
+    return field, lengths
+
+
+def _all_in_range(
+    field: NDArray[np.uint8], lengths: NDArray[np.int64], low: int, high: int
+) -> NDArray[np.bool_]:
+    """フィールドの全文字が [low, high] の範囲にあるかどうかを返す."""
+    in_range = (field >= low) & (field <= high)
+    return (in_range | (np.arange(field.shape[1]) >= lengths[:, None])).all(axis=1)
+
+
+def _parse_vectorized(
+    chars: NDArray[np.uint8],
+    lengths: NDArray[np.int64],
+    rows: NDArray[np.intp],
+    columns: _Columns,
+) -> NDArray[np.intp]:
+    """ASCII の行をベクトル演算でパースし、列に書き込む.
+
+    Returns:
+        ベクトル演算で判定できず、1行ずつの検査に回す行の番号.
+    """
+    # 正規化: 大文字変換と前後の空白除去
+    lower = (chars >= _LOWER_A) & (chars <= _LOWER_Z)
+    chars = chars - lower.astype(np.uint8) * _CASE_OFFSET
+    positions = np.arange(chars.shape[1])
+    inside = positions < lengths[:, None]
+    whitespace = np.isin(chars, _ASCII_WHITESPACE) & inside
+    content = inside & ~whitespace
+    has_content = content.any(axis=1)
+    starts = np.argmax(content, axis=1)
+    ends = chars.shape[1] - np.argmax(content[:, ::-1], axis=1)
+    span = (positions >= starts[:, None]) & (positions < ends[:, None])
+
+    # 内部に空白を含む行は正規表現・int() の扱いが複雑なため1行ずつ検査する
+    rejected = has_content & (whitespace & span).any(axis=1)
+    columns.error_code[rows[~has_content]] = _E004
+
+    colons = (chars == _COLON) & span
+    segment_counts = colons.sum(axis=1) + 1
+    accepted = has_content & ~rejected
+    invalid_count = accepted & ~np.isin(
+        segment_counts, (_EQUITY_SEGMENTS, _FUTURE_SEGMENTS, _OPTION_SEGMENTS)
+    )
+    columns.error_code[rows[invalid_count]] = _E004
+
+    rejected_rows = [rows[rejected]]
+    for segment_count in (_EQUITY_SEGMENTS, _FUTURE_SEGMENTS, _OPTION_SEGMENTS):
+        group = np.flatnonzero(accepted & (segment_counts == segment_count))
+        if not len(group):
+            continue
+        separators = np.nonzero(colons[group])[1].reshape(len(group), -1)
+        bounds_start = np.column_stack((starts[group], separators + 1))
+        bounds_end = np.column_stack((separators, ends[group]))
+        rejected_rows.append(
+            _parse_group(
+                chars[group],
+                bounds_start.astype(np.int64),
+                bounds_end.astype(np.int64),
+                rows[group],
+                columns,
+            )
+        )
+    return np.concatenate(rejected_rows)
+
+
+def _parse_group(
+    chars: NDArray[np.uint8],
+    starts: NDArray[np.int64],
+    ends: NDArray[np.int64],
+    rows: NDArray[np.intp],
+    columns: _Columns,
+) -> NDArray[np.intp]:
+    """セグメント数が等しい行をまとめて検査し、列に書き込む.
+
+    失敗条件は parse_symbol の検査順 (exchange -> code -> expiry -> type
+    -> strike) に並べ、最初に該当したものをエラーコードとする。
+
+    Returns:
+        1行ずつの検査に回す行の番号.
+    """
+    segment_count = starts.shape[1]
+    exchange, exchange_len = _field(chars, starts[:, 0], ends[:, 0], MIC_LENGTH)
+    code, code_len = _field(chars, starts[:, 1], ends[:, 1], MAX_CODE_LENGTH)
+
+    code_chars = (code >= _ZERO) & (code <= _NINE) | (code >= _UPPER_A) & (
+        code <= _UPPER_Z
+    )
+    code_ok = (code_chars | (np.arange(MAX_CODE_LENGTH) >= code_len[:, None])).all(
+        axis=1
+    )
+    failures = [
+        (exchange_len != MIC_LENGTH)
+        | ~_all_in_range(exchange, exchange_len, _UPPER_A, _UPPER_Z),
+        (code_len < MIN_CODE_LENGTH) | (code_len > MAX_CODE_LENGTH) | ~code_ok,
+    ]
+    error_codes = [_E007, _E008]
+    fallback = np.zeros(len(rows), dtype=np.bool_)
+
+    if segment_count == _EQUITY_SEGMENTS:
+        asset_class = np.full(len(rows), _EQUITY, dtype=np.uint8)
+        type_char = np.zeros(len(rows), dtype=np.uint8)
+    else:
+        expiry, expiry_len = _field(chars, starts[:, 2], ends[:, 2], EXPIRY_LENGTH)
+        expiry_ok = (expiry_len == EXPIRY_LENGTH) & _all_in_range(
+            expiry, expiry_len, _ZERO, _NINE
+        )
+        digits = expiry.astype(np.int64) - _ZERO
+        year = (
+            digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+        )
+        month = digits[:, 4] * 10 + digits[:, 5]
+        day = digits[:, 6] * 10 + digits[:, 7]
+        month_ok = (month >= 1) & (month <= _MONTHS_PER_YEAR)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        days_in_month = _DAYS_IN_MONTH[np.where(month_ok, month, 0)] + (
+            (month == _FEBRUARY) & leap
+        )
+        type_field, type_len = _field(chars, starts[:, 3], ends[:, 3], 1)
+        type_char = np.where(type_len == 1, type_field[:, 0], 0).astype(np.uint8)
+        type_ok = np.isin(type_char, (_CALL, _PUT, _SERIES, _FUTURE_TYPE))
+        failures += [
+            ~expiry_ok,
+            ~month_ok,
+            (day < 1) | (day > days_in_month),
+            ~type_ok,
+        ]
+        error_codes += [_E003, _E005, _E005, _E006]
+        no_strike_type = (type_char == _FUTURE_TYPE) | (type_char == _SERIES)
+
+        # ここまでの検査で失敗した行は strike の扱いによらずエラーが確定する
+        prefix_failed = np.logical_or.reduce(failures)
+
+        if segment_count == _FUTURE_SEGMENTS:
+            failures.append(~no_strike_type)
+            error_codes.append(_E002)
+            strike = np.zeros(len(rows), dtype=np.int64)
+        else:
+            strike, strike_format_ok, fallback = _strike_column(chars, starts, ends)
+            fallback &= ~prefix_failed
+            failures += [~strike_format_ok, no_strike_type, strike < MIN_STRIKE]
+            error_codes += [_E009, _E001, _E009]
+        asset_class = np.where(type_char == _FUTURE_TYPE, _FUTURE, _OPTION).astype(
+            np.uint8
+        )
+
+    error_code = np.select(failures, error_codes, default=0).astype(np.uint8)
+    error_code[fallback] = 0
+    columns.error_code[rows] = error_code
+
+    valid = (error_code == 0) & ~fallback
+    target = rows[valid]
+    columns.asset_class[target] = asset_class[valid]
+    columns.exchange[target] = exchange[valid]
+    columns.code[target] = code[valid]
+    if segment_count != _EQUITY_SEGMENTS:
+        columns.expiry[target] = _to_datetime64(year[valid], month[valid], day[valid])
+        is_option = type_char[valid] != _FUTURE_TYPE
+        columns.option_type[target[is_option]] = type_char[valid][is_option]
+        columns.strike[target] = strike[valid]
+    return rows[fallback]
+
+
+def _strike_column(
+    chars: NDArray[np.uint8], starts: NDArray[np.int64], ends: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.bool_], NDArray[np.bool_]]:
+    """5セグメント目の strike を整数に変換する.
+
+    Returns:
+        (strike の値, int() で変換可能か, 1行ずつの検査に回すか)。
+        数字のみで int64 に収まる桁数の行はベクトル演算で変換する。
+        int() が受け付けうる記号 (+ - _) を含む行や桁数の多い行は
+        1行ずつの検査に回す。それ以外の文字を含む行と空の行は変換不可。
+    """
+    width = max(1, int((ends[:, 4] - starts[:, 4]).max()))
+    field, lengths = _field(chars, starts[:, 4], ends[:, 4], width)
+    padding = np.arange(width) >= lengths[:, None]
+    is_digit = (field >= _ZERO) & (field <= _NINE)
+    all_digits = (is_digit | padding).all(axis=1) & (lengths > 0)
+    int_like = (is_digit | np.isin(field, _INT_SYMBOLS) | padding).all(axis=1)
+    vector = all_digits & (lengths <= _MAX_VECTOR_STRIKE_DIGITS)
+    fallback = (lengths > 0) & int_like & ~vector
+
+    # 右詰めにして桁の重みを掛ける (パディング位置は 0 とする)
+    digits = np.where(is_digit & ~padding, field.astype(np.int64) - _ZERO, 0)
+    digits = digits[:, :_MAX_VECTOR_STRIKE_DIGITS]
+    exponents = lengths[:, None] - 1 - np.arange(digits.shape[1])
+    weights = np.where(exponents >= 0, 10 ** np.maximum(exponents, 0), 0)
+    strike = np.where(vector, (digits * weights).sum(axis=1), 0)
+    return strike.astype(np.int64), vector | fallback, fallback
+
+
+def _to_datetime64(
+    year: NDArray[np.int64], month: NDArray[np.int64], day: NDArray[np.int64]
+) -> NDArray[np.datetime64]:
+    """年・月・日の配列を datetime64[D] に変換する."""
+    months = (year - 1970) * _MONTHS_PER_YEAR + (month - 1)
+    first_days = months.astype("datetime64[M]").astype("datetime64[D]")
+    expiry: NDArray[np.datetime64] = first_days + (day - 1).astype("timedelta64[D]")
+    return expiry
@@ -10,10 +10,16 @@ from typing import Final
 MIC_LENGTH: Final[int] = 4
 
 # コードの最小/最大長 (資産クラスにより異なる: Equity=1-10, Future=2-6, Option=2-10)
-# バリデーション時は資産クラスごとの制約を適用すること
+# 既定のパーサーは全資産クラス共通の 1-10 を適用する
 MIN_CODE_LENGTH: Final[int] = 1
 MAX_CODE_LENGTH: Final[int] = 10
 
+# 資産クラスごとのコード長 (ParserPolicy(asset_class_code_lengths=True) で適用)
+MIN_FUTURE_CODE_LENGTH: Final[int] = 2
+MAX_FUTURE_CODE_LENGTH: Final[int] = 6
+MIN_OPTION_CODE_LENGTH: Final[int] = 2
+MAX_OPTION_CODE_LENGTH: Final[int] = 10
+
 # 限月の長さ (YYYYMMDD 形式)
 EXPIRY_LENGTH: Final[int] = 8
 
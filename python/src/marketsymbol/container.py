@@ -0,0 +1,565 @@
+"""シンボル文字列と Symbol のどちらでも引けるコンパクトな集合・辞書.
+
+SymbolSet / SymbolDict はキーに Symbol またはシンボル文字列 (parse_symbol と
+同じ規則で正規化・検査する) を受け付け、内部では1つの整数に詰めたキーとして
+保持する。"xjpx:7203" で登録して EquitySymbol で引く (またはその逆) ことができる。
+
+キーの整数は下位ビットから次の順に詰める:
+
+- 種別 (3ビット): 0 株式、1 先物、2 シリーズ、3 コール、4 プット
+- exchange (21ビット): 4文字の 36 進数
+- code の長さ (4ビット) と code (52ビット): 1-10文字の 36 進数
+- expiry (27ビット): YYYYMMDD の整数 (株式は 0)
+- strike (残りの上位ビット、strike がない場合は 0)
+
+整数のキーは Symbol とその構成文字列を保持しないため、1件あたりのメモリは
+``dict[OptionSymbol, V]`` の数分の1になる。シンボル文字列からキーへの変換は
+メモ化する (同じ文字列の再検査・再正規化を行わない)。反復時の Symbol は
+キーから都度生成する。
+
+Example:
+    >>> from marketsymbol import SymbolDict, SymbolSet, parse_symbol
+    >>> watch = SymbolSet(["xjpx:7203", "XJPX:N225O:20250314:C:42000"])
+    >>> parse_symbol("XJPX:7203") in watch
+    True
+    >>> prices = SymbolDict({parse_symbol("XJPX:7203"): 2500})
+    >>> prices["xjpx:7203"]
+    2500
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, MutableMapping, MutableSet, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final, Self, overload
+
+from marketsymbol.enums import AssetClass, OptionType
+from marketsymbol.errors import SymbolParseError
+from marketsymbol.parser import (
+    _EQUITY_SEGMENT_COUNT,
+    _OPTION_SEGMENT_COUNT,
+    _check_input,
+    _check_segments,
+    _equity,
+    _future,
+    _normalize,
+    _option,
+    _split,
+)
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol, Symbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# シンボル文字列からキーへの変換をメモ化する件数の上限
+KEY_CACHE_SIZE: Final = 65_536
+
+# 各フィールドのビット位置と幅
+_EXCHANGE_SHIFT = 3
+_LENGTH_SHIFT = 24
+_CODE_SHIFT = 28
+_EXPIRY_SHIFT = 80
+_STRIKE_SHIFT = 107
+_KIND_MASK = (1 << _EXCHANGE_SHIFT) - 1
+_EXCHANGE_MASK = (1 << (_LENGTH_SHIFT - _EXCHANGE_SHIFT)) - 1
+_LENGTH_MASK = (1 << (_CODE_SHIFT - _LENGTH_SHIFT)) - 1
+_CODE_MASK = (1 << (_EXPIRY_SHIFT - _CODE_SHIFT)) - 1
+_EXPIRY_MASK = (1 << (_STRIKE_SHIFT - _EXPIRY_SHIFT)) - 1
+
+# 種別 (タイプ識別子の順、0 は株式)
+_EQUITY, _FUTURE, _SERIES = 0, 1, 2
+_KINDS = {"F": 1, "O": 2, "C": 3, "P": 4}
+_INDICATORS = ("", "F", "O", "C", "P")
+_OPTION_KINDS = {
+    OptionType.SERIES: _SERIES,
+    OptionType.CALL: _KINDS["C"],
+    OptionType.PUT: _KINDS["P"],
+}
+_ASSET_CLASS_KINDS = {
+    AssetClass.EQUITY: frozenset({_EQUITY}),
+    AssetClass.FUTURE: frozenset({_FUTURE}),
+    AssetClass.OPTION: frozenset({_SERIES, _KINDS["C"], _KINDS["P"]}),
+}
+
+# 無効な値の検索用のキー (キーは 0 以上のため、どの要素とも一致しない)
+_MISSING_KEY = -1
+
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_EXCHANGE_LENGTH = 4
+
+
+class SymbolSet(MutableSet[Symbol]):
+    """Symbol の集合 (要素は Symbol またはシンボル文字列で指定する).
+
+    集合演算は SymbolSet 同士であれば整数のキーの集合演算のみで行う。
+    反復の順序は保証しない。無効なシンボル文字列や Symbol・str 以外の値は
+    どの要素とも等しくない値として扱う (判定・削除の側では例外を送出しない)。
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, items: Iterable[Symbol | str] = ()) -> None:
+        """items を要素とする集合を生成する.
+
+        Args:
+            items: Symbol またはシンボル文字列
+
+        Raises:
+            TypeError: Symbol・str 以外の要素を含む場合
+            SymbolParseError: 無効なシンボル文字列を含む場合
+        """
+        self._keys: set[int] = (
+            items._keys.copy() if isinstance(items, SymbolSet) else _key_set(items)
+        )
+
+    def __contains__(self, item: object) -> bool:
+        """item (Symbol またはシンボル文字列) を含むかどうかを返す.
+
+        無効なシンボル文字列や Symbol・str 以外の値は含まない (False) とする。
+        """
+        return _find_key(item) in self._keys
+
+    def __iter__(self) -> Iterator[Symbol]:
+        """要素の Symbol を返す (キーから都度生成する)."""
+        return map(_unpack, self._keys)
+
+    def __len__(self) -> int:
+        """要素の数を返す."""
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """シンボル文字列の昇順で要素を並べた表現を返す."""
+        return f"SymbolSet({sorted(map(str, self))!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """要素が等しいかどうかを返す."""
+        if isinstance(other, SymbolSet):
+            return self._keys == other._keys
+        return super().__eq__(other)
+
+    def __le__(self, other: Set[object]) -> bool:
+        """other の部分集合かどうかを返す."""
+        if isinstance(other, SymbolSet):
+            return self._keys <= other._keys
+        return super().__le__(other)
+
+    def __ge__(self, other: Set[object]) -> bool:
+        """other の上位集合かどうかを返す."""
+        if isinstance(other, SymbolSet):
+            return self._keys >= other._keys
+        return super().__ge__(other)
+
+    def __or__(self, other: Set[object]) -> SymbolSet:
+        """和集合を返す.
+
+        Raises:
+            TypeError: other が Symbol・str 以外の要素を含む場合
+            SymbolParseError: other が無効なシンボル文字列を含む場合
+        """
+        return _set_from_keys(self._keys | _key_set(other))
+
+    def __and__(self, other: Set[object]) -> SymbolSet:
+        """積集合を返す."""
+        return _set_from_keys(self._keys & _key_set(other, strict=False))
+
+    def __sub__(self, other: Set[object]) -> SymbolSet:
+        """差集合を返す."""
+        return _set_from_keys(self._keys - _key_set(other, strict=False))
+
+    def __xor__(self, other: Set[object]) -> SymbolSet:
+        """対称差を返す.
+
+        Raises:
+            TypeError: other が Symbol・str 以外の要素を含む場合
+            SymbolParseError: other が無効なシンボル文字列を含む場合
+        """
+        return _set_from_keys(self._keys ^ _key_set(other))
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __ior__(self, other: Set[object]) -> Self:
+        """other の要素を追加する."""
+        self._keys |= _key_set(other)
+        return self
+
+    def __iand__(self, other: Set[object]) -> Self:
+        """other に含まれない要素を削除する."""
+        self._keys &= _key_set(other, strict=False)
+        return self
+
+    def __isub__(self, other: Set[object]) -> Self:
+        """other に含まれる要素を削除する."""
+        self._keys -= _key_set(other, strict=False)
+        return self
+
+    def __ixor__(self, other: Set[object]) -> Self:
+        """対称差に置き換える."""
+        self._keys ^= _key_set(other)
+        return self
+
+    def add(self, value: Symbol | str) -> None:
+        """要素を追加する.
+
+        Raises:
+            TypeError: value が Symbol・str でない場合
+            SymbolParseError: 無効なシンボル文字列の場合
+        """
+        self._keys.add(_key(value))
+
+    def discard(self, value: Symbol | str) -> None:
+        """要素を削除する (含まない場合は何もしない)."""
+        self._keys.discard(_find_key(value))
+
+    def remove(self, value: Symbol | str) -> None:
+        """要素を削除する.
+
+        Raises:
+            KeyError: 含まない場合
+        """
+        try:
+            self._keys.remove(_find_key(value))
+        except KeyError:
+            raise KeyError(value) from None
+
+    def pop(self) -> Symbol:
+        """任意の要素を削除して返す.
+
+        Raises:
+            KeyError: 空の場合
+        """
+        return _unpack(self._keys.pop())
+
+    def clear(self) -> None:
+        """すべての要素を削除する."""
+        self._keys.clear()
+
+    def copy(self) -> SymbolSet:
+        """同じ要素を持つ新しい集合を返す."""
+        return _set_from_keys(self._keys.copy())
+
+    def union(self, *others: Iterable[Symbol | str]) -> SymbolSet:
+        """self と others のいずれかに含まれる要素の集合を返す."""
+        return _set_from_keys(self._keys.union(*map(_key_set, others)))
+
+    def intersection(self, *others: Iterable[Symbol | str]) -> SymbolSet:
+        """self と others のすべてに含まれる要素の集合を返す.
+
+        others の無効なシンボル文字列は無視する (どの要素とも等しくない)。
+        """
+        keys = [_key_set(other, strict=False) for other in others]
+        return _set_from_keys(self._keys.intersection(*keys))
+
+    def difference(self, *others: Iterable[Symbol | str]) -> SymbolSet:
+        """self の要素のうち others のいずれにも含まれないものの集合を返す."""
+        keys = [_key_set(other, strict=False) for other in others]
+        return _set_from_keys(self._keys.difference(*keys))
+
+    def symmetric_difference(self, other: Iterable[Symbol | str]) -> SymbolSet:
+        """self と other の一方のみに含まれる要素の集合を返す."""
+        return _set_from_keys(self._keys.symmetric_difference(_key_set(other)))
+
+    def issubset(self, other: Iterable[object]) -> bool:
+        """other の部分集合かどうかを返す (other の無効な値は無視する)."""
+        return self._keys <= _key_set(other, strict=False)
+
+    def issuperset(self, other: Iterable[object]) -> bool:
+        """other の上位集合かどうかを返す (other の無効な値は含まない要素とする)."""
+        if isinstance(other, SymbolSet | SymbolDict):
+            return self._keys >= _key_set(other)
+        keys = self._keys
+        return all(_find_key(item) in keys for item in other)
+
+    def isdisjoint(self, other: Iterable[object]) -> bool:
+        """other と共通の要素を持たないかどうかを返す (other の無効な値は無視する)."""
+        return self._keys.isdisjoint(_key_set(other, strict=False))
+
+    def select(
+        self,
+        *,
+        exchange: str | None = None,
+        asset_class: AssetClass | None = None,
+    ) -> SymbolSet:
+        """指定した取引所・資産クラスの要素の集合を返す (キーのみで判定する).
+
+        Args:
+            exchange: 取引所の MIC (大文字・小文字を区別しない)
+            asset_class: 資産クラス
+
+        Returns:
+            該当する要素の新しい集合
+        """
+        return _set_from_keys(set(filter(_selector(exchange, asset_class), self._keys)))
+
+
+class SymbolDict[V](MutableMapping[Symbol, V]):
+    """Symbol をキーとする辞書 (キーは Symbol またはシンボル文字列で指定する).
+
+    反復の順序はキーの登録順 (dict と同じ)。
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(
+        self,
+        items: Mapping[Symbol, V]
+        | Mapping[str, V]
+        | Mapping[Symbol | str, V]
+        | Iterable[tuple[Symbol | str, V]] = (),
+    ) -> None:
+        """items のキーと値を登録した辞書を生成する.
+
+        Args:
+            items: キーと値の Mapping、または (キー, 値) の組
+
+        Raises:
+            TypeError: Symbol・str 以外のキーを含む場合
+            SymbolParseError: 無効なシンボル文字列のキーを含む場合
+        """
+        self._items: dict[int, V] = {}
+        pairs = items.items() if isinstance(items, Mapping) else items
+        target = self._items
+        for key, value in pairs:
+            target[_key(key)] = value
+
+    def __getitem__(self, key: Symbol | str) -> V:
+        """key の値を返す.
+
+        Raises:
+            KeyError: key を含まない場合 (無効なシンボル文字列を含む)
+        """
+        try:
+            return self._items[_find_key(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: Symbol | str, value: V) -> None:
+        """key の値を設定する.
+
+        Raises:
+            TypeError: key が Symbol・str でない場合
+            SymbolParseError: 無効なシンボル文字列の場合
+        """
+        self._items[_key(key)] = value
+
+    def __delitem__(self, key: Symbol | str) -> None:
+        """key を削除する.
+
+        Raises:
+            KeyError: key を含まない場合
+        """
+        try:
+            del self._items[_find_key(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        """key (Symbol またはシンボル文字列) を含むかどうかを返す."""
+        return _find_key(key) in self._items
+
+    def __iter__(self) -> Iterator[Symbol]:
+        """キーの Symbol を返す (キーから都度生成する)."""
+        return map(_unpack, self._items)
+
+    def __len__(self) -> int:
+        """キーの数を返す."""
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """シンボル文字列をキーとした表現を返す."""
+        return f"SymbolDict({ {str(k): v for k, v in self.items()}!r})"
+
+    @overload
+    def get(self, key: Symbol | str, /) -> V | None: ...
+
+    @overload
+    def get(self, key: Symbol | str, default: V, /) -> V: ...
+
+    @overload
+    def get[D](self, key: Symbol | str, default: D, /) -> V | D: ...
+
+    def get(self, key: Symbol | str, default: object = None, /) -> object:
+        """key の値を返す (含まない場合は default)."""
+        return self._items.get(_find_key(key), default)
+
+    def clear(self) -> None:
+        """すべてのキーを削除する."""
+        self._items.clear()
+
+    def copy(self) -> SymbolDict[V]:
+        """同じキーと値を持つ新しい辞書を返す."""
+        return _dict_from_items(self._items.copy())
+
+    def key_set(self) -> SymbolSet:
+        """キーの SymbolSet を返す (集合演算用、以降の変更は反映しない)."""
+        return _set_from_keys(set(self._items))
+
+    def select(
+        self,
+        *,
+        exchange: str | None = None,
+        asset_class: AssetClass | None = None,
+    ) -> SymbolDict[V]:
+        """指定した取引所・資産クラスのキーの項目を持つ辞書を返す.
+
+        Args:
+            exchange: 取引所の MIC (大文字・小文字を区別しない)
+            asset_class: 資産クラス
+
+        Returns:
+            該当する項目の新しい辞書 (登録順を保つ)
+        """
+        selected = _selector(exchange, asset_class)
+        return _dict_from_items({k: v for k, v in self._items.items() if selected(k)})
+
+
+def _set_from_keys(keys: set[int]) -> SymbolSet:
+    """キーの集合をそのまま保持する SymbolSet を生成する."""
+    result = SymbolSet.__new__(SymbolSet)
+    result._keys = keys
+    return result
+
+
+def _dict_from_items[V](items: dict[int, V]) -> SymbolDict[V]:
+    """キーと値の dict をそのまま保持する SymbolDict を生成する."""
+    result: SymbolDict[V] = SymbolDict.__new__(SymbolDict)
+    result._items = items
+    return result
+
+
+def _key_set(items: Iterable[object], *, strict: bool = True) -> set[int]:
+    """要素のキーの集合を返す.
+
+    strict が False の場合、無効なシンボル文字列や Symbol・str 以外の値は無視する。
+    SymbolSet の場合は保持しているキーの集合そのものを返す (呼び出し側で変更しない)。
+    """
+    if isinstance(items, SymbolSet):
+        return items._keys
+    if isinstance(items, SymbolDict):
+        return set(items._items)
+    if strict:
+        return set(map(_key, items))
+    return {key for key in map(_find_key, items) if key != _MISSING_KEY}
+
+
+def _selector(
+    exchange: str | None, asset_class: AssetClass | None
+) -> Callable[[int], bool]:
+    """キーが取引所・資産クラスに該当するかを返す述語を生成する."""
+    kinds = _ASSET_CLASS_KINDS[asset_class] if asset_class is not None else None
+    target: int | None = None
+    if exchange is not None:
+        # 4文字の英字以外の MIC はどのキーにも該当しない
+        target = (
+            int(exchange, 36)
+            if len(exchange) == _EXCHANGE_LENGTH
+            and exchange.isascii()
+            and exchange.isalpha()
+            else -1
+        )
+
+    def selected(key: int) -> bool:
+        if kinds is not None and key & _KIND_MASK not in kinds:
+            return False
+        return target is None or (key >> _EXCHANGE_SHIFT) & _EXCHANGE_MASK == target
+
+    return selected
+
+
+def _key(item: object) -> int:
+    """Symbol またはシンボル文字列のキーを返す.
+
+    Raises:
+        TypeError: Symbol・str 以外の場合
+        SymbolParseError: 無効なシンボル文字列の場合
+    """
+    if isinstance(item, str):
+        return _raw_key(item)
+    # Symbol は型の一致で判定する (サブクラスは対象外)
+    if type(item) is OptionSymbol:
+        return _pack_option(item)
+    if type(item) is FutureSymbol:
+        return _pack_future(item)
+    if type(item) is EquitySymbol:
+        return _pack_equity(item)
+    raise TypeError(f"Expected Symbol or str, got {type(item).__name__}")
+
+
+def _find_key(item: object) -> int:
+    """検索用のキーを返す (無効な値は _MISSING_KEY)."""
+    try:
+        return _key(item)
+    except (TypeError, SymbolParseError):
+        return _MISSING_KEY
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _raw_key(raw: str) -> int:
+    """シンボル文字列を parse_symbol と同じ規則で検査し、キーを返す (メモ化する)."""
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    _check_segments(segments, raw)
+    exchange, code = segments[0], segments[1]
+    if len(segments) == _EQUITY_SEGMENT_COUNT:
+        return _pack_fields(_EQUITY, exchange, code, 0, 0)
+    strike = int(segments[4]) if len(segments) == _OPTION_SEGMENT_COUNT else 0
+    return _pack_fields(_KINDS[segments[3]], exchange, code, int(segments[2]), strike)
+
+
+def _pack_fields(kind: int, exchange: str, code: str, expiry: int, strike: int) -> int:
+    """検査済みのフィールドを1つの整数に詰める."""
+    return (
+        kind
+        | int(exchange, 36) << _EXCHANGE_SHIFT
+        | len(code) << _LENGTH_SHIFT
+        | int(code, 36) << _CODE_SHIFT
+        | expiry << _EXPIRY_SHIFT
+        | strike << _STRIKE_SHIFT
+    )
+
+
+def _pack_equity(symbol: EquitySymbol) -> int:
+    """EquitySymbol のキーを返す."""
+    return _pack_fields(_EQUITY, symbol.exchange, symbol.code, 0, 0)
+
+
+def _pack_future(symbol: FutureSymbol) -> int:
+    """FutureSymbol のキーを返す."""
+    return _pack_fields(_FUTURE, symbol.exchange, symbol.code, int(symbol.expiry), 0)
+
+
+def _pack_option(symbol: OptionSymbol) -> int:
+    """OptionSymbol のキーを返す."""
+    return _pack_fields(
+        _OPTION_KINDS[symbol.option_type],
+        symbol.exchange,
+        symbol.code,
+        int(symbol.expiry),
+        symbol.strike or 0,
+    )
+
+
+def _base36(value: int, length: int) -> str:
+    """value を length 桁の 36 進数の文字列にする (上位の桁は 0 で埋める)."""
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 36)
+        chars.append(_DIGITS[digit])
+    return "".join(reversed(chars))
+
+
+def _unpack(key: int) -> Symbol:
+    """キーから Symbol を生成する."""
+    kind = key & _KIND_MASK
+    exchange = _base36((key >> _EXCHANGE_SHIFT) & _EXCHANGE_MASK, _EXCHANGE_LENGTH)
+    code = _base36(
+        (key >> _CODE_SHIFT) & _CODE_MASK, (key >> _LENGTH_SHIFT) & _LENGTH_MASK
+    )
+    if kind == _EQUITY:
+        return _equity(exchange, code)
+    expiry = f"{(key >> _EXPIRY_SHIFT) & _EXPIRY_MASK:08d}"
+    if kind == _FUTURE:
+        return _future(exchange, code, expiry)
+    strike = key >> _STRIKE_SHIFT
+    return _option(exchange, code, expiry, _INDICATORS[kind], strike or None)
@@ -0,0 +1,317 @@
+"""CSV のシンボル列のストリーミング変換.
+
+transform_csv は CSV を CHUNK_ROWS 行ずつ読み込み、指定した列の値を列ごとの
+変換関数 (normalize_symbol, canonicalize, vendor_to_symbol / symbol_to_vendor が
+返す関数など、str -> str の関数) で書き換えて出力する。他の列はそのまま出力する。
+
+- 同じ値の変換結果 (失敗を含む) は列ごとにメモ化し、参照データに多い
+  繰り返しの値を1回だけ変換する
+- いずれかの列の変換に失敗した行は出力せず、rejects に元の値と失敗した列・
+  エラーコード・メッセージを付けて出力する
+- executor を指定するとチャンクを並列に変換し、入力順に出力する
+  (ProcessPoolExecutor の場合、変換関数は pickle 可能である必要がある)
+
+変換の失敗は SymbolError (エラーコードは ErrorCode の値) と、アダプターが
+変換できない値に送出する ValueError (エラーコードは例外のクラス名) を対象とする。
+それ以外の例外は変換関数の誤りとしてそのまま送出する。アダプターが
+サポートしない資産クラスのシンボルは、アダプターを呼び出す前に ValueError とする。
+
+rejects の行は見出しの列数に揃える (見出しより短い行は空の値で補い、
+長い行は見出しを超える値を除く) ため、REJECT_COLUMNS は常に同じ位置に並ぶ。
+
+Example:
+    >>> import io
+    >>> from marketsymbol.csvstream import canonicalize, transform_csv
+    >>> source = io.StringIO("id,symbol\\n1,xjpx:7203\\n2,XX:7203\\n")
+    >>> output, rejects = io.StringIO(), io.StringIO()
+    >>> result = transform_csv(
+    ...     source, output, {"symbol": canonicalize}, rejects=rejects
+    ... )
+    >>> output.getvalue()
+    'id,symbol\\r\\n1,XJPX:7203\\r\\n'
+    >>> result.error_counts
+    {'E007': 1}
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from collections import Counter, deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from marketsymbol.errors import REJECTED_ERRORS, FailureRecord
+from marketsymbol.parser import parse_symbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from concurrent.futures import Executor, Future
+
+    from _typeshed import SupportsWrite
+
+    from marketsymbol.adapter import AdapterRegistry
+
+# 1チャンクあたりの行数の既定値
+CHUNK_ROWS: Final = 10_000
+
+# 列ごとのメモ化する値の数の上限の既定値 (上限に達した場合は破棄して再開する)
+CACHE_SIZE: Final = 65_536
+
+# rejects に追加する列
+REJECT_COLUMNS: Final = ("reject_column", "error_code", "message")
+
+
+@dataclass(frozen=True, slots=True)
+class CsvTransformResult:
+    """transform_csv の結果.
+
+    Attributes:
+        rows: 読み込んだデータ行数 (見出し行と空行を除く).
+        written: 出力した行数.
+        rejected: 変換に失敗した行数.
+        error_counts: エラーコード (ErrorCode の値、または例外のクラス名) 別の
+            失敗した行数.
+    """
+
+    rows: int
+    written: int
+    rejected: int
+    error_counts: dict[str, int]
+
+
+class _Plan(NamedTuple):
+    """チャンクの変換内容 (ワーカープロセスに渡すため pickle 可能な値のみ)."""
+
+    columns: tuple[tuple[int, str, Callable[[str], str]], ...]  # (位置, 列名, 変換)
+    width: int  # 変換する列を全て含む最小の列数
+    header_width: int  # 見出し行の列数 (rejects の列を揃える)
+    skip_empty: bool
+    cache_size: int
+
+
+class _ChunkResult(NamedTuple):
+    """チャンクの変換結果."""
+
+    rows: list[list[str]]
+    rejects: list[list[str]]
+    counts: Counter[str]
+
+
+def canonicalize(value: str) -> str:
+    """シンボル文字列をパースし、正規の文字列表現を返す.
+
+    Raises:
+        SymbolParseError: パース失敗時
+    """
+    return str(parse_symbol(value))
+
+
+@dataclass(frozen=True, slots=True)
+class _VendorRule:
+    """AdapterRegistry のアダプターによる変換."""
+
+    registry: AdapterRegistry
+    vendor: str
+    to_symbol: bool
+
+    def __call__(self, value: str) -> str:
+        """値を変換する."""
+        if self.to_symbol:
+            return str(self.registry.to_symbol(self.vendor, value))
+        symbol = parse_symbol(value)
+        self.registry.get_or_raise(self.vendor).check_supported(symbol)
+        return self.registry.from_symbol(self.vendor, symbol)
+
+
+def vendor_to_symbol(registry: AdapterRegistry, vendor: str) -> Callable[[str], str]:
+    """ベンダー固有シンボルを統一シンボルの文字列に変換する関数を返す.
+
+    Args:
+        registry: アダプターレジストリ
+        vendor: ベンダー識別名
+
+    Raises:
+        KeyError: ベンダーが未登録の場合
+    """
+    registry.get_or_raise(vendor)
+    return _VendorRule(registry, vendor, to_symbol=True)
+
+
+def symbol_to_vendor(registry: AdapterRegistry, vendor: str) -> Callable[[str], str]:
+    """統一シンボルの文字列をパースしてベンダー固有シンボルに変換する関数を返す.
+
+    Args:
+        registry: アダプターレジストリ
+        vendor: ベンダー識別名
+
+    Raises:
+        KeyError: ベンダーが未登録の場合
+    """
+    registry.get_or_raise(vendor)
+    return _VendorRule(registry, vendor, to_symbol=False)
+
+
+def transform_csv(
+    source: Iterable[str],
+    destination: SupportsWrite[str],
+    columns: Mapping[str, Callable[[str], str]],
+    *,
+    rejects: SupportsWrite[str] | None = None,
+    chunk_rows: int = CHUNK_ROWS,
+    cache_size: int = CACHE_SIZE,
+    skip_empty: bool = True,
+    executor: Executor | None = None,
+    **fmtparams: Any,
+) -> CsvTransformResult:
+    """CSV のシンボル列を変換して出力する.
+
+    先頭行を見出しとして columns の列名から列の位置を決定し、見出し行は
+    そのまま出力する。
+
+    Args:
+        source: CSV の行のイテラブル (newline="" で開いたファイルなど)
+        destination: 変換した行の出力先 (write() を持つオブジェクト)
+        columns: 列名 -> 変換関数
+        rejects: 変換に失敗した行の出力先。見出しと元の値に REJECT_COLUMNS を
+            加えて出力する。None の場合は失敗した行を件数のみ記録する。
+        chunk_rows: 1チャンクあたりの行数
+        cache_size: 列ごとのメモ化する値の数の上限
+        skip_empty: 空の値を変換せずにそのまま出力するかどうか
+        executor: チャンクを並列に変換する Executor (None の場合は逐次)
+        **fmtparams: csv.reader / csv.writer に渡す書式パラメータ
+
+    Returns:
+        行数とエラーコード別の失敗件数
+
+    Raises:
+        ValueError: 見出し行がない、列名が見出しに存在しない、または
+            chunk_rows / cache_size が 1 未満の場合
+    """
+    if chunk_rows < 1 or cache_size < 1:
+        msg = "chunk_rows and cache_size must be >= 1"
+        raise ValueError(msg)
+    reader = csv.reader(source, **fmtparams)
+    header = next(reader, None)
+    if header is None:
+        msg = "CSV has no header row"
+        raise ValueError(msg)
+    plan = _plan(header, columns, skip_empty, cache_size)
+
+    writer = csv.writer(destination, **fmtparams)
+    writer.writerow(header)
+    reject_writer = None
+    if rejects is not None:
+        reject_writer = csv.writer(rejects, **fmtparams)
+        reject_writer.writerow([*header, *REJECT_COLUMNS])
+
+    chunks = iter(lambda: list(islice(reader, chunk_rows)), [])
+    results: Iterable[_ChunkResult]
+    if executor is None:
+        # 逐次処理ではメモ化した値をチャンク間で共有する
+        caches: list[dict[str, str | FailureRecord]] = [{} for _ in plan.columns]
+        results = (_transform_chunk(plan, chunk, caches) for chunk in chunks)
+    else:
+        results = _transform_parallel(plan, chunks, executor)
+
+    rows = written = 0
+    counts: Counter[str] = Counter()
+    for result in results:
+        writer.writerows(result.rows)
+        if reject_writer is not None:
+            reject_writer.writerows(result.rejects)
+        rows += len(result.rows) + len(result.rejects)
+        written += len(result.rows)
+        counts.update(result.counts)
+    return CsvTransformResult(rows, written, rows - written, dict(counts))
+
+
+def _plan(
+    header: list[str],
+    columns: Mapping[str, Callable[[str], str]],
+    skip_empty: bool,
+    cache_size: int,
+) -> _Plan:
+    """見出し行から変換する列の位置を決定する."""
+    positions = {name: i for i, name in reversed(list(enumerate(header)))}
+    planned = []
+    for name, transform in columns.items():
+        position = positions.get(name)
+        if position is None:
+            msg = f"Column {name!r} not found in header"
+            raise ValueError(msg)
+        planned.append((position, name, transform))
+    width = max((position + 1 for position, _, _ in planned), default=0)
+    return _Plan(tuple(planned), width, len(header), skip_empty, cache_size)
+
+
+def _transform_chunk(
+    plan: _Plan,
+    chunk: list[list[str]],
+    caches: list[dict[str, str | FailureRecord]] | None = None,
+) -> _ChunkResult:
+    """チャンクの各行の列を変換する (caches が None の場合はチャンク内でメモ化)."""
+    if caches is None:
+        caches = [{} for _ in plan.columns]
+    rows: list[list[str]] = []
+    rejects: list[list[str]] = []
+    counts: Counter[str] = Counter()
+    for row in chunk:
+        if not row:
+            # csv.DictReader と同じく空行は読み飛ばす
+            continue
+        if len(row) < plan.width:
+            failure = FailureRecord(
+                "ValueError", f"Row has {len(row)} fields (expected {plan.width})"
+            )
+            counts[failure.code] += 1
+            rejects.append(_reject(row, plan.header_width, "", failure))
+            continue
+        transformed = row.copy()
+        for (position, name, transform), cache in zip(
+            plan.columns, caches, strict=True
+        ):
+            value = row[position]
+            if not value and plan.skip_empty:
+                continue
+            outcome = cache.get(value)
+            if outcome is None:
+                try:
+                    outcome = transform(value)
+                except REJECTED_ERRORS as e:
+                    outcome = FailureRecord.from_error(e)
+                if len(cache) >= plan.cache_size:
+                    cache.clear()
+                cache[value] = outcome
+            if isinstance(outcome, FailureRecord):
+                counts[outcome.code] += 1
+                rejects.append(_reject(row, plan.header_width, name, outcome))
+                break
+            transformed[position] = outcome
+        else:
+            rows.append(transformed)
+    return _ChunkResult(rows, rejects, counts)
+
+
+def _reject(
+    row: list[str], width: int, column: str, failure: FailureRecord
+) -> list[str]:
+    """rejects の行 (見出しの列数に揃えた値に REJECT_COLUMNS の値を加える)."""
+    padding = [""] * (width - len(row))
+    return [*row[:width], *padding, column, *failure]
+
+
+def _transform_parallel(
+    plan: _Plan, chunks: Iterable[list[list[str]]], executor: Executor
+) -> Iterable[_ChunkResult]:
+    """チャンクを executor で変換し、入力順に結果を返す."""
+    # 未処理のチャンク数を制限し、入力の大きさによらずメモリ使用量を一定に保つ
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending: deque[Future[_ChunkResult]] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(_transform_chunk, plan, chunk))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -1,10 +1,12 @@
 """marketsymbol の例外クラス定義.
 
 エラーコード列挙型とシンボル関連の例外クラスを提供する。
+また、CSV の変換 (csvstream) とコマンドラインツール (cli) が共有する
+1つの値の失敗の記録 (FailureRecord) を提供する。
 """
 
 from enum import Enum
-from typing import Self
+from typing import Any, Final, NamedTuple, Self
 
 
 class ErrorCode(Enum):
@@ -48,25 +50,41 @@ class ErrorCode(Enum):
 class SymbolError(Exception):
     """シンボル関連例外の基底クラス.
 
+    メッセージはテンプレートと引数から初回アクセス時に生成する (遅延評価)。
+    エラーコードのみを集計する用途では文字列整形のコストが発生しない。
+    args・repr()・pickle もテンプレートではなく整形したメッセージを用いる。
+
     Attributes:
         message: エラーメッセージ (str).
         error_code: エラーコード (ErrorCode 列挙型).
     """
 
-    def __init__(self, message: str, error_code: ErrorCode) -> None:
+    def __init__(
+        self,
+        message: str,
+        error_code: ErrorCode,
+        *,
+        message_args: tuple[object, ...] = (),
+    ) -> None:
         """SymbolError を初期化する.
 
         Args:
-            message: エラーメッセージ.
+            message: エラーメッセージ. message_args を指定した場合は
+                str.format 形式のテンプレート (例: "Invalid code: '{0}'").
             error_code: エラーコード.
+            message_args: テンプレートに埋め込む引数.
         """
-        super().__init__(message)
-        self._message = message
+        super().__init__()
+        self._template = message
+        self._message_args = message_args
+        self._message: str | None = None if message_args else message
         self._error_code = error_code
 
     @property
     def message(self) -> str:
-        """エラーメッセージを返す."""
+        """エラーメッセージを返す (初回アクセス時にテンプレートから生成)."""
+        if self._message is None:
+            self._message = self._template.format(*self._message_args)
         return self._message
 
     @property
@@ -74,9 +92,27 @@ class SymbolError(Exception):
         """エラーコードを返す."""
         return self._error_code
 
+    @property
+    def args(self) -> tuple[Any, ...]:
+        """整形したメッセージのみからなるタプルを返す."""
+        return (self.message,)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        """args の代入は先頭の要素によるメッセージの置き換えとして扱う."""
+        self._message = str(value[0]) if value else ""
+
     def __str__(self) -> str:
         """エラーコードとメッセージを含む文字列を返す."""
-        return f"[{self._error_code.value}] {self._message}"
+        return f"[{self._error_code.value}] {self.message}"
+
+    def __repr__(self) -> str:
+        """整形したメッセージを含む表現を返す."""
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """整形したメッセージとエラーコードで再生成し、属性を復元する."""
+        return type(self), (self.message, self._error_code), self.__dict__
 
 
 class SymbolParseError(SymbolError):
@@ -94,15 +130,17 @@ class SymbolParseError(SymbolError):
         error_code: ErrorCode,
         *,
         raw_symbol: str | None = None,
+        message_args: tuple[object, ...] = (),
     ) -> None:
         """SymbolParseError を初期化する.
 
         Args:
-            message: エラーメッセージ.
+            message: エラーメッセージ (またはテンプレート).
             error_code: エラーコード.
             raw_symbol: パースに失敗した元のシンボル文字列.
+            message_args: テンプレートに埋め込む引数.
         """
-        super().__init__(message, error_code)
+        super().__init__(message, error_code, message_args=message_args)
         self._raw_symbol = raw_symbol
 
     @property
@@ -116,6 +154,8 @@ class SymbolParseError(SymbolError):
         message: str,
         error_code: ErrorCode,
         raw_symbol: str,
+        *,
+        message_args: tuple[object, ...] = (),
     ) -> Self:
         """パース失敗時のファクトリメソッド.
 
@@ -124,14 +164,17 @@ class SymbolParseError(SymbolError):
         パース処理からは __init__ よりもこのメソッドの使用を推奨。
 
         Args:
-            message: エラーメッセージ.
+            message: エラーメッセージ (またはテンプレート).
             error_code: エラーコード.
             raw_symbol: パースに失敗した元のシンボル文字列 (必須).
+            message_args: テンプレートに埋め込む引数.
 
         Returns:
             SymbolParseError インスタンス.
         """
-        return cls(message, error_code, raw_symbol=raw_symbol)
+        return cls(
+            message, error_code, raw_symbol=raw_symbol, message_args=message_args
+        )
 
 
 class SymbolValidationError(SymbolError):
@@ -151,16 +194,18 @@ class SymbolValidationError(SymbolError):
         *,
         field_name: str | None = None,
         field_value: object = None,
+        message_args: tuple[object, ...] = (),
     ) -> None:
         """SymbolValidationError を初期化する.
 
         Args:
-            message: エラーメッセージ.
+            message: エラーメッセージ (またはテンプレート).
             error_code: エラーコード.
             field_name: バリデーションに失敗したフィールド名.
             field_value: バリデーションに失敗した値.
+            message_args: テンプレートに埋め込む引数.
         """
-        super().__init__(message, error_code)
+        super().__init__(message, error_code, message_args=message_args)
         self._field_name = field_name
         self._field_value = field_value
 
@@ -173,3 +218,55 @@ class SymbolValidationError(SymbolError):
     def field_value(self) -> object:
         """バリデーションに失敗した値を返す."""
         return self._field_value
+
+
+class SymbolPolicyWarning(UserWarning):
+    """ParserPolicy の警告モード (PolicyMode.WARN) で発行される警告.
+
+    未知の取引所・商品コードなど、ポリシー上は不正だがパースは続行する場合に
+    warnings.warn で発行する。
+
+    Attributes:
+        error_code: 厳格モード (PolicyMode.STRICT) であれば送出されるエラーコード.
+    """
+
+    def __init__(self, message: str, error_code: ErrorCode) -> None:
+        """SymbolPolicyWarning を初期化する.
+
+        Args:
+            message: 警告メッセージ.
+            error_code: 厳格モードであれば送出されるエラーコード.
+        """
+        super().__init__(f"[{error_code.value}] {message}")
+        self.error_code = error_code
+
+
+# 値の変換の失敗として記録する例外 (ValueError は BaseAdapter が変換できない値に
+# 送出するもの)。それ以外の例外は変換関数の誤りとしてそのまま送出する。
+REJECTED_ERRORS: Final = (SymbolError, ValueError)
+
+
+class FailureRecord(NamedTuple):
+    """1つの値のパース・変換の失敗.
+
+    Attributes:
+        code: ErrorCode の値 (例: "E004")。ErrorCode のない例外はクラス名.
+        message: エラーメッセージ.
+    """
+
+    code: str
+    message: str
+
+    @classmethod
+    def from_error(cls, error: Exception) -> Self:
+        """例外から失敗の記録を生成する.
+
+        Args:
+            error: パース・変換で送出された例外.
+
+        Returns:
+            SymbolError はエラーコードの値、それ以外は例外のクラス名を code とする記録.
+        """
+        if isinstance(error, SymbolError):
+            return cls(error.error_code.value, error.message)
+        return cls(type(error).__name__, str(error))
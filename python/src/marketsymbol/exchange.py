@@ -0,0 +1,170 @@
+"""取引所ごとのパースプラグイン.
+
+ExchangePlugin は取引所固有の検査・Symbol 生成の規則を表し、ExchangeRegistry は
+MIC (4文字の取引所コード) -> プラグインの対応を保持する。
+ExchangeRegistry.parse は分割直後に先頭セグメントで辞書を1回引いてプラグインを選び、
+以降の検査・生成をプラグインに任せる。プラグインが登録されていない取引所は
+parse_symbol と同じ汎用の経路で処理する。
+
+振り分けは辞書の1回の参照のみのため、取引所を追加しても
+他の取引所のパースの処理量は変わらない。
+
+Example:
+    >>> from marketsymbol.exchange import ExchangePlugin, ExchangeRegistry
+    >>>
+    >>> class XJPXPlugin(ExchangePlugin):
+    ...     def segment_failure(self, segments):
+    ...         # 汎用の検査の後に取引所固有の検査を加える
+    ...         return super().segment_failure(segments)
+    >>>
+    >>> registry = ExchangeRegistry()
+    >>> registry.register("XJPX", XJPXPlugin())
+    >>> registry.parse("XJPX:7203").code  # XJPXPlugin の経路
+    '7203'
+    >>> registry.parse("XOSE:7203").code  # 汎用の経路
+    '7203'
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from marketsymbol.instrumentation import INSTRUMENTATION
+from marketsymbol.parser import (
+    _build_symbol,
+    _check_input,
+    _check_segments,
+    _instrumented_parse,
+    _normalize,
+    _segment_failure,
+    _split,
+)
+from marketsymbol.validator import check_exchange
+
+if TYPE_CHECKING:
+    from marketsymbol.symbol import Symbol
+    from marketsymbol.validator import ValidationFailure
+
+
+class ExchangePlugin:
+    """取引所固有のパース規則の基底クラス.
+
+    既定の実装は parse_symbol と同じ検査・生成を行う。サブクラスは
+    segment_failure / build をオーバーライドし、取引所固有の規則を加える
+    (汎用の規則を含める場合は super() を呼ぶ)。
+
+    segments は正規化・分割済みのセグメントで、先頭はプラグインを登録した MIC となる。
+    """
+
+    __slots__ = ()
+
+    def segment_failure(self, segments: list[str]) -> ValidationFailure | None:
+        """セグメントを検査し、最初の失敗 (全て有効なら None) を返す."""
+        return _segment_failure(segments)
+
+    def build(self, segments: list[str]) -> Symbol:
+        """検査済みのセグメントから Symbol を生成する."""
+        return _build_symbol(segments)
+
+
+class ExchangeRegistry:
+    """MIC -> ExchangePlugin のスレッドセーフなレジストリ.
+
+    AdapterRegistry と同じく Copy-on-Write で更新し、
+    パース時の参照はロックフリーで行う。
+    """
+
+    def __init__(self) -> None:
+        """空のレジストリを初期化."""
+        self._lock = threading.Lock()
+        self._plugins: dict[str, ExchangePlugin] = {}
+
+    def register(self, mic: str, plugin: ExchangePlugin) -> None:
+        """取引所のプラグインを登録.
+
+        Args:
+            mic: 取引所コード (4文字の大文字英字)
+            plugin: 登録するプラグインインスタンス
+
+        Raises:
+            ValueError: MIC の形式が不正、または既に登録されている場合
+        """
+        if check_exchange(mic) is not None:
+            msg = f"Invalid MIC: {mic!r} (must be 4 uppercase letters)"
+            raise ValueError(msg)
+        with self._lock:
+            if mic in self._plugins:
+                msg = f"Plugin for '{mic}' already registered"
+                raise ValueError(msg)
+            new_plugins = self._plugins.copy()
+            new_plugins[mic] = plugin
+            self._plugins = new_plugins
+
+    def unregister(self, mic: str) -> None:
+        """取引所のプラグインの登録を解除.
+
+        Args:
+            mic: 取引所コード
+
+        Raises:
+            KeyError: プラグインが未登録の場合
+        """
+        with self._lock:
+            if mic not in self._plugins:
+                msg = f"No plugin registered for '{mic}'"
+                raise KeyError(msg)
+            new_plugins = self._plugins.copy()
+            del new_plugins[mic]
+            self._plugins = new_plugins
+
+    def get(self, mic: str) -> ExchangePlugin | None:
+        """プラグインを取得 (未登録の場合は None)."""
+        return self._plugins.get(mic)
+
+    def parse(self, raw: str) -> Symbol:
+        """取引所のプラグインでシンボル文字列をパースする.
+
+        プラグインが未登録の取引所は parse_symbol と同じ結果となる。
+
+        Args:
+            raw: シンボル文字列
+
+        Returns:
+            パース結果の Symbol オブジェクト
+
+        Raises:
+            TypeError: raw が str でない場合
+            SymbolParseError: パース失敗時
+        """
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return _instrumented_parse(raw, self._segment_failure, self._build)
+        _check_input(raw)
+        segments = _split(_normalize(raw), raw)
+        plugin = self._plugins.get(segments[0])
+        if plugin is None:
+            _check_segments(segments, raw)
+            return _build_symbol(segments)
+        failure = plugin.segment_failure(segments)
+        if failure is not None:
+            raise failure.to_parse_error(raw)
+        return plugin.build(segments)
+
+    def _segment_failure(self, segments: list[str]) -> ValidationFailure | None:
+        """計測経路用: 取引所のプラグイン (未登録なら汎用) で検査する."""
+        plugin = self._plugins.get(segments[0])
+        if plugin is None:
+            return _segment_failure(segments)
+        return plugin.segment_failure(segments)
+
+    def _build(self, segments: list[str]) -> Symbol:
+        """計測経路用: 取引所のプラグイン (未登録なら汎用) で生成する."""
+        plugin = self._plugins.get(segments[0])
+        if plugin is None:
+            return _build_symbol(segments)
+        return plugin.build(segments)
+
+    # list() より後の注釈では list がメソッドを指すため、クラスの末尾に定義する
+    def list(self) -> list[str]:
+        """プラグインを登録済みの MIC 一覧を取得."""
+        return list(self._plugins.keys())
@@ -0,0 +1,307 @@
+"""メモリに収まらないシンボルファイルの外部ソートと差分.
+
+sort_symbols は1行1シンボルの入力を parse_symbol と同じ規則でパース・正規化し、
+Symbol の全順序 (sort_key の順) で重複を除いて整列した正規の文字列表現を返す。
+入力を run_lines 行ずつのラン (整列済みの一時ファイル) に分割して整列し、
+ランを k-way マージするため、メモリ使用量は入力の大きさによらず run_lines 行分となる
+(入力が1つのランに収まる場合は一時ファイルを作らない)。
+
+diff_symbols は2つの入力 (例: 前日と当日の銘柄一覧) をそれぞれ外部ソートし、
+整列した2つの列を先頭から突き合わせて、追加・削除・変更なしの Symbol を
+順序どおりに返す。
+
+ランの各行はソートキーを文字列の大小が全順序と一致する形
+(固定幅の 16 進数と、桁数を前置した strike の 16 進数) にしたものと
+正規の文字列表現を並べたもので、マージ・突き合わせは行の文字列の比較のみで行う
+(一時ファイルから読み込んだ行を再度パースしない)。
+
+パースできない行は on_error に (入力名, 行番号, 例外) を渡して読み飛ばす。
+on_error が None の場合は例外をそのまま送出する。空行は読み飛ばす。
+
+Example:
+    >>> from marketsymbol.extsort import diff_symbols, sort_symbols
+    >>> list(sort_symbols(["XJPX:N225O:20250314:P:42000", "xjpx:7203",
+    ...                    "XJPX:N225O:20250314:P:9000", "XJPX:7203"]))
+    ['XJPX:7203', 'XJPX:N225O:20250314:P:9000', 'XJPX:N225O:20250314:P:42000']
+    >>> [(c.status, c.symbol) for c in diff_symbols(
+    ...     ["XJPX:7203", "XJPX:6758"], ["XJPX:7203", "XJPX:9984"]
+    ... )]
+    [('removed', 'XJPX:6758'), ('unchanged', 'XJPX:7203'), ('added', 'XJPX:9984')]
+"""
+
+from __future__ import annotations
+
+import heapq
+import tempfile
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import count, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.errors import SymbolError
+from marketsymbol.parser import (
+    _EQUITY_SEGMENT_COUNT,
+    _OPTION_SEGMENT_COUNT,
+    _check_input,
+    _check_segments,
+    _equity,
+    _future,
+    _normalize,
+    _option,
+    _split,
+)
+from marketsymbol.symbol import _STRIKE_BITS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from marketsymbol.symbol import Symbol
+
+# 1つのランの入力行数の既定値
+RUN_LINES: Final = 1_000_000
+
+# 1回のマージで同時に開くランの数の上限 (超える場合は段階的にマージする)
+MERGE_FAN_IN: Final = 64
+
+# 差分の種類
+ADDED: Final = "added"
+REMOVED: Final = "removed"
+UNCHANGED: Final = "unchanged"
+
+# ソートキーの strike を除く部分の 16 進数の桁数
+# (exchange 21 ビット + code 56 ビット + 資産クラス・限月・オプション種別 31 ビット)
+_PREFIX_DIGITS = 27
+
+# 一時ファイルの読み書きのバッファのサイズ (バイト)
+_BUFFER_SIZE = 1 << 20
+
+# パースできない行の通知先 (入力名, 行番号, 例外)
+type ErrorHandler = Callable[[str, int, SymbolError], None]
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolChange:
+    """差分の1件.
+
+    Attributes:
+        status: 差分の種類 ("added": new のみ、"removed": old のみ、
+            "unchanged": 両方に含まれる).
+        symbol: シンボルの正規の文字列表現.
+    """
+
+    status: str
+    symbol: str
+
+
+def sort_symbols(
+    lines: Iterable[str],
+    *,
+    run_lines: int = RUN_LINES,
+    tmpdir: str | Path | None = None,
+    source: str = "<input>",
+    on_error: ErrorHandler | None = None,
+) -> Iterator[str]:
+    """シンボルを全順序で整列し、重複を除いた正規の文字列表現を返す.
+
+    Args:
+        lines: 1行1シンボルの入力 (ファイルオブジェクトなど、末尾の改行は無視する)
+        run_lines: 1つのランの入力行数 (メモリに保持する行数の上限)
+        tmpdir: ランの一時ファイルを作るディレクトリ (None は既定の一時ディレクトリ)
+        source: on_error に渡す入力名
+        on_error: パースできない行の通知先 (None の場合は例外を送出する)
+
+    Returns:
+        正規の文字列表現のイテレータ (順序は Symbol の全順序)
+
+    Raises:
+        ValueError: run_lines が 1 未満の場合
+        SymbolParseError: on_error が None で、パースできない行がある場合
+    """
+    _check_run_lines(run_lines)
+    return _symbols(_sorted_records(lines, run_lines, tmpdir, source, on_error))
+
+
+def diff_symbols(
+    old: Iterable[str],
+    new: Iterable[str],
+    *,
+    unchanged: bool = True,
+    run_lines: int = RUN_LINES,
+    tmpdir: str | Path | None = None,
+    on_error: ErrorHandler | None = None,
+) -> Iterator[SymbolChange]:
+    """2つのシンボルの入力を外部ソートし、差分を全順序で返す.
+
+    各入力の重複は除く。on_error には入力名として "old" / "new" を渡す。
+
+    Args:
+        old: 比較元の入力 (1行1シンボル)
+        new: 比較先の入力 (1行1シンボル)
+        unchanged: 両方に含まれる Symbol も返すかどうか
+        run_lines: 1つのランの入力行数 (入力ごと)
+        tmpdir: ランの一時ファイルを作るディレクトリ
+        on_error: パースできない行の通知先 (None の場合は例外を送出する)
+
+    Returns:
+        SymbolChange のイテレータ
+
+    Raises:
+        ValueError: run_lines が 1 未満の場合
+        SymbolParseError: on_error が None で、パースできない行がある場合
+    """
+    _check_run_lines(run_lines)
+    return _diff(
+        _sorted_records(old, run_lines, tmpdir, "old", on_error),
+        _sorted_records(new, run_lines, tmpdir, "new", on_error),
+        unchanged=unchanged,
+    )
+
+
+def _check_run_lines(run_lines: int) -> None:
+    """run_lines を検査する (ジェネレーターの開始前に送出するため分離する)."""
+    if run_lines < 1:
+        msg = "run_lines must be >= 1"
+        raise ValueError(msg)
+
+
+def _parse(raw: str) -> Symbol:
+    """parse_symbol と同じ規則でパースする.
+
+    検査済みのセグメントから Symbol を直接生成する (フィールドを再検査しない)。
+    """
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    _check_segments(segments, raw)
+    exchange, code = segments[0], segments[1]
+    if len(segments) == _EQUITY_SEGMENT_COUNT:
+        return _equity(exchange, code)
+    expiry, type_indicator = segments[2], segments[3]
+    if type_indicator == "F":
+        return _future(exchange, code, expiry)
+    strike = int(segments[4]) if len(segments) == _OPTION_SEGMENT_COUNT else None
+    return _option(exchange, code, expiry, type_indicator, strike)
+
+
+def _record(symbol: Symbol) -> str:
+    """ソートキーと正規の文字列表現の行 (文字列の大小が全順序と一致する) を返す.
+
+    sort_key は 2**64 - 1 を超える strike を区別しないため、strike は桁数を
+    前置した 16 進数として別に付ける。
+    """
+    strike = f"{symbol._strike():x}"
+    prefix = symbol.sort_key >> _STRIKE_BITS
+    return f"{prefix:0{_PREFIX_DIGITS}x}{len(strike):02x}{strike}\t{symbol}\n"
+
+
+def _symbol_text(record: str) -> str:
+    """ランの行から正規の文字列表現を取り出す."""
+    return record[record.index("\t") + 1 : -1]
+
+
+def _symbols(records: Iterator[str]) -> Iterator[str]:
+    """ランの行の列を正規の文字列表現の列にする."""
+    for record in records:
+        yield _symbol_text(record)
+
+
+def _parsed_records(
+    lines: Iterable[str], source: str, on_error: ErrorHandler | None
+) -> Iterator[str]:
+    """入力の各行をパースしてランの行にする (空行は読み飛ばす)."""
+    for line_number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            symbol = _parse(line.rstrip("\n"))
+        except SymbolError as e:
+            if on_error is None:
+                raise
+            on_error(source, line_number, e)
+            continue
+        yield _record(symbol)
+
+
+def _sorted_records(
+    lines: Iterable[str],
+    run_lines: int,
+    tmpdir: str | Path | None,
+    source: str,
+    on_error: ErrorHandler | None,
+) -> Iterator[str]:
+    """入力をランに分けて整列し、マージしたランの行 (重複を除く) を返す."""
+    records = _parsed_records(lines, source, on_error)
+    run = sorted(set(islice(records, run_lines)))
+    first = next(records, None)
+    if first is None:
+        # 1つのランに収まる: 一時ファイルを作らない
+        yield from run
+        return
+    with tempfile.TemporaryDirectory(prefix="marketsymbol-", dir=tmpdir) as name:
+        directory = Path(name)
+        numbers = count()
+        paths = [_write_run(directory, next(numbers), run)]
+        del run
+        while first is not None:
+            chunk = [first, *islice(records, run_lines - 1)]
+            paths.append(_write_run(directory, next(numbers), sorted(set(chunk))))
+            del chunk
+            first = next(records, None)
+        while len(paths) > MERGE_FAN_IN:
+            # 先頭の MERGE_FAN_IN 個をマージした1つのランに置き換える
+            group, paths = paths[:MERGE_FAN_IN], paths[MERGE_FAN_IN:]
+            with ExitStack() as stack:
+                paths.append(_write_run(directory, next(numbers), _merge(stack, group)))
+            for path in group:
+                path.unlink()
+        with ExitStack() as stack:
+            yield from _merge(stack, paths)
+
+
+def _write_run(directory: Path, number: int, records: Iterable[str]) -> Path:
+    """整列済みのランの行を一時ファイルに書き出す."""
+    path = directory / f"run-{number:06d}.txt"
+    with path.open("w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+        f.writelines(records)
+    return path
+
+
+def _merge(stack: ExitStack, paths: list[Path]) -> Iterator[str]:
+    """整列済みのランを開いてマージし、重複を除いた行を返す (ファイルは stack が閉じる)."""
+    files = [
+        stack.enter_context(path.open(encoding="utf-8", buffering=_BUFFER_SIZE))
+        for path in paths
+    ]
+    previous = None
+    for record in heapq.merge(*files):
+        if record != previous:
+            yield record
+            previous = record
+
+
+def _diff(
+    old: Iterator[str], new: Iterator[str], *, unchanged: bool
+) -> Iterator[SymbolChange]:
+    """整列済みの2つのランの行の列を突き合わせる."""
+    a = next(old, None)
+    b = next(new, None)
+    while a is not None and b is not None:
+        if a < b:
+            yield SymbolChange(REMOVED, _symbol_text(a))
+            a = next(old, None)
+        elif b < a:
+            yield SymbolChange(ADDED, _symbol_text(b))
+            b = next(new, None)
+        else:
+            if unchanged:
+                yield SymbolChange(UNCHANGED, _symbol_text(a))
+            a = next(old, None)
+            b = next(new, None)
+    if a is not None:
+        yield SymbolChange(REMOVED, _symbol_text(a))
+        for record in old:
+            yield SymbolChange(REMOVED, _symbol_text(record))
+    if b is not None:
+        yield SymbolChange(ADDED, _symbol_text(b))
+        for record in new:
+            yield SymbolChange(ADDED, _symbol_text(record))
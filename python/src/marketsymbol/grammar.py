@@ -0,0 +1,426 @@
+"""シンボル文法のレジストリ.
+
+Grammar は1つのシンボル形式 (資産クラス) を宣言的に表す:
+
+- セグメントの形 (セグメントごとの検査関数。セグメント数は検査関数の数)
+- 判別セグメント (タイプ識別子の位置) と、この文法が受け付ける値
+- 検査済みのセグメントから Symbol を生成する関数
+
+GrammarRegistry は登録された文法を (セグメント数, タイプ識別子) をキーとする
+振り分け表にコンパイルする。パース時の振り分けは辞書の参照 (最大2回) のみで、
+文法の数に依存しない。組み込みの文法 (BUILTIN_GRAMMARS) のみを登録した
+レジストリの結果 (値・エラーコード・メッセージ) は parse_symbol と一致する。
+
+Example:
+    >>> from marketsymbol.grammar import GrammarRegistry
+    >>> registry = GrammarRegistry.default()
+    >>> registry.list()
+    ['equity', 'future', 'option_series', 'option']
+    >>> registry.parse("XJPX:NK:20250314:F").code
+    'NK'
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from marketsymbol.enums import OptionType
+from marketsymbol.errors import ErrorCode
+from marketsymbol.instrumentation import INSTRUMENTATION
+from marketsymbol.parser import (
+    _check_input,
+    _instrumented_parse,
+    _normalize,
+    _segment_failure,
+    _split,
+    _strike_failure,
+)
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+from marketsymbol.validator import (
+    ValidationFailure,
+    check_code,
+    check_exchange,
+    check_expiry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from marketsymbol.symbol import Symbol
+
+    _FieldCheck = Callable[[str], ValidationFailure | None]
+
+# parse_symbol が扱うセグメント数 (振り分けに失敗した場合のエラーを合わせる)
+_BUILTIN_SEGMENT_COUNTS = frozenset({2, 4, 5})
+
+# 先物・オプションのタイプ識別子の位置
+_TYPE_INDICATOR_INDEX = 3
+
+_SEGMENT_COUNT_MESSAGE = "Invalid segment count: {{0}} (expected {0})"
+_NO_GRAMMAR_MESSAGE = "Invalid segment count: {0} (no grammars registered)"
+_TYPE_INDICATOR_MESSAGE = "Invalid type indicator: '{{0}}' (expected {0})"
+
+
+@dataclass(frozen=True, slots=True)
+class Grammar:
+    """シンボル形式の文法.
+
+    Attributes:
+        name: 文法の名前 (レジストリ内で一意).
+        fields: セグメントごとの検査関数 (None は検査しない)。
+            セグメント数は要素数となり、検査はセグメントの順に行う.
+        build: 検査済みのセグメントから Symbol を生成する関数.
+        discriminator: 判別セグメントの位置 (None は判別しない).
+        type_indicators: 判別セグメントでこの文法が受け付ける値.
+    """
+
+    name: str
+    fields: tuple[_FieldCheck | None, ...]
+    build: Callable[[list[str]], Symbol]
+    discriminator: int | None = None
+    type_indicators: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        """判別セグメントの指定を検査する.
+
+        Raises:
+            ValueError: 判別セグメントの位置が範囲外、または位置と値の
+                指定が一方のみの場合.
+        """
+        if not self.fields:
+            msg = f"Grammar '{self.name}' must declare at least one segment"
+            raise ValueError(msg)
+        if self.discriminator is None:
+            if self.type_indicators:
+                msg = f"Grammar '{self.name}' has type indicators but no discriminator"
+                raise ValueError(msg)
+            return
+        if not 0 <= self.discriminator < len(self.fields):
+            msg = (
+                f"Grammar '{self.name}' discriminator {self.discriminator} "
+                f"is out of range for {len(self.fields)} segments"
+            )
+            raise ValueError(msg)
+        if not self.type_indicators:
+            msg = f"Grammar '{self.name}' has a discriminator but no type indicators"
+            raise ValueError(msg)
+
+    @property
+    def segment_count(self) -> int:
+        """セグメント数を返す."""
+        return len(self.fields)
+
+
+class _CompiledGrammar(NamedTuple):
+    """振り分け表の要素 (検査する (位置, 検査関数) と生成関数)."""
+
+    name: str
+    checks: tuple[tuple[int, _FieldCheck], ...]
+    build: Callable[[list[str]], Symbol]
+
+
+class _DispatchTable(NamedTuple):
+    """コンパイル済みの振り分け表.
+
+    table はセグメント数 -> (判別セグメントの位置, タイプ識別子 -> 文法)。
+    判別しない文法のタイプ識別子のキーは None とする。
+    """
+
+    table: dict[int, tuple[int | None, dict[str | None, _CompiledGrammar]]]
+    segment_count_message: str
+
+
+class GrammarRegistry:
+    """文法を登録し、振り分け表にコンパイルするレジストリ.
+
+    登録・解除のたびに振り分け表を作り直して置き換える (Copy-on-Write)。
+    パース時の参照はロックフリーで行う。
+    """
+
+    def __init__(self, grammars: Iterable[Grammar] = ()) -> None:
+        """文法を登録したレジストリを初期化.
+
+        Args:
+            grammars: 登録する文法 (登録順)
+
+        Raises:
+            ValueError: 文法が競合する場合
+        """
+        self._lock = threading.Lock()
+        self._grammars: tuple[Grammar, ...] = ()
+        self._dispatch = _compile(())
+        for grammar in grammars:
+            self.register(grammar)
+
+    @classmethod
+    def default(cls) -> GrammarRegistry:
+        """組み込みの文法 (parse_symbol と同じ形式) を登録したレジストリを返す."""
+        return cls(BUILTIN_GRAMMARS)
+
+    def register(self, grammar: Grammar) -> None:
+        """文法を登録.
+
+        Args:
+            grammar: 登録する文法
+
+        Raises:
+            ValueError: 同じ名前の文法が登録済み、または既存の文法と
+                (セグメント数, タイプ識別子) / 判別セグメントの位置が競合する場合
+        """
+        with self._lock:
+            if any(g.name == grammar.name for g in self._grammars):
+                msg = f"Grammar '{grammar.name}' already registered"
+                raise ValueError(msg)
+            grammars = (*self._grammars, grammar)
+            self._dispatch = _compile(grammars)
+            self._grammars = grammars
+
+    def unregister(self, name: str) -> None:
+        """文法の登録を解除.
+
+        Args:
+            name: 文法の名前
+
+        Raises:
+            KeyError: 文法が未登録の場合
+        """
+        with self._lock:
+            grammars = tuple(g for g in self._grammars if g.name != name)
+            if len(grammars) == len(self._grammars):
+                msg = f"No grammar registered for '{name}'"
+                raise KeyError(msg)
+            self._dispatch = _compile(grammars)
+            self._grammars = grammars
+
+    def get(self, name: str) -> Grammar | None:
+        """文法を取得 (未登録の場合は None)."""
+        return next((g for g in self._grammars if g.name == name), None)
+
+    def parse(self, raw: str) -> Symbol:
+        """登録された文法でシンボル文字列をパースする.
+
+        Args:
+            raw: シンボル文字列
+
+        Returns:
+            パース結果の Symbol オブジェクト
+
+        Raises:
+            TypeError: raw が str でない場合
+            SymbolParseError: パース失敗時 (該当する文法がない場合を含む)
+        """
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return _instrumented_parse(raw, self._segment_failure, self._build)
+        _check_input(raw)
+        segments = _split(_normalize(raw), raw)
+        dispatch = self._dispatch
+        grammar = _lookup(dispatch, segments)
+        if grammar is None:
+            raise _dispatch_failure(dispatch, segments).to_parse_error(raw)
+        for index, check in grammar.checks:
+            failure = check(segments[index])
+            if failure is not None:
+                raise failure.to_parse_error(raw)
+        return grammar.build(segments)
+
+    def _segment_failure(self, segments: list[str]) -> ValidationFailure | None:
+        """計測経路用: 振り分けた文法でセグメントを検査する."""
+        dispatch = self._dispatch
+        grammar = _lookup(dispatch, segments)
+        if grammar is None:
+            return _dispatch_failure(dispatch, segments)
+        for index, check in grammar.checks:
+            failure = check(segments[index])
+            if failure is not None:
+                return failure
+        return None
+
+    def _build(self, segments: list[str]) -> Symbol:
+        """計測経路用: 振り分けた文法で Symbol を生成する (検査済みの前提)."""
+        grammar = _lookup(self._dispatch, segments)
+        if grammar is None:  # 検査と生成の間に文法の登録が変わった場合
+            raise _dispatch_failure(self._dispatch, segments).to_parse_error(
+                ":".join(segments)
+            )
+        return grammar.build(segments)
+
+    # list() より後の注釈では list がメソッドを指すため、クラスの末尾に定義する
+    def list(self) -> list[str]:
+        """登録済みの文法の名前一覧を登録順に取得."""
+        return [grammar.name for grammar in self._grammars]
+
+
+def _lookup(dispatch: _DispatchTable, segments: list[str]) -> _CompiledGrammar | None:
+    """(セグメント数, タイプ識別子) で文法を引く (該当なしは None)."""
+    entry = dispatch.table.get(len(segments))
+    if entry is None:
+        return None
+    index, grammars = entry
+    return grammars.get(None if index is None else segments[index])
+
+
+def _dispatch_failure(
+    dispatch: _DispatchTable, segments: list[str]
+) -> ValidationFailure:
+    """振り分けに失敗したセグメントの失敗内容を返す.
+
+    parse_symbol と同じセグメント数では parse_symbol の検査を優先し、
+    エラーコード・メッセージを合わせる。
+    """
+    segment_count = len(segments)
+    if segment_count in _BUILTIN_SEGMENT_COUNTS:
+        failure = _segment_failure(segments)
+        if failure is not None:
+            return failure
+    index, grammars = dispatch.table.get(segment_count, (None, {}))
+    if index is None:
+        return ValidationFailure(
+            ErrorCode.INVALID_SEGMENT_COUNT,
+            dispatch.segment_count_message,
+            (segment_count,),
+            "segments",
+            segment_count,
+        )
+    expected = ", ".join(sorted(str(key) for key in grammars))
+    return ValidationFailure(
+        ErrorCode.INVALID_OPTION_TYPE,
+        _TYPE_INDICATOR_MESSAGE.format(expected),
+        (segments[index],),
+        "type_indicator",
+        segments[index],
+    )
+
+
+def _compile(grammars: tuple[Grammar, ...]) -> _DispatchTable:
+    """文法を振り分け表にコンパイルする.
+
+    Raises:
+        ValueError: 文法が競合する場合
+    """
+    table: dict[int, tuple[int | None, dict[str | None, _CompiledGrammar]]] = {}
+    for grammar in grammars:
+        count = grammar.segment_count
+        entry = table.setdefault(count, (grammar.discriminator, {}))
+        index, by_indicator = entry
+        if index != grammar.discriminator:
+            msg = (
+                f"Grammar '{grammar.name}' discriminates on segment "
+                f"{grammar.discriminator}, but another {count}-segment grammar "
+                f"discriminates on segment {index}"
+            )
+            raise ValueError(msg)
+        compiled = _CompiledGrammar(
+            grammar.name,
+            tuple(
+                (position, check)
+                for position, check in enumerate(grammar.fields)
+                if check is not None
+            ),
+            grammar.build,
+        )
+        keys: Iterable[str | None] = grammar.type_indicators or (None,)
+        for key in keys:
+            other = by_indicator.get(key)
+            if other is not None:
+                msg = (
+                    f"Grammar '{grammar.name}' conflicts with '{other.name}' "
+                    f"({count} segments, type indicator {key!r})"
+                )
+                raise ValueError(msg)
+            by_indicator[key] = compiled
+    return _DispatchTable(table, _segment_count_message(sorted(table)))
+
+
+def _segment_count_message(counts: list[int]) -> str:
+    """登録済みのセグメント数を列挙したエラーメッセージテンプレートを返す.
+
+    組み込みの文法のみの場合は parse_symbol と同じ '2, 4, or 5' となる。
+    """
+    if not counts:
+        return _NO_GRAMMAR_MESSAGE
+    names = [str(count) for count in counts]
+    if len(names) == 1:
+        expected = names[0]
+    elif len(names) == 2:
+        expected = f"{names[0]} or {names[1]}"
+    else:
+        expected = f"{', '.join(names[:-1])}, or {names[-1]}"
+    return _SEGMENT_COUNT_MESSAGE.format(expected)
+
+
+def _check_strike_segment(strike_str: str) -> ValidationFailure | None:
+    """C / P オプションの strike セグメントを検査する."""
+    return _strike_failure("C", strike_str)
+
+
+def _build_equity(segments: list[str]) -> Symbol:
+    """株式の Symbol を生成する."""
+    return EquitySymbol(exchange=segments[0], code=segments[1])
+
+
+def _build_future(segments: list[str]) -> Symbol:
+    """先物の Symbol を生成する."""
+    return FutureSymbol(exchange=segments[0], code=segments[1], expiry=segments[2])
+
+
+def _build_option_series(segments: list[str]) -> Symbol:
+    """オプションシリーズ (strike なし) の Symbol を生成する."""
+    return OptionSymbol(
+        exchange=segments[0],
+        code=segments[1],
+        expiry=segments[2],
+        option_type=OptionType.SERIES,
+        strike=None,
+    )
+
+
+def _build_option(segments: list[str]) -> Symbol:
+    """C / P オプションの Symbol を生成する."""
+    return OptionSymbol(
+        exchange=segments[0],
+        code=segments[1],
+        expiry=segments[2],
+        option_type=OptionType(segments[3]),
+        strike=int(segments[4]),
+    )
+
+
+EQUITY_GRAMMAR: Final = Grammar("equity", (check_exchange, check_code), _build_equity)
+"""株式: exchange:code."""
+
+FUTURE_GRAMMAR: Final = Grammar(
+    "future",
+    (check_exchange, check_code, check_expiry, None),
+    _build_future,
+    discriminator=_TYPE_INDICATOR_INDEX,
+    type_indicators=frozenset({"F"}),
+)
+"""先物: exchange:code:expiry:F."""
+
+OPTION_SERIES_GRAMMAR: Final = Grammar(
+    "option_series",
+    (check_exchange, check_code, check_expiry, None),
+    _build_option_series,
+    discriminator=_TYPE_INDICATOR_INDEX,
+    type_indicators=frozenset({"O"}),
+)
+"""オプションシリーズ: exchange:code:expiry:O."""
+
+OPTION_GRAMMAR: Final = Grammar(
+    "option",
+    (check_exchange, check_code, check_expiry, None, _check_strike_segment),
+    _build_option,
+    discriminator=_TYPE_INDICATOR_INDEX,
+    type_indicators=frozenset({"C", "P"}),
+)
+"""オプション: exchange:code:expiry:(C|P):strike."""
+
+# parse_symbol と同じ形式の組み込みの文法
+BUILTIN_GRAMMARS: Final = (
+    EQUITY_GRAMMAR,
+    FUTURE_GRAMMAR,
+    OPTION_SERIES_GRAMMAR,
+    OPTION_GRAMMAR,
+)
@@ -0,0 +1,34 @@
+"""計測 (metrics・tracing) の有効状態のフラグ.
+
+parse_symbol などの計測対象の関数は、ホットパスでこのモジュールの
+INSTRUMENTATION のみを参照する。metrics・tracing モジュール (と依存する
+threading) は計測が有効な場合に限り、記録の直前に遅延インポートする。
+そのため計測を使わないパースはこれらのインポートのコストを負わない。
+
+フラグは MetricsCollector.enabled・Tracer.active の実体であり、
+プロセス全体の METRICS・TRACER が INSTRUMENTATION を共有する。
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+
+class InstrumentationFlags:
+    """メトリクス計測・トレーシングの有効状態.
+
+    Attributes:
+        metrics: メトリクス計測が有効なら True.
+        tracing: トレースフックが1つ以上登録されていれば True.
+    """
+
+    __slots__ = ("metrics", "tracing")
+
+    def __init__(self) -> None:
+        """フラグを初期化 (いずれも無効)."""
+        self.metrics = False
+        self.tracing = False
+
+
+# プロセス全体の METRICS・TRACER が共有するフラグ
+INSTRUMENTATION: Final = InstrumentationFlags()
@@ -0,0 +1,315 @@
+"""パース・アダプター変換のランタイムメトリクス.
+
+オプトイン方式の計測レイヤーを提供する。有効化すると parse_symbol と
+AdapterRegistry 経由の変換について、以下をスレッドごとのカウンタに記録する:
+
+- 資産クラス別のパース成功数
+- ErrorCode 別のパース失敗数
+- ベンダー別の変換回数・失敗数
+- 累積処理時間 (ナノ秒)
+
+記録はスレッドローカルのカウンタに対して行うためロック不要で、
+読み取り (snapshot) 時に全スレッド分を集計する。終了したスレッドのカウンタは
+退役済みの合計に加算して登録を解除するため、スレッドを入れ替えるスレッドプールでも
+登録数は生存しているスレッドの数に留まる。
+無効時の呼び出し側のコストはフラグ参照1回のみ。
+
+Example:
+    >>> from marketsymbol import parse_symbol
+    >>> from marketsymbol.metrics import (
+    ...     disable_metrics, enable_metrics, metrics_snapshot,
+    ... )
+    >>> enable_metrics()
+    >>> _ = parse_symbol("XJPX:7203")
+    >>> metrics_snapshot().parse_count
+    1
+    >>> disable_metrics()
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from marketsymbol.enums import AssetClass
+from marketsymbol.errors import ErrorCode
+from marketsymbol.instrumentation import INSTRUMENTATION, InstrumentationFlags
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class ConversionStats:
+    """ベンダー1件分の変換統計.
+
+    Attributes:
+        to_symbol: to_symbol (ベンダー -> 統一) の呼び出し回数.
+        from_symbol: from_symbol (統一 -> ベンダー) の呼び出し回数.
+        errors: 例外で終了した呼び出し回数.
+        time_ns: 累積処理時間 (ナノ秒).
+    """
+
+    to_symbol: int
+    from_symbol: int
+    errors: int
+    time_ns: int
+
+    @property
+    def calls(self) -> int:
+        """変換の総呼び出し回数を返す."""
+        return self.to_symbol + self.from_symbol
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """全スレッド分を集計したメトリクスのスナップショット.
+
+    Attributes:
+        parses: 資産クラス別のパース成功数.
+        parse_errors: ErrorCode 別のパース失敗数.
+        parse_time_ns: parse_symbol の累積処理時間 (成功・失敗の合計, ナノ秒).
+        conversions: ベンダー名 -> 変換統計.
+    """
+
+    parses: Mapping[AssetClass, int]
+    parse_errors: Mapping[ErrorCode, int]
+    parse_time_ns: int
+    conversions: Mapping[str, ConversionStats]
+
+    @property
+    def parse_count(self) -> int:
+        """パース成功数の合計を返す."""
+        return sum(self.parses.values())
+
+    @property
+    def parse_error_count(self) -> int:
+        """パース失敗数の合計を返す."""
+        return sum(self.parse_errors.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """メトリクスシステムへのエクスポート用に JSON 互換の dict を返す.
+
+        キーは列挙型の値 (例: 'equity', 'E004') に変換する。
+        """
+        return {
+            "parse": {
+                "by_asset_class": {k.value: v for k, v in self.parses.items()},
+                "errors": {k.value: v for k, v in self.parse_errors.items()},
+                "time_ns": self.parse_time_ns,
+            },
+            "conversions": {
+                vendor: {
+                    "to_symbol": stats.to_symbol,
+                    "from_symbol": stats.from_symbol,
+                    "errors": stats.errors,
+                    "time_ns": stats.time_ns,
+                }
+                for vendor, stats in self.conversions.items()
+            },
+        }
+
+
+class _ThreadCounters:
+    """1スレッド分のカウンタ (所有スレッドのみが更新する)."""
+
+    __slots__ = ("conversions", "generation", "parse_errors", "parse_time_ns", "parses")
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.parses = dict.fromkeys(AssetClass, 0)
+        self.parse_errors = dict.fromkeys(ErrorCode, 0)
+        self.parse_time_ns = 0
+        # vendor -> [to_symbol, from_symbol, errors, time_ns]
+        self.conversions: dict[str, list[int]] = {}
+
+    def add(self, other: _ThreadCounters) -> None:
+        """other のカウンタを加算する (other は所有スレッドが更新中でもよい)."""
+        for asset_class, count in other.parses.copy().items():
+            self.parses[asset_class] += count
+        for error_code, count in other.parse_errors.copy().items():
+            self.parse_errors[error_code] += count
+        self.parse_time_ns += other.parse_time_ns
+        for vendor, stats in other.conversions.copy().items():
+            total = self.conversions.setdefault(vendor, [0, 0, 0, 0])
+            for i, value in enumerate(stats.copy()):
+                total[i] += value
+
+
+class _Owner:
+    """スレッドローカルに置く、カウンタの所有者の目印.
+
+    スレッドの終了 (またはカウンタの差し替え) でスレッドローカルの値とともに
+    破棄され、weakref.finalize でカウンタを退役させる。
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+# conversions リストのインデックス
+_TO_SYMBOL = 0
+_FROM_SYMBOL = 1
+_ERRORS = 2
+_TIME_NS = 3
+
+
+class MetricsCollector:
+    """スレッドごとのカウンタを管理し、読み取り時に集計するコレクター.
+
+    有効状態は InstrumentationFlags.metrics に保持する。計測対象の関数は
+    ホットパスでフラグを参照し、処理時間を測って record_* で記録する。
+    カウンタの登録・退役・集計・リセットのみロックを取得する。
+    """
+
+    def __init__(self, flags: InstrumentationFlags | None = None) -> None:
+        """コレクターを初期化 (無効状態).
+
+        Args:
+            flags: 有効状態を保持するフラグ (None は専用のフラグを作成する).
+        """
+        self._flags = InstrumentationFlags() if flags is None else flags
+        self._flags.metrics = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+        self._counters: set[_ThreadCounters] = set()
+        # 終了したスレッドのカウンタの合計
+        self._retired = _ThreadCounters(0)
+
+    @property
+    def enabled(self) -> bool:
+        """計測が有効なら True を返す."""
+        return self._flags.metrics
+
+    def enable(self) -> None:
+        """計測を有効にする."""
+        self._flags.metrics = True
+
+    def disable(self) -> None:
+        """計測を無効にする (記録済みの値は保持する)."""
+        self._flags.metrics = False
+
+    def reset(self) -> None:
+        """全スレッドのカウンタを破棄する.
+
+        各スレッドは次回の記録時に新しいカウンタを作成する。
+        """
+        with self._lock:
+            self._generation += 1
+            self._counters = set()
+            self._retired = _ThreadCounters(self._generation)
+
+    def _thread_counters(self) -> _ThreadCounters:
+        """呼び出しスレッドのカウンタを返す (未作成なら登録する)."""
+        counters: _ThreadCounters | None = getattr(self._local, "counters", None)
+        if counters is None or counters.generation != self._generation:
+            with self._lock:
+                counters = _ThreadCounters(self._generation)
+                self._counters.add(counters)
+            owner = _Owner()
+            # プロセスの終了時に生存しているスレッドのカウンタは退役させない
+            weakref.finalize(owner, self._retire, counters).atexit = False
+            # 差し替えた所有者の破棄で古いカウンタを退役させる (ロックの外で行う)
+            self._local.counters = counters
+            self._local.owner = owner
+        return counters
+
+    def _retire(self, counters: _ThreadCounters) -> None:
+        """所有スレッドが終了したカウンタを退役済みの合計に加算し、登録を解除する.
+
+        reset 前の世代のカウンタは加算せずに破棄する。
+        """
+        with self._lock:
+            self._counters.discard(counters)
+            if counters.generation == self._generation:
+                self._retired.add(counters)
+
+    def record_parse(
+        self,
+        asset_class: AssetClass | None,
+        error_code: ErrorCode | None,
+        elapsed_ns: int,
+    ) -> None:
+        """パース1回分の結果と処理時間を記録する.
+
+        Args:
+            asset_class: 成功時の資産クラス (失敗時は None).
+            error_code: 失敗時のエラーコード (成功時は None).
+            elapsed_ns: 処理時間 (ナノ秒).
+        """
+        counters = self._thread_counters()
+        counters.parse_time_ns += elapsed_ns
+        if asset_class is not None:
+            counters.parses[asset_class] += 1
+        elif error_code is not None:
+            counters.parse_errors[error_code] += 1
+
+    def record_conversion(
+        self,
+        vendor: str,
+        *,
+        to_symbol: bool,
+        failed: bool,
+        elapsed_ns: int,
+    ) -> None:
+        """アダプター変換1回分を記録する.
+
+        Args:
+            vendor: ベンダー識別名.
+            to_symbol: True なら to_symbol、False なら from_symbol として記録.
+            failed: 例外で終了した場合は True.
+            elapsed_ns: 処理時間 (ナノ秒).
+        """
+        conversions = self._thread_counters().conversions
+        stats = conversions.get(vendor)
+        if stats is None:
+            stats = conversions[vendor] = [0, 0, 0, 0]
+        stats[_TO_SYMBOL if to_symbol else _FROM_SYMBOL] += 1
+        if failed:
+            stats[_ERRORS] += 1
+        stats[_TIME_NS] += elapsed_ns
+
+    def snapshot(self) -> MetricsSnapshot:
+        """全スレッド (終了したスレッドを含む) のカウンタを集計したスナップショットを返す."""
+        total = _ThreadCounters(0)
+        with self._lock:
+            all_counters = list(self._counters)
+            total.add(self._retired)
+        for counters in all_counters:
+            total.add(counters)
+
+        return MetricsSnapshot(
+            parses=total.parses,
+            parse_errors=total.parse_errors,
+            parse_time_ns=total.parse_time_ns,
+            conversions={
+                vendor: ConversionStats(*stats)
+                for vendor, stats in sorted(total.conversions.items())
+            },
+        )
+
+
+# プロセス全体で共有するコレクター
+METRICS: Final = MetricsCollector(INSTRUMENTATION)
+
+
+def enable_metrics() -> None:
+    """プロセス全体のメトリクス計測を有効にする."""
+    METRICS.enable()
+
+
+def disable_metrics() -> None:
+    """プロセス全体のメトリクス計測を無効にする."""
+    METRICS.disable()
+
+
+def reset_metrics() -> None:
+    """プロセス全体のメトリクスをリセットする."""
+    METRICS.reset()
+
+
+def metrics_snapshot() -> MetricsSnapshot:
+    """プロセス全体のメトリクスのスナップショットを返す."""
+    return METRICS.snapshot()
@@ -1,27 +1,62 @@
 """marketsymbol のパーサー機能.
 
 シンボル文字列の正規化とパースを提供する。
+
+parse_symbol は正規化・分割・検査・生成の4段階で処理する。
+メトリクス計測 (metrics) またはトレーシング (tracing) が有効な場合のみ
+段階ごとの時間計測を行う経路に切り替わる。metrics・tracing モジュールは
+その経路で初めてインポートするため、計測を使わないパースは読み込まない。
 """
 
+from __future__ import annotations
+
+import time
 import unicodedata
+from functools import cache
+from itertools import pairwise
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 from marketsymbol.constants import MAX_SYMBOL_LENGTH
-from marketsymbol.enums import OptionType
-from marketsymbol.errors import ErrorCode, SymbolParseError, SymbolValidationError
+from marketsymbol.enums import AssetClass, OptionType
+from marketsymbol.errors import ErrorCode, SymbolParseError
+from marketsymbol.instrumentation import INSTRUMENTATION
 from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol, Symbol
 from marketsymbol.validator import (
-    validate_code,
-    validate_exchange,
-    validate_expiry,
-    validate_option_type,
-    validate_strike,
+    ValidationFailure,
+    check_code,
+    check_exchange,
+    check_expiry,
+    check_option_type,
+    check_strike,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marketsymbol.metrics import MetricsCollector
+    from marketsymbol.tracing import ParseStages, TracedOperation, TraceEvent, Tracer
+
 # セグメント数の定数
 _EQUITY_SEGMENT_COUNT = 2
 _FUTURE_SEGMENT_COUNT = 4
 _OPTION_SEGMENT_COUNT = 5
-_SERIES_SEGMENT_COUNT = 4
+
+# 段階別計測の段階数 (正規化・分割・検査・生成)
+_STAGE_COUNT = 4
+
+# パーサー固有のエラーメッセージテンプレート (整形は例外側で遅延実行)
+_TOO_LONG_MESSAGE = f"Symbol too long: {{0}} characters (max {MAX_SYMBOL_LENGTH})"
+_SEGMENT_COUNT_MESSAGE = "Invalid segment count: {0} (expected 2, 4, or 5)"
+_STRIKE_REQUIRED_MESSAGE = "Option type '{0}' requires strike price"
+_STRIKE_FORMAT_MESSAGE = "Invalid strike: '{0}' (must be a positive integer)"
+_STRIKE_NOT_ALLOWED_MESSAGE = "Type '{0}' must not have strike price"
+# 検査済みの値から Symbol を生成する (pickle からの復元と同じく __post_init__ を経由しない)
+_new = object.__new__
+_set = object.__setattr__
+_OPTION_TYPES = {option_type.value: option_type for option_type in OptionType}
+
+_SHAPE_COUNT_MESSAGE = "Invalid segment count: {{0}} (expected {0} for {1})"
+_SHAPE_TYPE_MESSAGE = "Type '{{0}}' is not {0} (expected {1})"
 
 
 def normalize_symbol(raw: str) -> str:
@@ -38,6 +73,23 @@ def normalize_symbol(raw: str) -> str:
     Returns:
         正規化後のシンボル文字列.
     """
+    if INSTRUMENTATION.tracing:
+        instruments = _instruments()
+        start = time.perf_counter_ns()
+        normalized = _normalize(raw)
+        instruments.tracer.emit(
+            instruments.event(
+                instruments.operations.NORMALIZE_SYMBOL,
+                raw,
+                time.perf_counter_ns() - start,
+            )
+        )
+        return normalized
+    return _normalize(raw)
+
+
+def _normalize(raw: str) -> str:
+    """normalize_symbol の本体 (トレースを含まない)."""
     normalized = unicodedata.normalize("NFKC", raw)
     normalized = normalized.upper()
     normalized = normalized.strip()
@@ -68,124 +120,441 @@ def parse_symbol(raw: str) -> Symbol:
         TypeError: raw が str でない場合.
         SymbolParseError: パース失敗時.
     """
+    if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+        return _instrumented_parse(raw)
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    _check_segments(segments, raw)
+    return _build_symbol(segments)
+
+
+def parse_equity(raw: str) -> EquitySymbol:
+    """株式のシンボル文字列 (exchange:code) をパースする.
+
+    形が株式に限られる入力向けに、セグメント数による分岐を省いた parse_symbol。
+    検査は parse_symbol と共通の関数で1回のみ行い、Symbol 生成時の再検査は省く。
+    株式以外の有効なシンボルは E004 (セグメント数) とする。それ以外の
+    エラーコード・メッセージは parse_symbol と同じ。
+
+    Args:
+        raw: シンボル文字列.
+
+    Returns:
+        パース結果の EquitySymbol.
+
+    Raises:
+        TypeError: raw が str でない場合.
+        SymbolParseError: パース失敗時、または株式以外のシンボルの場合.
+    """
+    if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+        return cast("EquitySymbol", _instrumented_parse(raw, _equity_failure))
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    failure = _equity_failure(segments)
+    if failure is not None:
+        raise failure.to_parse_error(raw)
+    return _equity(segments[0], segments[1])
+
+
+def parse_future(raw: str) -> FutureSymbol:
+    """先物のシンボル文字列 (exchange:code:expiry:F) をパースする.
+
+    形が先物に限られる入力向けに、セグメント数による分岐を省いた parse_symbol。
+    検査は parse_symbol と共通の関数で1回のみ行い、Symbol 生成時の再検査は省く。
+    先物以外の有効なシンボルは E004 (セグメント数) または E006 (タイプ識別子) とする。
+    それ以外のエラーコード・メッセージは parse_symbol と同じ。
+
+    Args:
+        raw: シンボル文字列.
+
+    Returns:
+        パース結果の FutureSymbol.
+
+    Raises:
+        TypeError: raw が str でない場合.
+        SymbolParseError: パース失敗時、または先物以外のシンボルの場合.
+    """
+    if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+        return cast("FutureSymbol", _instrumented_parse(raw, _future_failure))
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    failure = _future_failure(segments)
+    if failure is not None:
+        raise failure.to_parse_error(raw)
+    return _future(segments[0], segments[1], segments[2])
+
+
+def parse_option(raw: str) -> OptionSymbol:
+    """オプションのシンボル文字列をパースする.
+
+    exchange:code:expiry:(C|P):strike と exchange:code:expiry:O を受け付ける。
+    形がオプションに限られる入力向けに、セグメント数による分岐を省いた parse_symbol。
+    検査は parse_symbol と共通の関数で1回のみ行い、Symbol 生成時の再検査は省く。
+    オプション以外の有効なシンボルは E004 (セグメント数) または
+    E006 (タイプ識別子) とする。それ以外のエラーコード・メッセージは parse_symbol と同じ。
+
+    Args:
+        raw: シンボル文字列.
+
+    Returns:
+        パース結果の OptionSymbol.
+
+    Raises:
+        TypeError: raw が str でない場合.
+        SymbolParseError: パース失敗時、またはオプション以外のシンボルの場合.
+    """
+    if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+        return cast("OptionSymbol", _instrumented_parse(raw, _option_failure))
+    _check_input(raw)
+    segments = _split(_normalize(raw), raw)
+    failure = _option_failure(segments)
+    if failure is not None:
+        raise failure.to_parse_error(raw)
+    if len(segments) == _FUTURE_SEGMENT_COUNT:
+        return _option(segments[0], segments[1], segments[2], "O", None)
+    return _option(segments[0], segments[1], segments[2], segments[3], int(segments[4]))
+
+
+def _equity_failure(segments: list[str]) -> ValidationFailure | None:
+    """株式の形のセグメントを検査する (parse_equity 用)."""
+    if len(segments) == _EQUITY_SEGMENT_COUNT:
+        return check_exchange(segments[0]) or check_code(segments[1])
+    return _shape_failure(segments, AssetClass.EQUITY)
+
+
+def _future_failure(segments: list[str]) -> ValidationFailure | None:
+    """先物の形のセグメントを検査する (parse_future 用)."""
+    if len(segments) == _FUTURE_SEGMENT_COUNT and segments[3] == "F":
+        return (
+            check_exchange(segments[0])
+            or check_code(segments[1])
+            or check_expiry(segments[2])
+        )
+    return _shape_failure(segments, AssetClass.FUTURE)
+
+
+def _option_failure(segments: list[str]) -> ValidationFailure | None:
+    """オプションの形のセグメントを検査する (parse_option 用)."""
+    segment_count = len(segments)
+    if segment_count == _OPTION_SEGMENT_COUNT and segments[3] in ("C", "P"):
+        return (
+            check_exchange(segments[0])
+            or check_code(segments[1])
+            or check_expiry(segments[2])
+            or _strike_failure(segments[3], segments[4])
+        )
+    if segment_count == _FUTURE_SEGMENT_COUNT and segments[3] == "O":
+        return (
+            check_exchange(segments[0])
+            or check_code(segments[1])
+            or check_expiry(segments[2])
+        )
+    return _shape_failure(segments, AssetClass.OPTION)
+
+
+# 資産クラス -> 期待するセグメント数の表記 (エラーメッセージ用)
+_SHAPE_COUNTS: dict[AssetClass, str] = {
+    AssetClass.EQUITY: "2",
+    AssetClass.FUTURE: "4",
+    AssetClass.OPTION: "4 or 5",
+}
+
+# 資産クラス -> (名称, 期待するタイプ識別子の表記) (エラーメッセージ用)
+_SHAPE_TYPES: dict[AssetClass, tuple[str, str]] = {
+    AssetClass.FUTURE: ("a future", "F"),
+    AssetClass.OPTION: ("an option", "C, P, or O"),
+}
+
+
+def _shape_failure(
+    segments: list[str], asset_class: AssetClass
+) -> ValidationFailure | None:
+    """期待する資産クラスの形でないセグメントの失敗内容を返す.
+
+    parse_symbol の検査で失敗する場合はその失敗を返し (エラーの優先順位を
+    parse_symbol に合わせる)、他の資産クラスとして有効な場合は
+    セグメント数 (E004) またはタイプ識別子 (E006) の失敗を返す。
+    """
+    failure = _segment_failure(segments)
+    if failure is not None:
+        return failure
+    segment_count = len(segments)
+    if segment_count == _EQUITY_SEGMENT_COUNT or asset_class is AssetClass.EQUITY:
+        return ValidationFailure(
+            ErrorCode.INVALID_SEGMENT_COUNT,
+            _SHAPE_COUNT_MESSAGE.format(_SHAPE_COUNTS[asset_class], asset_class.value),
+            (segment_count,),
+            "segments",
+            segment_count,
+        )
+    name, expected_types = _SHAPE_TYPES[asset_class]
+    return ValidationFailure(
+        ErrorCode.INVALID_OPTION_TYPE,
+        _SHAPE_TYPE_MESSAGE.format(name, expected_types),
+        (segments[3],),
+        "option_type",
+        segments[3],
+    )
+
+
+def _instrumented_parse(
+    raw: str,
+    segment_failure: Callable[[list[str]], ValidationFailure | None] | None = None,
+    build_symbol: Callable[[list[str]], Symbol] | None = None,
+) -> Symbol:
+    """段階ごとの時間を計測しながらパースし、メトリクス・トレースに記録する.
+
+    SymbolParseError 以外の例外 (TypeError) は記録せずにそのまま送出する。
+
+    Args:
+        raw: シンボル文字列.
+        segment_failure: セグメントの検査関数 (None は _segment_failure).
+            ParserPolicy をコンパイルしたパーサーが検査を差し替えるために使う。
+        build_symbol: Symbol の生成関数 (None は _build_symbol).
+            ExchangeRegistry が取引所固有の生成に差し替えるために使う。
+    """
+    check = _segment_failure if segment_failure is None else segment_failure
+    build = _build_symbol if build_symbol is None else build_symbol
+    clock = time.perf_counter_ns
+    # marks[i] は i 番目の段階の開始時刻 (最後の要素は直前の段階の終了時刻)
+    marks = [clock()]
+    try:
+        # 長さの超過 (E010) は正規化の段階の失敗として記録する
+        # (str 以外の TypeError は記録しない)
+        _check_input(raw)
+        normalized = _normalize(raw)
+        marks.append(clock())
+        segments = _split(normalized, raw)
+        marks.append(clock())
+        failure = check(segments)
+        if failure is not None:
+            raise failure.to_parse_error(raw)
+        marks.append(clock())
+        symbol = build(segments)
+        marks.append(clock())
+    except SymbolParseError as e:
+        marks.append(clock())
+        _record_parse(raw, marks, None, e.error_code)
+        raise
+    _record_parse(raw, marks, symbol.asset_class, None)
+    return symbol
+
+
+class _Instruments(NamedTuple):
+    """計測が有効な経路で使う metrics・tracing の参照."""
+
+    metrics: MetricsCollector
+    tracer: Tracer
+    event: type[TraceEvent]
+    stages: type[ParseStages]
+    operations: type[TracedOperation]
+
+
+@cache
+def _instruments() -> _Instruments:
+    """metrics・tracing の参照を返す.
+
+    計測が有効になった後の最初の記録でインポートし、以降は同じ参照を返す。
+    """
+    from marketsymbol.metrics import METRICS
+    from marketsymbol.tracing import TRACER, ParseStages, TracedOperation, TraceEvent
+
+    return _Instruments(METRICS, TRACER, TraceEvent, ParseStages, TracedOperation)
+
+
+def _record_parse(
+    raw: str,
+    marks: list[int],
+    asset_class: AssetClass | None,
+    error_code: ErrorCode | None,
+) -> None:
+    """計測結果をメトリクス・トレースに記録する."""
+    instruments = _instruments()
+    elapsed = marks[-1] - marks[0]
+    if INSTRUMENTATION.metrics:
+        instruments.metrics.record_parse(asset_class, error_code, elapsed)
+    if INSTRUMENTATION.tracing:
+        durations: list[int | None] = [b - a for a, b in pairwise(marks)]
+        durations += [None] * (_STAGE_COUNT - len(durations))
+        instruments.tracer.emit(
+            instruments.event(
+                instruments.operations.PARSE_SYMBOL,
+                raw,
+                elapsed,
+                asset_class=asset_class,
+                error_code=error_code,
+                failed=error_code is not None,
+                stages=instruments.stages(*durations),
+            )
+        )
+
+
+def _check_input(raw: str) -> None:
+    """正規化前の入力 (型・長さ) を検査する."""
     if not isinstance(raw, str):
         raise TypeError(f"Expected str, got {type(raw).__name__}")
 
     if len(raw) > MAX_SYMBOL_LENGTH:
         raise SymbolParseError.from_parse_failure(
-            f"Symbol too long: {len(raw)} characters (max {MAX_SYMBOL_LENGTH})",
+            _TOO_LONG_MESSAGE,
             ErrorCode.SYMBOL_TOO_LONG,
             raw,
+            message_args=(len(raw),),
         )
 
-    normalized = normalize_symbol(raw)
 
+def _split(normalized: str, raw: str) -> list[str]:
+    """正規化済みのシンボル文字列をセグメントに分割する."""
     if not normalized:
         raise SymbolParseError.from_parse_failure(
             "Empty symbol string",
             ErrorCode.INVALID_SEGMENT_COUNT,
             raw,
         )
+    return normalized.split(":")
 
-    segments = normalized.split(":")
-    segment_count = len(segments)
-
-    try:
-        if segment_count == _EQUITY_SEGMENT_COUNT:
-            return _parse_equity(segments, raw)
-        elif segment_count == _FUTURE_SEGMENT_COUNT:
-            return _parse_future_or_series(segments, raw)
-        elif segment_count == _OPTION_SEGMENT_COUNT:
-            return _parse_option(segments, raw)
-        else:
-            raise SymbolParseError.from_parse_failure(
-                f"Invalid segment count: {segment_count} (expected 2, 4, or 5)",
-                ErrorCode.INVALID_SEGMENT_COUNT,
-                raw,
-            )
-    except SymbolValidationError as e:
-        raise SymbolParseError.from_parse_failure(
-            e.message,
-            e.error_code,
-            raw,
-        ) from e
 
+def _check_segments(segments: list[str], raw: str) -> None:
+    """セグメントを検査し、失敗時に SymbolParseError を1回だけ生成して送出する."""
+    failure = _segment_failure(segments)
+    if failure is not None:
+        raise failure.to_parse_error(raw)
 
-def _parse_equity(segments: list[str], raw: str) -> EquitySymbol:  # noqa: ARG001
-    """2セグメントを EquitySymbol としてパースする."""
-    exchange, code = segments
 
-    validate_exchange(exchange)
-    validate_code(code)
+def _segment_failure(segments: list[str]) -> ValidationFailure | None:
+    """セグメント数に応じて各フィールドを検査する (例外を送出しない).
 
-    return EquitySymbol(exchange=exchange, code=code)
+    parse_symbol と validate_symbols が共有する検査の本体。
+    検査順序がエラーコードの優先順位を決める。
 
+    Returns:
+        失敗時は ValidationFailure、成功時は None.
+    """
+    segment_count = len(segments)
+    if segment_count == _EQUITY_SEGMENT_COUNT:
+        return check_exchange(segments[0]) or check_code(segments[1])
+    elif segment_count in (_FUTURE_SEGMENT_COUNT, _OPTION_SEGMENT_COUNT):
+        return (
+            check_exchange(segments[0])
+            or check_code(segments[1])
+            or check_expiry(segments[2])
+            or _type_failure(
+                segments[3],
+                segments[4] if segment_count == _OPTION_SEGMENT_COUNT else None,
+            )
+        )
+    else:
+        return ValidationFailure(
+            ErrorCode.INVALID_SEGMENT_COUNT,
+            _SEGMENT_COUNT_MESSAGE,
+            (segment_count,),
+            "segments",
+            segment_count,
+        )
 
-def _parse_future_or_series(
-    segments: list[str], raw: str
-) -> FutureSymbol | OptionSymbol:
-    """4セグメントを FutureSymbol または OptionSymbol(SERIES) としてパースする."""
-    exchange, code, expiry, type_indicator = segments
 
-    validate_exchange(exchange)
-    validate_code(code)
-    validate_expiry(expiry)
-    validate_option_type(type_indicator)
+def _type_failure(
+    type_indicator: str, strike_str: str | None
+) -> ValidationFailure | None:
+    """先物・オプションのタイプ識別子と strike (有無・値) を検査する.
 
-    if type_indicator == "F":
-        return FutureSymbol(exchange=exchange, code=code, expiry=expiry)
-    elif type_indicator == "O":
-        return OptionSymbol(
-            exchange=exchange,
-            code=code,
-            expiry=expiry,
-            option_type=OptionType.SERIES,
-            strike=None,
-        )
-    else:
+    strike_str は5セグメント目 (4セグメントの場合は None)。
+    SymbolView も資産クラスの判定に使う。
+    """
+    failure = check_option_type(type_indicator)
+    if failure is not None:
+        return failure
+    if strike_str is not None:
+        return _strike_failure(type_indicator, strike_str)
+    if type_indicator not in ("F", "O"):
         # C または P だが strike がない
-        raise SymbolParseError.from_parse_failure(
-            f"Option type '{type_indicator}' requires strike price",
+        return ValidationFailure(
             ErrorCode.OPTION_WITHOUT_STRIKE,
-            raw,
+            _STRIKE_REQUIRED_MESSAGE,
+            (type_indicator,),
+            "strike",
+            None,
         )
+    return None
 
 
-def _parse_option(segments: list[str], raw: str) -> OptionSymbol:
-    """5セグメントを OptionSymbol としてパースする."""
-    exchange, code, expiry, type_indicator, strike_str = segments
-
-    validate_exchange(exchange)
-    validate_code(code)
-    validate_expiry(expiry)
-    validate_option_type(type_indicator)
-
+def _strike_failure(type_indicator: str, strike_str: str) -> ValidationFailure | None:
+    """5セグメント目の strike を検査する."""
     # strike を整数に変換
     try:
         strike = int(strike_str)
     except ValueError:
-        raise SymbolParseError.from_parse_failure(
-            f"Invalid strike: '{strike_str}' (must be a positive integer)",
+        return ValidationFailure(
             ErrorCode.INVALID_STRIKE_VALUE,
-            raw,
-        ) from None
+            _STRIKE_FORMAT_MESSAGE,
+            (strike_str,),
+            "strike",
+            strike_str,
+        )
 
     # F または O に strike が指定された場合はエラー
     if type_indicator in ("F", "O"):
-        raise SymbolParseError.from_parse_failure(
-            f"Type '{type_indicator}' must not have strike price",
+        return ValidationFailure(
             ErrorCode.FUTURE_WITH_STRIKE,
-            raw,
+            _STRIKE_NOT_ALLOWED_MESSAGE,
+            (type_indicator,),
+            "strike",
+            strike,
         )
 
-    validate_strike(strike)
+    return check_strike(strike)
 
-    option_type = OptionType.CALL if type_indicator == "C" else OptionType.PUT
 
+def _equity(exchange: str, code: str) -> EquitySymbol:
+    """検査済みの値から EquitySymbol を生成する (__post_init__ を経由しない)."""
+    equity = _new(EquitySymbol)
+    _set(equity, "exchange", exchange)
+    _set(equity, "code", code)
+    return equity
+
+
+def _future(exchange: str, code: str, expiry: str) -> FutureSymbol:
+    """検査済みの値から FutureSymbol を生成する (__post_init__ を経由しない)."""
+    future = _new(FutureSymbol)
+    _set(future, "exchange", exchange)
+    _set(future, "code", code)
+    _set(future, "expiry", expiry)
+    return future
+
+
+def _option(
+    exchange: str, code: str, expiry: str, type_indicator: str, strike: int | None
+) -> OptionSymbol:
+    """検査済みの値から OptionSymbol を生成する (__post_init__ を経由しない)."""
+    option = _new(OptionSymbol)
+    _set(option, "exchange", exchange)
+    _set(option, "code", code)
+    _set(option, "expiry", expiry)
+    _set(option, "option_type", _OPTION_TYPES[type_indicator])
+    _set(option, "strike", strike)
+    return option
+
+
+def _build_symbol(segments: list[str]) -> Symbol:
+    """検査済みのセグメントから Symbol オブジェクトを生成する."""
+    if len(segments) == _EQUITY_SEGMENT_COUNT:
+        return EquitySymbol(exchange=segments[0], code=segments[1])
+
+    exchange, code, expiry, type_indicator = segments[:4]
+    if type_indicator == "F":
+        return FutureSymbol(exchange=exchange, code=code, expiry=expiry)
+    if type_indicator == "O":
+        return OptionSymbol(
+            exchange=exchange,
+            code=code,
+            expiry=expiry,
+            option_type=OptionType.SERIES,
+            strike=None,
+        )
     return OptionSymbol(
         exchange=exchange,
         code=code,
         expiry=expiry,
-        option_type=option_type,
-        strike=strike,
+        option_type=OptionType.CALL if type_indicator == "C" else OptionType.PUT,
+        strike=int(segments[4]),
     )
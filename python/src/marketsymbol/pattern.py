@@ -0,0 +1,364 @@
+"""セグメント単位のワイルドカードによるシンボルのパターン.
+
+SymbolPattern は ``XJPX:N225O:202503*:C:*`` や ``*:NK:*:F`` のようなパターンを
+セグメントごとに解析し、Symbol の属性に対するフィールド単位の述語にコンパイルする。
+照合は exchange, code, expiry, タイプ識別子, strike の順に行い、最初に一致しない
+フィールドで打ち切る。str(symbol) に対する fnmatch と異なり、文字列の生成と
+パターン全体の走査を行わない。
+
+パターンのセグメント数でシンボルの形式を指定する:
+
+- 2: 株式 (exchange:code)
+- 4: 先物またはシリーズオプション (exchange:code:expiry:F/O)
+- 5: 権利行使価格付きオプション (exchange:code:expiry:C/P:strike)
+
+セグメントの構文:
+
+- ``*``: 任意の値 (照合しない)
+- リテラル (例: ``XJPX``, ``20250314``, ``42000``): 一致
+- ``PREFIX*`` (例: ``N225*``, ``202503*``): 前方一致 (strike 以外)
+- ``LOW-HIGH`` (例: ``20250301-20250331``, ``40000-45000``): 範囲 (両端を含む)。
+  ``LOW-`` / ``-HIGH`` は片側のみの範囲 (expiry と strike のみ)
+- その他の ``*`` / ``?`` を含むセグメント: fnmatch 形式 (exchange と code のみ)
+
+``*`` は ``:`` をまたがない (セグメント数が異なるシンボルには一致しない)。
+パターンは parse_symbol と同じく正規化 (大文字化・前後の空白の除去) してから解析する。
+
+Example:
+    >>> from marketsymbol import SymbolPattern, parse_symbol
+    >>> pattern = SymbolPattern("XJPX:N225O:202503*:C:40000-45000")
+    >>> pattern.matches(parse_symbol("XJPX:N225O:20250314:C:42000"))
+    True
+    >>> pattern.matches("XJPX:N225O:20250314:P:42000")
+    False
+    >>> [str(s) for s in SymbolPattern("*:NK:*:F").filter(["XJPX:NK:20250314:F", "XJPX:7203"])]
+    ['XJPX:NK:20250314:F']
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter, eq, methodcaller
+from typing import TYPE_CHECKING, NamedTuple
+
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.enums import OptionType
+from marketsymbol.parser import _build_symbol, _normalize, _segment_failure
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+from marketsymbol.validator import (
+    check_code,
+    check_exchange,
+    check_expiry,
+    check_strike,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from marketsymbol.symbol import Symbol
+
+# 任意の値を表すセグメント
+WILDCARD = "*"
+
+# セグメント数 -> 許可するタイプ識別子
+_SHAPE_INDICATORS: dict[int, frozenset[str]] = {
+    4: frozenset({"F", "O"}),
+    5: frozenset({"C", "P"}),
+}
+
+# 範囲の区切り
+_RANGE_SEPARATOR = "-"
+
+# セグメントの位置
+_EXCHANGE = 0
+_CODE = 1
+_EXPIRY = 2
+_TYPE = 3
+_STRIKE = 4
+
+# セグメントの位置 -> フィールド名 (エラーメッセージ用)
+_FIELD_NAMES = ("exchange", "code", "expiry", "type", "strike")
+
+_STRIKE_PATTERN = re.compile(r"[0-9]+")
+
+# 権利行使価格を持つオプションの種別 (5セグメント)
+_STRIKE_OPTION_TYPES = frozenset({OptionType.CALL, OptionType.PUT})
+
+
+def _type_indicator(symbol: Symbol) -> str:
+    """先物・オプションのタイプ識別子 (F, O, C, P) を返す."""
+    if isinstance(symbol, OptionSymbol):
+        return symbol.option_type.value
+    return "F"
+
+
+# セグメントの位置 -> Symbol の属性の取得関数 (種別は _compile_type で扱う)
+_GETTERS: dict[int, Callable[[Symbol], object]] = {
+    _EXCHANGE: attrgetter("exchange"),
+    _CODE: attrgetter("code"),
+    _EXPIRY: attrgetter("expiry"),
+    _STRIKE: attrgetter("strike"),
+}
+
+
+class _Check(NamedTuple):
+    """Symbol の1つ以上のフィールドの述語."""
+
+    getter: Callable[[Symbol], object]
+    check: Callable[[object], bool]
+
+
+def _segment_strike(segment: str) -> int:
+    """権利行使価格のセグメントを整数にする (有効な strike でない場合は -1).
+
+    parse_symbol と同じく int() で変換する (``+42000`` や ``4_2000`` も受け付ける)。
+    """
+    try:
+        strike = int(segment)
+    except ValueError:
+        return -1
+    return strike if check_strike(strike) is None else -1
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolPattern:
+    """セグメント単位のワイルドカードによるシンボルのパターン.
+
+    Attributes:
+        pattern: 正規化済みのパターン文字列.
+
+    Raises:
+        ValueError: パターンの形式が不正な場合
+    """
+
+    pattern: str
+    _size: int = field(init=False, repr=False, compare=False)
+    _types: tuple[type, ...] = field(init=False, repr=False, compare=False)
+    # Symbol の属性の述語 (照合する順)
+    _checks: tuple[_Check, ...] = field(init=False, repr=False, compare=False)
+    # シンボル文字列のセグメントの述語 (セグメントの位置, 述語)
+    _segment_checks: tuple[tuple[int, Callable[[object], bool]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """パターンを解析し、フィールド単位の述語にコンパイルする."""
+        pattern = _normalize(self.pattern)
+        segments = pattern.split(":")
+        if len(segments) not in (2, 4, 5):
+            msg = (
+                f"Invalid pattern {pattern!r}: {len(segments)} segments "
+                "(expected 2, 4, or 5)"
+            )
+            raise ValueError(msg)
+        segment_checks = [
+            (position, check)
+            for position, segment in enumerate(segments)
+            if (check := _compile_segment(pattern, position, segment, len(segments)))
+            is not None
+        ]
+        types, type_check = _compile_type(segments)
+
+        # 完全一致のフィールドは1つの attrgetter とタプルの比較にまとめて先に照合し、
+        # 種別 (権利行使価格の有無を含む) の後に前方一致・範囲を照合する
+        names: list[str] = []
+        values: list[object] = []
+        checks: list[_Check] = []
+        for position, check in segment_checks:
+            if position == _TYPE:
+                continue
+            if isinstance(check, partial) and check.func is eq:
+                names.append(_FIELD_NAMES[position])
+                values.append(check.args[0])
+            else:
+                checks.append(_Check(_GETTERS[position], check))
+        if type_check is not None:
+            checks.insert(0, type_check)
+        if names:
+            literal = values[0] if len(values) == 1 else tuple(values)
+            checks.insert(0, _Check(attrgetter(*names), partial(eq, literal)))
+
+        object.__setattr__(self, "pattern", pattern)
+        object.__setattr__(self, "_size", len(segments))
+        object.__setattr__(self, "_types", types)
+        object.__setattr__(self, "_checks", tuple(checks))
+        object.__setattr__(self, "_segment_checks", tuple(segment_checks))
+
+    @property
+    def segment_count(self) -> int:
+        """パターンのセグメント数 (一致するシンボルのセグメント数)."""
+        return self._size
+
+    def matches(self, item: Symbol | str) -> bool:
+        """Symbol またはシンボル文字列がパターンに一致するかを返す.
+
+        シンボル文字列は parse_symbol と同じ規則で検査し、無効な場合は False を返す。
+        """
+        if isinstance(item, str):
+            return self._match_raw(item) is not None
+        return self._match_symbol(item)
+
+    def filter(self, items: Iterable[Symbol | str]) -> Iterator[Symbol]:
+        """パターンに一致する Symbol を返す.
+
+        シンボル文字列はセグメントのままパターンと照合し、一致したもののみを
+        parse_symbol と同じ規則で検査して Symbol を生成する (無効な文字列は除く)。
+
+        Args:
+            items: Symbol またはシンボル文字列のイテラブル
+
+        Yields:
+            パターンに一致する Symbol
+        """
+        # 要素ごとの属性の参照とメソッド呼び出しを避けるためループを展開する
+        match_raw = self._match_raw
+        types = self._types
+        checks = self._checks
+        for item in items:
+            if isinstance(item, str):
+                symbol = match_raw(item)
+                if symbol is not None:
+                    yield symbol
+            elif isinstance(item, types):
+                for getter, check in checks:
+                    if not check(getter(item)):
+                        break
+                else:
+                    yield item
+
+    def _match_symbol(self, symbol: Symbol) -> bool:
+        """Symbol の属性を照合する (最初に一致しないフィールドで打ち切る)."""
+        if not isinstance(symbol, self._types):
+            return False
+        return all(check(getter(symbol)) for getter, check in self._checks)
+
+    def _match_raw(self, raw: str) -> Symbol | None:
+        """シンボル文字列のセグメントを照合し、一致すれば検査して Symbol を返す."""
+        if len(raw) > MAX_SYMBOL_LENGTH:
+            return None
+        segments = _normalize(raw).split(":")
+        if len(segments) != self._size:
+            return None
+        for position, check in self._segment_checks:
+            segment = segments[position]
+            if not check(_segment_strike(segment) if position == _STRIKE else segment):
+                return None
+        if _segment_failure(segments) is not None:
+            return None
+        return _build_symbol(segments)
+
+
+def _compile_type(segments: list[str]) -> tuple[tuple[type, ...], _Check | None]:
+    """セグメント数と種別から、一致する Symbol の型と種別の述語を返す.
+
+    型のみで決まる場合 (株式・先物) は述語を None とする。
+    """
+    if len(segments) == 2:
+        return (EquitySymbol,), None
+    segment = segments[_TYPE]
+    option_type = attrgetter("option_type")
+    if len(segments) == 4:
+        if segment == "F":
+            return (FutureSymbol,), None
+        if segment == "O":
+            return (OptionSymbol,), _Check(option_type, partial(eq, OptionType.SERIES))
+        return (FutureSymbol, OptionSymbol), _Check(
+            _type_indicator, _SHAPE_INDICATORS[4].__contains__
+        )
+    if segment == WILDCARD:
+        return (OptionSymbol,), _Check(option_type, _STRIKE_OPTION_TYPES.__contains__)
+    return (OptionSymbol,), _Check(option_type, partial(eq, OptionType(segment)))
+
+
+def _compile_segment(
+    pattern: str, position: int, segment: str, segment_count: int
+) -> Callable[[object], bool] | None:
+    """セグメントを述語にコンパイルする (照合が不要な場合は None)."""
+    name = _FIELD_NAMES[position]
+
+    def invalid(reason: str) -> ValueError:
+        return ValueError(f"Invalid pattern {pattern!r}: {name} {segment!r} {reason}")
+
+    if position == _TYPE:
+        allowed = _SHAPE_INDICATORS[segment_count]
+        if segment == WILDCARD:
+            return allowed.__contains__
+        if segment not in allowed:
+            expected = " or ".join(sorted(allowed))
+            raise invalid(f"(expected {expected} for {segment_count} segments)")
+        return partial(eq, segment)
+    if segment == WILDCARD:
+        return None
+    if position == _STRIKE:
+        return _compile_strike(segment, invalid)
+    if position == _EXPIRY:
+        return _compile_expiry(segment, invalid)
+
+    check = check_exchange if position == _EXCHANGE else check_code
+    if "*" in segment or "?" in segment:
+        stem = segment.removesuffix(WILDCARD)
+        if stem and "*" not in stem and "?" not in stem and check(stem) is None:
+            return methodcaller("startswith", stem)
+        if not re.fullmatch(r"[A-Z0-9*?]+", segment):
+            raise invalid("(wildcards may only be combined with A-Z and 0-9)")
+        match = re.compile(fnmatch.translate(segment)).match
+        return lambda value: isinstance(value, str) and match(value) is not None
+    if check(segment) is not None:
+        raise invalid("is not a valid literal")
+    return partial(eq, segment)
+
+
+def _compile_expiry(
+    segment: str, invalid: Callable[[str], ValueError]
+) -> Callable[[object], bool]:
+    """限月のセグメント (リテラル・前方一致・範囲) をコンパイルする.
+
+    YYYYMMDD は文字列の大小と日付の前後が一致するため、文字列のまま比較する。
+    """
+    if segment.endswith(WILDCARD):
+        stem = segment.removesuffix(WILDCARD)
+        if not stem.isdigit() or len(stem) > len("YYYYMMDD"):
+            raise invalid("(prefix must be up to 8 digits)")
+        return methodcaller("startswith", stem)
+    if _RANGE_SEPARATOR in segment:
+        low, _, high = segment.partition(_RANGE_SEPARATOR)
+        for bound in (low, high):
+            if bound and check_expiry(bound) is not None:
+                raise invalid("(range bounds must be YYYYMMDD dates)")
+        return _range(str, low or None, high or None, invalid)
+    if check_expiry(segment) is not None:
+        raise invalid("is not a valid YYYYMMDD date")
+    return partial(eq, segment)
+
+
+def _compile_strike(
+    segment: str, invalid: Callable[[str], ValueError]
+) -> Callable[[object], bool]:
+    """権利行使価格のセグメント (リテラル・範囲) をコンパイルする."""
+    low, separator, high = segment.partition(_RANGE_SEPARATOR)
+    for bound in (low, high):
+        if bound and not _STRIKE_PATTERN.fullmatch(bound):
+            raise invalid("(must be an integer or LOW-HIGH range)")
+    if not separator:
+        if not low:
+            raise invalid("(must be an integer or LOW-HIGH range)")
+        return partial(eq, int(low))
+    return _range(int, int(low) if low else None, int(high) if high else None, invalid)
+
+
+def _range[T: (str, int)](
+    kind: type[T], low: T | None, high: T | None, invalid: Callable[[str], ValueError]
+) -> Callable[[object], bool]:
+    """kind の値が両端を含む範囲にあるかの述語を返す (None は片側を制限しない)."""
+    if low is None and high is None:
+        raise invalid("(range needs at least one bound)")
+    if low is not None and high is not None:
+        if low > high:
+            raise invalid("(range is empty)")
+        return lambda value: isinstance(value, kind) and low <= value <= high
+    if low is not None:
+        return lambda value: isinstance(value, kind) and low <= value
+    return lambda value: isinstance(value, kind) and high is not None and value <= high
@@ -0,0 +1,288 @@
+"""パースのバリデーションポリシー.
+
+ParserPolicy は parse_symbol の既定の検査に加える規則を表す:
+
+- 未知の取引所 (known_exchanges に含まれない MIC) の扱い
+- 未知の商品コード (known_codes に含まれない先物・オプションのコード) の扱い
+- 資産クラスごとのコード長 (先物 2-6、オプション 2-10)
+
+未知の値の扱いは PolicyMode で指定する (LENIENT: 許可、WARN: 警告して許可、
+STRICT: SymbolParseError)。ポリシーは compile() で専用のパース関数に変換する。
+適用する検査はコンパイル時に関数の組み合わせとして確定するため、
+パースのたびにポリシーのフラグを参照する分岐は発生しない。
+
+Example:
+    >>> from marketsymbol import ParserPolicy
+    >>> parse = ParserPolicy.strict(known_exchanges={"XJPX"}).compile()
+    >>> parse("XJPX:NK:20250314:F").code
+    'NK'
+    >>> parse("XOSE:NK:20250314:F")
+    Traceback (most recent call last):
+    ...
+    marketsymbol.errors.SymbolParseError: [E007] Unknown exchange: 'XOSE' ...
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.constants import (
+    MAX_FUTURE_CODE_LENGTH,
+    MAX_OPTION_CODE_LENGTH,
+    MIN_FUTURE_CODE_LENGTH,
+    MIN_OPTION_CODE_LENGTH,
+)
+from marketsymbol.errors import SymbolPolicyWarning
+from marketsymbol.instrumentation import INSTRUMENTATION
+from marketsymbol.parser import (
+    _build_symbol,
+    _check_input,
+    _instrumented_parse,
+    _normalize,
+    _segment_failure,
+    _split,
+    _type_failure,
+    parse_symbol,
+)
+from marketsymbol.validator import (
+    check_code,
+    check_code_length,
+    check_exchange,
+    check_expiry,
+    check_known_code,
+    check_known_exchange,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from collections.abc import Set as AbstractSet
+
+    from marketsymbol.symbol import Symbol
+    from marketsymbol.validator import ValidationFailure
+
+    _FieldCheck = Callable[[str], ValidationFailure | None]
+
+# セグメント数の定数
+_EQUITY_SEGMENT_COUNT = 2
+_FUTURE_SEGMENT_COUNT = 4
+_OPTION_SEGMENT_COUNT = 5
+
+# コンパイル済みパース関数のキャッシュ数
+_COMPILED_CACHE_SIZE = 32
+
+# 警告の発行位置をパース関数の呼び出し元にする (パッケージ内のフレームを飛ばす。
+# メトリクス・トレースの有効時の計測など、呼び出しの経路によらない)
+_WARNING_SKIP_PREFIXES = (f"{Path(__file__).parent}{os.sep}",)
+
+
+class PolicyMode(Enum):
+    """ポリシー違反 (未知の取引所・商品コード) の扱い."""
+
+    LENIENT = "lenient"
+    """許可する."""
+
+    WARN = "warn"
+    """SymbolPolicyWarning を発行して許可する."""
+
+    STRICT = "strict"
+    """SymbolParseError を送出する."""
+
+
+@dataclass(frozen=True, slots=True)
+class ParserPolicy:
+    """パース時に適用する追加の検査規則.
+
+    既定値 (すべて LENIENT、既知の値の指定なし、共通のコード長) は
+    parse_symbol と同じ検査となる。
+
+    Attributes:
+        unknown_exchange: known_exchanges に含まれない取引所の扱い.
+        unknown_code: known_codes に含まれない商品コードの扱い (先物・オプションのみ).
+        known_exchanges: 既知の MIC の集合 (None は検査しない).
+        known_codes: 既知の商品コードの集合 (None は検査しない).
+        asset_class_code_lengths: True の場合、先物 2-6・オプション 2-10 の
+            コード長を適用する (株式は共通の 1-10).
+    """
+
+    unknown_exchange: PolicyMode = PolicyMode.LENIENT
+    unknown_code: PolicyMode = PolicyMode.LENIENT
+    known_exchanges: frozenset[str] | None = None
+    known_codes: frozenset[str] | None = None
+    asset_class_code_lengths: bool = False
+
+    def __post_init__(self) -> None:
+        """既知の値の集合を frozenset に変換する (ハッシュ可能にするため)."""
+        if self.known_exchanges is not None:
+            object.__setattr__(self, "known_exchanges", frozenset(self.known_exchanges))
+        if self.known_codes is not None:
+            object.__setattr__(self, "known_codes", frozenset(self.known_codes))
+
+    @classmethod
+    def strict(
+        cls,
+        *,
+        known_exchanges: Iterable[str] | None = None,
+        known_codes: Iterable[str] | None = None,
+    ) -> ParserPolicy:
+        """未知の値をエラーとし、資産クラスごとのコード長を適用するポリシーを返す."""
+        return cls._with_mode(PolicyMode.STRICT, known_exchanges, known_codes)
+
+    @classmethod
+    def warn(
+        cls,
+        *,
+        known_exchanges: Iterable[str] | None = None,
+        known_codes: Iterable[str] | None = None,
+    ) -> ParserPolicy:
+        """未知の値を警告し、資産クラスごとのコード長を適用するポリシーを返す."""
+        return cls._with_mode(PolicyMode.WARN, known_exchanges, known_codes)
+
+    @classmethod
+    def lenient(cls) -> ParserPolicy:
+        """parse_symbol と同じ検査のポリシーを返す."""
+        return cls()
+
+    @classmethod
+    def _with_mode(
+        cls,
+        mode: PolicyMode,
+        known_exchanges: Iterable[str] | None,
+        known_codes: Iterable[str] | None,
+    ) -> ParserPolicy:
+        """未知の取引所・商品コードの扱いを mode に揃えたポリシーを返す."""
+        return cls(
+            unknown_exchange=mode,
+            unknown_code=mode,
+            known_exchanges=None
+            if known_exchanges is None
+            else frozenset(known_exchanges),
+            known_codes=None if known_codes is None else frozenset(known_codes),
+            asset_class_code_lengths=True,
+        )
+
+    def compile(self) -> Callable[[str], Symbol]:
+        """ポリシーを適用するパース関数を返す.
+
+        返す関数のシグネチャ・例外は parse_symbol と同じ。既定のポリシーは
+        parse_symbol 自体を返す。同じポリシーのコンパイル結果は再利用する。
+        """
+        return _compile(self)
+
+
+# 既定のポリシー (parse_symbol と同じ検査)
+DEFAULT_POLICY: Final = ParserPolicy()
+
+
+@lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compile(policy: ParserPolicy) -> Callable[[str], Symbol]:
+    """ポリシーの検査を組み合わせたパース関数を生成する."""
+    if policy == DEFAULT_POLICY:
+        return parse_symbol
+
+    exchange_check = _with_known_values(
+        check_exchange,
+        policy.unknown_exchange,
+        policy.known_exchanges,
+        check_known_exchange,
+    )
+    if policy.asset_class_code_lengths:
+        future_code_check: _FieldCheck = partial(
+            check_code_length,
+            min_length=MIN_FUTURE_CODE_LENGTH,
+            max_length=MAX_FUTURE_CODE_LENGTH,
+        )
+        option_code_check: _FieldCheck = partial(
+            check_code_length,
+            min_length=MIN_OPTION_CODE_LENGTH,
+            max_length=MAX_OPTION_CODE_LENGTH,
+        )
+    else:
+        future_code_check = option_code_check = check_code
+    future_code_check, option_code_check = (
+        _with_known_values(
+            check, policy.unknown_code, policy.known_codes, check_known_code
+        )
+        for check in (future_code_check, option_code_check)
+    )
+    # タイプ識別子 -> 先物・オプションのコード検査
+    # (不正なタイプ識別子は共通の検査の後、タイプ識別子の検査で E006 となる)
+    code_checks = {
+        "F": future_code_check,
+        "C": option_code_check,
+        "P": option_code_check,
+        "O": option_code_check,
+    }
+    get_code_check = code_checks.get
+
+    def segment_failure(segments: list[str]) -> ValidationFailure | None:
+        """ポリシーの検査を parse_symbol と同じ順序で適用する."""
+        count = len(segments)
+        if count == _EQUITY_SEGMENT_COUNT:
+            return exchange_check(segments[0]) or check_code(segments[1])
+        if count in (_FUTURE_SEGMENT_COUNT, _OPTION_SEGMENT_COUNT):
+            type_indicator = segments[3]
+            return (
+                exchange_check(segments[0])
+                or get_code_check(type_indicator, check_code)(segments[1])
+                or check_expiry(segments[2])
+                or _type_failure(
+                    type_indicator,
+                    segments[4] if count == _OPTION_SEGMENT_COUNT else None,
+                )
+            )
+        return _segment_failure(segments)
+
+    def parse(raw: str) -> Symbol:
+        """ポリシーを適用してシンボル文字列をパースする."""
+        if INSTRUMENTATION.metrics or INSTRUMENTATION.tracing:
+            return _instrumented_parse(raw, segment_failure)
+        _check_input(raw)
+        segments = _split(_normalize(raw), raw)
+        failure = segment_failure(segments)
+        if failure is not None:
+            raise failure.to_parse_error(raw)
+        return _build_symbol(segments)
+
+    return parse
+
+
+def _with_known_values(
+    check: _FieldCheck,
+    mode: PolicyMode,
+    known: AbstractSet[str] | None,
+    check_known: Callable[[str, AbstractSet[str]], ValidationFailure | None],
+) -> _FieldCheck:
+    """形式の検査 check に、既知の値の検査を mode に応じて組み合わせる."""
+    if known is None or mode is PolicyMode.LENIENT:
+        return check
+
+    if mode is PolicyMode.STRICT:
+
+        def check_strict(value: str) -> ValidationFailure | None:
+            """形式の検査の後、未知の値を失敗とする."""
+            return check(value) or check_known(value, known)
+
+        return check_strict
+
+    def check_warn(value: str) -> ValidationFailure | None:
+        """形式の検査の後、未知の値を警告する."""
+        failure = check(value)
+        if failure is None:
+            unknown = check_known(value, known)
+            if unknown is not None:
+                warnings.warn(
+                    SymbolPolicyWarning(
+                        unknown.template.format(*unknown.message_args),
+                        unknown.error_code,
+                    ),
+                    skip_file_prefixes=_WARNING_SKIP_PREFIXES,
+                )
+        return failure
+
+    return check_warn
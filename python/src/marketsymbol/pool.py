@@ -0,0 +1,136 @@
+"""Symbol インスタンスのインターン (フライウェイト).
+
+SymbolPool は値が等しい Symbol に対して単一の正規インスタンスを返し、
+その構成文字列 (exchange / code / expiry) もプール内で共有する。
+同一銘柄への参照を大量に保持する場合 (板・ポジション台帳など) に、
+重複インスタンスと重複文字列のメモリを削減する。
+
+Symbol は slots dataclass で弱参照を持たないため、プールは強参照で保持する。
+不要になったインスタンスは clear() で解放するか、
+用途ごとに SymbolPool を生成してプールごと破棄する (スコープ付きプール)。
+
+Example:
+    >>> from marketsymbol import SymbolPool
+    >>> pool = SymbolPool()
+    >>> a = pool.parse("XJPX:N225O:20250314:C:42000")
+    >>> b = pool.parse("xjpx:n225o:20250314:c:42000")
+    >>> a is b
+    True
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.parser import parse_symbol
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marketsymbol.symbol import Symbol
+
+
+class SymbolPool:
+    """Symbol の正規インスタンスと構成文字列を保持するプール.
+
+    parse_symbol、アダプター、デシリアライザーなど生成元を問わず、
+    intern() に渡した Symbol を正規インスタンスに置き換えられる。
+    登録・参照は dict の単一操作で行うため、スレッド間で共有できる。
+    """
+
+    __slots__ = ("_strings", "_symbols")
+
+    def __init__(self) -> None:
+        """空のプールを生成する."""
+        self._symbols: dict[Symbol, Symbol] = {}
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """保持している正規インスタンスの数を返す."""
+        return len(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        """値が等しい Symbol を保持しているかどうかを返す."""
+        return symbol in self._symbols
+
+    @property
+    def string_count(self) -> int:
+        """保持している構成文字列の数を返す."""
+        return len(self._strings)
+
+    def intern(self, symbol: Symbol) -> Symbol:
+        """symbol と値が等しい正規インスタンスを返す.
+
+        初出の場合は構成文字列をプール内の文字列に置き換えた
+        インスタンスを生成し、正規インスタンスとして登録する。
+
+        Args:
+            symbol: Symbol オブジェクト.
+
+        Returns:
+            正規インスタンス (値は symbol と等しい).
+        """
+        canonical = self._symbols.get(symbol)
+        if canonical is None:
+            canonical = self._symbols.setdefault(symbol, self._share_strings(symbol))
+        return canonical
+
+    def intern_all(self, symbols: Iterable[Symbol]) -> list[Symbol]:
+        """各 Symbol を正規インスタンスに置き換えたリストを返す."""
+        intern = self.intern
+        return [intern(symbol) for symbol in symbols]
+
+    def parse(self, raw: str) -> Symbol:
+        """parse_symbol(raw) の結果の正規インスタンスを返す.
+
+        Raises:
+            TypeError: raw が str でない場合.
+            SymbolParseError: パース失敗時.
+        """
+        return self.intern(parse_symbol(raw))
+
+    def clear(self) -> None:
+        """保持しているインスタンスと文字列をすべて解放する.
+
+        既に返した正規インスタンスは引き続き有効で、
+        以降の intern() は新しい正規インスタンスを登録する。
+        """
+        self._symbols = {}
+        self._strings = {}
+
+    def _share(self, value: str) -> str:
+        """value と等しいプール内の文字列を返す (初出なら登録する)."""
+        return self._strings.setdefault(value, value)
+
+    def _share_strings(self, symbol: Symbol) -> Symbol:
+        """構成文字列をプール内の文字列に置き換えた Symbol を生成する."""
+        share = self._share
+        match symbol:
+            case EquitySymbol():
+                return EquitySymbol(
+                    exchange=share(symbol.exchange), code=share(symbol.code)
+                )
+            case FutureSymbol():
+                return FutureSymbol(
+                    exchange=share(symbol.exchange),
+                    code=share(symbol.code),
+                    expiry=share(symbol.expiry),
+                )
+            case OptionSymbol():
+                return OptionSymbol(
+                    exchange=share(symbol.exchange),
+                    code=share(symbol.code),
+                    expiry=share(symbol.expiry),
+                    option_type=symbol.option_type,
+                    strike=symbol.strike,
+                )
+
+
+# プロセス全体で共有するプール
+SYMBOL_POOL: Final = SymbolPool()
+
+
+def intern_symbol(symbol: Symbol) -> Symbol:
+    """プロセス全体のプールで symbol の正規インスタンスを返す."""
+    return SYMBOL_POOL.intern(symbol)
@@ -0,0 +1,337 @@
+"""シンボルの集合に対するインデックスを用いた検索.
+
+SymbolUniverse は Symbol のコレクションにフィールドごとのインデックスを構築し、
+「XJPX の N225O のオプションで、限月が 2025年1-3月、プット、strike 30000-35000」
+のような複合条件の検索を、全ての Symbol を走査せずに行う。
+
+Symbol には登録順に ID (0 始まりの整数) を割り当て、インデックスは ID の列を保持する:
+
+- ハッシュインデックス: exchange, code, asset_class, option_type の値 -> ID のリスト
+- 整列インデックス: expiry (YYYYMMDD は文字列の大小と日付の前後が一致する)、
+  strike の値の昇順に並べた (値, ID) の列。範囲は二分探索で求める。
+
+検索条件はいずれも該当する ID の件数をインデックスから正確に求められるため、
+プランナーは件数が最も少ない (最も選択的な) 条件の ID を候補とし、
+残りの条件を件数の少ない順に適用する。各条件は、その条件の ID の集合との積集合
+(件数に比例) と、候補の Symbol の属性の検査 (候補数に比例) のうち
+見積もりコストの小さい方で適用する。where に指定した述語は最後に候補に適用する。
+
+Example:
+    >>> from marketsymbol import OptionType, SymbolUniverse, parse_symbol
+    >>> universe = SymbolUniverse(
+    ...     parse_symbol(raw)
+    ...     for raw in [
+    ...         "XJPX:7203",
+    ...         "XJPX:N225O:20250314:P:32000",
+    ...         "XJPX:N225O:20250314:C:32000",
+    ...         "XJPX:N225O:20250613:P:32000",
+    ...     ]
+    ... )
+    >>> [str(s) for s in universe.query(
+    ...     code="N225O",
+    ...     expiry=("20250101", "20250331"),
+    ...     option_type=OptionType.PUT,
+    ...     strike=(30000, 35000),
+    ... )]
+    ['XJPX:N225O:20250314:P:32000']
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import date
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from marketsymbol.symbol import EquitySymbol, OptionSymbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from marketsymbol.enums import AssetClass, OptionType
+    from marketsymbol.symbol import Symbol
+
+# 値の条件 (一致、またはいずれかに一致) と範囲の条件 (一致、または両端を含む範囲)
+type _Values[T] = T | Collection[T] | None
+type _Range[T] = T | tuple[T | None, T | None] | None
+
+# 属性の検査1回のコストを積集合の要素1件の何倍と見積もるか
+# (属性の取得と比較は set への追加・参照より遅い)
+FILTER_COST: Final = 3
+
+# ハッシュインデックスを持つフィールド
+_HASH_FIELDS = ("exchange", "code", "asset_class", "option_type")
+
+
+@dataclass(frozen=True, slots=True)
+class PlanStep:
+    """検索計画の1つの手順.
+
+    Attributes:
+        field: 条件のフィールド名 (where の場合は "where").
+        rows: 条件に該当する件数 (インデックスから求めた値、where は候補数).
+        method: 適用方法 ("index": 候補の取得、"intersect": ID の積集合、
+            "filter": 候補の属性の検査).
+    """
+
+    field: str
+    rows: int
+    method: str
+
+
+@dataclass(frozen=True, slots=True)
+class QueryPlan:
+    """検索計画 (条件を適用する順の手順).
+
+    Attributes:
+        steps: 手順. 条件がない場合は全件の走査 ("scan") となる.
+    """
+
+    steps: tuple[PlanStep, ...]
+
+
+class _Condition(NamedTuple):
+    """インデックスで評価できる1つの条件."""
+
+    field: str
+    rows: int
+    ids: Callable[[], Sequence[int]]  # 該当する ID (必要になった時点で取得する)
+    test: Callable[[Symbol], bool]  # Symbol の検査
+
+
+class _SortedIndex[K: (str, int)](NamedTuple):
+    """値の昇順に並べた (値, ID) の列."""
+
+    keys: list[K]
+    ids: list[int]
+
+    @classmethod
+    def build(cls, keys: list[K], ids: list[int]) -> _SortedIndex[K]:
+        """ID の昇順の値と ID を値の昇順 (同じ値は ID の昇順) に並べて構築する."""
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return cls([keys[j] for j in order], [ids[j] for j in order])
+
+    def span(self, low: K | None, high: K | None) -> tuple[int, int]:
+        """low 以上 high 以下 (None は制限なし) の位置の範囲を返す."""
+        start = 0 if low is None else bisect_left(self.keys, low)
+        stop = len(self.keys) if high is None else bisect_right(self.keys, high)
+        return start, max(start, stop)
+
+
+class SymbolUniverse:
+    """フィールドごとのインデックスを持つ Symbol のコレクション.
+
+    構築後は変更しない (Symbol の追加・削除は新しく構築する)。
+    """
+
+    __slots__ = ("_expiries", "_hash", "_strikes", "_symbols")
+
+    def __init__(self, symbols: Iterable[Symbol]) -> None:
+        """Symbol を登録し、インデックスを構築する.
+
+        Args:
+            symbols: 登録する Symbol (登録順に ID を割り当てる)
+        """
+        self._symbols: list[Symbol] = list(symbols)
+        self._hash: dict[str, dict[object, list[int]]] = {
+            name: {} for name in _HASH_FIELDS
+        }
+        exchanges = self._hash["exchange"]
+        codes = self._hash["code"]
+        asset_classes = self._hash["asset_class"]
+        option_types = self._hash["option_type"]
+        # 整列インデックスの値は Symbol の属性の値をそのまま参照する (文字列を複製しない)
+        expiries: list[str] = []
+        expiry_ids: list[int] = []
+        strikes: list[int] = []
+        strike_ids: list[int] = []
+        for i, symbol in enumerate(self._symbols):
+            exchanges.setdefault(symbol.exchange, []).append(i)
+            codes.setdefault(symbol.code, []).append(i)
+            asset_classes.setdefault(symbol.asset_class, []).append(i)
+            if isinstance(symbol, EquitySymbol):
+                continue
+            expiries.append(symbol.expiry)
+            expiry_ids.append(i)
+            if not isinstance(symbol, OptionSymbol):
+                continue
+            option_types.setdefault(symbol.option_type, []).append(i)
+            if symbol.strike is not None:
+                strikes.append(symbol.strike)
+                strike_ids.append(i)
+        self._expiries = _SortedIndex.build(expiries, expiry_ids)
+        self._strikes = _SortedIndex.build(strikes, strike_ids)
+
+    def __len__(self) -> int:
+        """登録した Symbol の数を返す."""
+        return len(self._symbols)
+
+    def __iter__(self) -> Iterator[Symbol]:
+        """登録した Symbol を登録順に返す."""
+        return iter(self._symbols)
+
+    def query(
+        self,
+        *,
+        exchange: _Values[str] = None,
+        code: _Values[str] = None,
+        asset_class: _Values[AssetClass] = None,
+        option_type: _Values[OptionType] = None,
+        expiry: _Range[str | date] = None,
+        strike: _Range[int] = None,
+        where: Callable[[Symbol], bool] | None = None,
+    ) -> list[Symbol]:
+        """全ての条件に該当する Symbol を登録順に返す.
+
+        値の条件は単一の値 (一致) またはコレクション (いずれかに一致)、
+        範囲の条件は単一の値 (一致) または (下限, 上限) のタプル
+        (両端を含む、None は制限なし) で指定する。
+
+        Args:
+            exchange: 取引所の MIC
+            code: 銘柄・商品コード
+            asset_class: 資産クラス
+            option_type: オプション種別
+            expiry: 限月 (YYYYMMDD の文字列または date)。株式には該当しない。
+            strike: 権利行使価格。株式・先物・シリーズには該当しない。
+            where: 最後に候補に適用する述語 (SymbolPattern.matches など)
+
+        Returns:
+            該当する Symbol のリスト
+        """
+        conditions = self._conditions(
+            exchange, code, asset_class, option_type, expiry, strike
+        )
+        ids, _ = self._execute(conditions, where)
+        symbols = self._symbols
+        return [symbols[i] for i in ids]
+
+    def explain(
+        self,
+        *,
+        exchange: _Values[str] = None,
+        code: _Values[str] = None,
+        asset_class: _Values[AssetClass] = None,
+        option_type: _Values[OptionType] = None,
+        expiry: _Range[str | date] = None,
+        strike: _Range[int] = None,
+        where: Callable[[Symbol], bool] | None = None,
+    ) -> QueryPlan:
+        """query と同じ条件で検索し、実行した計画を返す (引数は query と同じ)."""
+        conditions = self._conditions(
+            exchange, code, asset_class, option_type, expiry, strike
+        )
+        _, steps = self._execute(conditions, where)
+        return QueryPlan(tuple(steps))
+
+    def _conditions(
+        self,
+        exchange: _Values[str],
+        code: _Values[str],
+        asset_class: _Values[AssetClass],
+        option_type: _Values[OptionType],
+        expiry: _Range[str | date],
+        strike: _Range[int],
+    ) -> list[_Condition]:
+        """指定された条件をインデックスで評価できる形にする."""
+        conditions = [
+            self._hash_condition(name, value)
+            for name, value in (
+                ("exchange", exchange),
+                ("code", code),
+                ("asset_class", asset_class),
+                ("option_type", option_type),
+            )
+            if value is not None
+        ]
+        if expiry is not None:
+            low, high = expiry if isinstance(expiry, tuple) else (expiry, expiry)
+            conditions.append(
+                _range_condition(
+                    "expiry", self._expiries, _expiry_key(low), _expiry_key(high)
+                )
+            )
+        if strike is not None:
+            strike_low, strike_high = (
+                strike if isinstance(strike, tuple) else (strike, strike)
+            )
+            conditions.append(
+                _range_condition("strike", self._strikes, strike_low, strike_high)
+            )
+        return conditions
+
+    def _hash_condition(self, name: str, value: object) -> _Condition:
+        """ハッシュインデックスの条件 (一致、またはいずれかに一致) を返す."""
+        index = self._hash[name]
+        if isinstance(value, str) or not isinstance(value, Collection):
+            ids = index.get(value, [])
+            return _Condition(
+                name, len(ids), lambda: ids, lambda s: getattr(s, name, None) == value
+            )
+        values = frozenset(value)
+        lists = [index[v] for v in values if v in index]
+
+        def test(symbol: Symbol) -> bool:
+            return getattr(symbol, name, None) in values
+
+        # フィールドは単一の値のため、各値の ID のリストは互いに素
+        return _Condition(
+            name, sum(map(len, lists)), lambda: list(chain.from_iterable(lists)), test
+        )
+
+    def _execute(
+        self, conditions: list[_Condition], where: Callable[[Symbol], bool] | None
+    ) -> tuple[list[int], list[PlanStep]]:
+        """条件を選択的な順に適用し、該当する ID (昇順) と手順を返す."""
+        symbols = self._symbols
+        steps: list[PlanStep] = []
+        if not conditions:
+            candidates: Collection[int] = range(len(symbols))
+            steps.append(PlanStep("*", len(symbols), "scan"))
+        else:
+            conditions.sort(key=attrgetter("rows"))
+            first, *rest = conditions
+            steps.append(PlanStep(first.field, first.rows, "index"))
+            candidates = first.ids() if first.rows else ()
+            for condition in rest:
+                if not candidates:
+                    break
+                if condition.rows <= len(candidates) * FILTER_COST:
+                    current = (
+                        candidates if isinstance(candidates, set) else set(candidates)
+                    )
+                    candidates = current.intersection(condition.ids())
+                    steps.append(PlanStep(condition.field, condition.rows, "intersect"))
+                else:
+                    test = condition.test
+                    candidates = [i for i in candidates if test(symbols[i])]
+                    steps.append(PlanStep(condition.field, condition.rows, "filter"))
+        if where is not None:
+            steps.append(PlanStep("where", len(candidates), "filter"))
+            candidates = [i for i in candidates if where(symbols[i])]
+        return sorted(candidates), steps
+
+
+def _range_condition[K: (str, int)](
+    name: str, index: _SortedIndex[K], low: K | None, high: K | None
+) -> _Condition:
+    """整列インデックスの条件 (name の値が両端を含む範囲) を返す."""
+    start, stop = index.span(low, high)
+
+    def test(symbol: Symbol) -> bool:
+        value = getattr(symbol, name, None)
+        if value is None:
+            return False
+        return (low is None or low <= value) and (high is None or value <= high)
+
+    return _Condition(name, stop - start, lambda: index.ids[start:stop], test)
+
+
+def _expiry_key(value: str | date | None) -> str | None:
+    """限月の条件を YYYYMMDD の文字列にする."""
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d")
+    return value
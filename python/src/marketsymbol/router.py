@@ -0,0 +1,422 @@
+"""多数のパターンによる購読のルーティング.
+
+SubscriptionRouter は購読者ごとの SymbolPattern をセグメント単位のトライに
+登録し、流れてくるシンボルに一致する購読者の集合を返す。トライの各階層は
+パターンのセグメント (exchange, code, expiry, 種別, strike) に対応し、
+セグメント数 (2: 株式、4: 先物・シリーズ、5: オプション) ごとに根を持つ。
+
+各ノードは子をセグメントの種類ごとに保持する:
+
+- リテラル: 値 -> 子の dict (1回の参照)
+- ``*``: 1つの子
+- ``PREFIX*``: 接頭辞の長さ -> 接頭辞 -> 子の dict (長さの種類ごとに1回の参照)
+- 範囲 (限月・strike の ``LOW-HIGH``): 範囲の両端で区切った区間 -> 値を含む範囲の
+  子の一覧 (1回の二分探索)
+- fnmatch 形式 (exchange・code の ``?`` や途中の ``*``): セグメント -> (述語, 子)
+  (種類ごとに1回の照合)
+
+範囲の子は exchange・code (とそれに続く限月・種別) の枝を辿った先のノードに
+置くため、範囲の索引は同じ exchange・code の経路のパターンごとに分かれる。
+ルーティングはシンボルの値で辿れる枝のみを訪れるため、計算量は登録した
+パターンの総数ではなく、一致したパターンの数と、経路上のノードにある
+接頭辞の長さ・fnmatch 形式のセグメントの種類の数 (と範囲の数の対数) に比例する。
+同じパターンの購読者は1つの葉で共有する。
+
+購読の追加・削除はトライを直接更新する。1つの配信ループ (スレッド) から
+利用する用途を想定し、スレッド間では共有しない。
+
+Example:
+    >>> from marketsymbol import SubscriptionRouter
+    >>> router = SubscriptionRouter()
+    >>> router.subscribe("client-a", "XJPX:N225O:202503*:C:*")
+    >>> router.subscribe("client-b", "*:N225O:*:*:40000-45000")
+    >>> sorted(router.route("XJPX:N225O:20250314:C:42000"))
+    ['client-a', 'client-b']
+    >>> sorted(router.route("XJPX:N225O:20250314:P:42000"))
+    ['client-b']
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import partial
+from operator import eq
+from typing import TYPE_CHECKING, NamedTuple
+
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.parser import _normalize, _segment_failure
+from marketsymbol.pattern import (
+    _EXPIRY,
+    _RANGE_SEPARATOR,
+    _STRIKE,
+    WILDCARD,
+    SymbolPattern,
+)
+from marketsymbol.symbol import EquitySymbol, OptionSymbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from marketsymbol.symbol import Symbol
+
+# セグメントの値 (strike は整数、それ以外は文字列)
+type _Value = str | int
+
+
+class _Node:
+    """トライのノード (子はセグメントの種類ごとに保持する)."""
+
+    __slots__ = (
+        "literals",
+        "others",
+        "prefixes",
+        "ranges",
+        "subscribers",
+        "wildcard",
+    )
+
+    def __init__(self) -> None:
+        """子と購読者を持たないノードを生成する."""
+        self.literals: dict[object, _Node] = {}
+        self.prefixes: dict[int, dict[str, _Node]] = {}
+        self.ranges: _RangeIndex | None = None
+        self.others: dict[str, tuple[Callable[[object], bool], _Node]] = {}
+        self.wildcard: _Node | None = None
+        self.subscribers: set[Hashable] = set()
+
+    def is_empty(self) -> bool:
+        """子と購読者を持たないかどうかを返す."""
+        return not (
+            self.literals
+            or self.prefixes
+            or self.ranges
+            or self.others
+            or self.wildcard
+            or self.subscribers
+        )
+
+
+class _RangeIndex:
+    """範囲のセグメントの子を、値を含む範囲の子の一覧として引く索引.
+
+    全ての範囲の両端の値で値の全体を区間 (両端の値そのものと、その間の開区間) に
+    区切り、区間ごとに値を含む範囲の子を前計算する。区間は二分探索で求める。
+    区間の表は範囲の追加・削除後の最初の検索で再構築する。
+    """
+
+    __slots__ = ("_bounds", "_children", "_covers")
+
+    def __init__(self) -> None:
+        """範囲を持たない索引を生成する."""
+        # セグメント -> (下限, 上限, 子) (None は制限なし)
+        self._children: dict[str, tuple[_Value | None, _Value | None, _Node]] = {}
+        # 両端の値の昇順と、区間 (2i: bounds[i] の手前の開区間、2i+1: bounds[i]) の子
+        self._bounds: list[_Value] = []
+        self._covers: list[tuple[_Node, ...]] | None = None
+
+    def __len__(self) -> int:
+        """範囲の数を返す."""
+        return len(self._children)
+
+    def child(self, segment: str, low: _Value | None, high: _Value | None) -> _Node:
+        """範囲の子を返す (存在しない場合は作成する)."""
+        entry = self._children.get(segment)
+        if entry is None:
+            entry = self._children[segment] = (low, high, _Node())
+            self._covers = None
+        return entry[2]
+
+    def remove(self, segment: str) -> None:
+        """範囲の子を外す."""
+        del self._children[segment]
+        self._covers = None
+
+    def lookup(self, value: _Value) -> tuple[_Node, ...]:
+        """value を含む範囲の子を返す."""
+        covers = self._covers if self._covers is not None else self._build()
+        bounds = self._bounds
+        i = bisect_left(bounds, value)
+        if i < len(bounds) and bounds[i] == value:
+            return covers[2 * i + 1]
+        return covers[2 * i]
+
+    def _build(self) -> list[tuple[_Node, ...]]:
+        """区間ごとの子の表を構築する."""
+        entries = self._children.values()
+        bounds = sorted(
+            {
+                bound
+                for low, high, _ in entries
+                for bound in (low, high)
+                if bound is not None
+            }
+        )
+        slots: list[list[_Node]] = [[] for _ in range(2 * len(bounds) + 1)]
+        slot_of = {bound: 2 * i + 1 for i, bound in enumerate(bounds)}
+        for low, high, node in entries:
+            start = 0 if low is None else slot_of[low]
+            stop = len(slots) - 1 if high is None else slot_of[high]
+            for slot in slots[start : stop + 1]:
+                slot.append(node)
+        self._bounds = bounds
+        self._covers = [tuple(slot) for slot in slots]
+        return self._covers
+
+
+class _Edge(NamedTuple):
+    """パターンの1つのセグメントに対応するトライの枝."""
+
+    kind: str  # "literal", "prefix", "range", "other", "wildcard"
+    key: object  # リテラルの値、接頭辞、またはセグメント
+    predicate: Callable[[object], bool] | None
+    # 範囲の下限と上限 (None は制限なし)
+    bounds: tuple[_Value | None, _Value | None] = (None, None)
+
+
+class SubscriptionRouter:
+    """購読者ごとのパターンをトライに登録し、シンボルを購読者にルーティングする.
+
+    購読者は任意のハッシュ可能な値 (クライアント ID など) で識別する。
+
+    リテラル・``*``・前方一致・範囲のセグメントは経路上のノードごとに定数回
+    (範囲は二分探索1回) の参照で辿る。exchange・code の fnmatch 形式のセグメント
+    (``X?PX``、``*225*`` など) は索引を持たず、そのノードを訪れるシンボルごとに
+    種類の数だけ照合する (種類の数に比例する)。
+    """
+
+    __slots__ = ("_roots", "_subscriptions")
+
+    def __init__(self) -> None:
+        """購読を持たないルーターを生成する."""
+        # セグメント数 -> トライの根
+        self._roots: dict[int, _Node] = {}
+        # 購読者 -> 購読しているパターン
+        self._subscriptions: dict[Hashable, set[SymbolPattern]] = {}
+
+    def __len__(self) -> int:
+        """購読 (購読者とパターンの組) の数を返す."""
+        return sum(map(len, self._subscriptions.values()))
+
+    def subscribe(self, subscriber: Hashable, pattern: str | SymbolPattern) -> None:
+        """購読者のパターンを登録する (登録済みの場合は何もしない).
+
+        Args:
+            subscriber: 購読者の識別子
+            pattern: パターン (文字列の場合は SymbolPattern として解析する)
+
+        Raises:
+            ValueError: パターンの形式が不正な場合
+        """
+        if isinstance(pattern, str):
+            pattern = SymbolPattern(pattern)
+        patterns = self._subscriptions.setdefault(subscriber, set())
+        if pattern in patterns:
+            return
+        node = self._roots.setdefault(pattern.segment_count, _Node())
+        for edge in _edges(pattern):
+            node = _child(node, edge)
+        node.subscribers.add(subscriber)
+        patterns.add(pattern)
+
+    def unsubscribe(self, subscriber: Hashable, pattern: str | SymbolPattern) -> bool:
+        """購読者のパターンの登録を解除する.
+
+        Args:
+            subscriber: 購読者の識別子
+            pattern: 登録したパターン
+
+        Returns:
+            登録を解除した場合は True、登録されていなかった場合は False
+
+        Raises:
+            ValueError: パターンの形式が不正な場合
+        """
+        if isinstance(pattern, str):
+            pattern = SymbolPattern(pattern)
+        patterns = self._subscriptions.get(subscriber)
+        if patterns is None or pattern not in patterns:
+            return False
+        patterns.remove(pattern)
+        if not patterns:
+            del self._subscriptions[subscriber]
+
+        root = self._roots[pattern.segment_count]
+        path = [(root, _Edge("wildcard", None, None))]
+        node = root
+        for edge in _edges(pattern):
+            node = _child(node, edge)
+            path.append((node, edge))
+        node.subscribers.discard(subscriber)
+        # 空になったノードを葉から順に親から外す
+        for (parent, _), (child, edge) in zip(
+            reversed(path[:-1]), reversed(path[1:]), strict=True
+        ):
+            if not child.is_empty():
+                break
+            _remove_child(parent, edge)
+        if root.is_empty():
+            del self._roots[pattern.segment_count]
+        return True
+
+    def unsubscribe_all(self, subscriber: Hashable) -> int:
+        """購読者の全てのパターンの登録を解除する.
+
+        Returns:
+            登録を解除したパターンの数
+        """
+        patterns = list(self._subscriptions.get(subscriber, ()))
+        for pattern in patterns:
+            self.unsubscribe(subscriber, pattern)
+        return len(patterns)
+
+    def subscriptions(self, subscriber: Hashable) -> frozenset[SymbolPattern]:
+        """購読者が登録しているパターンを返す."""
+        return frozenset(self._subscriptions.get(subscriber, ()))
+
+    def route(self, item: Symbol | str) -> set[Hashable]:
+        """シンボルに一致するパターンを購読している購読者の集合を返す.
+
+        シンボル文字列は parse_symbol と同じ規則で検査し (Symbol は生成しない)、
+        無効な場合は空の集合を返す。
+
+        Args:
+            item: Symbol またはシンボル文字列
+
+        Returns:
+            購読者の識別子の集合 (呼び出しごとに新しい集合)
+        """
+        values = _raw_values(item) if isinstance(item, str) else _values(item)
+        subscribers: set[Hashable] = set()
+        if values is None:
+            return subscribers
+        root = self._roots.get(len(values))
+        if root is None:
+            return subscribers
+
+        last = len(values)
+        stack = [(root, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, depth = pop()
+            if depth == last:
+                subscribers.update(node.subscribers)
+                continue
+            value = values[depth]
+            depth += 1
+            child = node.literals.get(value)
+            if child is not None:
+                push((child, depth))
+            if node.wildcard is not None:
+                push((node.wildcard, depth))
+            if isinstance(value, str):
+                for length, children in node.prefixes.items():
+                    child = children.get(value[:length])
+                    if child is not None:
+                        push((child, depth))
+            if node.ranges is not None:
+                for child in node.ranges.lookup(value):
+                    push((child, depth))
+            for predicate, child in node.others.values():
+                if predicate(value):
+                    push((child, depth))
+        return subscribers
+
+
+def _edges(pattern: SymbolPattern) -> list[_Edge]:
+    """パターンのセグメントをトライの枝に変換する."""
+    checks = dict(pattern._segment_checks)
+    edges = []
+    for position, segment in enumerate(pattern.pattern.split(":")):
+        if segment == WILDCARD:
+            # 種別の * もセグメント数が同じシンボルの全ての値に一致する
+            edges.append(_Edge("wildcard", None, None))
+            continue
+        check = checks[position]
+        if isinstance(check, partial) and check.func is eq:
+            edges.append(_Edge("literal", check.args[0], None))
+        elif (
+            position != _STRIKE
+            and segment.endswith(WILDCARD)
+            and "*" not in (stem := segment[:-1])
+            and "?" not in stem
+        ):
+            edges.append(_Edge("prefix", stem, None))
+        elif position in (_EXPIRY, _STRIKE) and _RANGE_SEPARATOR in segment:
+            low, _, high = segment.partition(_RANGE_SEPARATOR)
+            convert = int if position == _STRIKE else str
+            bounds = (convert(low) if low else None, convert(high) if high else None)
+            edges.append(_Edge("range", segment, None, bounds))
+        else:
+            edges.append(_Edge("other", segment, check))
+    return edges
+
+
+def _child(node: _Node, edge: _Edge) -> _Node:
+    """枝に対応する子を返す (存在しない場合は作成する)."""
+    if edge.kind == "literal":
+        return node.literals.setdefault(edge.key, _Node())
+    if edge.kind == "prefix":
+        stem = str(edge.key)
+        return node.prefixes.setdefault(len(stem), {}).setdefault(stem, _Node())
+    if edge.kind == "range":
+        if node.ranges is None:
+            node.ranges = _RangeIndex()
+        return node.ranges.child(str(edge.key), *edge.bounds)
+    if edge.kind == "other":
+        assert edge.predicate is not None
+        return node.others.setdefault(str(edge.key), (edge.predicate, _Node()))[1]
+    if node.wildcard is None:
+        node.wildcard = _Node()
+    return node.wildcard
+
+
+def _remove_child(node: _Node, edge: _Edge) -> None:
+    """枝に対応する子を外す."""
+    if edge.kind == "literal":
+        del node.literals[edge.key]
+    elif edge.kind == "prefix":
+        stem = str(edge.key)
+        children = node.prefixes[len(stem)]
+        del children[stem]
+        if not children:
+            del node.prefixes[len(stem)]
+    elif edge.kind == "range":
+        assert node.ranges is not None
+        node.ranges.remove(str(edge.key))
+        if not node.ranges:
+            node.ranges = None
+    elif edge.kind == "other":
+        del node.others[str(edge.key)]
+    else:
+        node.wildcard = None
+
+
+def _values(symbol: Symbol) -> tuple[_Value, ...]:
+    """Symbol のセグメントの値 (strike は整数) を返す."""
+    if isinstance(symbol, EquitySymbol):
+        return (symbol.exchange, symbol.code)
+    if isinstance(symbol, OptionSymbol):
+        if symbol.strike is None:
+            return (symbol.exchange, symbol.code, symbol.expiry, "O")
+        return (
+            symbol.exchange,
+            symbol.code,
+            symbol.expiry,
+            symbol.option_type.value,
+            symbol.strike,
+        )
+    return (symbol.exchange, symbol.code, symbol.expiry, "F")
+
+
+def _raw_values(raw: str) -> list[_Value] | None:
+    """シンボル文字列を検査し、セグメントの値を返す (無効な場合は None)."""
+    if len(raw) > MAX_SYMBOL_LENGTH:
+        return None
+    segments = _normalize(raw).split(":")
+    if _segment_failure(segments) is not None:
+        return None
+    values: list[_Value] = list(segments)
+    if len(values) > _STRIKE:
+        values[_STRIKE] = int(segments[_STRIKE])
+    return values
@@ -0,0 +1,162 @@
+"""テキスト中のシンボルの抽出.
+
+find_symbols / iter_symbols はログ行やチャットの書き出しなどの長いテキストから、
+埋め込まれた統一シンボル (例: ``XJPX:NK:20250314:F``) を文字位置とともに取り出す。
+
+候補の検出は1つのコンパイル済みの正規表現で1回の走査で行う。候補は
+4文字の大文字英字 (MIC) と ``:`` で始まり、``:`` 区切りの大文字英数字の
+セグメントが続く文字列で、前後が英数字・``:`` に接していないもの
+(文末の ``:`` は区切りとして扱う)。候補は parse_symbol と同じ規則
+(parser の _segment_failure) で例外を送出せずに検査し、無効な候補は読み飛ばす。
+テキスト中の正規化は行わないため、小文字や全角の表記は対象外となる。
+
+MIC の形式のみでは ``HTTP:200`` のような文字列も有効なシンボルとなるため、
+exchanges に既知の取引所を指定すると、その MIC で始まる候補のみを検出する。
+
+iter_symbols はファイルオブジェクトなど str のイテラブル (行やブロック) も受け付け、
+チャンクの境界をまたぐシンボルも検出する (保持するのは境界付近の
+MAX_SYMBOL_LENGTH 程度の文字のみ)。
+
+Example:
+    >>> from marketsymbol.scan import find_symbols
+    >>> text = "filled XJPX:NK:20250314:F x3, XJPX:N225O:20250314:C:42000 rejected"
+    >>> [(str(m.symbol), m.start, m.end) for m in find_symbols(text)]
+    [('XJPX:NK:20250314:F', 7, 25), ('XJPX:N225O:20250314:C:42000', 30, 57)]
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.parser import _build_symbol, _segment_failure
+from marketsymbol.validator import check_exchange
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+
+    from marketsymbol.symbol import Symbol
+
+# 候補の MIC 以降 (:セグメント を1-4個) と前後の境界
+# 後方: 英数字・':' の直後は候補の途中のため開始しない
+# 前方: 英数字、または ':' に続く英数字が続く場合は候補の途中のため終了しない
+_BEFORE = r"(?<![A-Za-z0-9:])"
+_SEGMENTS = r"(?::[A-Z0-9]+){1,4}(?!:?[A-Za-z0-9])"
+
+# 任意の MIC の候補
+_CANDIDATE = re.compile(rf"{_BEFORE}[A-Z]{{4}}{_SEGMENTS}")
+
+# チャンクの末尾で次のチャンクに持ち越す文字数
+# (候補の最大長と前方の境界の判定に必要な2文字)
+_TAIL = MAX_SYMBOL_LENGTH + 2
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolMatch:
+    """テキスト中のシンボル.
+
+    Attributes:
+        symbol: パース結果の Symbol.
+        start: テキスト中の開始位置 (文字単位).
+        end: テキスト中の終了位置 (文字単位、text[start:end] がシンボル文字列).
+    """
+
+    symbol: Symbol
+    start: int
+    end: int
+
+
+def find_symbols(
+    text: str, *, exchanges: Collection[str] | None = None
+) -> list[SymbolMatch]:
+    """テキスト中の有効なシンボルを出現順に返す.
+
+    Args:
+        text: 検索するテキスト
+        exchanges: 検出する取引所の MIC (None の場合は全ての MIC)
+
+    Returns:
+        シンボルと文字位置のリスト
+
+    Raises:
+        ValueError: exchanges に MIC の形式でない値が含まれる場合
+    """
+    return list(iter_symbols(text, exchanges=exchanges))
+
+
+def iter_symbols(
+    source: str | Iterable[str], *, exchanges: Collection[str] | None = None
+) -> Iterator[SymbolMatch]:
+    """テキスト (またはチャンクのイテラブル) 中の有効なシンボルを出現順に返す.
+
+    Args:
+        source: 検索するテキスト、または順に連結したものを検索する
+            str のイテラブル (ファイルオブジェクトなど)。文字位置は連結した
+            テキストでの位置となる。
+        exchanges: 検出する取引所の MIC (None の場合は全ての MIC)
+
+    Yields:
+        シンボルと文字位置
+
+    Raises:
+        ValueError: exchanges に MIC の形式でない値が含まれる場合
+    """
+    pattern = (
+        _CANDIDATE if exchanges is None else _exchange_pattern(frozenset(exchanges))
+    )
+    if isinstance(source, str):
+        yield from _matches(pattern, source, 0, len(source), 0)
+        return
+    # buffer は持ち越した末尾とチャンクを連結したもの、offset は buffer[0] の位置
+    buffer = ""
+    offset = 0
+    pos = 0
+    for chunk in source:
+        buffer += chunk
+        # safe_end より前で始まる候補は境界の判定に必要な文字がそろっている
+        safe_end = len(buffer) - _TAIL
+        if safe_end <= pos:
+            continue
+        yield from _matches(pattern, buffer, pos, safe_end, offset)
+        # 後方の境界の判定のため safe_end の直前の1文字も持ち越す
+        keep = safe_end - 1
+        buffer = buffer[keep:]
+        offset += keep
+        pos = 1
+    yield from _matches(pattern, buffer, pos, len(buffer) + 1, offset)
+
+
+def _matches(
+    pattern: re.Pattern[str], buffer: str, pos: int, stop: int, offset: int
+) -> Iterator[SymbolMatch]:
+    """buffer[pos:] から stop より前で始まる候補を検査して返す."""
+    for match in pattern.finditer(buffer, pos):
+        start = match.start()
+        if start >= stop:
+            return
+        candidate = match.group()
+        if len(candidate) > MAX_SYMBOL_LENGTH:
+            continue
+        # 候補は大文字英数字と ':' のみのため正規化済みで、分割のみで検査できる
+        segments = candidate.split(":")
+        if _segment_failure(segments) is None:
+            yield SymbolMatch(
+                _build_symbol(segments), offset + start, offset + match.end()
+            )
+
+
+@lru_cache(maxsize=32)
+def _exchange_pattern(exchanges: frozenset[str]) -> re.Pattern[str]:
+    """指定した MIC で始まる候補の正規表現をコンパイルする."""
+    for mic in exchanges:
+        if check_exchange(mic) is not None:
+            msg = f"Invalid MIC: {mic!r} (must be 4 uppercase letters)"
+            raise ValueError(msg)
+    if not exchanges:
+        # 常に失敗する空の選択肢 (どの候補も検出しない)
+        return re.compile(r"(?!)")
+    alternatives = "|".join(sorted(exchanges))
+    return re.compile(rf"{_BEFORE}(?:{alternatives}){_SEGMENTS}")
@@ -0,0 +1,212 @@
+"""プロセス・ノードをまたいで安定したシンボルのフィンガープリントとシャード分割.
+
+Symbol の ``hash()`` は PYTHONHASHSEED によって変わるため、プロセスやノードへの
+振り分けには使えない。symbol_fingerprint は正規のフィールドから求める 64 ビットの
+値で、プロセス・プラットフォーム・言語によらず同じ値となる:
+
+1. 正規の文字列表現 (``str(symbol)``、例: ``XJPX:N225O:20250314:C:42000``) を
+   UTF-8 でエンコードする
+2. BLAKE2b (RFC 7693) をダイジェスト長 8 バイト・鍵なしで計算する
+   (64 バイトのダイジェストの先頭 8 バイトとは異なる値となる)
+3. 8 バイトのダイジェストを little endian の符号なし整数として読む
+
+ShardPartitioner はフィンガープリントを jump consistent hash
+(Lamping, Veach 2014) でシャード番号 0..shard_count-1 に割り当てる。中央の
+対応表を持たず、シャード数を n から n+1 に増やした場合に移動するのは約 1/(n+1) の
+シンボル (移動先は新しいシャードのみ) となる。group を指定すると同じグループの
+シンボルを同じシャードに割り当てる (グループのキーの文字列のフィンガープリントを使う):
+
+- ``"symbol"``: シンボルごと (既定)
+- ``"chain"``: 限月のチェーンごと (``exchange:code:expiry``、株式は ``exchange:code``)
+- ``"product"``: 商品ごと (``exchange:code``)
+
+Example:
+    >>> from marketsymbol import ShardPartitioner, symbol_fingerprint
+    >>> hex(symbol_fingerprint("XJPX:7203"))
+    '0x5486523bc8cb8f15'
+    >>> partitioner = ShardPartitioner(16, group="chain")
+    >>> partitioner.shard("XJPX:N225O:20250314:C:42000") == partitioner.shard(
+    ...     "XJPX:N225O:20250314:P:38000"
+    ... )
+    True
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from hashlib import blake2b as _blake2b
+from typing import TYPE_CHECKING, Final
+
+from marketsymbol.parser import parse_symbol
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from marketsymbol.symbol import Symbol
+
+# グループの種類
+GROUP_SYMBOL: Final = "symbol"
+GROUP_CHAIN: Final = "chain"
+GROUP_PRODUCT: Final = "product"
+
+# フィンガープリントの BLAKE2b のダイジェスト長 (バイト)
+_DIGEST_SIZE = 8
+
+# jump consistent hash の線形合同法の乗数、64 ビットのマスクと 2**31
+_JUMP_MULTIPLIER = 2862933555777941757
+_MASK = (1 << 64) - 1
+_JUMP_SCALE = float(1 << 31)
+
+# グループ・シャード数ごとのシャード番号をメモ化する件数の上限
+_GROUP_CACHE_SIZE = 8192
+
+_SYMBOL_TYPES = (EquitySymbol, FutureSymbol, OptionSymbol)
+
+
+def symbol_fingerprint(symbol: Symbol | str) -> int:
+    """プロセス・プラットフォームによらない 64 ビットのフィンガープリントを返す.
+
+    正規の文字列表現の UTF-8 バイト列の BLAKE2b (digest_size=8) を little endian の
+    符号なし整数として読んだ値。シンボル文字列は parse_symbol と同じ規則で
+    パース・正規化する (Symbol を渡す場合はパースしない)。
+
+    Args:
+        symbol: Symbol またはシンボル文字列
+
+    Returns:
+        0 以上 2**64 未満の整数
+
+    Raises:
+        SymbolParseError: 無効なシンボル文字列の場合
+        TypeError: Symbol・str 以外の場合
+    """
+    return _fingerprint(str(_symbol(symbol)))
+
+
+class ShardPartitioner:
+    """シンボルを安定したフィンガープリントでシャードに割り当てる.
+
+    同じシンボル (group を指定した場合は同じグループ) はプロセス・ノードによらず
+    同じシャードとなる。
+    """
+
+    __slots__ = ("_group", "_shard_count", "_shard_of")
+
+    def __init__(self, shard_count: int, *, group: str = GROUP_SYMBOL) -> None:
+        """shard_count 個のシャードに割り当てるパーティショナーを生成する.
+
+        Args:
+            shard_count: シャード数 (1 以上)
+            group: 同じシャードに割り当てる単位 ("symbol", "chain", "product")
+
+        Raises:
+            ValueError: shard_count が 1 未満、または group が不正な場合
+        """
+        if shard_count < 1:
+            msg = "shard_count must be >= 1"
+            raise ValueError(msg)
+        shard_of = _GROUP_SHARDS.get(group)
+        if shard_of is None:
+            msg = f"Unknown group: {group!r} (expected one of {sorted(_GROUP_SHARDS)})"
+            raise ValueError(msg)
+        self._shard_count = shard_count
+        self._group = group
+        self._shard_of = shard_of
+
+    @property
+    def shard_count(self) -> int:
+        """シャード数."""
+        return self._shard_count
+
+    @property
+    def group(self) -> str:
+        """同じシャードに割り当てる単位."""
+        return self._group
+
+    def shard(self, symbol: Symbol | str) -> int:
+        """シンボルのシャード番号 (0 以上 shard_count 未満) を返す.
+
+        Raises:
+            SymbolParseError: 無効なシンボル文字列の場合
+            TypeError: Symbol・str 以外の場合
+        """
+        return self._shard_of(_symbol(symbol), self._shard_count)
+
+    def partition(self, symbols: Iterable[Symbol | str]) -> list[list[Symbol]]:
+        """シンボルをシャードごとのリスト (入力の順) に分ける.
+
+        Raises:
+            SymbolParseError: 無効なシンボル文字列を含む場合
+            TypeError: Symbol・str 以外を含む場合
+        """
+        shards: list[list[Symbol]] = [[] for _ in range(self._shard_count)]
+        shard_of = self._shard_of
+        shard_count = self._shard_count
+        for item in symbols:
+            symbol = _symbol(item)
+            shards[shard_of(symbol, shard_count)].append(symbol)
+        return shards
+
+    def __repr__(self) -> str:
+        """シャード数とグループを含む表現を返す."""
+        return f"ShardPartitioner({self._shard_count}, group={self._group!r})"
+
+
+def _symbol(item: Symbol | str) -> Symbol:
+    """シンボル文字列をパースし、Symbol・str 以外は TypeError を送出する."""
+    if isinstance(item, str):
+        return parse_symbol(item)
+    if not isinstance(item, _SYMBOL_TYPES):
+        msg = f"Expected Symbol or str, got {type(item).__name__}"
+        raise TypeError(msg)
+    return item
+
+
+def _fingerprint(text: str) -> int:
+    """正規の文字列表現のフィンガープリントを返す."""
+    digest = _blake2b(text.encode(), digest_size=_DIGEST_SIZE).digest()
+    return int.from_bytes(digest, "little")
+
+
+@lru_cache(maxsize=_GROUP_CACHE_SIZE)
+def _group_shard(exchange: str, code: str, expiry: str | None, shard_count: int) -> int:
+    """グループのキーの文字列のシャード番号を返す (グループの種類は限られるためメモ化する)."""
+    text = f"{exchange}:{code}" if expiry is None else f"{exchange}:{code}:{expiry}"
+    return _jump_hash(_fingerprint(text), shard_count)
+
+
+def _symbol_shard(symbol: Symbol, shard_count: int) -> int:
+    """シンボルごとに割り当てたシャード番号を返す."""
+    return _jump_hash(_fingerprint(str(symbol)), shard_count)
+
+
+def _chain_shard(symbol: Symbol, shard_count: int) -> int:
+    """チェーン (exchange:code:expiry、株式は exchange:code) のシャード番号を返す."""
+    expiry = None if isinstance(symbol, EquitySymbol) else symbol.expiry
+    return _group_shard(symbol.exchange, symbol.code, expiry, shard_count)
+
+
+def _product_shard(symbol: Symbol, shard_count: int) -> int:
+    """商品 (exchange:code) のシャード番号を返す."""
+    return _group_shard(symbol.exchange, symbol.code, None, shard_count)
+
+
+_GROUP_SHARDS: dict[str, Callable[[Symbol, int], int]] = {
+    GROUP_SYMBOL: _symbol_shard,
+    GROUP_CHAIN: _chain_shard,
+    GROUP_PRODUCT: _product_shard,
+}
+
+
+def _jump_hash(key: int, bucket_count: int) -> int:
+    """jump consistent hash で key を 0..bucket_count-1 に割り当てる.
+
+    参照実装 (Lamping, Veach 2014) と同じ64ビット整数・倍精度浮動小数点数の演算を行う。
+    """
+    bucket, candidate = -1, 0
+    while candidate < bucket_count:
+        bucket = candidate
+        key = (key * _JUMP_MULTIPLIER + 1) & _MASK
+        candidate = int((bucket + 1) * (_JUMP_SCALE / ((key >> 33) + 1)))
+    return bucket
@@ -2,10 +2,21 @@
 
 EquitySymbol, FutureSymbol, OptionSymbol の dataclass と
 Symbol 型エイリアスを提供する。
+
+Symbol は資産クラスをまたいで全順序を持つ。比較は次の順に行う:
+exchange, code (文字列の辞書順), 資産クラス (株式 < 先物 < オプション),
+限月 (日付順), オプション種別 (CALL < PUT < SERIES), strike (数値順)。
+順序は1つの整数のソートキー (sort_key) で表し、初回の参照時に計算して
+インスタンスにキャッシュする (キャッシュは基底クラスのスロットに置き、dataclass の
+フィールドには含めない)。大量の Symbol の整列には
+``sorted(symbols, key=attrgetter("sort_key"))`` を使う (比較演算子より速い)。
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 
+from marketsymbol.constants import MAX_CODE_LENGTH
 from marketsymbol.enums import AssetClass, OptionType
 from marketsymbol.errors import ErrorCode, SymbolValidationError
 from marketsymbol.validator import (
@@ -15,9 +26,107 @@ from marketsymbol.validator import (
     validate_strike,
 )
 
+# ソートキーの各フィールドの幅 (上位から exchange, code, 資産クラス, 限月,
+# オプション種別, strike)。code は '0' で右詰めした 36 進数と長さで辞書順を保つ。
+_CODE_BITS = 56
+_RANK_BITS = 2
+_EXPIRY_BITS = 27
+_STRIKE_BITS = 64
+_STRIKE_LIMIT = (1 << _STRIKE_BITS) - 1
+_OPTION_RANKS = {OptionType.CALL: 0, OptionType.PUT: 1, OptionType.SERIES: 2}
+
+# exchange と code の部分をメモ化する件数の上限
+_PREFIX_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_PREFIX_CACHE_SIZE)
+def _code_prefix(exchange: str, code: str) -> int:
+    """ソートキーの exchange と code の部分を返す (銘柄の種類は限られるためメモ化する)."""
+    code_key = int(code.ljust(MAX_CODE_LENGTH, "0"), 36) * (MAX_CODE_LENGTH + 1)
+    prefix = int(exchange, 36) << _CODE_BITS | code_key + len(code)
+    return prefix << (_RANK_BITS + _EXPIRY_BITS + _RANK_BITS)
+
+
+def _pack_sort_key(
+    exchange: str, code: str, rank: int, expiry: int, option_rank: int, strike: int
+) -> int:
+    """各フィールドの順序を保つ1つの整数を返す.
+
+    strike が 2**64 - 1 以上の場合は 2**64 - 1 として扱う
+    (比較演算子はその場合も strike で比較する)。
+    """
+    low = (rank << _EXPIRY_BITS | expiry) << _RANK_BITS | option_rank
+    return (_code_prefix(exchange, code) | low) << _STRIKE_BITS | min(
+        strike, _STRIKE_LIMIT
+    )
+
+
+class _SymbolOrder:
+    """資産クラスをまたぐ全順序 (sort_key の順) を提供する基底クラス.
+
+    sort_key の計算は各 Symbol クラスが定義する _make_sort_key が行う
+    (ABC にすると isinstance の判定が遅くなるため、型の宣言のみとする)。
+
+    計算したキーはこのクラスのスロット _sort_key にキャッシュする。dataclass の
+    フィールドではないため、fields()・asdict()・replace()・等価性・pickle の
+    対象外となる (replace・pickle で生成したインスタンスは再計算する)。
+    """
+
+    __slots__ = ("_sort_key",)
+
+    # キャッシュしたソートキー (未計算の間は属性が存在しない)
+    _sort_key: int
+    # ソートキーを計算するメソッド (各 Symbol クラスが定義する)
+    _make_sort_key: Callable[[], int]
+
+    @property
+    def sort_key(self) -> int:
+        """全順序のソートキーを返す (初回の参照時に計算してキャッシュする)."""
+        try:
+            return self._sort_key
+        except AttributeError:
+            key = self._make_sort_key()
+            object.__setattr__(self, "_sort_key", key)
+            return key
+
+    def _strike(self) -> int:
+        """sort_key が等しい場合に比較する strike を返す.
+
+        sort_key の strike の上限を超える値を区別するために使う。
+        """
+        return getattr(self, "strike", None) or 0
+
+    def __lt__(self, other: object) -> bool:
+        """順序で self < other かどうかを返す."""
+        if not isinstance(other, _SymbolOrder):
+            return NotImplemented
+        a, b = self.sort_key, other.sort_key
+        return a < b if a != b else self._strike() < other._strike()
+
+    def __le__(self, other: object) -> bool:
+        """順序で self <= other かどうかを返す."""
+        if not isinstance(other, _SymbolOrder):
+            return NotImplemented
+        a, b = self.sort_key, other.sort_key
+        return a < b if a != b else self._strike() <= other._strike()
+
+    def __gt__(self, other: object) -> bool:
+        """順序で self > other かどうかを返す."""
+        if not isinstance(other, _SymbolOrder):
+            return NotImplemented
+        a, b = self.sort_key, other.sort_key
+        return a > b if a != b else self._strike() > other._strike()
+
+    def __ge__(self, other: object) -> bool:
+        """順序で self >= other かどうかを返す."""
+        if not isinstance(other, _SymbolOrder):
+            return NotImplemented
+        a, b = self.sort_key, other.sort_key
+        return a > b if a != b else self._strike() >= other._strike()
+
 
 @dataclass(frozen=True, slots=True)
-class EquitySymbol:
+class EquitySymbol(_SymbolOrder):
     """株式・ETF シンボル.
 
     Attributes:
@@ -38,13 +147,17 @@ class EquitySymbol:
         """資産クラスを返す."""
         return AssetClass.EQUITY
 
+    def _make_sort_key(self) -> int:
+        """ソートキーを計算する."""
+        return _pack_sort_key(self.exchange, self.code, 0, 0, 0, 0)
+
     def __str__(self) -> str:
         """'exchange:code' 形式の文字列を返す."""
         return f"{self.exchange}:{self.code}"
 
 
 @dataclass(frozen=True, slots=True)
-class FutureSymbol:
+class FutureSymbol(_SymbolOrder):
     """先物シンボル.
 
     Attributes:
@@ -68,13 +181,17 @@ class FutureSymbol:
         """資産クラスを返す."""
         return AssetClass.FUTURE
 
+    def _make_sort_key(self) -> int:
+        """ソートキーを計算する."""
+        return _pack_sort_key(self.exchange, self.code, 1, int(self.expiry), 0, 0)
+
     def __str__(self) -> str:
         """'exchange:code:expiry:F' 形式の文字列を返す."""
         return f"{self.exchange}:{self.code}:{self.expiry}:F"
 
 
 @dataclass(frozen=True, slots=True)
-class OptionSymbol:
+class OptionSymbol(_SymbolOrder):
     """オプションシンボル.
 
     Attributes:
@@ -101,10 +218,11 @@ class OptionSymbol:
         if self.option_type in (OptionType.CALL, OptionType.PUT):
             if self.strike is None:
                 raise SymbolValidationError(
-                    f"Option type '{self.option_type.value}' requires strike price",
+                    "Option type '{0}' requires strike price",
                     ErrorCode.OPTION_WITHOUT_STRIKE,
                     field_name="strike",
                     field_value=self.strike,
+                    message_args=(self.option_type.value,),
                 )
             validate_strike(self.strike)
         elif self.option_type == OptionType.SERIES:
@@ -121,6 +239,17 @@ class OptionSymbol:
         """資産クラスを返す."""
         return AssetClass.OPTION
 
+    def _make_sort_key(self) -> int:
+        """ソートキーを計算する."""
+        return _pack_sort_key(
+            self.exchange,
+            self.code,
+            2,
+            int(self.expiry),
+            _OPTION_RANKS[self.option_type],
+            self.strike or 0,
+        )
+
     def __str__(self) -> str:
         """シンボル文字列を返す.
 
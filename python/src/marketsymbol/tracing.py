@@ -0,0 +1,400 @@
+"""パース・正規化・アダプター変換のトレーシングフック.
+
+トレースフックを登録すると parse_symbol、normalize_symbol、
+AdapterRegistry 経由の変換 (to_symbol / from_symbol) の呼び出しごとに
+TraceEvent が通知される。フック未登録時の呼び出し側のコストは
+フラグ参照1回のみ。
+
+parse_symbol のイベントには段階別の処理時間 (ParseStages:
+正規化・分割・検査・生成) が含まれる。
+
+組み込みのフックとして以下を提供する:
+
+- HistogramHook: 操作・資産クラス別の固定バケット (log2) レイテンシヒストグラム
+- SlowCallSampler: しきい値を超えた呼び出しを入力・段階別時間とともに通知
+
+フックはイベントを発生させたスレッドで同期的に呼び出される。
+フックが送出した例外は呼び出し元にそのまま伝播する。
+
+Example:
+    >>> from marketsymbol import parse_symbol
+    >>> from marketsymbol.tracing import (
+    ...     HistogramHook, TracedOperation, add_trace_hook, remove_trace_hook,
+    ... )
+    >>> hook = HistogramHook()
+    >>> add_trace_hook(hook)
+    >>> _ = parse_symbol("XJPX:7203")
+    >>> remove_trace_hook(hook)
+    >>> hook.total(TracedOperation.PARSE_SYMBOL).count
+    1
+"""
+
+from __future__ import annotations
+
+import threading
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from marketsymbol.instrumentation import INSTRUMENTATION, InstrumentationFlags
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from marketsymbol.enums import AssetClass
+    from marketsymbol.errors import ErrorCode
+
+    TraceHook = Callable[["TraceEvent"], None]
+
+# ヒストグラムのバケット数
+# バケット i (i >= 1) は [2**(i-1), 2**i) ns、最終バケットはそれ以上すべてを含む
+# 2**34 ns は約 17 秒
+HISTOGRAM_BUCKETS: Final = 36
+
+
+class TracedOperation(Enum):
+    """トレース対象の操作."""
+
+    PARSE_SYMBOL = "parse_symbol"
+    NORMALIZE_SYMBOL = "normalize_symbol"
+    TO_SYMBOL = "to_symbol"
+    FROM_SYMBOL = "from_symbol"
+
+
+class ParseStages(NamedTuple):
+    """parse_symbol の段階別処理時間 (ナノ秒).
+
+    失敗した段階には失敗までの時間が入り、実行されなかった段階は None。
+
+    Attributes:
+        normalize_ns: 正規化 (NFKC・大文字化・空白除去).
+        split_ns: セグメント分割.
+        validate_ns: フィールドの検査.
+        construct_ns: Symbol オブジェクトの生成.
+    """
+
+    normalize_ns: int | None
+    split_ns: int | None
+    validate_ns: int | None
+    construct_ns: int | None
+
+
+class TraceEvent(NamedTuple):
+    """トレース対象の呼び出し1回分の記録.
+
+    呼び出しごとに生成されるため、生成コストの小さい NamedTuple とする。
+
+    Attributes:
+        operation: 操作.
+        raw: 入力 (parse_symbol / normalize_symbol はシンボル文字列、
+            to_symbol はベンダー固有シンボル、from_symbol は Symbol).
+        elapsed_ns: 処理時間 (ナノ秒).
+        asset_class: 結果の資産クラス (不明・失敗時は None).
+        error_code: SymbolParseError で失敗した場合のエラーコード.
+        failed: 例外で終了した場合は True.
+        vendor: 変換のベンダー識別名 (変換以外は None).
+        stages: parse_symbol の段階別処理時間 (parse_symbol 以外は None).
+    """
+
+    operation: TracedOperation
+    raw: object
+    elapsed_ns: int
+    asset_class: AssetClass | None = None
+    error_code: ErrorCode | None = None
+    failed: bool = False
+    vendor: str | None = None
+    stages: ParseStages | None = None
+
+
+class Tracer:
+    """トレースフックを保持し、イベントを通知する.
+
+    フックの有無は InstrumentationFlags.tracing に保持し、計測対象の関数が
+    ホットパスで参照する。フック一覧は tuple で保持し、登録・解除時に
+    丸ごと差し替える (copy-on-write) ため、通知時にロックは不要。
+    """
+
+    def __init__(self, flags: InstrumentationFlags | None = None) -> None:
+        """トレーサーを初期化 (フックなし).
+
+        Args:
+            flags: フックの有無を保持するフラグ (None は専用のフラグを作成する).
+        """
+        self._flags = InstrumentationFlags() if flags is None else flags
+        self._flags.tracing = False
+        self._hooks: tuple[TraceHook, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """フックが1つ以上登録されていれば True を返す."""
+        return self._flags.tracing
+
+    @property
+    def hooks(self) -> tuple[TraceHook, ...]:
+        """登録済みのフックを登録順に返す."""
+        return self._hooks
+
+    def add_hook(self, hook: TraceHook) -> None:
+        """フックを登録する.
+
+        Args:
+            hook: TraceEvent を受け取る callable.
+        """
+        with self._lock:
+            self._hooks = (*self._hooks, hook)
+            self._flags.tracing = True
+
+    def remove_hook(self, hook: TraceHook) -> None:
+        """フックの登録を解除する.
+
+        Args:
+            hook: 登録済みのフック.
+
+        Raises:
+            ValueError: フックが登録されていない場合.
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+            hooks.remove(hook)
+            self._hooks = tuple(hooks)
+            self._flags.tracing = bool(hooks)
+
+    def clear(self) -> None:
+        """すべてのフックの登録を解除する."""
+        with self._lock:
+            self._hooks = ()
+            self._flags.tracing = False
+
+    def emit(self, event: TraceEvent) -> None:
+        """登録済みのフックにイベントを通知する.
+
+        Args:
+            event: 通知するイベント.
+        """
+        for hook in self._hooks:
+            hook(event)
+
+
+# プロセス全体で共有するトレーサー
+TRACER: Final = Tracer(INSTRUMENTATION)
+
+
+def add_trace_hook(hook: TraceHook) -> None:
+    """プロセス全体のトレーサーにフックを登録する."""
+    TRACER.add_hook(hook)
+
+
+def remove_trace_hook(hook: TraceHook) -> None:
+    """プロセス全体のトレーサーからフックの登録を解除する.
+
+    Raises:
+        ValueError: フックが登録されていない場合.
+    """
+    TRACER.remove_hook(hook)
+
+
+def clear_trace_hooks() -> None:
+    """プロセス全体のトレーサーのフックをすべて解除する."""
+    TRACER.clear()
+
+
+class LatencyHistogram:
+    """固定バケット (log2 スケール) のレイテンシヒストグラム.
+
+    バケット i (i >= 1) は [2**(i-1), 2**i) ns の観測値を数える。
+    バケット 0 は 0ns、最終バケットは 2**(HISTOGRAM_BUCKETS-2) ns 以上の観測値。
+    バケット位置は int.bit_length() で求めるため記録は O(1)。
+    """
+
+    __slots__ = ("_counts", "_total_ns")
+
+    def __init__(self) -> None:
+        """空のヒストグラムを生成する."""
+        self._counts = [0] * HISTOGRAM_BUCKETS
+        self._total_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        """観測値を1件記録する.
+
+        Args:
+            elapsed_ns: 処理時間 (ナノ秒, 負値は 0 として扱う).
+        """
+        elapsed_ns = max(elapsed_ns, 0)
+        self._counts[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self._total_ns += elapsed_ns
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """other の観測値を加算する."""
+        for i, count in enumerate(other._counts):
+            self._counts[i] += count
+        self._total_ns += other._total_ns
+
+    def copy(self) -> LatencyHistogram:
+        """複製を返す."""
+        histogram = LatencyHistogram()
+        histogram.merge(self)
+        return histogram
+
+    @property
+    def counts(self) -> tuple[int, ...]:
+        """バケットごとの観測数を返す."""
+        return tuple(self._counts)
+
+    @property
+    def count(self) -> int:
+        """観測数の合計を返す."""
+        return sum(self._counts)
+
+    @property
+    def total_ns(self) -> int:
+        """処理時間の合計 (ナノ秒) を返す."""
+        return self._total_ns
+
+    @staticmethod
+    def upper_bound_ns(bucket: int) -> int | None:
+        """バケットの上限 (この値を含まない, ナノ秒) を返す.
+
+        最終バケットは上限がないため None。
+        """
+        if bucket >= HISTOGRAM_BUCKETS - 1:
+            return None
+        return 1 << bucket
+
+    def percentile(self, q: float) -> int | None:
+        """q 分位点を含むバケットの上限 (ナノ秒) を返す.
+
+        Args:
+            q: 0 より大きく 1 以下の分位 (例: 0.99).
+
+        Returns:
+            バケット上限 (観測なしの場合、最終バケットの場合は None).
+
+        Raises:
+            ValueError: q が範囲外の場合.
+        """
+        if not 0 < q <= 1:
+            msg = f"q must be in (0, 1], got {q}"
+            raise ValueError(msg)
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for bucket, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return self.upper_bound_ns(bucket)
+        return None  # pragma: no cover
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 互換の dict を返す (観測のあるバケットのみ, キーは上限 ns)."""
+        buckets: dict[str, int] = {}
+        for bucket, count in enumerate(self._counts):
+            if count:
+                bound = self.upper_bound_ns(bucket)
+                buckets["inf" if bound is None else str(bound)] = count
+        return {"count": self.count, "total_ns": self._total_ns, "buckets": buckets}
+
+
+class HistogramHook:
+    """操作・資産クラス別にレイテンシヒストグラムを集計するフック.
+
+    キーは (操作, 資産クラス)。資産クラスが不明な呼び出し
+    (失敗した呼び出しや normalize_symbol) は資産クラス None として集計する。
+    """
+
+    def __init__(self) -> None:
+        """空の集計状態で初期化する."""
+        self._lock = threading.Lock()
+        self._histograms: dict[
+            tuple[TracedOperation, AssetClass | None], LatencyHistogram
+        ] = {}
+
+    def __call__(self, event: TraceEvent) -> None:
+        """イベントの処理時間を該当するヒストグラムに記録する."""
+        key = (event.operation, event.asset_class)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(event.elapsed_ns)
+
+    def histogram(
+        self, operation: TracedOperation, asset_class: AssetClass | None = None
+    ) -> LatencyHistogram:
+        """指定したキーのヒストグラムの複製を返す (観測なしなら空)."""
+        with self._lock:
+            histogram = self._histograms.get((operation, asset_class))
+            return LatencyHistogram() if histogram is None else histogram.copy()
+
+    def total(self, operation: TracedOperation) -> LatencyHistogram:
+        """操作の全資産クラス分を合算したヒストグラムを返す."""
+        merged = LatencyHistogram()
+        with self._lock:
+            for (op, _), histogram in self._histograms.items():
+                if op is operation:
+                    merged.merge(histogram)
+        return merged
+
+    def snapshot(
+        self,
+    ) -> Mapping[tuple[TracedOperation, AssetClass | None], LatencyHistogram]:
+        """全ヒストグラムの複製を返す."""
+        with self._lock:
+            return {key: h.copy() for key, h in self._histograms.items()}
+
+    def reset(self) -> None:
+        """集計をすべて破棄する."""
+        with self._lock:
+            self._histograms = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        """メトリクスシステムへのエクスポート用に JSON 互換の dict を返す.
+
+        形式: {操作: {資産クラス (不明は 'unknown'): ヒストグラム}}
+        """
+        data: dict[str, Any] = {}
+        for (operation, asset_class), histogram in self.snapshot().items():
+            key = "unknown" if asset_class is None else asset_class.value
+            data.setdefault(operation.value, {})[key] = histogram.to_dict()
+        return data
+
+
+class SlowCallSampler:
+    """しきい値以上の時間がかかった呼び出しを callback に通知するフック.
+
+    callback が受け取る TraceEvent には元の入力 (raw) と、
+    parse_symbol の場合は段階別処理時間 (stages) が含まれる。
+    """
+
+    def __init__(
+        self,
+        threshold_ns: int,
+        callback: Callable[[TraceEvent], None],
+        *,
+        operations: Iterable[TracedOperation] | None = None,
+    ) -> None:
+        """サンプラーを初期化する.
+
+        Args:
+            threshold_ns: 通知するしきい値 (ナノ秒, この値以上を通知).
+            callback: 遅い呼び出しのイベントを受け取る callable.
+            operations: 対象とする操作 (None ならすべて).
+
+        Raises:
+            ValueError: threshold_ns が負の場合.
+        """
+        if threshold_ns < 0:
+            msg = f"threshold_ns must be non-negative, got {threshold_ns}"
+            raise ValueError(msg)
+        self.threshold_ns = threshold_ns
+        self.callback = callback
+        self.operations = None if operations is None else frozenset(operations)
+
+    def __call__(self, event: TraceEvent) -> None:
+        """しきい値以上の呼び出しであれば callback に通知する."""
+        if event.elapsed_ns < self.threshold_ns:
+            return
+        if self.operations is not None and event.operation not in self.operations:
+            return
+        self.callback(event)
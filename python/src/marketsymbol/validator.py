@@ -1,10 +1,15 @@
 """marketsymbol のバリデーション機能.
 
 各フィールドのバリデーション関数を提供する。
+
+check_* 関数は例外を送出せず、失敗時に ValidationFailure を返す。
+validate_* 関数は check_* の結果から SymbolValidationError を送出する。
+パーサーは check_* を直接使い、SymbolParseError を1回だけ生成する。
 """
 
-import calendar
 import re
+from collections.abc import Set as AbstractSet
+from typing import NamedTuple
 
 from marketsymbol.constants import (
     EXPIRY_LENGTH,
@@ -12,7 +17,7 @@ from marketsymbol.constants import (
     MIN_CODE_LENGTH,
     MIN_STRIKE,
 )
-from marketsymbol.errors import ErrorCode, SymbolValidationError
+from marketsymbol.errors import ErrorCode, SymbolParseError, SymbolValidationError
 
 # 有効なオプション/アセットタイプ識別子
 VALID_TYPE_IDENTIFIERS = frozenset({"C", "P", "O", "F"})
@@ -22,88 +27,308 @@ _MIC_PATTERN = re.compile(r"^[A-Z]{4}$")
 _CODE_PATTERN = re.compile(r"^[A-Z0-9]+$")
 _EXPIRY_PATTERN = re.compile(r"^\d{8}$")
 
+# 平年の各月の日数 (インデックス 0 はダミー)
+# calendar モジュールはインポートコストが大きい (datetime, locale 等を連鎖ロード)
+# ため、月の日数は自前のテーブルで求める
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_FEBRUARY = 2
+_MONTHS_PER_YEAR = 12
 
-def validate_exchange(exchange: str) -> None:
-    """取引所コード (MIC) をバリデーションする.
+# エラーメッセージテンプレート (str.format 形式, 整形は例外側で遅延実行)
+_EXCHANGE_MESSAGE = "Invalid exchange code: '{0}' (must be 4 uppercase letters)"
+_CODE_LENGTH_MESSAGE = (
+    f"Invalid code: '{{0}}' (must be {MIN_CODE_LENGTH}-{MAX_CODE_LENGTH} characters)"
+)
+_CODE_PATTERN_MESSAGE = "Invalid code: '{0}' (must be uppercase alphanumeric)"
+_EXPIRY_FORMAT_MESSAGE = "Invalid expiry format: '{0}' (must be YYYYMMDD)"
+_MONTH_MESSAGE = "Invalid date: '{0}' (invalid month: {1})"
+_DAY_MESSAGE = "Invalid date: '{0}' (invalid day: {1} for month {2})"
+_CODE_RANGE_MESSAGE = "Invalid code: '{0}' (must be {1}-{2} characters)"
+_UNKNOWN_EXCHANGE_MESSAGE = "Unknown exchange: '{0}' (not in known exchanges)"
+_UNKNOWN_CODE_MESSAGE = "Unknown code: '{0}' (not in known codes)"
+_OPTION_TYPE_MESSAGE = "Invalid option type: '{0}' (must be C, P, O, or F)"
+_STRIKE_MESSAGE = f"Invalid strike: {{0}} (must be positive integer >= {MIN_STRIKE})"
+
+
+class ValidationFailure(NamedTuple):
+    """バリデーション失敗の内容.
+
+    例外を生成せずに失敗を表現する。メッセージは未整形のまま保持し、
+    例外に変換した後、message へのアクセス時に初めて整形される。
+
+    Attributes:
+        error_code: エラーコード.
+        template: メッセージテンプレート (str.format 形式).
+        message_args: テンプレートに埋め込む引数.
+        field_name: バリデーションに失敗したフィールド名.
+        field_value: バリデーションに失敗した値.
+    """
+
+    error_code: ErrorCode
+    template: str
+    message_args: tuple[object, ...]
+    field_name: str
+    field_value: object
+
+    def to_validation_error(self) -> SymbolValidationError:
+        """SymbolValidationError に変換する."""
+        return SymbolValidationError(
+            self.template,
+            self.error_code,
+            field_name=self.field_name,
+            field_value=self.field_value,
+            message_args=self.message_args,
+        )
+
+    def to_parse_error(self, raw_symbol: str) -> SymbolParseError:
+        """SymbolParseError に変換する.
+
+        Args:
+            raw_symbol: パースに失敗した元のシンボル文字列.
+        """
+        return SymbolParseError.from_parse_failure(
+            self.template,
+            self.error_code,
+            raw_symbol,
+            message_args=self.message_args,
+        )
+
+
+def _is_leap_year(year: int) -> bool:
+    """うるう年かどうかを返す (グレゴリオ暦)."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """指定年月の日数を返す (うるう年考慮)."""
+    if month == _FEBRUARY and _is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def check_exchange(exchange: str) -> ValidationFailure | None:
+    """取引所コード (MIC) を検査する.
 
     Args:
         exchange: 取引所コード.
 
-    Raises:
-        SymbolValidationError: バリデーション失敗時 (E007).
+    Returns:
+        失敗時は ValidationFailure (E007)、成功時は None.
     """
-    if not _MIC_PATTERN.match(exchange):
-        raise SymbolValidationError(
-            f"Invalid exchange code: '{exchange}' (must be 4 uppercase letters)",
-            ErrorCode.UNKNOWN_EXCHANGE,
-            field_name="exchange",
-            field_value=exchange,
-        )
+    if _MIC_PATTERN.match(exchange):
+        return None
+    return ValidationFailure(
+        ErrorCode.UNKNOWN_EXCHANGE,
+        _EXCHANGE_MESSAGE,
+        (exchange,),
+        "exchange",
+        exchange,
+    )
 
 
-def validate_code(code: str) -> None:
-    """証券/商品コードをバリデーションする.
+def check_code(code: str) -> ValidationFailure | None:
+    """証券/商品コードを検査する.
 
     Args:
         code: 証券/商品コード.
 
-    Raises:
-        SymbolValidationError: バリデーション失敗時 (E008).
+    Returns:
+        失敗時は ValidationFailure (E008)、成功時は None.
     """
     if not code or len(code) < MIN_CODE_LENGTH or len(code) > MAX_CODE_LENGTH:
-        raise SymbolValidationError(
-            f"Invalid code: '{code}' (must be {MIN_CODE_LENGTH}-{MAX_CODE_LENGTH} characters)",
-            ErrorCode.INVALID_CODE,
-            field_name="code",
-            field_value=code,
+        return ValidationFailure(
+            ErrorCode.INVALID_CODE, _CODE_LENGTH_MESSAGE, (code,), "code", code
         )
     if not _CODE_PATTERN.match(code):
-        raise SymbolValidationError(
-            f"Invalid code: '{code}' (must be uppercase alphanumeric)",
+        return ValidationFailure(
+            ErrorCode.INVALID_CODE, _CODE_PATTERN_MESSAGE, (code,), "code", code
+        )
+    return None
+
+
+def check_code_length(
+    code: str, min_length: int, max_length: int
+) -> ValidationFailure | None:
+    """証券/商品コードを指定の長さの範囲で検査する.
+
+    資産クラスごとのコード長 (constants の MIN_FUTURE_CODE_LENGTH 等) の
+    適用に使う。文字種の検査は check_code と同じ。
+
+    Args:
+        code: 証券/商品コード.
+        min_length: 最小長.
+        max_length: 最大長.
+
+    Returns:
+        失敗時は ValidationFailure (E008)、成功時は None.
+    """
+    if len(code) < min_length or len(code) > max_length:
+        return ValidationFailure(
             ErrorCode.INVALID_CODE,
-            field_name="code",
-            field_value=code,
+            _CODE_RANGE_MESSAGE,
+            (code, min_length, max_length),
+            "code",
+            code,
         )
+    if not _CODE_PATTERN.match(code):
+        return ValidationFailure(
+            ErrorCode.INVALID_CODE, _CODE_PATTERN_MESSAGE, (code,), "code", code
+        )
+    return None
 
 
-def validate_expiry(expiry: str) -> None:
-    """限月 (YYYYMMDD) をバリデーションする.
+def check_known_exchange(
+    exchange: str, known_exchanges: AbstractSet[str]
+) -> ValidationFailure | None:
+    """取引所コードが既知の MIC に含まれるかを検査する.
+
+    形式の検査 (check_exchange) は行わない。
+
+    Returns:
+        未知の場合は ValidationFailure (E007)、既知の場合は None.
+    """
+    if exchange in known_exchanges:
+        return None
+    return ValidationFailure(
+        ErrorCode.UNKNOWN_EXCHANGE,
+        _UNKNOWN_EXCHANGE_MESSAGE,
+        (exchange,),
+        "exchange",
+        exchange,
+    )
+
+
+def check_known_code(
+    code: str, known_codes: AbstractSet[str]
+) -> ValidationFailure | None:
+    """商品コードが既知のコードに含まれるかを検査する.
+
+    形式の検査 (check_code) は行わない。
+
+    Returns:
+        未知の場合は ValidationFailure (E008)、既知の場合は None.
+    """
+    if code in known_codes:
+        return None
+    return ValidationFailure(
+        ErrorCode.INVALID_CODE, _UNKNOWN_CODE_MESSAGE, (code,), "code", code
+    )
+
+
+def check_expiry(expiry: str) -> ValidationFailure | None:
+    """限月 (YYYYMMDD) を検査する.
 
     Args:
         expiry: 限月 (YYYYMMDD 形式).
 
-    Raises:
-        SymbolValidationError: フォーマット不正時 (E003)、日付不正時 (E005).
+    Returns:
+        フォーマット不正時は ValidationFailure (E003)、
+        日付不正時は ValidationFailure (E005)、成功時は None.
     """
     if not _EXPIRY_PATTERN.match(expiry) or len(expiry) != EXPIRY_LENGTH:
-        raise SymbolValidationError(
-            f"Invalid expiry format: '{expiry}' (must be YYYYMMDD)",
+        return ValidationFailure(
             ErrorCode.INVALID_EXPIRY_FORMAT,
-            field_name="expiry",
-            field_value=expiry,
+            _EXPIRY_FORMAT_MESSAGE,
+            (expiry,),
+            "expiry",
+            expiry,
         )
 
-    year = int(expiry[:4])
     month = int(expiry[4:6])
-    day = int(expiry[6:8])
-
-    if month < 1 or month > 12:
-        raise SymbolValidationError(
-            f"Invalid date: '{expiry}' (invalid month: {month})",
-            ErrorCode.INVALID_DATE,
-            field_name="expiry",
-            field_value=expiry,
+    if month < 1 or month > _MONTHS_PER_YEAR:
+        return ValidationFailure(
+            ErrorCode.INVALID_DATE, _MONTH_MESSAGE, (expiry, month), "expiry", expiry
         )
 
     # 月の最大日数を取得 (うるう年考慮)
-    _, max_day = calendar.monthrange(year, month)
-    if day < 1 or day > max_day:
-        raise SymbolValidationError(
-            f"Invalid date: '{expiry}' (invalid day: {day} for month {month})",
+    day = int(expiry[6:8])
+    if day < 1 or day > _days_in_month(int(expiry[:4]), month):
+        return ValidationFailure(
             ErrorCode.INVALID_DATE,
-            field_name="expiry",
-            field_value=expiry,
+            _DAY_MESSAGE,
+            (expiry, day, month),
+            "expiry",
+            expiry,
         )
+    return None
+
+
+def check_option_type(option_type: str) -> ValidationFailure | None:
+    """オプション/資産タイプ識別子を検査する.
+
+    Args:
+        option_type: タイプ識別子 (C/P/O/F).
+
+    Returns:
+        失敗時は ValidationFailure (E006)、成功時は None.
+    """
+    if option_type in VALID_TYPE_IDENTIFIERS:
+        return None
+    return ValidationFailure(
+        ErrorCode.INVALID_OPTION_TYPE,
+        _OPTION_TYPE_MESSAGE,
+        (option_type,),
+        "option_type",
+        option_type,
+    )
+
+
+def check_strike(strike: int) -> ValidationFailure | None:
+    """権利行使価格を検査する.
+
+    Args:
+        strike: 権利行使価格.
+
+    Returns:
+        失敗時は ValidationFailure (E009)、成功時は None.
+    """
+    if strike >= MIN_STRIKE:
+        return None
+    return ValidationFailure(
+        ErrorCode.INVALID_STRIKE_VALUE, _STRIKE_MESSAGE, (strike,), "strike", strike
+    )
+
+
+def validate_exchange(exchange: str) -> None:
+    """取引所コード (MIC) をバリデーションする.
+
+    Args:
+        exchange: 取引所コード.
+
+    Raises:
+        SymbolValidationError: バリデーション失敗時 (E007).
+    """
+    failure = check_exchange(exchange)
+    if failure is not None:
+        raise failure.to_validation_error()
+
+
+def validate_code(code: str) -> None:
+    """証券/商品コードをバリデーションする.
+
+    Args:
+        code: 証券/商品コード.
+
+    Raises:
+        SymbolValidationError: バリデーション失敗時 (E008).
+    """
+    failure = check_code(code)
+    if failure is not None:
+        raise failure.to_validation_error()
+
+
+def validate_expiry(expiry: str) -> None:
+    """限月 (YYYYMMDD) をバリデーションする.
+
+    Args:
+        expiry: 限月 (YYYYMMDD 形式).
+
+    Raises:
+        SymbolValidationError: フォーマット不正時 (E003)、日付不正時 (E005).
+    """
+    failure = check_expiry(expiry)
+    if failure is not None:
+        raise failure.to_validation_error()
 
 
 def validate_option_type(option_type: str) -> None:
@@ -115,13 +340,9 @@ def validate_option_type(option_type: str) -> None:
     Raises:
         SymbolValidationError: バリデーション失敗時 (E006).
     """
-    if option_type not in VALID_TYPE_IDENTIFIERS:
-        raise SymbolValidationError(
-            f"Invalid option type: '{option_type}' (must be C, P, O, or F)",
-            ErrorCode.INVALID_OPTION_TYPE,
-            field_name="option_type",
-            field_value=option_type,
-        )
+    failure = check_option_type(option_type)
+    if failure is not None:
+        raise failure.to_validation_error()
 
 
 def validate_strike(strike: int) -> None:
@@ -133,10 +354,6 @@ def validate_strike(strike: int) -> None:
     Raises:
         SymbolValidationError: バリデーション失敗時 (E009).
     """
-    if strike < MIN_STRIKE:
-        raise SymbolValidationError(
-            f"Invalid strike: {strike} (must be positive integer >= {MIN_STRIKE})",
-            ErrorCode.INVALID_STRIKE_VALUE,
-            field_name="strike",
-            field_value=strike,
-        )
+    failure = check_strike(strike)
+    if failure is not None:
+        raise failure.to_validation_error()
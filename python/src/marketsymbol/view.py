@@ -0,0 +1,272 @@
+"""シンボル文字列の遅延ビュー.
+
+SymbolView は str / bytes のシンボル文字列を包み、生成時には正規化と
+セグメント分割 (1回の走査) のみを行う。各フィールドは初回アクセス時に
+デコード・検査し、結果をキャッシュする。取引所や資産クラスだけを見て
+メッセージを振り分ける経路では、Symbol の生成と未使用フィールドの検査を省ける。
+
+検査規則とエラーコードは parse_symbol と同じ (parser の検査関数を共有する)。
+ただし検査はアクセスしたフィールドに対してのみ行うため、複数のフィールドが
+不正な場合に送出されるエラーは parse_symbol と異なりうる。
+materialize() は parse_symbol と同じ順序ですべてのフィールドを検査する。
+
+Example:
+    >>> from marketsymbol import SymbolView
+    >>> view = SymbolView(b"XJPX:N225O:20250314:C:42000")
+    >>> view.exchange
+    'XJPX'
+    >>> view.asset_class
+    <AssetClass.OPTION: 'option'>
+    >>> view.materialize().strike
+    42000
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.enums import AssetClass, OptionType
+from marketsymbol.errors import ErrorCode, SymbolParseError
+from marketsymbol.parser import (
+    _SEGMENT_COUNT_MESSAGE,
+    _TOO_LONG_MESSAGE,
+    _build_symbol,
+    _check_segments,
+    _normalize,
+    _type_failure,
+)
+from marketsymbol.validator import check_code, check_exchange, check_expiry
+
+if TYPE_CHECKING:
+    from marketsymbol.symbol import Symbol
+    from marketsymbol.validator import ValidationFailure
+
+# str.strip() が除去する ASCII の空白 (bytes.strip() は \x1c-\x1f を除去しない)
+_ASCII_WHITESPACE = b" \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+
+# セグメント数の定数
+_EQUITY_SEGMENT_COUNT = 2
+_DERIVATIVE_SEGMENT_COUNTS = frozenset({4, 5})
+_STRIKE_INDEX = 4
+
+_OPTION_TYPES = {option_type.value: option_type for option_type in OptionType}
+
+
+class SymbolView:
+    """シンボル文字列の遅延ビュー.
+
+    生成時に長さ・空文字列・セグメント数を検査し、各フィールドは
+    初回アクセス時に parse_symbol と同じ規則で検査する。
+    検査に失敗したフィールドへのアクセスは毎回 SymbolParseError を送出する。
+
+    bytes は ASCII であればそのまま分割し、フィールドごとにデコードする。
+    ASCII 以外を含む場合は UTF-8 としてデコードしてから正規化する。
+    """
+
+    __slots__ = (
+        "_code",
+        "_exchange",
+        "_expiry",
+        "_raw",
+        "_segments",
+        "_symbol",
+        "_type_indicator",
+    )
+
+    def __init__(self, raw: str | bytes) -> None:
+        """raw を正規化してセグメントに分割する.
+
+        Args:
+            raw: シンボル文字列 (str または bytes).
+
+        Raises:
+            TypeError: raw が str / bytes でない場合.
+            UnicodeDecodeError: bytes が UTF-8 としてデコードできない場合.
+            SymbolParseError: 長すぎる (E010)、空 (E004)、
+                セグメント数が不正 (E004) な場合.
+        """
+        segments: list[str] | list[bytes]
+        if isinstance(raw, bytes) and raw.isascii():
+            length = len(raw)
+            segments = raw.upper().strip(_ASCII_WHITESPACE).split(b":")
+        elif isinstance(raw, str | bytes):
+            text = raw if isinstance(raw, str) else raw.decode()
+            length = len(text)
+            segments = _normalize(text).split(":")
+        else:
+            raise TypeError(f"Expected str or bytes, got {type(raw).__name__}")
+
+        self._raw = raw
+        count = len(segments)
+        if length > MAX_SYMBOL_LENGTH:
+            raise SymbolParseError.from_parse_failure(
+                _TOO_LONG_MESSAGE,
+                ErrorCode.SYMBOL_TOO_LONG,
+                self._raw_text(),
+                message_args=(length,),
+            )
+        if count == 1 and not segments[0]:
+            raise SymbolParseError.from_parse_failure(
+                "Empty symbol string", ErrorCode.INVALID_SEGMENT_COUNT, self._raw_text()
+            )
+        if count != _EQUITY_SEGMENT_COUNT and count not in _DERIVATIVE_SEGMENT_COUNTS:
+            raise SymbolParseError.from_parse_failure(
+                _SEGMENT_COUNT_MESSAGE,
+                ErrorCode.INVALID_SEGMENT_COUNT,
+                self._raw_text(),
+                message_args=(count,),
+            )
+
+        self._segments = segments
+        self._exchange: str | None = None
+        self._code: str | None = None
+        self._expiry: str | None = None
+        self._type_indicator: str | None = None
+        self._symbol: Symbol | None = None
+
+    def __repr__(self) -> str:
+        """'SymbolView(raw)' 形式の文字列を返す."""
+        return f"{type(self).__name__}({self._raw!r})"
+
+    @property
+    def raw(self) -> str | bytes:
+        """生成時に渡された値を返す."""
+        return self._raw
+
+    @property
+    def segment_count(self) -> int:
+        """セグメント数 (2, 4, 5) を返す."""
+        return len(self._segments)
+
+    @property
+    def exchange(self) -> str:
+        """取引所コードを検査して返す.
+
+        Raises:
+            SymbolParseError: 取引所コードが不正な場合 (E007).
+        """
+        exchange = self._exchange
+        if exchange is None:
+            exchange = self._field(0)
+            self._raise_if(check_exchange(exchange))
+            self._exchange = exchange
+        return exchange
+
+    @property
+    def code(self) -> str:
+        """証券/商品コードを検査して返す.
+
+        Raises:
+            SymbolParseError: コードが不正な場合 (E008).
+        """
+        code = self._code
+        if code is None:
+            code = self._field(1)
+            self._raise_if(check_code(code))
+            self._code = code
+        return code
+
+    @property
+    def expiry(self) -> str | None:
+        """限月を検査して返す (株式は None).
+
+        Raises:
+            SymbolParseError: 限月が不正な場合 (E003, E005).
+        """
+        expiry = self._expiry
+        if expiry is None and len(self._segments) != _EQUITY_SEGMENT_COUNT:
+            expiry = self._field(2)
+            self._raise_if(check_expiry(expiry))
+            self._expiry = expiry
+        return expiry
+
+    @property
+    def asset_class(self) -> AssetClass:
+        """資産クラスを返す.
+
+        先物・オプションはタイプ識別子と strike の有無
+        (5セグメントの場合は strike の値を含む) を検査する。
+
+        Raises:
+            SymbolParseError: タイプ識別子・strike が不正な場合
+                (E001, E002, E006, E009).
+        """
+        if len(self._segments) == _EQUITY_SEGMENT_COUNT:
+            return AssetClass.EQUITY
+        if self._checked_type_indicator() == "F":
+            return AssetClass.FUTURE
+        return AssetClass.OPTION
+
+    @property
+    def option_type(self) -> OptionType | None:
+        """オプション種別を返す (株式・先物は None).
+
+        Raises:
+            SymbolParseError: タイプ識別子・strike が不正な場合
+                (E001, E002, E006, E009).
+        """
+        if len(self._segments) == _EQUITY_SEGMENT_COUNT:
+            return None
+        return _OPTION_TYPES.get(self._checked_type_indicator())
+
+    @property
+    def strike(self) -> int | None:
+        """権利行使価格を返す (strike なしは None).
+
+        Raises:
+            SymbolParseError: タイプ識別子・strike が不正な場合
+                (E001, E002, E006, E009).
+        """
+        if len(self._segments) != _STRIKE_INDEX + 1:
+            # 4セグメントの C / P は asset_class と同じエラーを送出する
+            if len(self._segments) != _EQUITY_SEGMENT_COUNT:
+                self._checked_type_indicator()
+            return None
+        self._checked_type_indicator()
+        return int(self._field(_STRIKE_INDEX))
+
+    def materialize(self) -> Symbol:
+        """parse_symbol と同じ順序で全フィールドを検査し、Symbol を返す.
+
+        結果はキャッシュし、2回目以降は同じインスタンスを返す。
+
+        Raises:
+            SymbolParseError: いずれかのフィールドが不正な場合
+                (エラーコードは parse_symbol と同じ).
+        """
+        symbol = self._symbol
+        if symbol is None:
+            segments = [self._field(i) for i in range(len(self._segments))]
+            _check_segments(segments, self._raw_text())
+            symbol = self._symbol = _build_symbol(segments)
+        return symbol
+
+    def _field(self, index: int) -> str:
+        """index 番目のセグメントを str で返す."""
+        segment = self._segments[index]
+        return segment if isinstance(segment, str) else segment.decode("ascii")
+
+    def _checked_type_indicator(self) -> str:
+        """検査済みのタイプ識別子を返す (先物・オプションのみ)."""
+        type_indicator = self._type_indicator
+        if type_indicator is None:
+            type_indicator = self._field(3)
+            strike = (
+                self._field(_STRIKE_INDEX)
+                if len(self._segments) > _STRIKE_INDEX
+                else None
+            )
+            self._raise_if(_type_failure(type_indicator, strike))
+            self._type_indicator = type_indicator
+        return type_indicator
+
+    def _raise_if(self, failure: ValidationFailure | None) -> None:
+        """検査に失敗した場合に SymbolParseError を送出する."""
+        if failure is not None:
+            raise failure.to_parse_error(self._raw_text())
+
+    def _raw_text(self) -> str:
+        """エラーに記録する元のシンボル文字列を返す."""
+        raw = self._raw
+        return raw if isinstance(raw, str) else raw.decode(errors="replace")
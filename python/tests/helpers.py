@@ -0,0 +1,24 @@
+"""複数のテストモジュールで共有するヘルパー."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from marketsymbol import SymbolParseError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marketsymbol import ErrorCode, Symbol
+
+
+def verdict(parse: Callable[[str], Symbol], raw: str) -> Symbol | tuple[ErrorCode, str]:
+    """parse(raw) の結果、または (エラーコード, メッセージ) を返す.
+
+    parse_symbol と別のパーサーの結果 (値・エラーコード・メッセージ) の
+    一致を検証するために使う。
+    """
+    try:
+        return parse(raw)
+    except SymbolParseError as e:
+        return e.error_code, str(e)
@@ -104,6 +104,29 @@ class TestBaseAdapter:
         adapter = CompleteAdapter()
         assert adapter is not None
 
+    def test_check_supported(self) -> None:
+        """check_supported はサポート外の資産クラスを ValueError とする."""
+        from marketsymbol.adapter import BaseAdapter
+
+        class EquityAdapter(BaseAdapter):
+            @property
+            def supported_asset_classes(self) -> frozenset[AssetClass]:
+                return frozenset({AssetClass.EQUITY})
+
+            def to_symbol(self, _vendor_symbol: str) -> EquitySymbol:
+                return EquitySymbol(exchange="XJPX", code="7203")
+
+            def from_symbol(
+                self, _symbol: EquitySymbol | FutureSymbol | OptionSymbol
+            ) -> str:
+                return "7203.T"
+
+        adapter = EquityAdapter()
+        adapter.check_supported(EquitySymbol(exchange="XJPX", code="7203"))
+        future = FutureSymbol(exchange="XJPX", code="NK", expiry="20250314")
+        with pytest.raises(ValueError, match="Unsupported asset class: future"):
+            adapter.check_supported(future)
+
     def test_to_symbol_conversion(self) -> None:
         """to_symbol でベンダー固有シンボルを統一シンボルに変換できることを確認."""
         from marketsymbol.adapter import BaseAdapter
@@ -435,6 +458,24 @@ class TestAdapterRegistry:
         assert registry.get("unknown") is None
         assert "test" in registry.list()
 
+    def test_pickle(self) -> None:
+        """登録済みのアダプターごと pickle でき、復元後も登録できる."""
+        import pickle
+
+        from marketsymbol.adapter import AdapterRegistry
+        from tests.test_cli import _SuffixAdapter
+
+        registry = AdapterRegistry()
+        registry.register("suffix", _SuffixAdapter())
+        restored = pickle.loads(pickle.dumps(registry))
+
+        assert restored.list() == ["suffix"]
+        assert restored.to_symbol("suffix", "7203.T") == EquitySymbol(
+            exchange="XJPX", code="7203"
+        )
+        restored.register("other", _SuffixAdapter())
+        assert registry.list() == ["suffix"]
+
 
 class TestAdapterRegistryThreadSafety:
     """AdapterRegistry のスレッドセーフ性テスト."""
@@ -0,0 +1,258 @@
+"""marketsymbol.bench (ベンチマークスイート) のテスト."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marketsymbol.bench import (
+    DEFAULT_BASELINE_PATH,
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    ComparisonStatus,
+    compare_reports,
+    default_cases,
+    run_benchmarks,
+    run_case,
+)
+from marketsymbol.bench import cases as bench_cases
+from marketsymbol.bench.__main__ import main
+from marketsymbol.bench.memory import run_container_benchmarks, run_memory_benchmarks
+from marketsymbol.bench.query import QUERIES, run_query_benchmarks
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _report(calibration_ns: float, **p50: float) -> BenchmarkReport:
+    """p50 のみを指定したレポートを生成する."""
+    return BenchmarkReport(
+        calibration_ns=calibration_ns,
+        results={
+            name: BenchmarkResult(
+                name=name,
+                ns_per_op=value,
+                p50_ns=value,
+                p99_ns=value,
+                samples=1,
+                inner_loops=1,
+            )
+            for name, value in p50.items()
+        },
+    )
+
+
+class TestDefaultCases:
+    """組み込みケースのテスト."""
+
+    def test_names_are_unique(self) -> None:
+        """ケース名は一意."""
+        names = [case.name for case in default_cases()]
+        assert len(names) == len(set(names))
+
+    @pytest.mark.parametrize(
+        "prefix",
+        [
+            "normalize_symbol.",
+            "parse_symbol.equity",
+            "parse_symbol.future",
+            "parse_symbol.option",
+            "parse_symbol.series",
+            "parse_symbol.error.",
+            "construct.",
+            "str.",
+            "hash.",
+            "registry.",
+        ],
+    )
+    def test_coverage(self, prefix: str) -> None:
+        """要求された各グループのケースが存在する."""
+        assert any(case.name.startswith(prefix) for case in default_cases())
+
+    def test_all_cases_callable(self) -> None:
+        """全ケースの setup が呼び出し可能な callable を返す."""
+        for case in default_cases():
+            case.setup()()
+            if case.teardown is not None:
+                case.teardown()
+
+    def test_fixtures_built_on_setup(self) -> None:
+        """フィクスチャはケースの一覧の生成時ではなく setup の実行時に構築する."""
+        fixtures = [bench_cases._batch, bench_cases._chain, bench_cases._unsorted]
+        for fixture in fixtures:
+            fixture.cache_clear()
+        selected = [
+            case for case in default_cases() if case.name == "chain.parse_all.1k"
+        ]
+        assert all(fixture.cache_info().currsize == 0 for fixture in fixtures)
+        selected[0].setup()
+        assert [fixture.cache_info().currsize for fixture in fixtures] == [0, 1, 0]
+
+    def test_baseline_covers_default_cases(self) -> None:
+        """コミット済みベースラインが全ケースを含む."""
+        baseline = BenchmarkReport.load(DEFAULT_BASELINE_PATH)
+        assert {case.name for case in default_cases()} <= set(baseline.results)
+
+
+class TestRunner:
+    """計測処理のテスト."""
+
+    def test_run_case(self) -> None:
+        """run_case が統計値を返す."""
+        case = BenchmarkCase("noop", lambda: lambda: None)
+        result = run_case(case, samples=5, sample_time_ns=10_000)
+        assert result.name == "noop"
+        assert result.samples == 5
+        assert result.inner_loops >= 1
+        assert 0 < result.p50_ns <= result.p99_ns
+        assert result.ops_per_sec > 0
+
+    def test_run_benchmarks_progress(self) -> None:
+        """run_benchmarks はケースごとに progress を呼び出す."""
+        seen: list[str] = []
+        cases = [
+            BenchmarkCase("a", lambda: lambda: None),
+            BenchmarkCase("b", lambda: lambda: None),
+        ]
+        report = run_benchmarks(
+            cases,
+            samples=2,
+            sample_time_ns=10_000,
+            progress=lambda r: seen.append(r.name),
+        )
+        assert seen == ["a", "b"]
+        assert set(report.results) == {"a", "b"}
+        assert report.calibration_ns > 0
+
+    def test_json_roundtrip(self, tmp_path: Path) -> None:
+        """dump/load で結果が復元される."""
+        report = _report(100.0, case=50.0)
+        path = tmp_path / "results.json"
+        report.dump(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["results"]["case"]["ops_per_sec"] == 20_000_000.0
+        restored = BenchmarkReport.load(path)
+        assert restored.results["case"].p50_ns == 50.0
+        assert restored.calibration_ns == 100.0
+
+    def test_load_rejects_unknown_schema(self) -> None:
+        """未知のスキーマバージョンは ValueError."""
+        with pytest.raises(ValueError, match="schema"):
+            BenchmarkReport.from_dict({"schema": 999, "results": {}})
+
+
+class TestCompareReports:
+    """compare_reports() のテスト."""
+
+    def test_statuses(self) -> None:
+        """許容幅に応じて OK/REGRESSION/IMPROVED/NEW を判定する."""
+        baseline = _report(100.0, same=100.0, slower=100.0, faster=100.0)
+        current = _report(100.0, same=110.0, slower=200.0, faster=50.0, added=1.0)
+        statuses = {
+            c.name: c.status for c in compare_reports(current, baseline, tolerance=0.25)
+        }
+        assert statuses == {
+            "same": ComparisonStatus.OK,
+            "slower": ComparisonStatus.REGRESSION,
+            "faster": ComparisonStatus.IMPROVED,
+            "added": ComparisonStatus.NEW,
+        }
+
+    def test_calibration_normalization(self) -> None:
+        """マシンが 2 倍遅い場合、2 倍の計測値は回帰とみなさない."""
+        baseline = _report(100.0, case=100.0)
+        current = _report(200.0, case=200.0)
+        (comparison,) = compare_reports(current, baseline)
+        assert comparison.status is ComparisonStatus.OK
+        assert comparison.ratio == pytest.approx(1.0)
+
+    def test_negative_tolerance(self) -> None:
+        """負の tolerance は ValueError."""
+        with pytest.raises(ValueError, match="tolerance"):
+            compare_reports(_report(1.0), _report(1.0), tolerance=-0.1)
+
+
+class TestMain:
+    """python -m marketsymbol.bench のテスト."""
+
+    def test_list(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """--list はケース名を出力する."""
+        assert main(["--list", "-k", "registry."]) == 0
+        names = capsys.readouterr().out.split()
+        assert names
+        assert all("registry." in name for name in names)
+
+    def test_output_and_compare(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--output で JSON を書き出し、--compare で比較結果を出力する."""
+        output = tmp_path / "results.json"
+        baseline = tmp_path / "baseline.json"
+        args = ["-k", "registry.get", "--samples", "2", "--sample-time-ms", "0.01"]
+        assert main([*args, "--update-baseline", "--baseline", str(baseline)]) == 0
+        code = main(
+            [
+                *args,
+                "--output",
+                str(output),
+                "--baseline",
+                str(baseline),
+                "--compare",
+                "--tolerance",
+                "100",
+            ]
+        )
+        assert code == 0
+        assert "registry.get" in BenchmarkReport.load(output).results
+        assert "comparison against" in capsys.readouterr().out
+
+
+class TestMemory:
+    """メモリ計測のテスト."""
+
+    def test_pool_reduces_bytes_per_symbol(self) -> None:
+        """SymbolPool 使用時は1参照あたりのバイト数が小さい."""
+        unpooled, pooled = run_memory_benchmarks(references=2000, distinct=20)
+        assert unpooled.references == pooled.references == 2000
+        assert unpooled.distinct == 20
+        assert pooled.bytes_per_symbol < unpooled.bytes_per_symbol / 2
+
+    def test_containers_reduce_bytes_per_entry(self) -> None:
+        """SymbolSet / SymbolDict は Symbol の set / dict より1件あたりのバイト数が小さい."""
+        symbol_set, packed_set, symbol_dict, packed_dict = run_container_benchmarks(
+            2000
+        )
+        assert packed_set.references == packed_set.distinct == 2000
+        assert packed_set.bytes_per_symbol < symbol_set.bytes_per_symbol / 2
+        assert packed_dict.bytes_per_symbol < symbol_dict.bytes_per_symbol / 2
+
+    def test_main_memory(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """--memory は1参照・1件あたりのバイト数を出力する."""
+        assert main(["--memory", "--memory-references", "1000"]) == 0
+        out = capsys.readouterr().out
+        assert "bytes/symbol" in out
+        assert "memory.symbol_dict" in out
+
+
+class TestQueryBenchmark:
+    """SymbolUniverse の検索の計測のテスト."""
+
+    def test_run(self) -> None:
+        """条件ごとにインデックスと全件の走査の時間を計測する."""
+        build_ns, results = run_query_benchmarks(5000, repeat=1)
+        assert build_ns > 0
+        assert [result.name for result in results] == list(QUERIES)
+        assert all(result.size == 5000 for result in results)
+        assert all(result.scan_ns is not None for result in results)
+        assert any(result.rows for result in results)
+
+    def test_main_query(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """--query は件数ごとの構築時間と検索時間を出力する."""
+        assert main(["--query", "--query-size", "1000", "--query-size", "2000"]) == 0
+        out = capsys.readouterr().out
+        assert "(1,000 symbols)" in out
+        assert "(2,000 symbols)" in out
+        assert "query.n225o_q1_puts_strike" in out
@@ -0,0 +1,183 @@
+"""bloom モジュール (SymbolBloomFilter) のテスト."""
+
+import hashlib
+import mmap
+import pickle
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from marketsymbol import SymbolBloomFilter, SymbolParseError, SymbolSet, parse_symbol
+from marketsymbol.bloom import _hashes
+
+_MEMBERS = [f"XJPX:N225O:20250314:C:{strike}" for strike in range(1, 20_001)]
+_OTHERS = [f"XJPX:N225O:20250314:P:{strike}" for strike in range(1, 20_001)]
+
+
+@pytest.fixture(scope="module")
+def bloom() -> SymbolBloomFilter:
+    """_MEMBERS を登録した誤検出率 1% のフィルター."""
+    return SymbolBloomFilter.from_symbols(_MEMBERS)
+
+
+class TestMembership:
+    """登録と判定."""
+
+    def test_no_false_negatives(self, bloom: SymbolBloomFilter) -> None:
+        """登録したシンボルは必ず含まれる (文字列・Symbol のどちらでも)."""
+        assert all(raw in bloom for raw in _MEMBERS)
+        assert all(parse_symbol(raw) in bloom for raw in _MEMBERS[:1_000])
+
+    def test_error_rate(self, bloom: SymbolBloomFilter) -> None:
+        """未登録のシンボルの誤検出率は指定した値の程度."""
+        false_positives = sum(raw in bloom for raw in _OTHERS)
+        assert false_positives / len(_OTHERS) < 0.02
+
+    def test_sizing(self, bloom: SymbolBloomFilter) -> None:
+        """ビット数・ハッシュ数は件数と誤検出率から決まる."""
+        assert bloom.bit_count == 191_704
+        assert bloom.hash_count == 7
+        assert len(bloom.buffer) == 16 + bloom.bit_count // 8
+        strict = SymbolBloomFilter(len(_MEMBERS), error_rate=0.0001)
+        assert strict.bit_count > bloom.bit_count * 1.9
+
+    def test_raw_normalization(self, bloom: SymbolBloomFilter) -> None:
+        """シンボル文字列は parse_symbol と同じ正規の文字列表現で判定する."""
+        assert " xjpx:n225o:20250314:c:42 " in bloom
+        assert "XJPX:N225O:20250314:C:00042" in bloom
+        assert "ＸＪＰＸ:Ｎ２２５Ｏ:20250314:C:42" in bloom  # noqa: RUF001
+        equity = SymbolBloomFilter.from_symbols(["XJPX:0001"])
+        assert "xjpx:0001" in equity
+        assert "XJPX:1" not in equity
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "XJPX:N225O:20250314:C:+42000",
+            "XJPX:N225O:20250314:C:4_2000",
+            "XJPX:N225O:20250314:C: 42000",
+            "XJPX:N225O:20250314:C:+042000",
+            "XJPX:N225O:20250314:C:\u0664\u0662\u0660\u0660\u0660",
+        ],
+    )
+    def test_strike_spellings(self, raw: str) -> None:
+        """parse_symbol が受け付ける strike の表記は全て含まれる (偽陰性なし)."""
+        bloom = SymbolBloomFilter.from_symbols([parse_symbol(raw)])
+        assert str(parse_symbol(raw)) == "XJPX:N225O:20250314:C:42000"
+        assert raw in bloom
+
+    def test_invalid_non_ascii(self) -> None:
+        """ASCII 以外の無効なシンボル文字列は含まれない."""
+        bloom = SymbolBloomFilter.from_symbols(["XJPX:7203"], error_rate=0.5)
+        assert "ＸＪＰＸ:７２０３:Ｘ" not in bloom  # noqa: RUF001
+
+    @pytest.mark.parametrize("item", [7203, None, b"XJPX:7203"])
+    def test_other_types(self, bloom: SymbolBloomFilter, item: object) -> None:
+        """Symbol・str 以外は含まれない."""
+        assert item not in bloom
+
+    def test_add_invalid(self) -> None:
+        """無効なシンボル文字列・型は登録できない."""
+        bloom = SymbolBloomFilter(10)
+        with pytest.raises(SymbolParseError):
+            bloom.add("XX:7203")
+        with pytest.raises(TypeError, match="Expected Symbol or str"):
+            bloom.add(7203)  # type: ignore[arg-type]
+        bloom.update(["XJPX:7203", parse_symbol("XJPX:6758")])
+        assert "XJPX:7203" in bloom
+        assert "XJPX:6758" in bloom
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"), [(0, 0.01), (10, 0.0), (10, 1.0)]
+    )
+    def test_invalid_parameters(self, capacity: int, error_rate: float) -> None:
+        """容量が 1 未満、誤検出率が範囲外の場合は ValueError."""
+        with pytest.raises(ValueError, match="capacity"):
+            SymbolBloomFilter(capacity, error_rate=error_rate)
+
+    def test_fallback(self, bloom: SymbolBloomFilter) -> None:
+        """fallback はフィルターが True を返した場合に正確に判定する."""
+        exact = SymbolBloomFilter.from_buffer(
+            bloom.buffer, fallback=SymbolSet(_MEMBERS)
+        )
+        assert not any(raw in exact for raw in _OTHERS)
+        assert "xjpx:n225o:20250314:c:42" in exact
+        texts = SymbolBloomFilter.from_symbols(_MEMBERS[:10], fallback=set(_MEMBERS))
+        assert "XJPX:N225O:20250314:C:007" in texts
+        assert not any(raw in texts for raw in _OTHERS)
+
+
+class TestStableHash:
+    """プロセスによらないハッシュ."""
+
+    def test_documented_hash(self) -> None:
+        """BLAKE2b の下位・上位 8 バイト (little endian) を h1, h2 とする."""
+        digest = hashlib.blake2b(b"XJPX:7203", digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        assert (
+            _hashes("XJPX:7203") == (h1, h2) == (0x8A5814980FCCFBF7, 0x23546AAD2CC3D93B)
+        )
+
+    def test_buffer_is_deterministic(self) -> None:
+        """同じシンボルから生成したバッファは一致する."""
+        first = SymbolBloomFilter.from_symbols(_MEMBERS[:100])
+        second = SymbolBloomFilter.from_symbols(reversed(_MEMBERS[:100]))
+        assert bytes(first.buffer) == bytes(second.buffer)
+
+
+class TestBuffer:
+    """バッファの共有と復元."""
+
+    def test_mmap(self, bloom: SymbolBloomFilter, tmp_path: Path) -> None:
+        """ファイルに書き出したバイト列を mmap で参照する."""
+        path = tmp_path / "universe.bloom"
+        path.write_bytes(bloom.buffer)
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            shared = SymbolBloomFilter.from_buffer(m)
+            assert shared.bit_count == bloom.bit_count
+            assert all(raw in shared for raw in _MEMBERS[:1_000])
+            with pytest.raises(TypeError):
+                shared.add("XJPX:7203")
+            del shared
+
+    def test_shared_memory(self) -> None:
+        """共有メモリ上のフィルターへの登録は他の参照からも見える."""
+        size = len(SymbolBloomFilter(1_000).buffer)
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        buffer = memory.buf
+        assert buffer is not None
+        try:
+            buffer[:size] = SymbolBloomFilter(1_000).buffer
+            writer = SymbolBloomFilter.from_buffer(buffer[:size])
+            reader = SymbolBloomFilter.from_buffer(buffer[:size])
+            writer.add("XJPX:7203")
+            assert "XJPX:7203" in reader
+            del writer, reader, buffer
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_pickle(self, bloom: SymbolBloomFilter) -> None:
+        """pickle はバッファの内容をコピーして復元する."""
+        restored = pickle.loads(pickle.dumps(bloom))
+        assert bytes(restored.buffer) == bytes(bloom.buffer)
+        restored.add("XJPX:7203")
+        assert "XJPX:7203" in restored
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XXXX" + bytes(12),
+            b"MSBF\x01\x07\x00\x00" + (64).to_bytes(8, "little"),
+        ],
+    )
+    def test_invalid_buffer(self, data: bytes) -> None:
+        """ヘッダーが不正、または長さが一致しないバッファは ValueError."""
+        with pytest.raises(ValueError, match="SymbolBloomFilter"):
+            SymbolBloomFilter.from_buffer(data)
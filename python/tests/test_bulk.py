@@ -0,0 +1,164 @@
+"""bulk モジュール (一括バリデーション) のテスト."""
+
+import random
+
+import pytest
+
+from marketsymbol import (
+    AssetClass,
+    ErrorCode,
+    SymbolParseError,
+    parse_symbol,
+    validate_symbols,
+)
+from marketsymbol.bulk import ASSET_CLASSES, ERROR_CODES, VALID
+
+# 差分テストの基になる入力 (正常系・各エラーコード・正規化が必要な入力)
+_SEED_SYMBOLS = [
+    "XJPX:7203",
+    "xjpx:7203",
+    "  XJPX:7203  ",
+    "ＸＪＰＸ：７２０３",  # noqa: RUF001
+    "XJPX:NK:20250314:F",
+    "XJPX:NK:20240229:F",
+    "XJPX:NK:20250229:F",
+    "XJPX:N225O:20250314:O",
+    "XJPX:N225O:20250314:C:42000",
+    "XJPX:N225O:20250314:P:1",
+    "XJPX:N225O:20250314:P:0",
+    "XJPX:N225O:20250314:P:-5",
+    "XJPX:N225O:20250314:P:+5",
+    "XJPX:N225O:20250314:P:4_2",
+    "XJPX:N225O:20250314:C:ABC",
+    "XJPX:N225O:20250314:C",
+    "XJPX:N225O:20250314:F:100",
+    "XJPX:N225O:20250314:O:100",
+    "XJPX:N225O:20250314:X:100",
+    "XJPX:NK:2025031:F",
+    "XJPX:NK:20251301:F",
+    "XJPX:NK:20250100:F",
+    "XJPX:NK:20250314",
+    "XJPX:NK:20250314:F:1:2",
+    "XX:7203",
+    "XJPX:7",
+    "XJPX:72-03",
+    "XJPX:",
+    ":",
+    "",
+    "   ",
+    "XJPX",
+    "XJPX:" + "A" * 100,
+    "XJPX:7203\n",
+]
+
+_ALPHABET = "XJPX:NK7203OCPF0-_ abc　Ａ："  # noqa: RUF001
+
+
+def _mutations(count: int) -> list[str]:
+    """シード入力に1文字の置換・挿入・削除を加えた入力を生成する (再現可能)."""
+    rng = random.Random(20250314)
+    result = []
+    for _ in range(count):
+        base = rng.choice(_SEED_SYMBOLS)
+        chars = list(base)
+        position = rng.randrange(len(chars) + 1)
+        operation = rng.randrange(3)
+        if operation == 0 and chars:
+            chars[min(position, len(chars) - 1)] = rng.choice(_ALPHABET)
+        elif operation == 1:
+            chars.insert(position, rng.choice(_ALPHABET))
+        elif chars:
+            del chars[min(position, len(chars) - 1)]
+        result.append("".join(chars))
+    return result
+
+
+def _parse_verdict(raw: str) -> tuple[ErrorCode | None, AssetClass | None]:
+    """parse_symbol の判定を (エラーコード, 資産クラス) で返す."""
+    try:
+        symbol = parse_symbol(raw)
+    except SymbolParseError as e:
+        return e.error_code, None
+    return None, symbol.asset_class
+
+
+class TestDifferential:
+    """parse_symbol との判定一致の検証."""
+
+    @pytest.mark.parametrize("raw", _SEED_SYMBOLS)
+    def test_seed_symbols(self, raw: str) -> None:
+        """代表的な入力で parse_symbol と判定が一致する."""
+        result = validate_symbols([raw], asset_classes=True)
+        assert (result.error_code(0), result.asset_class(0)) == _parse_verdict(raw)
+
+    def test_mutated_symbols(self) -> None:
+        """ランダムに変異させた入力で parse_symbol と判定が一致する."""
+        inputs = _mutations(5000)
+        result = validate_symbols(inputs, asset_classes=True)
+        assert len(result) == len(inputs)
+        mismatches = [
+            (raw, result.error_code(i), result.asset_class(i), _parse_verdict(raw))
+            for i, raw in enumerate(inputs)
+            if (result.error_code(i), result.asset_class(i)) != _parse_verdict(raw)
+        ]
+        assert not mismatches
+
+
+class TestValidateSymbols:
+    """validate_symbols の結果のテスト."""
+
+    def test_ordinals(self) -> None:
+        """エラーコードの序数は E00n の n、有効な行は 0."""
+        result = validate_symbols(["XJPX:7203", "XX:7203", "XJPX:" + "A" * 100])
+        assert result.error_codes.typecode == "B"
+        assert list(result.error_codes) == [VALID, 7, 10]
+        assert all(
+            code is None or int(code.value[1:]) == i
+            for i, code in enumerate(ERROR_CODES)
+        )
+        assert result.asset_classes is None
+
+    def test_asset_classes(self) -> None:
+        """asset_classes=True の場合は資産クラスの序数を記録する."""
+        result = validate_symbols(
+            ["XJPX:7203", "XJPX:NK:20250314:F", "XJPX:N225O:20250314:O", "XX:1"],
+            asset_classes=True,
+        )
+        assert result.asset_classes is not None
+        assert [ASSET_CLASSES[i] for i in result.asset_classes] == [
+            AssetClass.EQUITY,
+            AssetClass.FUTURE,
+            AssetClass.OPTION,
+            None,
+        ]
+
+    def test_asset_class_not_recorded(self) -> None:
+        """資産クラスを記録していない場合の asset_class() は ValueError."""
+        with pytest.raises(ValueError, match="asset_classes=True"):
+            validate_symbols(["XJPX:7203"]).asset_class(0)
+
+    def test_summary(self) -> None:
+        """有効・無効の件数と ErrorCode 別の件数を返す."""
+        result = validate_symbols(
+            iter(["XJPX:7203", "XX:7203", "YY:7203", "XJPX", "XJPX:9984"])
+        )
+        assert result.valid_count == 2
+        assert result.invalid_count == 3
+        assert result.invalid_indices() == [1, 2, 3]
+        assert result.is_valid(0)
+        assert not result.is_valid(1)
+        assert result.error_counts() == {
+            ErrorCode.UNKNOWN_EXCHANGE: 2,
+            ErrorCode.INVALID_SEGMENT_COUNT: 1,
+        }
+
+    def test_empty_input(self) -> None:
+        """空の入力は空の結果."""
+        result = validate_symbols([])
+        assert len(result) == 0
+        assert result.error_counts() == {}
+
+    def test_type_error(self) -> None:
+        """str 以外の要素は parse_symbol と同様に TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            validate_symbols(["XJPX:7203", 7203])  # type: ignore[list-item]
@@ -0,0 +1,149 @@
+"""chain モジュール (ChainParser) のテスト."""
+
+import pickle
+import random
+
+import pytest
+
+from marketsymbol import ChainParser, SymbolParseError, parse_symbol
+from marketsymbol.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from marketsymbol.symbol import OptionSymbol
+from tests.helpers import verdict
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
+
+# 同一の接頭辞を持つチェーンの末尾 (正常系・タイプ/strike の異常系)
+_TAILS = [
+    "C:42000",
+    "P:1",
+    "O",
+    "F",
+    "C",
+    "P:0",
+    "P:-5",
+    "P:+5",
+    "C:4_2",
+    "C: 42000",
+    "C:ABC",
+    "F:100",
+    "O:100",
+    "X:100",
+    "X",
+    "C:1:2",
+    "",
+]
+
+
+def _chain_inputs(count: int) -> list[str]:
+    """接頭辞を共有する入力を生成する (再現可能)."""
+    rng = random.Random(42000)
+    prefixes = ["XJPX:N225O:20250314:", "xjpx:n225o:20250314:", "XJPX:NK:20250230:"]
+    return [rng.choice(prefixes) + rng.choice(_TAILS) for _ in range(count)]
+
+
+class TestDifferential:
+    """parse_symbol との結果 (値・エラーコード・メッセージ) の一致の検証."""
+
+    def test_chain_inputs(self) -> None:
+        """接頭辞がヒットする入力で parse_symbol と一致する."""
+        parser = ChainParser()
+        inputs = _chain_inputs(2000)
+        mismatches = [
+            raw
+            for raw in inputs
+            if verdict(parser.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+        assert parser.hits > 0
+
+    def test_mutated_symbols(self) -> None:
+        """ランダムに変異させた入力で parse_symbol と一致する."""
+        parser = ChainParser(capacity=4)
+        inputs = _SEED_SYMBOLS + _mutations(5000)
+        mismatches = [
+            raw
+            for raw in inputs
+            if verdict(parser.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+
+class TestChainParser:
+    """ChainParser のキャッシュのテスト."""
+
+    def test_hits_and_misses(self) -> None:
+        """検査済みの接頭辞はヒットとして数える."""
+        parser = ChainParser()
+        parser.parse_all(
+            [
+                "XJPX:N225O:20250314:C:42000",
+                "XJPX:N225O:20250314:P:42000",
+                "XJPX:N225O:20250314:O",
+                "XJPX:7203",
+            ]
+        )
+        assert (parser.hits, parser.misses) == (2, 2)
+        assert len(parser) == 1
+
+    def test_failed_prefix_is_not_cached(self) -> None:
+        """検査に失敗したシンボルの接頭辞は登録しない."""
+        parser = ChainParser()
+        with pytest.raises(SymbolParseError):
+            parser.parse("XJPX:N225O:20250314:X:42000")
+        assert len(parser) == 0
+
+    def test_capacity(self) -> None:
+        """容量を超えた場合は最も古い接頭辞を破棄する."""
+        parser = ChainParser(capacity=2)
+        for expiry in ("20250314", "20250411", "20250509"):
+            parser.parse(f"XJPX:N225O:{expiry}:C:42000")
+        assert len(parser) == parser.capacity == 2
+        parser.parse("XJPX:N225O:20250314:P:42000")
+        assert parser.hits == 0
+
+    def test_invalid_capacity(self) -> None:
+        """capacity が1未満の場合は ValueError."""
+        with pytest.raises(ValueError, match="capacity"):
+            ChainParser(capacity=0)
+
+    def test_clear(self) -> None:
+        """clear() は接頭辞と統計を破棄する."""
+        parser = ChainParser()
+        parser.parse_all(["XJPX:NK:20250314:F", "XJPX:NK:20250314:F"])
+        parser.clear()
+        assert (len(parser), parser.hits, parser.misses) == (0, 0, 0)
+
+    def test_cached_symbol_behaves_like_parsed(self) -> None:
+        """ヒット時に生成した Symbol も不変・ハッシュ可能・pickle 可能."""
+        parser = ChainParser()
+        parser.parse("XJPX:N225O:20250314:C:42000")
+        symbol = parser.parse("XJPX:N225O:20250314:P:42000")
+        assert parser.hits == 1
+        assert isinstance(symbol, OptionSymbol)
+        assert symbol == parse_symbol("XJPX:N225O:20250314:P:42000")
+        assert hash(symbol) == hash(parse_symbol("XJPX:N225O:20250314:P:42000"))
+        assert pickle.loads(pickle.dumps(symbol)) == symbol
+        with pytest.raises(AttributeError):
+            symbol.strike = 1  # type: ignore[misc]
+
+    def test_type_error(self) -> None:
+        """str 以外は parse_symbol と同様に TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            ChainParser().parse(7203)  # type: ignore[arg-type]
+
+    def test_metrics_delegate_to_parse_symbol(self) -> None:
+        """メトリクス有効時は parse_symbol に委譲して計測に含める."""
+        reset_metrics()
+        enable_metrics()
+        try:
+            parser = ChainParser()
+            parser.parse_all(["XJPX:NK:20250314:F", "XJPX:NK:20250314:F"])
+        finally:
+            disable_metrics()
+        assert metrics_snapshot().parse_count == 2
+        assert parser.hits == 0
+        reset_metrics()
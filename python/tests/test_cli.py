@@ -0,0 +1,422 @@
+"""cli モジュール (marketsymbol コマンド) のテスト."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from marketsymbol import AssetClass, EquitySymbol, main, parse_symbol
+from marketsymbol.adapter import BaseAdapter
+from marketsymbol.cli import load_adapter
+from marketsymbol.symbol import Symbol
+
+_LINES = [
+    "XJPX:7203",
+    "xjpx:nk:20250314:f",
+    "XX:7203",
+    "XJPX:N225O:20250314:C",
+    "",
+    "XJPX:N225O:20250314:C:42000",
+]
+
+
+class _SuffixAdapter(BaseAdapter):
+    """'7203.T' 形式 (東証の株式のみ) のテスト用アダプター."""
+
+    @property
+    def supported_asset_classes(self) -> frozenset[AssetClass]:
+        """株式のみ."""
+        return frozenset({AssetClass.EQUITY})
+
+    def to_symbol(self, vendor_symbol: str) -> Symbol:
+        """'7203.T' -> XJPX:7203."""
+        code, _, suffix = vendor_symbol.partition(".")
+        if suffix != "T":
+            msg = f"Unsupported suffix: {vendor_symbol!r}"
+            raise ValueError(msg)
+        return EquitySymbol(exchange="XJPX", code=code)
+
+    def from_symbol(self, symbol: Symbol) -> str:
+        """XJPX:7203 -> '7203.T'."""
+        if not isinstance(symbol, EquitySymbol):
+            msg = f"Unsupported asset class: {symbol.asset_class.value}"
+            raise TypeError(msg)
+        return f"{symbol.code}.T"
+
+
+# 読み込み済みのアダプターインスタンス (module:attribute で参照する)
+_ADAPTER = _SuffixAdapter()
+
+
+def _write(path: Path, lines: list[str]) -> str:
+    """lines を1行ずつ書き込み、パスを返す."""
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def _run(capsys: pytest.CaptureFixture[str], *argv: str) -> tuple[int, str, list[str]]:
+    """main(argv) を実行し、終了コード・標準出力・標準エラー出力の行を返す."""
+    exit_code = main(list(argv))
+    captured = capsys.readouterr()
+    return exit_code, captured.out, captured.err.splitlines()
+
+
+class TestCommands:
+    """各コマンドの text 形式の出力."""
+
+    def test_parse(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """成功した行は正規の文字列、失敗した行は標準エラー出力."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        exit_code, out, err = _run(capsys, "parse", path)
+        assert exit_code == 1
+        assert out.splitlines() == [
+            "XJPX:7203",
+            "XJPX:NK:20250314:F",
+            "XJPX:N225O:20250314:C:42000",
+        ]
+        assert err[:3] == [
+            f"{path}:3: E007: Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+            f"{path}:4: E002: Option type 'C' requires strike price",
+            f"{path}:5: E004: Empty symbol string",
+        ]
+        assert err[3:] == [
+            "marketsymbol parse: 6 lines, 3 ok, 3 failed",
+            "  E002              1",
+            "  E004              1",
+            "  E007              1",
+        ]
+
+    def test_normalize(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """normalize は全ての行を正規化して出力する."""
+        path = _write(tmp_path / "symbols.txt", [" xjpx:7203 ", "xx:7203"])
+        exit_code, out, _ = _run(capsys, "normalize", path)
+        assert exit_code == 0
+        assert out.splitlines() == ["XJPX:7203", "XX:7203"]
+
+    def test_validate(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """validate の text 形式は失敗した行のみを報告する."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        exit_code, out, err = _run(capsys, "validate", path)
+        assert exit_code == 1
+        assert out == ""
+        assert [line.split(": ")[1] for line in err[:3]] == ["E007", "E002", "E004"]
+        assert err[3] == "marketsymbol validate: 6 lines, 3 ok, 3 failed"
+
+    def test_all_valid(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """全ての行が有効な場合は終了コード 0."""
+        path = _write(tmp_path / "symbols.txt", ["XJPX:7203", "XJPX:NK:20250314:F"])
+        exit_code, _, err = _run(capsys, "validate", path)
+        assert exit_code == 0
+        assert err == ["marketsymbol validate: 2 lines, 2 ok, 0 failed"]
+
+    def test_quiet(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """--quiet は標準エラー出力に書き出さない (終了コードは変わらない)."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        exit_code, _, err = _run(capsys, "validate", "--quiet", path)
+        assert exit_code == 1
+        assert err == []
+
+
+class TestFormats:
+    """jsonl / csv 形式の出力."""
+
+    def test_jsonl(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """全ての行を同じキーのレコードとして出力する."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        _, out, err = _run(capsys, "parse", "--format", "jsonl", path)
+        records = [json.loads(line) for line in out.splitlines()]
+        assert len(records) == len(_LINES)
+        assert records[5] == {
+            "line": 6,
+            "input": "XJPX:N225O:20250314:C:42000",
+            "symbol": "XJPX:N225O:20250314:C:42000",
+            "asset_class": "option",
+            "exchange": "XJPX",
+            "code": "N225O",
+            "expiry": "20250314",
+            "option_type": "C",
+            "strike": 42000,
+            "error_code": None,
+            "message": None,
+        }
+        assert records[2]["symbol"] is None
+        assert records[2]["error_code"] == "E007"
+        # レコードに含まれる失敗は行ごとには報告しない
+        assert err[0] == "marketsymbol parse: 6 lines, 3 ok, 3 failed"
+
+    def test_jsonl_validate(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """validate のレコードは valid を含む."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        _, out, _ = _run(capsys, "validate", "-f", "jsonl", path)
+        records = [json.loads(line) for line in out.splitlines()]
+        assert [record["valid"] for record in records] == [
+            True,
+            True,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert records[4]["message"] == "Empty symbol string"
+
+    def test_csv(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """見出し行に続いて全ての行を出力する."""
+        path = _write(tmp_path / "symbols.txt", _LINES)
+        _, out, _ = _run(capsys, "parse", "--format", "csv", path)
+        rows = list(csv.DictReader(io.StringIO(out)))
+        assert len(rows) == len(_LINES)
+        assert rows[1]["symbol"] == "XJPX:NK:20250314:F"
+        assert rows[1]["strike"] == ""
+        assert rows[3]["error_code"] == "E002"
+
+
+class TestInput:
+    """入力の読み込み."""
+
+    def test_stdin(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """ファイルの指定がない場合は標準入力を読み込む."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("xjpx:7203\nXX:7203\n"))
+        exit_code, out, err = _run(capsys, "parse")
+        assert exit_code == 1
+        assert out == "XJPX:7203\n"
+        assert err[0].startswith("<stdin>:2: E007: ")
+
+    def test_line_numbers_per_file_and_chunk(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """行番号はファイルごとに数え、チャンクの分割に依存しない."""
+        first = _write(tmp_path / "first.txt", _LINES)
+        second = _write(tmp_path / "second.txt", ["XX:7203"])
+        _, out, err = _run(capsys, "parse", "--chunk-lines", "2", first, second)
+        _, expected_out, expected_err = _run(capsys, "parse", first, second)
+        assert out == expected_out
+        assert err == expected_err
+        assert err[3] == f"{second}:1: E007: " + (
+            "Invalid exchange code: 'XX' (must be 4 uppercase letters)"
+        )
+
+    def test_missing_file(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """読み込めないファイルは終了コード 2."""
+        exit_code, _, err = _run(capsys, "validate", "no-such-file.txt")
+        assert exit_code == 2
+        assert err[0].startswith("marketsymbol: error: ")
+
+    @pytest.mark.parametrize("option", [["--jobs", "-1"], ["--chunk-lines", "0"]])
+    def test_invalid_options(
+        self, option: list[str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """不正なジョブ数・チャンク行数は引数のエラー."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["validate", *option])
+        assert exc_info.value.code == 2
+        capsys.readouterr()
+
+
+class TestJobs:
+    """--jobs のテスト."""
+
+    @pytest.mark.parametrize("output_format", ["text", "jsonl"])
+    def test_parallel_matches_serial(
+        self, output_format: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """ワーカープロセスでの処理も入力順に同じ結果を出力する."""
+        path = _write(tmp_path / "symbols.txt", _LINES * 50)
+        argv = ["parse", "--format", output_format, "--chunk-lines", "7", path]
+        serial = _run(capsys, *argv)
+        assert _run(capsys, *argv, "--jobs", "2") == serial
+
+    def test_parallel_convert(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """ワーカープロセスもアダプターを読み込む."""
+        path = _write(tmp_path / "vendor.txt", ["7203.T", "6758.T"] * 10)
+        exit_code, out, _ = _run(
+            capsys, "convert", "--vendor", f"{__name__}:_ADAPTER", "-j", "2", path
+        )
+        assert exit_code == 0
+        assert out.splitlines() == ["XJPX:7203", "XJPX:6758"] * 10
+
+    def test_parallel_validates_adapter_only(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """並列処理では親プロセスは処理器を作らず、アダプターの読み込みのみ検証する."""
+        loaded: list[str] = []
+
+        def load(vendor: str) -> BaseAdapter:
+            loaded.append(vendor)
+            return load_adapter(vendor)
+
+        def no_processor(job: object) -> None:
+            raise AssertionError(job)
+
+        monkeypatch.setattr("marketsymbol.cli.load_adapter", load)
+        monkeypatch.setattr("marketsymbol.cli._Processor", no_processor)
+        vendor = f"{__name__}:_ADAPTER"
+        path = _write(tmp_path / "vendor.txt", ["7203.T", "7203.O"])
+        argv = ["convert", "--vendor", vendor, "--format", "csv", "-j", "2", path]
+        exit_code, out, _ = _run(capsys, *argv)
+        assert exit_code == 1
+        assert loaded == [vendor]
+        rows = list(csv.DictReader(io.StringIO(out)))
+        assert [row["error_code"] for row in rows] == ["", "ValueError"]
+        with pytest.raises(SystemExit) as exc_info:
+            main(["convert", "--vendor", "unknown-vendor", "-j", "2", path])
+        assert exc_info.value.code == 2
+
+
+class TestConvert:
+    """convert のテスト."""
+
+    def test_to_symbol(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """ベンダー固有シンボルを統一シンボルに変換する."""
+        path = _write(tmp_path / "vendor.txt", ["7203.T", "7203.O", "!.T"])
+        exit_code, out, err = _run(
+            capsys, "convert", "--vendor", f"{__name__}:_SuffixAdapter", path
+        )
+        assert exit_code == 1
+        assert out == "XJPX:7203\n"
+        # アダプターの例外は ErrorCode がなければクラス名で集計する
+        assert err[:2] == [
+            f"{path}:2: ValueError: Unsupported suffix: '7203.O'",
+            f"{path}:3: E008: Invalid code: '!' (must be uppercase alphanumeric)",
+        ]
+        assert err[-2:] == ["  E008                  1", "  ValueError            1"]
+
+    def test_from_symbol(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--from-symbol は統一シンボルをパースしてベンダー固有シンボルに変換する."""
+        path = _write(
+            tmp_path / "symbols.txt", ["xjpx:7203", "XJPX:NK:20250314:F", "XX:7203"]
+        )
+        _, out, _ = _run(
+            capsys,
+            "convert",
+            "--vendor",
+            f"{__name__}:_ADAPTER",
+            "--from-symbol",
+            "--format",
+            "csv",
+            path,
+        )
+        rows = list(csv.DictReader(io.StringIO(out)))
+        assert [row["output"] for row in rows] == ["7203.T", "", ""]
+        assert [row["error_code"] for row in rows] == ["", "ValueError", "E007"]
+
+    @pytest.mark.parametrize(
+        "vendor",
+        ["unknown-vendor", "no_such_module:Adapter", f"{__name__}:_LINES"],
+    )
+    def test_unknown_vendor(
+        self, vendor: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """アダプターを読み込めない場合は引数のエラー."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["convert", "--vendor", vendor])
+        assert exc_info.value.code == 2
+        assert "marketsymbol: error: " in capsys.readouterr().err
+
+
+class TestSortAndDiff:
+    """sort / diff コマンド (外部ソート)."""
+
+    def test_sort(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """全順序で整列して重複を除き、空行以外の失敗した行を報告する."""
+        path = _write(tmp_path / "symbols.txt", [*_LINES, "XJPX:6758", "xjpx:7203"])
+        exit_code, out, err = _run(
+            capsys, "sort", "--run-lines", "2", "--tmpdir", str(tmp_path), path
+        )
+        assert exit_code == 1
+        assert out.splitlines() == [
+            "XJPX:6758",
+            "XJPX:7203",
+            "XJPX:N225O:20250314:C:42000",
+            "XJPX:NK:20250314:F",
+        ]
+        assert err == [
+            f"{path}:3: E007: Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+            f"{path}:4: E002: Option type 'C' requires strike price",
+            "marketsymbol sort: 4 symbols, 2 failed",
+            "  E002              1",
+            "  E007              1",
+        ]
+        assert list(tmp_path.iterdir()) == [Path(path)]
+
+    def test_diff(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """差分を +追加 / -削除 / 空白 (変更なし) の行で出力する."""
+        old = _write(tmp_path / "old.txt", ["XJPX:7203", "XJPX:6758"])
+        new = _write(tmp_path / "new.txt", ["XJPX:9984", "XJPX:7203", "XX:1"])
+        exit_code, out, err = _run(capsys, "diff", old, new)
+        assert exit_code == 1
+        assert out.splitlines() == ["-XJPX:6758", " XJPX:7203", "+XJPX:9984"]
+        assert err[0].startswith(f"{new}:3: E007: ")
+        assert err[1] == "marketsymbol diff: 1 added, 1 removed, 1 unchanged, 1 failed"
+
+    def test_diff_formats(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """jsonl / csv 形式と --changes-only、標準入力の指定."""
+        old = _write(tmp_path / "old.txt", ["XJPX:7203", "XJPX:6758"])
+        monkeypatch.setattr("sys.stdin", io.StringIO("XJPX:7203\nXJPX:9984\n"))
+        exit_code, out, err = _run(
+            capsys, "diff", "--format", "jsonl", "--changes-only", old, "-"
+        )
+        assert exit_code == 0
+        assert [json.loads(line) for line in out.splitlines()] == [
+            {"status": "removed", "symbol": "XJPX:6758"},
+            {"status": "added", "symbol": "XJPX:9984"},
+        ]
+        assert err == ["marketsymbol diff: 1 added, 1 removed, 0 unchanged, 0 failed"]
+        _, out, _ = _run(capsys, "diff", "--format", "csv", "-q", old, old)
+        assert list(csv.reader(io.StringIO(out))) == [
+            ["status", "symbol"],
+            ["unchanged", "XJPX:6758"],
+            ["unchanged", "XJPX:7203"],
+        ]
+
+    def test_errors(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """読み込めないファイルは終了コード 2、不正なラン行数は引数のエラー."""
+        exit_code, _, err = _run(capsys, "sort", "no-such-file.txt")
+        assert exit_code == 2
+        assert err[0].startswith("marketsymbol: error: ")
+        with pytest.raises(SystemExit) as exc_info:
+            main(["diff", "--run-lines", "0", "a.txt", "b.txt"])
+        assert exc_info.value.code == 2
+        capsys.readouterr()
+
+
+class TestLoadAdapter:
+    """load_adapter のテスト."""
+
+    def test_instance_and_class(self) -> None:
+        """インスタンスはそのまま、クラスはインスタンス化して返す."""
+        assert load_adapter(f"{__name__}:_ADAPTER") is _ADAPTER
+        adapter = load_adapter(f"{__name__}:_SuffixAdapter")
+        assert adapter.to_symbol("7203.T") == parse_symbol("XJPX:7203")
+
+    def test_errors(self) -> None:
+        """参照先が存在しない・アダプターでない場合の例外."""
+        with pytest.raises(LookupError, match="Unknown vendor"):
+            load_adapter("unknown-vendor")
+        with pytest.raises(AttributeError):
+            load_adapter(f"{__name__}:_MISSING")
+        with pytest.raises(TypeError, match="is not a BaseAdapter"):
+            load_adapter(f"{__name__}:_LINES")
@@ -0,0 +1,207 @@
+"""columnar モジュール (NumPy による列指向パース) のテスト."""
+
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from marketsymbol import (  # noqa: E402
+    ErrorCode,
+    OptionSymbol,
+    SymbolParseError,
+    parse_symbol,
+)
+from marketsymbol.bulk import ASSET_CLASSES, ERROR_CODES  # noqa: E402
+from marketsymbol.columnar import (  # noqa: E402
+    COLUMNS,
+    parse_columns,
+    parse_structured,
+)
+from marketsymbol.constants import MAX_SYMBOL_LENGTH  # noqa: E402
+from tests.test_bulk import _SEED_SYMBOLS, _mutations  # noqa: E402
+
+# strike の境界 (int64 に収まる最大桁数、先頭のゼロ)
+_STRIKE_SYMBOLS = [
+    "XJPX:N225O:20250314:C:" + "9" * 18,
+    "XJPX:N225O:20250314:C:0042",
+    "XJPX:N225O:20250314:C:" + "0" * 30 + "7",
+]
+
+
+def _expected_row(raw: str) -> tuple[Any, ...]:
+    """parse_symbol の結果を列の値 (エラーコード, 資産クラス, ...) で返す."""
+    try:
+        symbol = parse_symbol(raw)
+    except SymbolParseError as e:
+        return (e.error_code, None, "", "", None, "", 0)
+    expiry = getattr(symbol, "expiry", None)
+    if expiry is not None:
+        expiry = np.datetime64(f"{expiry[:4]}-{expiry[4:6]}-{expiry[6:]}")
+    if isinstance(symbol, OptionSymbol):
+        option_type, strike = symbol.option_type.value, symbol.strike or 0
+    else:
+        option_type, strike = "", 0
+    return (
+        None,
+        symbol.asset_class,
+        symbol.exchange,
+        symbol.code,
+        expiry,
+        option_type,
+        strike,
+    )
+
+
+def _actual_row(columns: dict[str, Any], i: int) -> tuple[Any, ...]:
+    """parse_columns の結果の i 行目を _expected_row と同じ形式で返す."""
+    expiry = columns["expiry"][i]
+    return (
+        ERROR_CODES[columns["error_code"][i]],
+        ASSET_CLASSES[columns["asset_class"][i]],
+        str(columns["exchange"][i]),
+        str(columns["code"][i]),
+        None if np.isnat(expiry) else expiry,
+        str(columns["option_type"][i]),
+        int(columns["strike"][i]),
+    )
+
+
+def _mismatches(inputs: list[str], symbols: Any) -> list[tuple[Any, ...]]:
+    """parse_columns(symbols) と parse_symbol の結果が異なる行を返す."""
+    columns = parse_columns(symbols)
+    return [
+        (raw, _actual_row(columns, i), _expected_row(raw))
+        for i, raw in enumerate(inputs)
+        if _actual_row(columns, i) != _expected_row(raw)
+    ]
+
+
+class TestDifferential:
+    """parse_symbol との列の値の一致の検証."""
+
+    @pytest.mark.parametrize("raw", _SEED_SYMBOLS + _STRIKE_SYMBOLS)
+    def test_seed_symbols(self, raw: str) -> None:
+        """代表的な入力で parse_symbol と列の値が一致する."""
+        assert _actual_row(parse_columns([raw]), 0) == _expected_row(raw)
+
+    def test_mutated_symbols(self) -> None:
+        """ランダムに変異させた入力で parse_symbol と列の値が一致する."""
+        inputs = _SEED_SYMBOLS + _mutations(5000)
+        assert not _mismatches(inputs, inputs)
+
+    def test_unicode_array(self) -> None:
+        """dtype 'U' の配列でもシーケンスと同じ結果."""
+        inputs = _SEED_SYMBOLS + _mutations(2000)
+        assert not _mismatches(inputs, np.array(inputs))
+
+    def test_bytes_array(self) -> None:
+        """固定長バイト列 (dtype 'S') の配列でも同じ結果."""
+        inputs = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(2000)
+            if raw.isascii() and not raw.endswith("\0")
+        ]
+        encoded = np.array([raw.encode("ascii") for raw in inputs])
+        assert encoded.dtype.kind == "S"
+        assert not _mismatches(inputs, encoded)
+
+    def test_utf8_bytes_length(self) -> None:
+        """UTF-8 のバイト列の長さの上限はバイト数ではなく文字数で判定する."""
+        padding = "\u3000" * (MAX_SYMBOL_LENGTH - 9)
+        inputs = [
+            "ＸＪＰＸ：７２０３" + padding,  # noqa: RUF001
+            "ＸＪＰＸ：７２０３" + padding + "\u3000",  # noqa: RUF001
+            "XJPX:7203",
+        ]
+        encoded = np.array([raw.encode("utf-8") for raw in inputs])
+        assert len(encoded[0]) > MAX_SYMBOL_LENGTH
+        assert not _mismatches(inputs, encoded)
+        assert [ERROR_CODES[i] for i in parse_columns(encoded)["error_code"]] == [
+            None,
+            ErrorCode.SYMBOL_TOO_LONG,
+            None,
+        ]
+
+
+class TestParseColumns:
+    """parse_columns の列の型と値のテスト."""
+
+    def test_dtypes(self) -> None:
+        """各列の dtype."""
+        columns = parse_columns(["XJPX:N225O:20250314:C:42000"])
+        assert list(columns) == list(COLUMNS)
+        assert columns["error_code"].dtype == np.uint8
+        assert columns["asset_class"].dtype == np.uint8
+        assert columns["expiry"].dtype == np.dtype("datetime64[D]")
+        assert columns["option_type"].dtype == np.dtype("U1")
+        assert columns["strike"].dtype == np.int64
+
+    def test_values(self) -> None:
+        """資産クラスごとの列の値と無効な行の既定値."""
+        columns = parse_columns(
+            [
+                "XJPX:7203",
+                "xjpx:nk:20250314:f",
+                "XJPX:N225O:20250314:P:42000",
+                "XX:7203",
+            ]
+        )
+        assert columns["error_code"].tolist() == [0, 0, 0, 7]
+        assert columns["asset_class"].tolist() == [1, 2, 3, 0]
+        assert columns["exchange"].tolist() == ["XJPX", "XJPX", "XJPX", ""]
+        assert columns["code"].tolist() == ["7203", "NK", "N225O", ""]
+        assert np.isnat(columns["expiry"][[0, 3]]).all()
+        assert columns["expiry"][1] == np.datetime64("2025-03-14")
+        assert columns["option_type"].tolist() == ["", "", "P", ""]
+        assert columns["strike"].tolist() == [0, 0, 42000, 0]
+
+    def test_fallback_rows(self) -> None:
+        """全角文字・内部の空白・符号付き strike の行も parse_symbol と同じ."""
+        columns = parse_columns(
+            [
+                "ＸＪＰＸ：７２０３",  # noqa: RUF001
+                "XJPX:N225O:20250314:C:+5",
+                "XJPX: 7203",
+            ]
+        )
+        assert columns["error_code"].tolist() == [0, 0, 8]
+        assert columns["code"].tolist() == ["7203", "N225O", ""]
+        assert columns["strike"].tolist() == [0, 5, 0]
+
+    def test_error_codes(self) -> None:
+        """エラーコード序数は validate_symbols と共通."""
+        columns = parse_columns(["XJPX:NK:20251301:F", "XJPX:" + "A" * 100, ""])
+        assert [ERROR_CODES[i] for i in columns["error_code"]] == [
+            ErrorCode.INVALID_DATE,
+            ErrorCode.SYMBOL_TOO_LONG,
+            ErrorCode.INVALID_SEGMENT_COUNT,
+        ]
+
+    def test_empty_input(self) -> None:
+        """空の入力は長さ 0 の列."""
+        columns = parse_columns([])
+        assert all(len(columns[name]) == 0 for name in COLUMNS)
+
+    def test_type_error(self) -> None:
+        """str 以外の要素は parse_symbol と同様に TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            parse_columns(["XJPX:7203", 7203])  # type: ignore[list-item]
+
+    def test_strike_overflow(self) -> None:
+        """int64 に収まらない strike は OverflowError."""
+        with pytest.raises(OverflowError, match="int64"):
+            parse_columns(["XJPX:N225O:20250314:C:" + "9" * 19])
+
+
+class TestParseStructured:
+    """parse_structured のテスト."""
+
+    def test_fields(self) -> None:
+        """フィールドは COLUMNS の順で、値は parse_columns と同じ."""
+        inputs = ["XJPX:7203", "XJPX:N225O:20250314:C:42000", "XX:7203"]
+        result = parse_structured(inputs)
+        columns = parse_columns(inputs)
+        assert result.dtype.names == COLUMNS
+        for name in COLUMNS:
+            assert result[name].tolist() == columns[name].tolist()
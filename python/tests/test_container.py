@@ -0,0 +1,203 @@
+"""container モジュール (SymbolSet / SymbolDict) のテスト."""
+
+import pytest
+
+from marketsymbol import (
+    AssetClass,
+    EquitySymbol,
+    OptionSymbol,
+    OptionType,
+    SymbolDict,
+    SymbolParseError,
+    SymbolSet,
+    parse_symbol,
+)
+from marketsymbol.container import _raw_key, _unpack
+
+_RAWS = [
+    "XJPX:7203",
+    "XJPX:0001",
+    "XOSE:7203",
+    "XJPX:NK:20250314:F",
+    "XOSE:NK:20250314:F",
+    "XJPX:N225O:20250314:O",
+    "XJPX:N225O:20250314:C:42000",
+    "XJPX:N225O:20250314:P:42000",
+    "XJPX:ABCDEFGHIJ:20991231:P:123456789012345678901234567890",
+]
+
+
+class TestKey:
+    """キーへの変換."""
+
+    @pytest.mark.parametrize("raw", _RAWS)
+    def test_round_trip(self, raw: str) -> None:
+        """キーから生成した Symbol はパース結果と等しい."""
+        symbol = _unpack(_raw_key(raw))
+        assert symbol == parse_symbol(raw)
+        assert str(symbol) == raw
+
+    def test_distinct(self) -> None:
+        """異なるシンボルのキーは異なる (先頭の 0 の有無、種別を区別する)."""
+        raws = [*_RAWS, "XJPX:1", "XJPX:01", "XJPX:N225O:20250314:C:4200"]
+        assert len({_raw_key(raw) for raw in raws}) == len(raws)
+
+    def test_normalized(self) -> None:
+        """シンボル文字列は parse_symbol と同じ規則で正規化する."""
+        assert (
+            _raw_key(" xjpx:7203 ")
+            == _raw_key("ＸＪＰＸ:７２０３")  # noqa: RUF001
+            == _raw_key("XJPX:7203")
+        )
+        assert _raw_key("XJPX:N225O:20250314:P:042000") == _raw_key(_RAWS[7])
+
+
+class TestSymbolSet:
+    """SymbolSet の要素の追加・参照と集合演算."""
+
+    def test_raw_and_symbol(self) -> None:
+        """シンボル文字列で登録して Symbol で引ける (逆も同じ)."""
+        symbols = SymbolSet(["xjpx:7203", parse_symbol(_RAWS[6])])
+        assert EquitySymbol(exchange="XJPX", code="7203") in symbols
+        assert "xjpx:n225o:20250314:c:42000" in symbols  # type: ignore[comparison-overlap]
+        assert "XOSE:7203" not in symbols  # type: ignore[comparison-overlap]
+        assert len(symbols) == 2
+        symbols.add(parse_symbol("XJPX:7203"))
+        symbols.add("XJPX:N225O:20250314:C:42000")
+        assert len(symbols) == 2
+        assert set(symbols) == {parse_symbol("XJPX:7203"), parse_symbol(_RAWS[6])}
+
+    def test_invalid(self) -> None:
+        """無効な値は含まない扱い、追加は例外."""
+        symbols = SymbolSet(_RAWS)
+        assert "XJPX" not in symbols  # type: ignore[comparison-overlap]
+        assert "XJPX:N225O:20250230:C:42000" not in symbols  # type: ignore[comparison-overlap]
+        assert 7203 not in symbols  # type: ignore[comparison-overlap]
+        symbols.discard("XJPX")
+        with pytest.raises(SymbolParseError):
+            symbols.add("XJPX")
+        with pytest.raises(TypeError, match="Expected Symbol or str"):
+            SymbolSet([7203])  # type: ignore[list-item]
+        with pytest.raises(KeyError):
+            symbols.remove("XJPX:9999")
+
+    def test_algebra(self) -> None:
+        """集合演算は Symbol の set と同じ結果となる."""
+        left = SymbolSet(_RAWS[:6])
+        right = SymbolSet(raw.lower() for raw in _RAWS[3:])
+        expected_left = {parse_symbol(raw) for raw in _RAWS[:6]}
+        expected_right = {parse_symbol(raw) for raw in _RAWS[3:]}
+        assert set(left | right) == expected_left | expected_right
+        assert set(left & right) == expected_left & expected_right
+        assert set(left - right) == expected_left - expected_right
+        assert set(left ^ right) == expected_left ^ expected_right
+        assert set(left & expected_right) == expected_left & expected_right
+        assert set(left.union(_RAWS[6:], right)) == set(map(parse_symbol, _RAWS))
+        assert set(left.intersection(["XJPX:7203", "XJPX"])) == {
+            parse_symbol("XJPX:7203")
+        }
+        assert left.difference(["XJPX"]) == left
+        assert SymbolSet(_RAWS[:2]) <= left
+        assert left >= SymbolSet(_RAWS[:2])
+        assert left.issubset(_RAWS)
+        assert not left.isdisjoint(right)
+        assert SymbolSet(_RAWS[:2]).isdisjoint(["XJPX", 1])
+        assert left == expected_left
+        assert left != right
+
+    def test_comparisons_with_invalid_values(self) -> None:
+        """包含関係の判定は無効な値を含まない要素として扱い、例外を送出しない."""
+        symbols = SymbolSet(_RAWS[:2])
+        others = [*_RAWS[:2], "XJPX", 7203]
+        assert symbols.issubset(others)
+        assert not symbols.issuperset(others)
+        assert symbols.issuperset(_RAWS[:2])
+        assert not symbols.issuperset(["xjpx:7203", "XJPX"])
+        assert symbols.isdisjoint(["XJPX", 7203])
+        assert not symbols.isdisjoint(others)
+
+    def test_in_place(self) -> None:
+        """複合代入は元の集合を更新し、相手の集合は変更しない."""
+        left = SymbolSet(_RAWS[:6])
+        right = SymbolSet(_RAWS[3:])
+        copied = SymbolSet(right)
+        left |= right
+        assert len(left) == len(_RAWS)
+        left -= right
+        assert left == SymbolSet(_RAWS[:3])
+        left ^= right
+        left &= {parse_symbol(raw) for raw in _RAWS[:4]}
+        assert left == SymbolSet(_RAWS[:4])
+        assert right == copied == SymbolSet(_RAWS[3:])
+        copied.clear()
+        assert len(right) == len(_RAWS) - 3
+
+    def test_select(self) -> None:
+        """取引所・資産クラスの要素を取り出す."""
+        symbols = SymbolSet(_RAWS)
+        assert symbols.select(exchange="XOSE") == SymbolSet(["XOSE:7203", _RAWS[4]])
+        assert symbols.select(exchange="xose", asset_class=AssetClass.EQUITY) == {
+            parse_symbol("XOSE:7203")
+        }
+        options = symbols.select(asset_class=AssetClass.OPTION)
+        assert len(options) == 4
+        assert all(isinstance(symbol, OptionSymbol) for symbol in options)
+        assert len(symbols.select(exchange="XJP")) == 0
+
+    def test_pop_and_repr(self) -> None:
+        """pop は要素の Symbol を返し、repr はシンボル文字列の昇順."""
+        symbols = SymbolSet(["XJPX:N225O:20250314:O", "xjpx:7203"])
+        assert repr(symbols) == "SymbolSet(['XJPX:7203', 'XJPX:N225O:20250314:O'])"
+        popped = symbols.pop()
+        assert popped not in symbols
+        assert len(symbols) == 1
+
+
+class TestSymbolDict:
+    """SymbolDict のキーの登録・参照."""
+
+    def test_raw_and_symbol(self) -> None:
+        """シンボル文字列と Symbol のどちらでも同じキーとして扱う."""
+        prices = SymbolDict({"xjpx:7203": 2500})
+        prices[parse_symbol("XOSE:7203")] = 2490
+        prices["XJPX:7203"] = 2510
+        assert prices[EquitySymbol(exchange="XJPX", code="7203")] == 2510
+        assert prices.get("XOSE:7203") == 2490
+        assert prices.get("XJPX:6758") is None
+        assert prices.get("XJPX", 0) == 0
+        assert "ｘｊｐｘ:７２０３" in prices  # type: ignore[comparison-overlap]  # noqa: RUF001
+        assert list(prices) == [parse_symbol("XJPX:7203"), parse_symbol("XOSE:7203")]
+        del prices["xose:7203"]
+        assert dict(prices) == {parse_symbol("XJPX:7203"): 2510}
+
+    def test_missing_and_invalid(self) -> None:
+        """存在しないキー・無効なキーの参照は KeyError、登録は例外."""
+        prices = SymbolDict([("XJPX:7203", 1)])
+        with pytest.raises(KeyError, match="XJPX:6758"):
+            prices["XJPX:6758"]
+        with pytest.raises(KeyError):
+            prices["XJPX"]
+        with pytest.raises(KeyError):
+            del prices["XJPX"]
+        with pytest.raises(SymbolParseError):
+            prices["XJPX"] = 1
+        assert 1 not in prices  # type: ignore[comparison-overlap]
+
+    def test_views(self) -> None:
+        """select は登録順を保ち、key_set は集合演算に使える."""
+        prices = SymbolDict((raw, i) for i, raw in enumerate(_RAWS))
+        selected = prices.select(exchange="XJPX", asset_class=AssetClass.OPTION)
+        assert list(selected.values()) == [5, 6, 7, 8]
+        assert selected[_RAWS[6]] == 6
+        option = OptionSymbol(
+            exchange="XJPX",
+            code="N225O",
+            expiry="20250314",
+            option_type=OptionType.SERIES,
+            strike=None,
+        )
+        assert option in selected.key_set() & SymbolSet(_RAWS[5:6])
+        copied = prices.copy()
+        copied.clear()
+        assert len(prices) == len(_RAWS)
+        assert repr(SymbolDict({"xjpx:7203": 1})) == "SymbolDict({'XJPX:7203': 1})"
@@ -0,0 +1,288 @@
+"""csvstream モジュール (transform_csv) のテスト."""
+
+import csv
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from marketsymbol import CsvTransformResult, normalize_symbol, transform_csv
+from marketsymbol.adapter import AdapterRegistry
+from marketsymbol.csvstream import (
+    REJECT_COLUMNS,
+    canonicalize,
+    symbol_to_vendor,
+    vendor_to_symbol,
+)
+from tests.test_cli import _SuffixAdapter
+
+_CSV = (
+    "id,symbol,name,vendor\n"
+    '1,xjpx:7203,"Toyota, Motor",7203.T\n'
+    "2,XX:7203,Unknown,7203.T\n"
+    "3,XJPX:NK:20250314:F,Nikkei,7203.O\n"
+    "4,,Empty,6758.T\n"
+)
+
+
+def _rows(text: str) -> list[list[str]]:
+    """CSV の文字列を行のリストにする."""
+    return list(csv.reader(io.StringIO(text)))
+
+
+def _registry() -> AdapterRegistry:
+    """テスト用のアダプターを登録したレジストリを返す."""
+    registry = AdapterRegistry()
+    registry.register("suffix", _SuffixAdapter())
+    return registry
+
+
+def _transform(text: str, **kwargs: object) -> tuple[CsvTransformResult, str, str]:
+    """text を変換し、結果・出力・rejects の出力を返す."""
+    output, rejects = io.StringIO(), io.StringIO()
+    result = transform_csv(io.StringIO(text), output, rejects=rejects, **kwargs)  # type: ignore[arg-type]
+    return result, output.getvalue(), rejects.getvalue()
+
+
+class TestTransformCsv:
+    """列の変換と失敗した行の出力."""
+
+    def test_canonicalize_column(self) -> None:
+        """指定した列のみ変換し、他の列 (引用符を含む値) はそのまま出力する."""
+        result, output, rejects = _transform(_CSV, columns={"symbol": canonicalize})
+        assert _rows(output) == [
+            ["id", "symbol", "name", "vendor"],
+            ["1", "XJPX:7203", "Toyota, Motor", "7203.T"],
+            ["3", "XJPX:NK:20250314:F", "Nikkei", "7203.O"],
+            ["4", "", "Empty", "6758.T"],
+        ]
+        assert _rows(rejects) == [
+            ["id", "symbol", "name", "vendor", *REJECT_COLUMNS],
+            [
+                "2",
+                "XX:7203",
+                "Unknown",
+                "7203.T",
+                "symbol",
+                "E007",
+                "Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+            ],
+        ]
+        assert result == CsvTransformResult(4, 3, 1, {"E007": 1})
+
+    def test_normalize_column(self) -> None:
+        """normalize_symbol は検査せずに正規化する."""
+        result, output, _ = _transform(_CSV, columns={"symbol": normalize_symbol})
+        assert [row[1] for row in _rows(output)[1:]] == [
+            "XJPX:7203",
+            "XX:7203",
+            "XJPX:NK:20250314:F",
+            "",
+        ]
+        assert result.rejected == 0
+
+    def test_vendor_columns(self) -> None:
+        """アダプターによる変換 (アダプターの例外はクラス名で集計する)."""
+        registry = _registry()
+        result, output, rejects = _transform(
+            _CSV,
+            columns={
+                "vendor": vendor_to_symbol(registry, "suffix"),
+                "symbol": symbol_to_vendor(registry, "suffix"),
+            },
+        )
+        assert _rows(output)[1:] == [
+            ["1", "7203.T", "Toyota, Motor", "XJPX:7203"],
+            ["4", "", "Empty", "XJPX:6758"],
+        ]
+        # 最初に失敗した列を記録する (columns の順に変換する)
+        assert [row[4:6] for row in _rows(rejects)[1:]] == [
+            ["symbol", "E007"],
+            ["vendor", "ValueError"],
+        ]
+        assert result.error_counts == {"E007": 1, "ValueError": 1}
+
+    def test_unknown_vendor(self) -> None:
+        """未登録のベンダーは変換関数の生成時に KeyError."""
+        with pytest.raises(KeyError, match="No adapter registered"):
+            vendor_to_symbol(_registry(), "unknown")
+
+    def test_skip_empty(self) -> None:
+        """skip_empty=False の場合は空の値も変換する."""
+        result, _, rejects = _transform(
+            _CSV, columns={"symbol": canonicalize}, skip_empty=False
+        )
+        assert result.error_counts == {"E004": 1, "E007": 1}
+        assert _rows(rejects)[2][0] == "4"
+
+    def test_short_row(self) -> None:
+        """変換する列を含まない行は失敗とし、rejects の列は見出しに揃える."""
+        result, output, rejects = _transform(
+            "id,symbol,name\n1\n2,XX:7203\n3,XJPX:7203\n",
+            columns={"symbol": canonicalize},
+        )
+        assert _rows(output) == [["id", "symbol", "name"], ["3", "XJPX:7203"]]
+        assert _rows(rejects) == [
+            ["id", "symbol", "name", *REJECT_COLUMNS],
+            ["1", "", "", "", "ValueError", "Row has 1 fields (expected 2)"],
+            [
+                "2",
+                "XX:7203",
+                "",
+                "symbol",
+                "E007",
+                "Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+            ],
+        ]
+        assert result.rejected == 2
+
+    def test_long_row(self) -> None:
+        """見出しより長い行は出力にはそのまま、rejects には見出しの列数で出力する."""
+        result, output, rejects = _transform(
+            "id,symbol\n1,xjpx:7203,extra\n2,XX:7203,extra,more\n",
+            columns={"symbol": canonicalize},
+        )
+        assert _rows(output)[1:] == [["1", "XJPX:7203", "extra"]]
+        assert _rows(rejects)[1:] == [
+            [
+                "2",
+                "XX:7203",
+                "symbol",
+                "E007",
+                "Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+            ],
+        ]
+        assert result.rejected == 1
+
+    def test_unsupported_asset_class(self) -> None:
+        """アダプターがサポートしない資産クラスは ValueError として記録する."""
+        result, _, rejects = _transform(
+            "symbol\nXJPX:NK:20250314:F\n",
+            columns={"symbol": symbol_to_vendor(_registry(), "suffix")},
+        )
+        assert _rows(rejects)[1][1:] == [
+            "symbol",
+            "ValueError",
+            "Unsupported asset class: future",
+        ]
+        assert result.error_counts == {"ValueError": 1}
+
+    def test_transform_bug_propagates(self) -> None:
+        """SymbolError・ValueError 以外の例外は失敗として記録せずに送出する."""
+
+        def broken(value: str) -> str:
+            return {"XJPX:NK:20250314:F": "ok"}[value]
+
+        with pytest.raises(KeyError, match="xjpx:7203"):
+            _transform(_CSV, columns={"symbol": broken})
+
+    def test_blank_lines(self) -> None:
+        """空行は csv.DictReader と同じく読み飛ばす (行数にも含めない)."""
+        result, output, rejects = _transform(
+            "id,symbol\n\n1,xjpx:7203\n\n\n", columns={"symbol": canonicalize}
+        )
+        assert _rows(output) == [["id", "symbol"], ["1", "XJPX:7203"]]
+        assert _rows(rejects) == [["id", "symbol", *REJECT_COLUMNS]]
+        assert result == CsvTransformResult(1, 1, 0, {})
+
+    def test_without_rejects(self) -> None:
+        """rejects を指定しない場合は失敗した行を件数のみ記録する."""
+        output = io.StringIO()
+        result = transform_csv(io.StringIO(_CSV), output, {"symbol": canonicalize})
+        assert len(_rows(output.getvalue())) == 4
+        assert result.error_counts == {"E007": 1}
+
+    def test_fmtparams(self) -> None:
+        """書式パラメータは読み込みと出力の両方に適用する."""
+        output = io.StringIO()
+        transform_csv(
+            io.StringIO("id;symbol\n1;xjpx:7203\n"),
+            output,
+            {"symbol": canonicalize},
+            delimiter=";",
+            lineterminator="\n",
+        )
+        assert output.getvalue() == "id;symbol\n1;XJPX:7203\n"
+
+    @pytest.mark.parametrize(
+        ("text", "columns", "match"),
+        [
+            ("", {"symbol": canonicalize}, "no header"),
+            ("id,name\n", {"symbol": canonicalize}, "'symbol' not found"),
+        ],
+    )
+    def test_invalid_input(
+        self, text: str, columns: dict[str, object], match: str
+    ) -> None:
+        """見出し行・列がない場合は ValueError."""
+        with pytest.raises(ValueError, match=match):
+            transform_csv(io.StringIO(text), io.StringIO(), columns)  # type: ignore[arg-type]
+
+
+class TestMemoization:
+    """繰り返しの値のメモ化."""
+
+    @pytest.mark.parametrize(
+        ("chunk_rows", "cache_size", "calls"),
+        [(10_000, 10_000, 3), (2, 10_000, 3), (10_000, 2, 9)],
+    )
+    def test_repeated_values(
+        self, chunk_rows: int, cache_size: int, calls: int
+    ) -> None:
+        """同じ値 (失敗を含む) は1回だけ変換する.
+
+        逐次処理ではチャンク間でも共有し、上限に達した場合は破棄して再計算する。
+        """
+        seen: list[str] = []
+
+        def transform(value: str) -> str:
+            seen.append(value)
+            return canonicalize(value)
+
+        values = ["xjpx:7203", "XX:7203", "XJPX:6758"] * 3
+        text = "symbol\n" + "".join(f"{value}\n" for value in values)
+        result, output, _ = _transform(
+            text,
+            columns={"symbol": transform},
+            chunk_rows=chunk_rows,
+            cache_size=cache_size,
+        )
+        assert len(seen) == calls
+        assert [row[0] for row in _rows(output)[1:]] == ["XJPX:7203", "XJPX:6758"] * 3
+        assert result.error_counts == {"E007": 3}
+
+
+class TestParallel:
+    """executor による並列変換."""
+
+    def _text(self) -> str:
+        """チャンクに分割される大きさの CSV."""
+        rows = [
+            f"{i},{symbol}\n"
+            for i in range(300)
+            for symbol in ("xjpx:7203", "XX:7203", "XJPX:NK:20250314:F")
+        ]
+        return "id,symbol\n" + "".join(rows)
+
+    def test_thread_pool_preserves_order(self) -> None:
+        """チャンクの完了順によらず入力順に出力する."""
+        text = self._text()
+        expected = _transform(text, columns={"symbol": canonicalize})
+        with ThreadPoolExecutor(4) as executor:
+            actual = _transform(
+                text, columns={"symbol": canonicalize}, chunk_rows=7, executor=executor
+            )
+        assert actual == expected
+
+    def test_process_pool_with_registry(self) -> None:
+        """AdapterRegistry を使う変換関数もワーカープロセスに渡せる."""
+        text = "id,vendor\n" + "".join(f"{i},{i % 10}000.T\n" for i in range(200))
+        columns = {"vendor": vendor_to_symbol(_registry(), "suffix")}
+        expected = _transform(text, columns=columns)
+        with ProcessPoolExecutor(
+            2, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            actual = _transform(text, columns=columns, chunk_rows=16, executor=executor)
+        assert actual == expected
+        assert expected[0].written == 200
@@ -1,9 +1,13 @@
 """ErrorCode, SymbolError, SymbolParseError, SymbolValidationError のテスト."""
 
+import pickle
+
 import pytest
 
+from marketsymbol import parse_symbol
 from marketsymbol.errors import (
     ErrorCode,
+    FailureRecord,
     SymbolError,
     SymbolParseError,
     SymbolValidationError,
@@ -84,6 +88,20 @@ class TestSymbolError:
         assert exc_info.value.error_code == ErrorCode.INVALID_DATE
 
 
+class TestFailureRecord:
+    """FailureRecord (1つの値の失敗の記録) のテスト."""
+
+    def test_from_error(self) -> None:
+        """SymbolError はエラーコードの値とメッセージ、それ以外はクラス名を記録する."""
+        with pytest.raises(SymbolParseError) as exc_info:
+            parse_symbol("XX:7203")
+        assert FailureRecord.from_error(exc_info.value) == (
+            "E007",
+            "Invalid exchange code: 'XX' (must be 4 uppercase letters)",
+        )
+        assert FailureRecord.from_error(ValueError("bad")) == ("ValueError", "bad")
+
+
 class TestSymbolParseError:
     """SymbolParseError のテスト."""
 
@@ -180,3 +198,92 @@ class TestSymbolValidationError:
         """error_code 属性を持つ (受入条件)."""
         error = SymbolValidationError("Validation failed", ErrorCode.INVALID_DATE)
         assert error.error_code == ErrorCode.INVALID_DATE
+
+
+class _CountingArg:
+    """str.format で整形された回数を数えるテンプレート引数."""
+
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __format__(self, format_spec: str) -> str:
+        self.formatted += 1
+        return "ARG"
+
+
+class TestLazyMessage:
+    """メッセージの遅延整形のテスト."""
+
+    def test_template_rendered_on_access(self) -> None:
+        """message_args を指定するとテンプレートから整形される."""
+        error = SymbolError(
+            "Invalid code: '{0}'", ErrorCode.INVALID_CODE, message_args=("X",)
+        )
+        assert error.message == "Invalid code: 'X'"
+        assert str(error) == "[E008] Invalid code: 'X'"
+
+    def test_not_rendered_until_accessed(self) -> None:
+        """message/str() にアクセスするまで整形しない."""
+        arg = _CountingArg()
+        error = SymbolParseError(
+            "value {0}",
+            ErrorCode.INVALID_CODE,
+            raw_symbol="XJPX:?",
+            message_args=(arg,),
+        )
+        assert error.error_code == ErrorCode.INVALID_CODE
+        assert error.raw_symbol == "XJPX:?"
+        assert arg.formatted == 0
+        assert error.message == "value ARG"
+        assert arg.formatted == 1
+
+    def test_rendered_once(self) -> None:
+        """整形結果はキャッシュされる."""
+        arg = _CountingArg()
+        error = SymbolValidationError(
+            "value {0}", ErrorCode.INVALID_CODE, message_args=(arg,)
+        )
+        assert str(error) == "[E008] value ARG"
+        assert error.message == "value ARG"
+        assert arg.formatted == 1
+
+    def test_plain_message_not_formatted(self) -> None:
+        """message_args なしの場合、波括弧を含むメッセージもそのまま返す."""
+        error = SymbolError("literal {braces}", ErrorCode.INVALID_CODE)
+        assert error.message == "literal {braces}"
+
+    def test_from_parse_failure_with_args(self) -> None:
+        """from_parse_failure も message_args を受け付ける."""
+        error = SymbolParseError.from_parse_failure(
+            "Invalid segment count: {0}",
+            ErrorCode.INVALID_SEGMENT_COUNT,
+            "XJPX",
+            message_args=(1,),
+        )
+        assert error.message == "Invalid segment count: 1"
+        assert error.raw_symbol == "XJPX"
+
+    def test_args_and_repr_of_parse_error(self) -> None:
+        """args と repr() はテンプレートではなく整形したメッセージを含む."""
+        with pytest.raises(SymbolParseError) as info:
+            parse_symbol("XJPX:NK:20250314")
+        error = info.value
+        message = "Invalid segment count: 3 (expected 2, 4, or 5)"
+        assert error.args == (message,)
+        assert repr(error) == f"SymbolParseError({message!r})"
+
+    def test_pickle_keeps_formatted_message(self) -> None:
+        """pickle で復元した例外はメッセージとコード・属性を保持する."""
+        error = SymbolValidationError(
+            "value {0}",
+            ErrorCode.INVALID_CODE,
+            field_name="code",
+            field_value="?",
+            message_args=("?",),
+        )
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is SymbolValidationError
+        assert restored.args == ("value ?",)
+        assert str(restored) == "[E008] value ?"
+        assert restored.field_name == "code"
+        assert restored.field_value == "?"
@@ -0,0 +1,180 @@
+"""exchange モジュール (ExchangeRegistry) のテスト."""
+
+import pytest
+
+from marketsymbol import (
+    ErrorCode,
+    ExchangePlugin,
+    ExchangeRegistry,
+    OptionSymbol,
+    SymbolParseError,
+    parse_symbol,
+)
+from marketsymbol.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from marketsymbol.symbol import Symbol
+from marketsymbol.validator import ValidationFailure
+from tests.helpers import verdict
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
+
+# 権利行使価格の刻み (テスト用の取引所固有の規則)
+_STRIKE_STEP = 125
+
+
+class _StrikeStepPlugin(ExchangePlugin):
+    """オプションの権利行使価格を一定の刻みに制限するプラグイン."""
+
+    __slots__ = ()
+
+    def segment_failure(self, segments: list[str]) -> ValidationFailure | None:
+        """汎用の検査の後、権利行使価格の刻みを検査する."""
+        failure = super().segment_failure(segments)
+        if failure is None and len(segments) == 5 and int(segments[4]) % _STRIKE_STEP:
+            return ValidationFailure(
+                ErrorCode.INVALID_STRIKE_VALUE,
+                "Invalid strike: '{0}' (must be a multiple of 125)",
+                (segments[4],),
+                "strike",
+                segments[4],
+            )
+        return failure
+
+
+class _AliasPlugin(ExchangePlugin):
+    """旧コードを現行コードに読み替えるプラグイン."""
+
+    __slots__ = ()
+
+    def build(self, segments: list[str]) -> Symbol:
+        """コード 'NK225' を 'NK' に読み替えて生成する."""
+        if segments[1] == "NK225":
+            segments = [segments[0], "NK", *segments[2:]]
+        return super().build(segments)
+
+
+def _registry() -> ExchangeRegistry:
+    """テスト用のプラグインを登録したレジストリを返す."""
+    registry = ExchangeRegistry()
+    registry.register("XOSE", _StrikeStepPlugin())
+    registry.register("XTKS", _AliasPlugin())
+    return registry
+
+
+class TestDifferential:
+    """parse_symbol との結果 (値・エラーコード・メッセージ) の一致の検証."""
+
+    @pytest.mark.parametrize(
+        "registry",
+        [ExchangeRegistry(), _registry()],
+        ids=["empty", "plugins"],
+    )
+    def test_generic_fallback(self, registry: ExchangeRegistry) -> None:
+        """プラグイン未登録の取引所は parse_symbol と一致する."""
+        inputs = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(3000)
+            if not raw.strip().upper().startswith(("XOSE", "XTKS"))
+        ]
+        mismatches = [
+            raw
+            for raw in inputs
+            if verdict(registry.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+    def test_default_plugin(self) -> None:
+        """ExchangePlugin の既定の実装は parse_symbol と一致する."""
+        registry = ExchangeRegistry()
+        registry.register("XJPX", ExchangePlugin())
+        mismatches = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(3000)
+            if verdict(registry.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+
+class TestExchangeRegistry:
+    """プラグインへの振り分けのテスト."""
+
+    def test_plugin_segment_failure(self) -> None:
+        """登録した取引所のみプラグインの検査を適用する."""
+        registry = _registry()
+        assert registry.parse("XOSE:N225O:20250314:C:42000") == parse_symbol(
+            "XOSE:N225O:20250314:C:42000"
+        )
+        with pytest.raises(SymbolParseError, match="multiple of 125") as exc_info:
+            registry.parse("xose:n225o:20250314:c:42010")
+        assert exc_info.value.error_code is ErrorCode.INVALID_STRIKE_VALUE
+        assert exc_info.value.raw_symbol == "xose:n225o:20250314:c:42010"
+        assert registry.parse("XJPX:N225O:20250314:C:42010") == parse_symbol(
+            "XJPX:N225O:20250314:C:42010"
+        )
+
+    def test_plugin_build(self) -> None:
+        """プラグインの生成規則を適用する."""
+        registry = _registry()
+        assert registry.parse("XTKS:NK225:20250314:F").code == "NK"
+        assert registry.parse("XJPX:NK225:20250314:F").code == "NK225"
+
+    def test_generic_errors_in_plugin(self) -> None:
+        """プラグインも汎用の検査を含む."""
+        option = _registry().parse("XOSE:N225O:20250314:O")
+        assert isinstance(option, OptionSymbol)
+        with pytest.raises(SymbolParseError) as exc_info:
+            _registry().parse("XOSE:N225O:20250230:C:42000")
+        assert exc_info.value.error_code is ErrorCode.INVALID_DATE
+
+    def test_register_and_unregister(self) -> None:
+        """登録・解除・参照."""
+        registry = ExchangeRegistry()
+        plugin = ExchangePlugin()
+        registry.register("XJPX", plugin)
+        assert registry.get("XJPX") is plugin
+        assert registry.list() == ["XJPX"]
+        registry.unregister("XJPX")
+        assert registry.get("XJPX") is None
+        assert registry.list() == []
+
+    @pytest.mark.parametrize("mic", ["", "XJP", "xjpx", "XJPX1"])
+    def test_invalid_mic(self, mic: str) -> None:
+        """MIC の形式が不正な場合は ValueError."""
+        with pytest.raises(ValueError, match="Invalid MIC"):
+            ExchangeRegistry().register(mic, ExchangePlugin())
+
+    def test_duplicate_registration(self) -> None:
+        """同じ MIC の二重登録は ValueError."""
+        registry = ExchangeRegistry()
+        registry.register("XJPX", ExchangePlugin())
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("XJPX", ExchangePlugin())
+
+    def test_unregister_unknown(self) -> None:
+        """未登録の MIC の解除は KeyError."""
+        with pytest.raises(KeyError, match="No plugin registered"):
+            ExchangeRegistry().unregister("XJPX")
+
+    def test_type_error(self) -> None:
+        """str 以外は parse_symbol と同様に TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            ExchangeRegistry().parse(7203)  # type: ignore[arg-type]
+
+    def test_metrics_use_plugins(self) -> None:
+        """メトリクス有効時もプラグインの規則を適用して記録する."""
+        registry = _registry()
+        reset_metrics()
+        enable_metrics()
+        try:
+            assert registry.parse("XTKS:NK225:20250314:F").code == "NK"
+            with pytest.raises(SymbolParseError):
+                registry.parse("XOSE:N225O:20250314:C:42010")
+        finally:
+            disable_metrics()
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_count == 1
+        assert snapshot.parse_errors[ErrorCode.INVALID_STRIKE_VALUE] == 1
+        reset_metrics()
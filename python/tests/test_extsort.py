@@ -0,0 +1,166 @@
+"""extsort モジュール (外部ソート・差分) のテスト."""
+
+import random
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+
+from marketsymbol import (
+    SymbolChange,
+    SymbolError,
+    SymbolParseError,
+    diff_symbols,
+    parse_symbol,
+    sort_symbols,
+)
+from marketsymbol.bench.query import synthetic_symbols
+
+_HUGE_STRIKE = 2**70
+
+
+def _shuffled_lines(size: int, seed: int = 0) -> list[str]:
+    """重複を含む合成したシンボルの行 (改行付き、順序は無作為)."""
+    lines = [f"{symbol}\n" for symbol in synthetic_symbols(size)]
+    random.Random(seed).shuffle(lines)
+    return lines
+
+
+def _expected(lines: list[str]) -> list[str]:
+    """行をパースし、重複を除いて sort_key の順に並べた正規の文字列表現."""
+    symbols = {parse_symbol(line) for line in lines if line.strip()}
+    return [str(s) for s in sorted(symbols, key=attrgetter("sort_key"))]
+
+
+class TestSortSymbols:
+    """sort_symbols の整列・重複の除去."""
+
+    @pytest.mark.parametrize("run_lines", [1, 7, 500, 1_000_000])
+    def test_matches_in_memory_sort(self, run_lines: int, tmp_path: Path) -> None:
+        """ランの数によらずメモリ内の整列と同じ結果となる."""
+        lines = _shuffled_lines(3_000)
+        result = list(sort_symbols(lines, run_lines=run_lines, tmpdir=tmp_path))
+        assert result == _expected(lines)
+
+    def test_multi_pass_merge(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """ランの数が MERGE_FAN_IN を超える場合は段階的にマージする."""
+        monkeypatch.setattr("marketsymbol.extsort.MERGE_FAN_IN", 3)
+        lines = _shuffled_lines(2_000, seed=1)
+        result = list(sort_symbols(lines, run_lines=50, tmpdir=tmp_path))
+        assert result == _expected(lines)
+
+    def test_normalized_and_numeric_strike(self) -> None:
+        """入力は正規化して重複を除き、strike は数値の順に並べる."""
+        lines = [
+            "XJPX:N225O:20250314:P:42000",
+            " xjpx:n225o:20250314:p:042000\n",
+            f"XJPX:N225O:20250314:P:{_HUGE_STRIKE + 1}",
+            "XJPX:N225O:20250314:P:9000",
+            f"XJPX:N225O:20250314:P:{_HUGE_STRIKE}",
+            "ＸＪＰＸ:７２０３",  # noqa: RUF001
+            "XJPX:7203",
+        ]
+        assert list(sort_symbols(lines, run_lines=2)) == [
+            "XJPX:7203",
+            "XJPX:N225O:20250314:P:9000",
+            "XJPX:N225O:20250314:P:42000",
+            f"XJPX:N225O:20250314:P:{_HUGE_STRIKE}",
+            f"XJPX:N225O:20250314:P:{_HUGE_STRIKE + 1}",
+        ]
+
+    def test_temporary_files(self, tmp_path: Path) -> None:
+        """1つのランに収まる場合は一時ファイルを作らず、マージ後は削除する."""
+        lines = _shuffled_lines(100)
+        iterator = sort_symbols(lines, run_lines=100, tmpdir=tmp_path)
+        next(iterator)
+        assert list(tmp_path.iterdir()) == []
+        iterator = sort_symbols(lines, run_lines=10, tmpdir=tmp_path)
+        next(iterator)
+        (directory,) = tmp_path.iterdir()
+        assert len(list(directory.iterdir())) == 10
+        list(iterator)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_errors(self) -> None:
+        """パースできない行は on_error に渡し、空行は読み飛ばす."""
+        errors: list[tuple[str, int, str]] = []
+
+        def on_error(source: str, line: int, error: SymbolError) -> None:
+            errors.append((source, line, error.error_code.value))
+
+        lines = ["XJPX:7203\n", "\n", "XX:7203\n", "XJPX:NK:20250230:F\n"]
+        result = list(sort_symbols(lines, source="today.txt", on_error=on_error))
+        assert result == ["XJPX:7203"]
+        assert errors == [("today.txt", 3, "E007"), ("today.txt", 4, "E005")]
+
+    def test_raises_without_handler(self) -> None:
+        """on_error がない場合はパースできない行で例外を送出する."""
+        with pytest.raises(SymbolParseError, match="XX"):
+            list(sort_symbols(["XJPX:7203", "XX:7203"]))
+
+    def test_invalid_run_lines(self) -> None:
+        """run_lines が 1 未満の場合は呼び出し時に送出する."""
+        with pytest.raises(ValueError, match="run_lines"):
+            sort_symbols([], run_lines=0)
+        with pytest.raises(ValueError, match="run_lines"):
+            diff_symbols([], [], run_lines=0)
+
+
+class TestDiffSymbols:
+    """diff_symbols の突き合わせ."""
+
+    def test_changes(self) -> None:
+        """追加・削除・変更なしを全順序で返す."""
+        old = ["XJPX:7203", "XJPX:6758", "xjpx:nk:20250314:f", "XJPX:6758"]
+        new = ["XJPX:NK:20250314:F", "XJPX:9984", "XJPX:7203"]
+        assert list(diff_symbols(old, new)) == [
+            SymbolChange("removed", "XJPX:6758"),
+            SymbolChange("unchanged", "XJPX:7203"),
+            SymbolChange("added", "XJPX:9984"),
+            SymbolChange("unchanged", "XJPX:NK:20250314:F"),
+        ]
+        assert [c.status for c in diff_symbols(old, new, unchanged=False)] == [
+            "removed",
+            "added",
+        ]
+
+    @pytest.mark.parametrize(("old_size", "new_size"), [(0, 50), (50, 0), (0, 0)])
+    def test_empty_side(self, old_size: int, new_size: int) -> None:
+        """片方が空の場合は全て追加または削除となる."""
+        old = [f"XJPX:{1000 + i}" for i in range(old_size)]
+        new = [f"XJPX:{1000 + i}" for i in range(new_size)]
+        changes = list(diff_symbols(old, new))
+        assert len(changes) == old_size + new_size
+        assert {c.status for c in changes} <= {"added", "removed"}
+
+    def test_matches_set_difference(self, tmp_path: Path) -> None:
+        """複数のランに分かれる入力でも集合の差と一致する."""
+        rng = random.Random(2)
+        universe = [
+            f"XJPX:N225O:20250314:{rng.choice('CP')}:{strike}"
+            for strike in range(1_000, 4_000)
+        ]
+        old = rng.sample(universe, 2_000)
+        new = rng.sample(universe, 2_000)
+        changes = list(diff_symbols(old, new, run_lines=128, tmpdir=tmp_path))
+        by_status: dict[str, set[str]] = {}
+        for change in changes:
+            by_status.setdefault(change.status, set()).add(change.symbol)
+        assert by_status["added"] == set(new) - set(old)
+        assert by_status["removed"] == set(old) - set(new)
+        assert by_status["unchanged"] == set(old) & set(new)
+        assert [c.symbol for c in changes] == _expected(old + new)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_error_sources(self) -> None:
+        """on_error には入力名として old / new を渡す."""
+        errors: list[tuple[str, int]] = []
+        changes = diff_symbols(
+            ["XX:1", "XJPX:7203"],
+            ["XJPX:7203", "", "XX:2"],
+            on_error=lambda source, line, _: errors.append((source, line)),
+        )
+        assert [c.status for c in changes] == ["unchanged"]
+        assert sorted(errors) == [("new", 3), ("old", 1)]
@@ -0,0 +1,213 @@
+"""grammar モジュール (GrammarRegistry) のテスト."""
+
+import pytest
+
+from marketsymbol import (
+    EquitySymbol,
+    ErrorCode,
+    FutureSymbol,
+    Grammar,
+    GrammarRegistry,
+    SymbolParseError,
+    normalize_symbol,
+    parse_symbol,
+)
+from marketsymbol.grammar import BUILTIN_GRAMMARS, FUTURE_GRAMMAR
+from marketsymbol.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from marketsymbol.symbol import Symbol
+from marketsymbol.validator import check_code, check_exchange, check_expiry
+from tests.helpers import verdict
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
+
+
+def _error(parse: object, raw: str) -> tuple[ErrorCode, str]:
+    """parse(raw) が送出したエラーコードとメッセージを返す."""
+    with pytest.raises(SymbolParseError) as exc_info:
+        parse(raw)  # type: ignore[operator]
+    return exc_info.value.error_code, exc_info.value.message
+
+
+def _build_short_future(segments: list[str]) -> Symbol:
+    """exchange:code:expiry 形式から先物を生成する."""
+    return FutureSymbol(exchange=segments[0], code=segments[1], expiry=segments[2])
+
+
+def _build_listed(segments: list[str]) -> Symbol:
+    """exchange:code:L 形式から株式を生成する."""
+    return EquitySymbol(exchange=segments[0], code=segments[1])
+
+
+# 3セグメントの先物の省略形 (判別セグメントなし)
+_SHORT_FUTURE = Grammar(
+    "short_future", (check_exchange, check_code, check_expiry), _build_short_future
+)
+
+# 6セグメントの上場区分付き株式 (6番目のセグメントで判別)
+_LISTED = Grammar(
+    "listed",
+    (check_exchange, check_code, None, None, None, None),
+    _build_listed,
+    discriminator=5,
+    type_indicators=frozenset({"L"}),
+)
+
+
+class TestDifferential:
+    """組み込みの文法と parse_symbol の結果 (値・エラーコード・メッセージ) の一致."""
+
+    def test_builtin_grammars(self) -> None:
+        """組み込みの文法のみの場合は parse_symbol と一致する."""
+        registry = GrammarRegistry.default()
+        mismatches = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(5000)
+            if verdict(registry.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+    def test_additional_grammars(self) -> None:
+        """組み込み以外のセグメント数の文法を追加しても既存の形式は変わらない."""
+        registry = GrammarRegistry((*BUILTIN_GRAMMARS, _LISTED))
+        inputs = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(3000)
+            if normalize_symbol(raw).count(":") + 1 in (2, 4, 5)
+        ]
+        mismatches = [
+            raw
+            for raw in inputs
+            if verdict(registry.parse, raw) != verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+
+class TestGrammarRegistry:
+    """文法の登録と振り分けのテスト."""
+
+    def test_custom_grammar(self) -> None:
+        """追加した文法で生成・検査する."""
+        registry = GrammarRegistry((*BUILTIN_GRAMMARS, _SHORT_FUTURE, _LISTED))
+        assert registry.parse("xjpx:nk:20250314") == parse_symbol("XJPX:NK:20250314:F")
+        assert registry.parse("XJPX:7203:A:B:C:L") == parse_symbol("XJPX:7203")
+        assert _error(registry.parse, "XJPX:NK:20250230")[0] is ErrorCode.INVALID_DATE
+
+    def test_segment_count_message_lists_grammars(self) -> None:
+        """該当するセグメント数がない場合は登録済みのセグメント数を示す."""
+        registry = GrammarRegistry((*BUILTIN_GRAMMARS, _SHORT_FUTURE))
+        assert _error(registry.parse, "XJPX:7203:A:B:C:D") == (
+            ErrorCode.INVALID_SEGMENT_COUNT,
+            "Invalid segment count: 6 (expected 2, 3, 4, or 5)",
+        )
+        assert _error(GrammarRegistry().parse, "XJPX:7203")[1] == (
+            "Invalid segment count: 2 (no grammars registered)"
+        )
+
+    def test_unknown_type_indicator(self) -> None:
+        """判別セグメントの値に該当する文法がない場合は E006."""
+        registry = GrammarRegistry([_LISTED])
+        assert _error(registry.parse, "XJPX:7203:A:B:C:X") == (
+            ErrorCode.INVALID_OPTION_TYPE,
+            "Invalid type indicator: 'X' (expected L)",
+        )
+
+    def test_builtin_count_without_builtin_grammar(self) -> None:
+        """組み込みの文法を解除した形式は該当なしのエラーとなる."""
+        registry = GrammarRegistry.default()
+        registry.unregister("future")
+        assert _error(registry.parse, "XJPX:NK:20250314:F") == (
+            ErrorCode.INVALID_OPTION_TYPE,
+            "Invalid type indicator: 'F' (expected O)",
+        )
+        registry.unregister("equity")
+        assert _error(registry.parse, "XJPX:7203")[0] is (
+            ErrorCode.INVALID_SEGMENT_COUNT
+        )
+
+    def test_register_get_list(self) -> None:
+        """登録・参照・解除."""
+        registry = GrammarRegistry.default()
+        assert registry.list() == ["equity", "future", "option_series", "option"]
+        assert registry.get("future") is FUTURE_GRAMMAR
+        assert registry.get("bond") is None
+        registry.register(_SHORT_FUTURE)
+        assert registry.list()[-1] == "short_future"
+        registry.unregister("short_future")
+        with pytest.raises(KeyError, match="No grammar registered"):
+            registry.unregister("short_future")
+
+    def test_duplicate_name(self) -> None:
+        """同じ名前の文法の二重登録は ValueError."""
+        registry = GrammarRegistry.default()
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(FUTURE_GRAMMAR)
+
+    def test_conflicting_type_indicator(self) -> None:
+        """(セグメント数, タイプ識別子) が重複する文法は ValueError."""
+        registry = GrammarRegistry.default()
+        weekly = Grammar(
+            "weekly",
+            FUTURE_GRAMMAR.fields,
+            FUTURE_GRAMMAR.build,
+            discriminator=3,
+            type_indicators=frozenset({"W", "F"}),
+        )
+        with pytest.raises(ValueError, match="conflicts with 'future'"):
+            registry.register(weekly)
+        # 失敗した登録は振り分け表に反映しない
+        assert registry.list() == ["equity", "future", "option_series", "option"]
+
+    def test_conflicting_discriminator(self) -> None:
+        """同じセグメント数で判別セグメントの位置が異なる文法は ValueError."""
+        with pytest.raises(ValueError, match="discriminates on segment"):
+            GrammarRegistry(
+                [
+                    _LISTED,
+                    Grammar(
+                        "other",
+                        _LISTED.fields,
+                        _build_listed,
+                        discriminator=4,
+                        type_indicators=frozenset({"L"}),
+                    ),
+                ]
+            )
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"discriminator": 6, "type_indicators": frozenset({"L"})}, "out of range"),
+            ({"discriminator": 5}, "no type indicators"),
+            ({"type_indicators": frozenset({"L"})}, "no discriminator"),
+        ],
+    )
+    def test_invalid_grammar(self, kwargs: dict[str, object], match: str) -> None:
+        """判別セグメントの指定が不正な文法は ValueError."""
+        with pytest.raises(ValueError, match=match):
+            Grammar("invalid", _LISTED.fields, _build_listed, **kwargs)  # type: ignore[arg-type]
+
+    def test_type_error(self) -> None:
+        """str 以外は parse_symbol と同様に TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            GrammarRegistry.default().parse(7203)  # type: ignore[arg-type]
+
+    def test_metrics(self) -> None:
+        """メトリクス有効時も振り分けた文法で検査・生成して記録する."""
+        registry = GrammarRegistry((*BUILTIN_GRAMMARS, _SHORT_FUTURE))
+        future = parse_symbol("XJPX:NK:20250314:F")
+        error = verdict(parse_symbol, "XJPX:NK:20250314:C")
+        reset_metrics()
+        enable_metrics()
+        try:
+            assert registry.parse("XJPX:NK:20250314") == future
+            assert verdict(registry.parse, "XJPX:NK:20250314:C") == error
+        finally:
+            disable_metrics()
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_count == 1
+        assert snapshot.parse_errors[ErrorCode.OPTION_WITHOUT_STRIKE] == 1
+        reset_metrics()
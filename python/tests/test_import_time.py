@@ -0,0 +1,160 @@
+"""パッケージの遅延ロードとインポート時間のテスト.
+
+``import marketsymbol`` がサブモジュールを読み込まないこと、
+公開 API へのアクセスで必要なモジュールのみがロードされること、
+および ``-X importtime`` で計測したインポート時間が予算内に収まることを検証する。
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import marketsymbol
+
+# インポート時間の予算 (マイクロ秒, -X importtime の cumulative 値)
+# サブモジュールを一切読み込まない素の `import marketsymbol` の予算
+PACKAGE_IMPORT_BUDGET_US = 5_000
+# `from marketsymbol import parse_symbol` で読み込む parser とその依存の予算
+# (計測用の metrics・tracing と threading を含まない)
+PARSER_IMPORT_BUDGET_US = 60_000
+
+# 計測ノイズを抑えるため複数回計測して最小値を採用する
+IMPORT_TIME_RUNS = 5
+
+# サブプロセスからも検証対象のソースツリーをインポートできるようにする
+_SOURCE_ROOT = str(Path(marketsymbol.__file__).resolve().parent.parent)
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """新しいインタープリタで code を実行する."""
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SOURCE_ROOT},
+    )
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """statement 実行後に新たにロードされたモジュール名の集合を返す."""
+    code = (
+        "import json, sys\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    return set(json.loads(_run_python(code).stdout))
+
+
+def _cumulative_import_us(module: str) -> int:
+    """-X importtime の出力から module の cumulative 時間 (us) を返す."""
+    stderr = _run_python(f"import {module}", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        # 形式: "import time:  self [us] |  cumulative | imported package"
+        _, _, rest = line.partition(":")
+        fields = [field.strip() for field in rest.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    msg = f"{module} not found in -X importtime output"
+    raise AssertionError(msg)
+
+
+class TestLazyPackage:
+    """marketsymbol パッケージの遅延ロードのテスト."""
+
+    def test_import_loads_no_submodules(self) -> None:
+        """import marketsymbol はサブモジュールをロードしない."""
+        loaded = _loaded_modules("import marketsymbol")
+        assert loaded == {"marketsymbol"}
+
+    def test_enums_only(self) -> None:
+        """列挙型のみの利用では enums 以外をロードしない."""
+        loaded = _loaded_modules("from marketsymbol import AssetClass, OptionType")
+        assert "marketsymbol.enums" in loaded
+        assert loaded.isdisjoint(
+            {
+                "marketsymbol.adapter",
+                "marketsymbol.parser",
+                "marketsymbol.symbol",
+                "marketsymbol.validator",
+            }
+        )
+
+    def test_symbol_does_not_load_parser_or_adapter(self) -> None:
+        """EquitySymbol の利用では parser/adapter とその依存をロードしない."""
+        loaded = _loaded_modules("from marketsymbol import EquitySymbol")
+        assert "marketsymbol.symbol" in loaded
+        assert loaded.isdisjoint(
+            {
+                "marketsymbol.adapter",
+                "marketsymbol.parser",
+                "threading",
+                "unicodedata",
+                "calendar",
+            }
+        )
+
+    def test_parse_does_not_load_instrumentation(self) -> None:
+        """計測が無効なパースは metrics・tracing とその依存をロードしない."""
+        loaded = _loaded_modules(
+            "from marketsymbol import parse_symbol\nparse_symbol('XJPX:7203')"
+        )
+        assert "marketsymbol.parser" in loaded
+        assert loaded.isdisjoint(
+            {"marketsymbol.metrics", "marketsymbol.tracing", "threading"}
+        )
+
+    @pytest.mark.parametrize("name", marketsymbol.__all__)
+    def test_all_names_resolve(self, name: str) -> None:
+        """__all__ の全ての名前が解決できる."""
+        assert getattr(marketsymbol, name) is not None
+
+    def test_resolved_object_is_identical(self) -> None:
+        """遅延ロードされた属性は定義元モジュールの属性と同一."""
+        from marketsymbol.parser import parse_symbol
+
+        assert marketsymbol.parse_symbol is parse_symbol
+
+    def test_unknown_attribute_raises(self) -> None:
+        """存在しない属性は AttributeError を発生する."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = marketsymbol.no_such_name
+
+    def test_dir_lists_public_api(self) -> None:
+        """dir() は未ロードの公開属性も含む."""
+        assert set(marketsymbol.__all__) <= set(dir(marketsymbol))
+
+
+@pytest.mark.slow
+class TestImportTime:
+    """-X importtime によるインポート時間の回帰テスト."""
+
+    def test_package_import_within_budget(self) -> None:
+        """素の import marketsymbol が予算内に収まる."""
+        elapsed_us = min(
+            _cumulative_import_us("marketsymbol") for _ in range(IMPORT_TIME_RUNS)
+        )
+        assert elapsed_us < PACKAGE_IMPORT_BUDGET_US, (
+            f"import marketsymbol took {elapsed_us}us "
+            f"(budget {PACKAGE_IMPORT_BUDGET_US}us)"
+        )
+
+    def test_parser_import_within_budget(self) -> None:
+        """parse_symbol の利用で読み込む parser とその依存が予算内に収まる.
+
+        __getattr__ 経由の import_module は -X importtime に現れないため、
+        同じモジュールを読み込む import marketsymbol.parser で計測する。
+        """
+        elapsed_us = min(
+            _cumulative_import_us("marketsymbol.parser")
+            for _ in range(IMPORT_TIME_RUNS)
+        )
+        assert elapsed_us < PARSER_IMPORT_BUDGET_US, (
+            f"import marketsymbol.parser took {elapsed_us}us "
+            f"(budget {PARSER_IMPORT_BUDGET_US}us)"
+        )
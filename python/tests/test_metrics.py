@@ -0,0 +1,240 @@
+"""metrics モジュール (ランタイムメトリクス) のテスト."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marketsymbol import (
+    AdapterRegistry,
+    AssetClass,
+    EquitySymbol,
+    ErrorCode,
+    SymbolParseError,
+    parse_symbol,
+)
+from marketsymbol.adapter import BaseAdapter
+from marketsymbol.constants import MAX_SYMBOL_LENGTH
+from marketsymbol.metrics import (
+    MetricsCollector,
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from marketsymbol import Symbol
+
+
+class _SuffixAdapter(BaseAdapter):
+    """'7203.T' 形式のテスト用アダプター."""
+
+    @property
+    def supported_asset_classes(self) -> frozenset[AssetClass]:
+        return frozenset({AssetClass.EQUITY})
+
+    def to_symbol(self, vendor_symbol: str) -> Symbol:
+        code, suffix = vendor_symbol.split(".")
+        if suffix != "T":
+            msg = f"Unknown suffix: {suffix}"
+            raise ValueError(msg)
+        return EquitySymbol(exchange="XJPX", code=code)
+
+    def from_symbol(self, symbol: Symbol) -> str:
+        return f"{symbol.code}.T"
+
+
+@pytest.fixture
+def metrics() -> Iterator[None]:
+    """メトリクスを有効化し、テスト後に無効化・リセットする."""
+    reset_metrics()
+    enable_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+@pytest.fixture
+def registry() -> AdapterRegistry:
+    """テスト用アダプターを登録したレジストリ."""
+    registry = AdapterRegistry()
+    registry.register("suffix", _SuffixAdapter())
+    return registry
+
+
+@pytest.mark.usefixtures("metrics")
+class TestParseMetrics:
+    """parse_symbol の計測のテスト."""
+
+    def test_counts_by_asset_class(self) -> None:
+        """資産クラス別にパース成功数を記録する."""
+        parse_symbol("XJPX:7203")
+        parse_symbol("XJPX:9984")
+        parse_symbol("XJPX:NK:20250314:F")
+        parse_symbol("XJPX:NK:20250314:C:40000")
+        snapshot = metrics_snapshot()
+        assert snapshot.parses[AssetClass.EQUITY] == 2
+        assert snapshot.parses[AssetClass.FUTURE] == 1
+        assert snapshot.parses[AssetClass.OPTION] == 1
+        assert snapshot.parse_count == 4
+        assert snapshot.parse_time_ns > 0
+
+    def test_counts_by_error_code(self) -> None:
+        """ErrorCode 別にパース失敗数を記録し、例外はそのまま送出する."""
+        for raw in ("XX:7203", "XJPX", "XJPX:NK:20250230:F"):
+            with pytest.raises(SymbolParseError):
+                parse_symbol(raw)
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_errors[ErrorCode.UNKNOWN_EXCHANGE] == 1
+        assert snapshot.parse_errors[ErrorCode.INVALID_SEGMENT_COUNT] == 1
+        assert snapshot.parse_errors[ErrorCode.INVALID_DATE] == 1
+        assert snapshot.parse_error_count == 3
+        assert snapshot.parse_count == 0
+
+    def test_counts_too_long(self) -> None:
+        """長すぎるシンボル文字列 (E010) も失敗として記録し、str 以外は記録しない."""
+        with pytest.raises(SymbolParseError):
+            parse_symbol("XJPX:" + "7" * MAX_SYMBOL_LENGTH)
+        with pytest.raises(TypeError):
+            parse_symbol(7203)  # type: ignore[arg-type]
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_errors[ErrorCode.SYMBOL_TOO_LONG] == 1
+        assert snapshot.parse_error_count == 1
+
+    def test_reset(self) -> None:
+        """reset_metrics() でカウンタが 0 に戻る."""
+        parse_symbol("XJPX:7203")
+        reset_metrics()
+        assert metrics_snapshot().parse_count == 0
+        parse_symbol("XJPX:7203")
+        assert metrics_snapshot().parse_count == 1
+
+    def test_aggregates_across_threads(self) -> None:
+        """複数スレッドのカウンタを読み取り時に集計する."""
+        threads_count = 4
+        per_thread = 50
+
+        def worker() -> None:
+            for _ in range(per_thread):
+                parse_symbol("XJPX:7203")
+
+        threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert metrics_snapshot().parses[AssetClass.EQUITY] == (
+            threads_count * per_thread
+        )
+
+    def test_finished_threads_are_retired(self) -> None:
+        """終了したスレッドのカウンタは合計に加算して登録を解除する."""
+        collector = MetricsCollector()
+        collector.record_parse(AssetClass.EQUITY, None, 1)
+
+        def worker() -> None:
+            collector.record_parse(AssetClass.EQUITY, None, 1)
+            collector.record_parse(None, ErrorCode.UNKNOWN_EXCHANGE, 1)
+
+        for _ in range(3):
+            threads = [threading.Thread(target=worker) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        # 生存しているのは呼び出しスレッドのカウンタのみ
+        assert len(collector._counters) == 1
+        snapshot = collector.snapshot()
+        assert snapshot.parses[AssetClass.EQUITY] == 61
+        assert snapshot.parse_errors[ErrorCode.UNKNOWN_EXCHANGE] == 60
+        assert snapshot.parse_time_ns == 121
+
+    def test_reset_discards_retired(self) -> None:
+        """reset 前に記録したスレッドのカウンタは終了後も加算しない."""
+        collector = MetricsCollector()
+        started, finish = threading.Event(), threading.Event()
+
+        def worker() -> None:
+            collector.record_parse(AssetClass.EQUITY, None, 1)
+            started.set()
+            finish.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait()
+        collector.record_parse(AssetClass.FUTURE, None, 1)
+        collector.reset()
+        finish.set()
+        thread.join()
+        assert collector.snapshot().parse_count == 0
+        collector.record_parse(AssetClass.FUTURE, None, 1)
+        assert collector.snapshot().parse_count == 1
+        assert len(collector._counters) == 1
+
+
+class TestDisabled:
+    """無効時の挙動のテスト."""
+
+    def test_disabled_records_nothing(self) -> None:
+        """無効時は何も記録しない."""
+        reset_metrics()
+        parse_symbol("XJPX:7203")
+        assert metrics_snapshot().parse_count == 0
+
+    def test_disable_keeps_values(self) -> None:
+        """disable() は記録済みの値を保持する."""
+        collector = MetricsCollector()
+        collector.enable()
+        collector.record_parse(AssetClass.EQUITY, None, 100)
+        collector.disable()
+        assert collector.snapshot().parse_count == 1
+
+
+@pytest.mark.usefixtures("metrics")
+class TestConversionMetrics:
+    """AdapterRegistry 経由の変換の計測のテスト."""
+
+    def test_counts_by_vendor(self, registry: AdapterRegistry) -> None:
+        """ベンダー別に変換回数を記録する."""
+        symbol = registry.to_symbol("suffix", "7203.T")
+        assert symbol == EquitySymbol(exchange="XJPX", code="7203")
+        assert registry.from_symbol("suffix", symbol) == "7203.T"
+        stats = metrics_snapshot().conversions["suffix"]
+        assert stats.to_symbol == 1
+        assert stats.from_symbol == 1
+        assert stats.calls == 2
+        assert stats.errors == 0
+        assert stats.time_ns > 0
+
+    def test_counts_errors(self, registry: AdapterRegistry) -> None:
+        """変換失敗を記録し、例外はそのまま送出する."""
+        with pytest.raises(ValueError, match="suffix"):
+            registry.to_symbol("suffix", "7203.X")
+        assert metrics_snapshot().conversions["suffix"].errors == 1
+
+    def test_unknown_vendor(self, registry: AdapterRegistry) -> None:
+        """未登録ベンダーは KeyError (変換統計には記録しない)."""
+        with pytest.raises(KeyError):
+            registry.to_symbol("unknown", "7203.T")
+        assert "unknown" not in metrics_snapshot().conversions
+
+
+class TestSnapshotExport:
+    """MetricsSnapshot.to_dict() のテスト."""
+
+    @pytest.mark.usefixtures("metrics")
+    def test_to_dict(self, registry: AdapterRegistry) -> None:
+        """列挙型の値をキーにした JSON 互換の dict を返す."""
+        parse_symbol("XJPX:7203")
+        with pytest.raises(SymbolParseError):
+            parse_symbol("XJPX")
+        registry.to_symbol("suffix", "7203.T")
+        data = metrics_snapshot().to_dict()
+        assert data["parse"]["by_asset_class"]["equity"] == 1
+        assert data["parse"]["errors"]["E004"] == 1
+        assert data["conversions"]["suffix"]["to_symbol"] == 1
@@ -1,14 +1,30 @@
 """parser モジュールのテスト.
 
-normalize_symbol と parse_symbol のテストを含む。
+normalize_symbol、parse_symbol と資産クラスを限定したパース関数
+(parse_equity / parse_future / parse_option) のテストを含む。
 """
 
+import pickle
+
 import pytest
 
 from marketsymbol.enums import AssetClass, OptionType
 from marketsymbol.errors import ErrorCode, SymbolParseError
-from marketsymbol.parser import normalize_symbol, parse_symbol
-from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol
+from marketsymbol.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from marketsymbol.parser import (
+    normalize_symbol,
+    parse_equity,
+    parse_future,
+    parse_option,
+    parse_symbol,
+)
+from marketsymbol.symbol import EquitySymbol, FutureSymbol, OptionSymbol, Symbol
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
 
 
 class TestNormalizeSymbol:
@@ -267,6 +283,15 @@ class TestParseSymbolErrors:
         with pytest.raises(TypeError):
             parse_symbol(12345)  # type: ignore[arg-type]
 
+    def test_validation_error_not_chained(self) -> None:
+        """フィールド検証の失敗は SymbolParseError を1回だけ生成する (連鎖なし)."""
+        with pytest.raises(SymbolParseError) as exc_info:
+            parse_symbol("XX:7203")
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.message == (
+            "Invalid exchange code: 'XX' (must be 4 uppercase letters)"
+        )
+
     def test_raw_symbol_in_error(self) -> None:
         """エラーに raw_symbol が含まれる."""
         with pytest.raises(SymbolParseError) as exc_info:
@@ -353,3 +378,124 @@ class TestParseSymbolEdgeCases:
         result = parse_symbol(symbol)
         assert isinstance(result, EquitySymbol)
         assert result.code == long_code
+
+
+# 資産クラスを限定したパース関数 -> 受け付ける Symbol の型
+_SHAPED_PARSERS: list[tuple[object, type[Symbol]]] = [
+    (parse_equity, EquitySymbol),
+    (parse_future, FutureSymbol),
+    (parse_option, OptionSymbol),
+]
+
+
+def _verdict(parse: object, raw: str) -> object:
+    """parse(raw) の結果、または (エラーコード, メッセージ) を返す."""
+    try:
+        return parse(raw)  # type: ignore[operator]
+    except SymbolParseError as e:
+        return e.error_code, str(e)
+
+
+class TestShapedParsers:
+    """parse_equity / parse_future / parse_option のテスト."""
+
+    @pytest.mark.parametrize(("parse", "symbol_type"), _SHAPED_PARSERS)
+    def test_differential(self, parse: object, symbol_type: type[Symbol]) -> None:
+        """parse_symbol と一致する (他の資産クラスの有効なシンボルは E004 / E006)."""
+        mismatches = []
+        for raw in _SEED_SYMBOLS + _mutations(3000):
+            expected = _verdict(parse_symbol, raw)
+            actual = _verdict(parse, raw)
+            if isinstance(expected, Symbol) and not isinstance(expected, symbol_type):
+                ok = isinstance(actual, tuple) and actual[0] in (
+                    ErrorCode.INVALID_SEGMENT_COUNT,
+                    ErrorCode.INVALID_OPTION_TYPE,
+                )
+            else:
+                ok = actual == expected and type(actual) is type(expected)
+            if not ok:
+                mismatches.append(raw)
+        assert not mismatches
+
+    def test_typed_results(self) -> None:
+        """資産クラスに対応する型の Symbol を返す."""
+        assert parse_equity("xjpx:7203") == EquitySymbol(exchange="XJPX", code="7203")
+        assert parse_future("XJPX:NK:20250314:F").expiry == "20250314"
+        assert parse_option("XJPX:N225O:20250314:P:42000").strike == 42000
+        assert parse_option("XJPX:N225O:20250314:O").option_type is OptionType.SERIES
+
+    @pytest.mark.parametrize(
+        ("parse", "raw"),
+        [
+            (parse_equity, "XJPX:7203"),
+            (parse_future, "XJPX:NK:20250314:F"),
+            (parse_option, "XJPX:N225O:20250314:C:42000"),
+        ],
+    )
+    def test_results_behave_like_parsed(self, parse: object, raw: str) -> None:
+        """生成した Symbol は parse_symbol の結果と同様に不変・ハッシュ可能・pickle 可能."""
+        expected = parse_symbol(raw)
+        symbol = parse(raw)  # type: ignore[operator]
+        assert hash(symbol) == hash(expected)
+        assert pickle.loads(pickle.dumps(symbol)) == expected
+        with pytest.raises(AttributeError):
+            symbol.code = "X"
+
+    @pytest.mark.parametrize(
+        ("parse", "raw", "message"),
+        [
+            (
+                parse_equity,
+                "XJPX:NK:20250314:F",
+                "[E004] Invalid segment count: 4 (expected 2 for equity)",
+            ),
+            (
+                parse_future,
+                "XJPX:7203",
+                "[E004] Invalid segment count: 2 (expected 4 for future)",
+            ),
+            (
+                parse_future,
+                "XJPX:N225O:20250314:C:42000",
+                "[E006] Type 'C' is not a future (expected F)",
+            ),
+            (
+                parse_option,
+                "XJPX:NK:20250314:F",
+                "[E006] Type 'F' is not an option (expected C, P, or O)",
+            ),
+        ],
+    )
+    def test_other_asset_class(self, parse: object, raw: str, message: str) -> None:
+        """他の資産クラスの有効なシンボルはセグメント数・タイプ識別子のエラー."""
+        assert str(_verdict(parse, raw)[1]) == message  # type: ignore[index]
+
+    def test_parse_symbol_error_precedence(self) -> None:
+        """無効なシンボルは資産クラスによらず parse_symbol と同じエラー."""
+        assert _verdict(parse_equity, "XX:NK:20250314:F") == _verdict(
+            parse_symbol, "XX:NK:20250314:F"
+        )
+        assert _verdict(parse_future, "XJPX:NK:20250314:F:100") == _verdict(
+            parse_symbol, "XJPX:NK:20250314:F:100"
+        )
+
+    @pytest.mark.parametrize("parse", [parse_equity, parse_future, parse_option])
+    def test_type_error(self, parse: object) -> None:
+        """str 以外は TypeError."""
+        with pytest.raises(TypeError, match="Expected str"):
+            parse(7203)  # type: ignore[operator]
+
+    def test_metrics(self) -> None:
+        """メトリクス有効時も同じ検査で記録する."""
+        reset_metrics()
+        enable_metrics()
+        try:
+            assert isinstance(parse_future("XJPX:NK:20250314:F"), FutureSymbol)
+            with pytest.raises(SymbolParseError):
+                parse_equity("XJPX:NK:20250314:F")
+        finally:
+            disable_metrics()
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_count == 1
+        assert snapshot.parse_errors[ErrorCode.INVALID_SEGMENT_COUNT] == 1
+        reset_metrics()
@@ -0,0 +1,176 @@
+"""pattern モジュール (SymbolPattern) のテスト."""
+
+import fnmatch
+import pickle
+
+import pytest
+
+from marketsymbol import SubscriptionRouter, SymbolPattern, parse_symbol
+
+# 照合の対象 (資産クラス・取引所・限月・種別・権利行使価格の組み合わせ)
+_SYMBOLS = [
+    "XJPX:7203",
+    "XJPX:6758",
+    "XOSE:7203",
+    "XJPX:NK:20250314:F",
+    "XJPX:NK:20250613:F",
+    "XOSE:NKM:20250314:F",
+    "XJPX:N225O:20250314:O",
+    "XJPX:N225O:20250314:C:40000",
+    "XJPX:N225O:20250314:C:42000",
+    "XJPX:N225O:20250314:P:42000",
+    "XJPX:N225O:20250411:C:45000",
+    "XJPX:N225W:20250307:C:41000",
+]
+
+
+def _matched(pattern: str) -> list[str]:
+    """_SYMBOLS のうちパターンに一致するものを返す."""
+    return [str(s) for s in SymbolPattern(pattern).filter(_SYMBOLS)]
+
+
+class TestSymbolPattern:
+    """パターンの解析と照合."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*:*",
+            "XJPX:*",
+            "*:7203",
+            "XJPX:*:*:*",
+            "*:NK:*:F",
+            "*:*:*:O",
+            "XJPX:N225O:202503*:C:*",
+            "XJPX:N225?:*:C:*",
+            "X*:N*:2025*:*",
+            "*:*:*:*:*",
+            "*:*:*:P:42000",
+        ],
+    )
+    def test_same_as_fnmatch(self, pattern: str) -> None:
+        """範囲を含まないパターンはセグメントごとの fnmatch と同じ結果となる."""
+        symbols = [parse_symbol(raw) for raw in _SYMBOLS]
+        parts = pattern.split(":")
+        expected = [
+            str(s)
+            for s in symbols
+            if len(segments := str(s).split(":")) == len(parts)
+            and all(map(fnmatch.fnmatchcase, segments, parts))
+        ]
+        assert [str(s) for s in SymbolPattern(pattern).filter(symbols)] == expected
+        assert _matched(pattern) == expected
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (
+                "XJPX:N225O:*:C:40000-42000",
+                ["XJPX:N225O:20250314:C:40000", "XJPX:N225O:20250314:C:42000"],
+            ),
+            ("*:*:*:C:43000-", ["XJPX:N225O:20250411:C:45000"]),
+            ("*:*:*:*:-40000", ["XJPX:N225O:20250314:C:40000"]),
+            (
+                "*:*:20250301-20250331:F",
+                ["XJPX:NK:20250314:F", "XOSE:NKM:20250314:F"],
+            ),
+            ("*:*:20250401-:F", ["XJPX:NK:20250613:F"]),
+            (
+                "*:*:-20250310:C:*",
+                ["XJPX:N225W:20250307:C:41000"],
+            ),
+        ],
+    )
+    def test_ranges(self, pattern: str, expected: list[str]) -> None:
+        """限月・権利行使価格の範囲 (両端を含む、片側のみも可)."""
+        assert _matched(pattern) == expected
+
+    def test_matches(self) -> None:
+        """Symbol と文字列のいずれも照合し、無効な文字列は一致しない."""
+        pattern = SymbolPattern("xjpx:n225o:202503*:c:*")
+        assert pattern.pattern == "XJPX:N225O:202503*:C:*"
+        assert pattern.segment_count == 5
+        assert pattern.matches(parse_symbol("XJPX:N225O:20250314:C:42000"))
+        assert pattern.matches(" xjpx:n225o:20250314:c:42000 ")
+        assert not pattern.matches("XJPX:N225O:20250314:P:42000")
+        # パターンには一致するが parse_symbol では無効
+        assert not pattern.matches("XJPX:N225O:20250332:C:42000")
+        assert not pattern.matches("XJPX:N225O:20250314:C:ABC")
+        # 権利行使価格は整数として比較する
+        assert SymbolPattern("*:*:*:C:42000").matches("XJPX:N225O:20250314:C:042000")
+        assert not pattern.matches("XJPX:N225O:20250314:C:" + "1" * 100)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "XJPX:N225O:20250314:C:+42000",
+            "XJPX:N225O:20250314:C:4_2000",
+            "XJPX:N225O:20250314:C:+042000",
+            "XJPX:N225O:20250314:C:\u0664\u0662\u0660\u0660\u0660",
+        ],
+    )
+    def test_strike_spellings(self, raw: str) -> None:
+        """parse_symbol が受け付ける strike の表記は Symbol と同じく照合する."""
+        pattern = SymbolPattern("XJPX:N225O:*:C:40000-45000")
+        assert pattern.matches(parse_symbol(raw))
+        assert pattern.matches(raw)
+        router = SubscriptionRouter()
+        router.subscribe("client", pattern)
+        assert router.route(raw) == {"client"}
+
+    def test_wildcard_within_segment(self) -> None:
+        """'*' はセグメントをまたがない (str(symbol) に対する fnmatch との違い)."""
+        symbol = parse_symbol("XJPX:NK:20250314:F")
+        assert fnmatch.fnmatchcase(str(symbol), "XJPX:*")
+        assert not SymbolPattern("XJPX:*").matches(symbol)
+        assert SymbolPattern("XJPX:*:*:*").matches(symbol)
+
+    def test_shape(self) -> None:
+        """セグメント数と種別で資産クラスを区別する."""
+        assert _matched("*:*:*:F") == [
+            "XJPX:NK:20250314:F",
+            "XJPX:NK:20250613:F",
+            "XOSE:NKM:20250314:F",
+        ]
+        assert _matched("*:*:*:*") == [*_matched("*:*:*:F"), "XJPX:N225O:20250314:O"]
+        assert SymbolPattern("*:*").matches(parse_symbol("XJPX:7203"))
+        assert not SymbolPattern("*:*").matches(parse_symbol("XJPX:NK:20250314:F"))
+
+    def test_filter_parses_strings(self) -> None:
+        """filter は一致した文字列を Symbol にして返す."""
+        pattern = SymbolPattern("XJPX:*")
+        assert list(pattern.filter(["xjpx:7203", "XJPX:72-03", "XOSE:7203"])) == [
+            parse_symbol("XJPX:7203")
+        ]
+
+    def test_equality_and_pickle(self) -> None:
+        """正規化したパターン文字列で比較し、pickle 後も同じく照合する."""
+        pattern = SymbolPattern("*:nk:*:f")
+        assert pattern == SymbolPattern("*:NK:*:F")
+        assert hash(pattern) == hash(SymbolPattern("*:NK:*:F"))
+        restored = pickle.loads(pickle.dumps(pattern))
+        assert restored == pattern
+        assert _matched(restored.pattern) == _matched(pattern.pattern)
+
+    @pytest.mark.parametrize(
+        ("pattern", "message"),
+        [
+            ("XJPX", "1 segments"),
+            ("*:*:*", "3 segments"),
+            ("XX:*", "exchange 'XX'"),
+            ("XJPX:72-03", "code '72-03'"),
+            ("XJPX:7[0-9]*", "code '7\\[0-9\\]\\*'"),
+            ("*:*:20250230:F", "expiry '20250230'"),
+            ("*:*:2025*03:F", "expiry '2025\\*03'"),
+            ("*:*:20250331-20250301:F", "range is empty"),
+            ("*:*:-:F", "at least one bound"),
+            ("*:*:*:C", "type 'C'"),
+            ("*:*:*:F:*", "type 'F'"),
+            ("*:*:*:C:4*", "strike '4\\*'"),
+            ("*:*:*:C:45000-40000", "range is empty"),
+        ],
+    )
+    def test_invalid(self, pattern: str, message: str) -> None:
+        """不正なパターンは ValueError."""
+        with pytest.raises(ValueError, match=f"Invalid pattern .*{message}"):
+            SymbolPattern(pattern)
@@ -1,82 +1,96 @@
 """パフォーマンステスト (SC-PY-007 対応).
 
-parse_symbol の処理時間が 1ms (0.001秒) 以内で完了することを検証する。
+marketsymbol.bench のケースを短時間で計測し、
+コミット済みベースライン (marketsymbol/bench/baseline.json) と比較する。
+マシン性能の差はキャリブレーション値で正規化するため、
+絶対時間ではなく相対的な劣化 (回帰) を検出できる。
+
+ベースラインとの比較は計測するマシンの負荷に左右されるため、
+環境変数 MARKETSYMBOL_PERF_BASELINE=1 を指定した場合のみ実行する。
 """
 
-import time
+import os
 
 import pytest
 
-from marketsymbol import normalize_symbol, parse_symbol
+from marketsymbol.bench import (
+    DEFAULT_BASELINE_PATH,
+    BenchmarkReport,
+    ComparisonStatus,
+    compare_reports,
+    default_cases,
+    run_benchmarks,
+)
+
+# パフォーマンス要件 (SC-PY-007): 1ms = 1,000,000ns
+MAX_PARSE_TIME_NS = 1_000_000
+
+# ベースライン比較の許容幅 (1.0 = 正規化後 2 倍までの劣化を許容)
+# CI 環境のノイズを考慮し、ベンチマーク CLI の既定値より緩めに設定する
+REGRESSION_TOLERANCE = 1.0
+
+# ベースラインとの比較を有効にする環境変数
+_BASELINE_ENV = "MARKETSYMBOL_PERF_BASELINE"
+
+baseline_comparison = pytest.mark.skipif(
+    os.environ.get(_BASELINE_ENV) != "1",
+    reason=f"set {_BASELINE_ENV}=1 to compare against the committed baseline",
+)
+
+# テスト用の短時間計測設定
+_SAMPLES = 15
+_SAMPLE_TIME_NS = 500_000
+
+
+def _run(prefix: str) -> BenchmarkReport:
+    """prefix で始まるケースを短時間計測する."""
+    cases = [case for case in default_cases() if case.name.startswith(prefix)]
+    assert cases, f"no benchmark cases for {prefix!r}"
+    return run_benchmarks(cases, samples=_SAMPLES, sample_time_ns=_SAMPLE_TIME_NS)
 
-# パフォーマンス要件: 1ms = 0.001秒
-MAX_PARSE_TIME_SECONDS = 0.001
+
+def _assert_no_regression(report: BenchmarkReport) -> None:
+    """ベースラインに対する回帰がないことを検証する."""
+    baseline = BenchmarkReport.load(DEFAULT_BASELINE_PATH)
+    comparisons = compare_reports(report, baseline, tolerance=REGRESSION_TOLERANCE)
+    regressions = [
+        f"{c.name}: {c.ratio:.2f}x"
+        for c in comparisons
+        if c.status is ComparisonStatus.REGRESSION
+    ]
+    assert not regressions, f"performance regression: {regressions}"
 
 
 @pytest.mark.slow
 class TestParseSymbolPerformance:
     """parse_symbol のパフォーマンステスト."""
 
-    @pytest.mark.parametrize(
-        "symbol",
-        [
-            "XJPX:7203",  # Equity
-            "XJPX:NK:20250314:F",  # Future
-            "XJPX:N225O:20250314:C:42000",  # Option
-            "XJPX:N225O:20250314:O",  # Option series
-        ],
-        ids=["equity", "future", "option", "series"],
-    )
-    def test_parse_symbol_under_1ms(self, symbol: str) -> None:
-        """parse_symbol が 1ms 以内で完了する.
-
-        Args:
-            symbol: テスト対象のシンボル文字列.
-        """
-        # Warm up - キャッシュ、遅延インポート、正規表現コンパイルの影響を排除
-        for _ in range(100):
-            parse_symbol(symbol)
-
-        # 測定: 1000 回実行して平均を取る
-        iterations = 1000
-        start = time.perf_counter()
-        for _ in range(iterations):
-            parse_symbol(symbol)
-        elapsed = time.perf_counter() - start
-        average_time = elapsed / iterations
-
-        assert average_time < MAX_PARSE_TIME_SECONDS, (
-            f"parse_symbol('{symbol}') took {average_time * 1000:.3f}ms "
-            f"(expected < {MAX_PARSE_TIME_SECONDS * 1000}ms)"
-        )
-
-    @pytest.mark.parametrize(
-        "symbol",
-        [
-            pytest.param("xjpx:7203", id="lowercase"),
-            pytest.param("ＸＪＰＸ：７２０３", id="fullwidth"),  # noqa: RUF001
-            pytest.param("  XJPX:7203  ", id="whitespace"),
-        ],
-    )
-    def test_normalize_symbol_under_1ms(self, symbol: str) -> None:
-        """normalize_symbol が 1ms 以内で完了する.
-
-        Args:
-            symbol: テスト対象のシンボル文字列.
-        """
-        # Warm up - キャッシュ、遅延インポート、正規表現コンパイルの影響を排除
-        for _ in range(100):
-            normalize_symbol(symbol)
-
-        # 測定: 1000 回実行して平均を取る
-        iterations = 1000
-        start = time.perf_counter()
-        for _ in range(iterations):
-            normalize_symbol(symbol)
-        elapsed = time.perf_counter() - start
-        average_time = elapsed / iterations
-
-        assert average_time < MAX_PARSE_TIME_SECONDS, (
-            f"normalize_symbol('{symbol}') took {average_time * 1000:.3f}ms "
-            f"(expected < {MAX_PARSE_TIME_SECONDS * 1000}ms)"
-        )
+    def test_parse_symbol_under_1ms(self) -> None:
+        """parse_symbol が正常系・異常系とも p99 で 1ms 以内に完了する."""
+        report = _run("parse_symbol.")
+        for result in report.results.values():
+            assert result.p99_ns < MAX_PARSE_TIME_NS, (
+                f"{result.name} p99 {result.p99_ns / 1000:.1f}us "
+                f"(expected < {MAX_PARSE_TIME_NS / 1000:.0f}us)"
+            )
+
+    @baseline_comparison
+    def test_parse_symbol_no_regression(self) -> None:
+        """parse_symbol がベースラインから劣化していない."""
+        _assert_no_regression(_run("parse_symbol."))
+
+
+@pytest.mark.slow
+class TestNormalizeSymbolPerformance:
+    """normalize_symbol のパフォーマンステスト."""
+
+    def test_normalize_symbol_under_1ms(self) -> None:
+        """normalize_symbol が p99 で 1ms 以内に完了する."""
+        report = _run("normalize_symbol.")
+        for result in report.results.values():
+            assert result.p99_ns < MAX_PARSE_TIME_NS
+
+    @baseline_comparison
+    def test_normalize_symbol_no_regression(self) -> None:
+        """normalize_symbol がベースラインから劣化していない."""
+        _assert_no_regression(_run("normalize_symbol."))
@@ -0,0 +1,185 @@
+"""policy モジュール (ParserPolicy) のテスト."""
+
+import warnings
+
+import pytest
+
+from marketsymbol import (
+    ErrorCode,
+    ParserPolicy,
+    PolicyMode,
+    SymbolParseError,
+    SymbolPolicyWarning,
+    parse_symbol,
+)
+from marketsymbol.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
+
+_KNOWN_EXCHANGES = {"XJPX"}
+_KNOWN_CODES = {"NK", "N225O"}
+
+
+def _verdict(parse: object, raw: str) -> object:
+    """parse(raw) の結果、または (エラーコード, メッセージ) を返す."""
+    try:
+        return parse(raw)  # type: ignore[operator]
+    except SymbolParseError as e:
+        return e.error_code, str(e)
+
+
+def _error_code(parse: object, raw: str) -> ErrorCode | None:
+    """parse(raw) が送出したエラーコード (成功時は None) を返す."""
+    try:
+        parse(raw)  # type: ignore[operator]
+    except SymbolParseError as e:
+        return e.error_code
+    return None
+
+
+class TestCompile:
+    """compile() のテスト."""
+
+    def test_default_policy_is_parse_symbol(self) -> None:
+        """既定のポリシーは parse_symbol 自体を返す."""
+        assert ParserPolicy().compile() is parse_symbol
+        assert ParserPolicy.lenient().compile() is parse_symbol
+
+    def test_compiled_parser_is_reused(self) -> None:
+        """同じポリシーのコンパイル結果は再利用する."""
+        first = ParserPolicy.strict(known_exchanges=["XJPX"]).compile()
+        assert ParserPolicy.strict(known_exchanges=("XJPX",)).compile() is first
+
+    def test_lenient_known_values_match_parse_symbol(self) -> None:
+        """LENIENT では既知の値を指定しても parse_symbol と一致する."""
+        parse = ParserPolicy(
+            known_exchanges=frozenset(_KNOWN_EXCHANGES),
+            known_codes=frozenset(_KNOWN_CODES),
+        ).compile()
+        mismatches = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(3000)
+            if _verdict(parse, raw) != _verdict(parse_symbol, raw)
+        ]
+        assert not mismatches
+
+
+class TestStrict:
+    """STRICT モードのテスト."""
+
+    def test_unknown_exchange(self) -> None:
+        """未知の取引所は E007."""
+        parse = ParserPolicy.strict(known_exchanges=_KNOWN_EXCHANGES).compile()
+        assert parse("XJPX:7203").exchange == "XJPX"
+        with pytest.raises(SymbolParseError, match="Unknown exchange") as exc_info:
+            parse("XOSE:7203")
+        assert exc_info.value.error_code is ErrorCode.UNKNOWN_EXCHANGE
+        assert exc_info.value.raw_symbol == "XOSE:7203"
+
+    def test_unknown_code(self) -> None:
+        """未知の商品コードは E008 (株式のコードは対象外)."""
+        parse = ParserPolicy.strict(known_codes=_KNOWN_CODES).compile()
+        assert _error_code(parse, "XJPX:NK:20250314:F") is None
+        assert _error_code(parse, "XJPX:7203") is None
+        assert _error_code(parse, "XJPX:NKM:20250314:F") is ErrorCode.INVALID_CODE
+
+    def test_format_errors_take_precedence(self) -> None:
+        """形式の検査は既知の値の検査より先に行う (エラーは parse_symbol と同じ)."""
+        parse = ParserPolicy.strict(known_exchanges=_KNOWN_EXCHANGES).compile()
+        assert _verdict(parse, "XX:7203") == _verdict(parse_symbol, "XX:7203")
+
+    @pytest.mark.parametrize(
+        ("raw", "error_code"),
+        [
+            ("XJPX:N:20250314:F", ErrorCode.INVALID_CODE),
+            ("XJPX:NK:20250314:F", None),
+            ("XJPX:NIKKEI:20250314:F", None),
+            ("XJPX:NIKKEI2:20250314:F", ErrorCode.INVALID_CODE),
+            ("XJPX:N:20250314:C:100", ErrorCode.INVALID_CODE),
+            ("XJPX:NIKKEI225O:20250314:O", None),
+            ("XJPX:7:20250314:X", ErrorCode.INVALID_OPTION_TYPE),
+            ("XJPX:7", None),
+        ],
+    )
+    def test_asset_class_code_lengths(
+        self, raw: str, error_code: ErrorCode | None
+    ) -> None:
+        """先物は 2-6 文字、オプションは 2-10 文字、株式は 1-10 文字."""
+        parse = ParserPolicy.strict().compile()
+        assert _error_code(parse, raw) is error_code
+
+    def test_code_length_message(self) -> None:
+        """コード長のエラーメッセージは資産クラスごとの範囲を含む."""
+        with pytest.raises(SymbolParseError, match="must be 2-6 characters"):
+            ParserPolicy.strict().compile()("XJPX:NIKKEI2:20250314:F")
+
+
+class TestWarn:
+    """WARN モードのテスト."""
+
+    def test_unknown_values_warn(self) -> None:
+        """未知の取引所・商品コードは警告してパースを続行する."""
+        parse = ParserPolicy.warn(
+            known_exchanges=_KNOWN_EXCHANGES, known_codes=_KNOWN_CODES
+        ).compile()
+        with pytest.warns(SymbolPolicyWarning) as record:
+            symbol = parse("XOSE:NKM:20250314:F")
+        assert symbol.exchange == "XOSE"
+        assert [w.message.error_code for w in record] == [  # type: ignore[union-attr]
+            ErrorCode.UNKNOWN_EXCHANGE,
+            ErrorCode.INVALID_CODE,
+        ]
+        assert record[0].filename == __file__
+
+    def test_warning_location_with_metrics(self) -> None:
+        """メトリクスの有効時 (計測するパースを経由) も警告の発行位置は呼び出し元."""
+        parse = ParserPolicy.warn(known_exchanges=_KNOWN_EXCHANGES).compile()
+        enable_metrics()
+        try:
+            with pytest.warns(SymbolPolicyWarning) as record:
+                parse("XOSE:7203")
+        finally:
+            disable_metrics()
+            reset_metrics()
+        assert record[0].filename == __file__
+
+    def test_known_values_do_not_warn(self) -> None:
+        """既知の値は警告しない."""
+        parse = ParserPolicy.warn(known_exchanges=_KNOWN_EXCHANGES).compile()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            parse("XJPX:NK:20250314:F")
+
+    def test_per_field_modes(self) -> None:
+        """取引所と商品コードで異なるモードを指定できる."""
+        parse = ParserPolicy(
+            unknown_exchange=PolicyMode.WARN,
+            unknown_code=PolicyMode.STRICT,
+            known_exchanges=frozenset(_KNOWN_EXCHANGES),
+            known_codes=frozenset(_KNOWN_CODES),
+        ).compile()
+        with pytest.warns(SymbolPolicyWarning, match="E007"):
+            parse("XOSE:NK:20250314:F")
+        assert _error_code(parse, "XJPX:NKM:20250314:F") is ErrorCode.INVALID_CODE
+
+
+class TestInstrumentation:
+    """メトリクス有効時のテスト."""
+
+    def test_metrics_record_policy_errors(self) -> None:
+        """メトリクス有効時もポリシーの検査を適用して記録する."""
+        parse = ParserPolicy.strict(known_exchanges=_KNOWN_EXCHANGES).compile()
+        reset_metrics()
+        enable_metrics()
+        try:
+            assert _error_code(parse, "XOSE:7203") is ErrorCode.UNKNOWN_EXCHANGE
+        finally:
+            disable_metrics()
+        snapshot = metrics_snapshot()
+        assert snapshot.parse_errors[ErrorCode.UNKNOWN_EXCHANGE] == 1
+        assert snapshot.parse_error_count == 1
+        reset_metrics()
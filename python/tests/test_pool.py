@@ -0,0 +1,132 @@
+"""pool モジュール (Symbol のインターン) のテスト."""
+
+import pickle
+import threading
+
+import pytest
+
+from marketsymbol import (
+    EquitySymbol,
+    FutureSymbol,
+    OptionSymbol,
+    OptionType,
+    SymbolParseError,
+    SymbolPool,
+    parse_symbol,
+)
+from marketsymbol.pool import SYMBOL_POOL, intern_symbol
+
+
+class TestIntern:
+    """SymbolPool.intern() のテスト."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        ["XJPX:7203", "XJPX:NK:20250314:F", "XJPX:N225O:20250314:C:42000"],
+    )
+    def test_returns_canonical_instance(self, raw: str) -> None:
+        """値が等しい Symbol には同一インスタンスを返す."""
+        pool = SymbolPool()
+        first = pool.intern(parse_symbol(raw))
+        second = pool.intern(parse_symbol(raw))
+        assert first is second
+        assert first == parse_symbol(raw)
+        assert len(pool) == 1
+
+    def test_shares_component_strings(self) -> None:
+        """異なる銘柄の間でも構成文字列を共有する."""
+        pool = SymbolPool()
+        call = pool.parse("XJPX:N225O:20250314:C:42000")
+        put = pool.parse("XJPX:N225O:20250314:P:42000")
+        future = pool.parse("XJPX:N225O:20250314:F")
+        assert isinstance(call, OptionSymbol)
+        assert isinstance(put, OptionSymbol)
+        assert isinstance(future, FutureSymbol)
+        assert call is not put
+        assert call.exchange is put.exchange is future.exchange
+        assert call.code is put.code is future.code
+        assert call.expiry is put.expiry is future.expiry
+        assert pool.string_count == 3
+
+    def test_parse_normalizes(self) -> None:
+        """parse() は正規化後の値で同一インスタンスを返す."""
+        pool = SymbolPool()
+        assert pool.parse("xjpx:7203") is pool.parse("  XJPX:7203 ")
+
+    def test_parse_error(self) -> None:
+        """parse() はパース失敗時に SymbolParseError を送出し、何も登録しない."""
+        pool = SymbolPool()
+        with pytest.raises(SymbolParseError):
+            pool.parse("XX:7203")
+        assert len(pool) == 0
+
+    def test_intern_all(self) -> None:
+        """intern_all() は各要素を正規インスタンスに置き換える."""
+        pool = SymbolPool()
+        symbols = [EquitySymbol(exchange="XJPX", code="7203") for _ in range(3)]
+        interned = pool.intern_all(symbols)
+        assert interned[0] is interned[1] is interned[2]
+
+    def test_series_option(self) -> None:
+        """SERIES オプションも正規化できる."""
+        pool = SymbolPool()
+        symbol = OptionSymbol(
+            exchange="XJPX",
+            code="N225O",
+            expiry="20250314",
+            option_type=OptionType.SERIES,
+            strike=None,
+        )
+        assert pool.intern(symbol) == symbol
+
+    def test_deserialized_symbols(self) -> None:
+        """デシリアライズした Symbol も正規インスタンスに置き換えられる."""
+        pool = SymbolPool()
+        canonical = pool.parse("XJPX:7203")
+        restored = pickle.loads(pickle.dumps(canonical))
+        assert restored is not canonical
+        assert pool.intern(restored) is canonical
+
+    def test_concurrent_intern(self) -> None:
+        """複数スレッドから同時に登録しても正規インスタンスは1つ."""
+        pool = SymbolPool()
+        results: list[object] = []
+
+        def worker() -> None:
+            results.extend(pool.parse("XJPX:7203") for _ in range(100))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(symbol) for symbol in results}) == 1
+
+
+class TestClear:
+    """SymbolPool.clear() のテスト."""
+
+    def test_clear_releases_instances(self) -> None:
+        """clear() 後は新しい正規インスタンスを登録する."""
+        pool = SymbolPool()
+        before = pool.parse("XJPX:7203")
+        pool.clear()
+        assert len(pool) == 0
+        assert pool.string_count == 0
+        assert before not in pool
+        after = pool.parse("XJPX:7203")
+        assert after == before
+        assert after is not before
+
+
+class TestProcessPool:
+    """プロセス全体のプールのテスト."""
+
+    def test_intern_symbol(self) -> None:
+        """intern_symbol() は SYMBOL_POOL を使う."""
+        symbol = intern_symbol(EquitySymbol(exchange="XJPX", code="9984"))
+        try:
+            assert symbol in SYMBOL_POOL
+            assert intern_symbol(parse_symbol("XJPX:9984")) is symbol
+        finally:
+            SYMBOL_POOL.clear()
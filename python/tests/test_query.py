@@ -0,0 +1,143 @@
+"""query モジュール (SymbolUniverse) のテスト."""
+
+from datetime import date
+
+import pytest
+
+from marketsymbol import (
+    AssetClass,
+    OptionType,
+    PlanStep,
+    SymbolPattern,
+    SymbolUniverse,
+    parse_symbol,
+)
+from marketsymbol.bench.query import QUERIES, _scan, synthetic_symbols
+
+_RAWS = [
+    "XJPX:7203",
+    "XOSE:7203",
+    "XJPX:NK:20250314:F",
+    "XJPX:NK:20250613:F",
+    "XJPX:N225O:20250314:O",
+    "XJPX:N225O:20250314:P:30000",
+    "XJPX:N225O:20250314:P:36000",
+    "XJPX:N225O:20250314:C:32000",
+    "XJPX:N225O:20250214:P:35000",
+    "XJPX:N225O:20250411:P:32000",
+    "XOSE:N225O:20250314:P:32000",
+    "XJPX:N225W:20250307:P:32000",
+]
+
+
+@pytest.fixture(scope="module")
+def universe() -> SymbolUniverse:
+    """_RAWS を登録したコレクション."""
+    return SymbolUniverse(parse_symbol(raw) for raw in _RAWS)
+
+
+def _query(universe: SymbolUniverse, **criteria: object) -> list[str]:
+    """検索結果をシンボル文字列で返す."""
+    return [str(s) for s in universe.query(**criteria)]  # type: ignore[arg-type]
+
+
+class TestQuery:
+    """条件による検索."""
+
+    def test_compound(self, universe: SymbolUniverse) -> None:
+        """複数の条件を全て満たすものを登録順に返す."""
+        assert _query(
+            universe,
+            exchange="XJPX",
+            code="N225O",
+            asset_class=AssetClass.OPTION,
+            expiry=("20250101", "20250331"),
+            option_type=OptionType.PUT,
+            strike=(30000, 35000),
+        ) == ["XJPX:N225O:20250314:P:30000", "XJPX:N225O:20250214:P:35000"]
+
+    @pytest.mark.parametrize(
+        ("criteria", "expected"),
+        [
+            ({"code": "7203"}, ["XJPX:7203", "XOSE:7203"]),
+            ({"exchange": ["XOSE"]}, ["XOSE:7203", "XOSE:N225O:20250314:P:32000"]),
+            (
+                {"asset_class": {AssetClass.EQUITY, AssetClass.FUTURE}},
+                _RAWS[:4],
+            ),
+            ({"option_type": OptionType.SERIES}, ["XJPX:N225O:20250314:O"]),
+            ({"expiry": date(2025, 6, 13)}, ["XJPX:NK:20250613:F"]),
+            (
+                {"expiry": ("20250401", None)},
+                ["XJPX:NK:20250613:F", "XJPX:N225O:20250411:P:32000"],
+            ),
+            (
+                {"strike": (None, 30000)},
+                ["XJPX:N225O:20250314:P:30000"],
+            ),
+            ({"strike": 36000}, ["XJPX:N225O:20250314:P:36000"]),
+            ({"code": "UNKNOWN"}, []),
+            ({"strike": (40000, 30000)}, []),
+        ],
+    )
+    def test_single_condition(
+        self, universe: SymbolUniverse, criteria: dict[str, object], expected: list[str]
+    ) -> None:
+        """値・コレクション・範囲 (片側のみを含む) の条件."""
+        assert _query(universe, **criteria) == expected
+
+    def test_where(self, universe: SymbolUniverse) -> None:
+        """where の述語は最後に適用し、条件がない場合は全件に適用する."""
+        pattern = SymbolPattern("*:N225?:*:P:*")
+        assert _query(universe, exchange="XOSE", where=pattern.matches) == [
+            "XOSE:N225O:20250314:P:32000"
+        ]
+        assert len(universe.query(where=pattern.matches)) == 6
+        assert _query(universe) == _RAWS
+
+    def test_matches_scan(self) -> None:
+        """合成したシンボルで全件の走査と同じ結果となる."""
+        universe = SymbolUniverse(synthetic_symbols(20_000))
+        assert len(universe) == 20_000
+        for criteria in QUERIES.values():
+            expected = _scan(universe, criteria)
+            assert universe.query(**criteria) == expected
+
+
+class TestExplain:
+    """検索計画."""
+
+    def test_most_selective_first(self, universe: SymbolUniverse) -> None:
+        """件数の少ない条件から適用する."""
+        plan = universe.explain(exchange="XJPX", code="N225O", strike=36000)
+        assert plan.steps[0] == PlanStep("strike", 1, "index")
+        assert [step.field for step in plan.steps] == ["strike", "code", "exchange"]
+
+    def test_intersect_or_filter(self) -> None:
+        """候補数に比べて件数の多い条件は属性の検査で適用する."""
+        universe = SymbolUniverse(synthetic_symbols(20_000))
+        plan = universe.explain(exchange="XJPX", code="1500")
+        assert [(step.field, step.method) for step in plan.steps] == [
+            ("code", "index"),
+            ("exchange", "filter"),
+        ]
+        plan = universe.explain(
+            asset_class=AssetClass.FUTURE, expiry=("20250101", "20251231")
+        )
+        assert [(step.field, step.method) for step in plan.steps] == [
+            ("asset_class", "index"),
+            ("expiry", "intersect"),
+        ]
+
+    def test_scan_and_where(self, universe: SymbolUniverse) -> None:
+        """条件がない場合は全件の走査、where は最後の手順."""
+        plan = universe.explain(where=bool)
+        assert plan.steps == (
+            PlanStep("*", len(_RAWS), "scan"),
+            PlanStep("where", len(_RAWS), "filter"),
+        )
+
+    def test_empty_stops(self, universe: SymbolUniverse) -> None:
+        """候補が空になった時点で残りの条件を適用しない."""
+        plan = universe.explain(code="UNKNOWN", exchange="XJPX")
+        assert plan.steps == (PlanStep("code", 0, "index"),)
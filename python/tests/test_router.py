@@ -0,0 +1,167 @@
+"""router モジュール (SubscriptionRouter) のテスト."""
+
+import random
+
+import pytest
+
+from marketsymbol import SubscriptionRouter, SymbolPattern, parse_symbol
+
+# 購読するパターン (リテラル・*・前方一致・範囲・fnmatch 形式)
+_PATTERNS = [
+    "*:*",
+    "XJPX:*",
+    "XJPX:7203",
+    "X*:72*",
+    "XJPX:?2?3",
+    "*:*:*:*",
+    "*:NK:*:F",
+    "XJPX:NK:202503*:F",
+    "*:*:20250401-:*",
+    "*:N225O:*:O",
+    "*:*:*:*:*",
+    "XJPX:N225O:202503*:C:*",
+    "XJPX:N225O:*:*:40000-42000",
+    "*:N225O:20250314:P:42000",
+    "*:N225*:-20250331:*:-40000",
+]
+
+_SYMBOLS = [
+    "XJPX:7203",
+    "XJPX:6758",
+    "XOSE:7203",
+    "XJPX:NK:20250314:F",
+    "XJPX:NK:20250613:F",
+    "XOSE:NK:20250314:F",
+    "XJPX:N225O:20250314:O",
+    "XJPX:N225O:20250314:C:40000",
+    "XJPX:N225O:20250314:C:42000",
+    "XJPX:N225O:20250314:P:42000",
+    "XJPX:N225O:20250411:C:45000",
+    "XJPX:N225W:20250307:P:39000",
+]
+
+
+def _expected(subscriptions: list[tuple[str, str]], raw: str) -> set[str]:
+    """SymbolPattern.matches による購読者の集合を返す."""
+    symbol = parse_symbol(raw)
+    return {
+        subscriber
+        for subscriber, pattern in subscriptions
+        if SymbolPattern(pattern).matches(symbol)
+    }
+
+
+class TestSubscriptionRouter:
+    """購読の登録・解除とルーティング."""
+
+    def test_route_matches_patterns(self) -> None:
+        """ルーティング結果は各パターンの matches による結果と一致する."""
+        router = SubscriptionRouter()
+        subscriptions = [(f"s{i}", pattern) for i, pattern in enumerate(_PATTERNS)]
+        for subscriber, pattern in subscriptions:
+            router.subscribe(subscriber, pattern)
+        for raw in _SYMBOLS:
+            expected = _expected(subscriptions, raw)
+            assert router.route(parse_symbol(raw)) == expected, raw
+            assert router.route(raw.lower()) == expected, raw
+
+    def test_incremental(self) -> None:
+        """ランダムな追加・削除の後も全パターンの照合と一致する."""
+        rng = random.Random(0)
+        router = SubscriptionRouter()
+        active: set[tuple[str, str]] = set()
+        for _ in range(500):
+            subscription = (f"s{rng.randrange(8)}", rng.choice(_PATTERNS))
+            if rng.random() < 0.6:
+                router.subscribe(*subscription)
+                active.add(subscription)
+            else:
+                assert router.unsubscribe(*subscription) == (subscription in active)
+                active.discard(subscription)
+            assert len(router) == len(active)
+        for raw in _SYMBOLS:
+            assert router.route(raw) == _expected(sorted(active), raw), raw
+
+    def test_range_index(self) -> None:
+        """重なり合う限月・strike の範囲は両端を含めて全パターンの照合と一致する."""
+        rng = random.Random(1)
+        router = SubscriptionRouter()
+        active: set[tuple[str, str]] = set()
+        strikes = [1, 39000, 40000, 41000, 42000, 45000]
+        expiries = ["20250101", "20250314", "20250331", "20250411"]
+        symbols = [
+            f"XJPX:N225O:{expiry}:{kind}:{strike}"
+            for expiry in expiries
+            for kind in "CP"
+            for strike in strikes
+        ]
+        for step in range(300):
+            low, high = sorted(rng.sample([0, *strikes], 2))
+            first, last = sorted(rng.sample(expiries, 2))
+            pattern = rng.choice(
+                [
+                    f"XJPX:N225O:*:*:{low}-{high}",
+                    f"*:N225O:*:C:{low}-",
+                    f"XJPX:*:*:*:-{high}",
+                    f"XJPX:N225O:{first}-{last}:*:*",
+                    f"*:*:-{last}:P:{low}-{high}",
+                ]
+            )
+            subscription = (f"s{rng.randrange(6)}", pattern)
+            if rng.random() < 0.7:
+                router.subscribe(*subscription)
+                active.add(subscription)
+            else:
+                router.unsubscribe(*subscription)
+                active.discard(subscription)
+            if step % 10 == 0:
+                for raw in symbols:
+                    assert router.route(raw) == _expected(sorted(active), raw), raw
+        # 範囲は述語の照合 (others) ではなく範囲の索引に登録する
+        nodes = list(router._roots.values())
+        while nodes:
+            node = nodes.pop()
+            assert not node.others
+            nodes += node.literals.values()
+            if node.wildcard is not None:
+                nodes.append(node.wildcard)
+            if node.ranges is not None:
+                nodes += [child for _, _, child in node.ranges._children.values()]
+
+    def test_unsubscribe_prunes(self) -> None:
+        """全ての購読を解除するとトライは空になる."""
+        router = SubscriptionRouter()
+        for i, pattern in enumerate(_PATTERNS):
+            router.subscribe(i % 3, pattern)
+        assert router.unsubscribe_all(0) == 5
+        assert router.subscriptions(0) == frozenset()
+        assert router.unsubscribe_all(1) + router.unsubscribe_all(2) == 10
+        assert len(router) == 0
+        assert router._roots == {}
+        assert all(router.route(raw) == set() for raw in _SYMBOLS)
+
+    def test_shared_pattern(self) -> None:
+        """同じパターン (正規化後) の購読者は個別に解除できる."""
+        router = SubscriptionRouter()
+        router.subscribe("a", "XJPX:*")
+        router.subscribe("a", SymbolPattern("xjpx:*"))
+        router.subscribe("b", "XJPX:*")
+        assert len(router) == 2
+        assert router.subscriptions("a") == {SymbolPattern("XJPX:*")}
+        assert router.route("XJPX:7203") == {"a", "b"}
+        assert router.unsubscribe("a", "xjpx:*")
+        assert not router.unsubscribe("a", "XJPX:*")
+        assert router.route("XJPX:7203") == {"b"}
+
+    def test_invalid(self) -> None:
+        """無効なシンボル文字列は空の集合、不正なパターンは ValueError."""
+        router = SubscriptionRouter()
+        router.subscribe("a", "*:*:*:*:*")
+        assert router.route("XJPX:N225O:20250314:C:ABC") == set()
+        assert router.route("XJPX:N225O:20250230:C:42000") == set()
+        assert router.route("") == set()
+        assert router.route("XJPX:" + "A" * 100) == set()
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            router.subscribe("a", "XJPX")
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            router.unsubscribe("a", "XJPX:*:*")
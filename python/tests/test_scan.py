@@ -0,0 +1,131 @@
+"""scan モジュール (find_symbols / iter_symbols) のテスト."""
+
+import io
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from marketsymbol import SymbolMatch, find_symbols, iter_symbols, parse_symbol
+
+# ログ行の語彙 (有効なシンボル・無効な候補・紛らわしい文字列)
+_WORDS = [
+    "order",
+    "filled",
+    "qty=3",
+    "price:42000",
+    "a:b",
+    "2025-03-14T10:00:00",
+    "XJPX:7203",
+    "XJPX:NK:20250314:F",
+    "XJPX:N225O:20250314:C:42000",
+    "XJPX:N225O:20250314:O",
+    "XOSE:7203.",
+    "(XJPX:6758)",
+    "XJPX:NK:20250230:F",
+    "XJPX:7203:X",
+    "ERR:XJPX:7203",
+    "xjpx:7203",
+    "XJPX:" + "A" * 98,
+    "\n",
+]
+
+
+def _log(words: int, seed: int = 0) -> str:
+    """ランダムなログ風のテキストを返す."""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _found(text: str, **kwargs: object) -> list[str]:
+    """検出したシンボルの元の文字列を返す."""
+    return [text[m.start : m.end] for m in find_symbols(text, **kwargs)]  # type: ignore[arg-type]
+
+
+class TestFindSymbols:
+    """テキスト中のシンボルの検出."""
+
+    def test_offsets(self) -> None:
+        """シンボルと文字位置を出現順に返す."""
+        text = "buy XJPX:NK:20250314:F and sell XJPX:N225O:20250314:C:42000."
+        assert find_symbols(text) == [
+            SymbolMatch(parse_symbol("XJPX:NK:20250314:F"), 4, 22),
+            SymbolMatch(parse_symbol("XJPX:N225O:20250314:C:42000"), 32, 59),
+        ]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("(XJPX:7203)", ["XJPX:7203"]),
+            ("symbol=XJPX:7203, qty=3", ["XJPX:7203"]),
+            ("XJPX:7203: filled", ["XJPX:7203"]),
+            ("XJPX:7203\nXOSE:6758", ["XJPX:7203", "XOSE:6758"]),
+            # 英数字・':' に接する候補は部分一致として扱わない
+            ("ERR:XJPX:7203", []),
+            ("AXJPX:7203", []),
+            ("XJPX:7203abc", []),
+            ("XJPX:7203:X", []),
+            ("XJPX:NK:20250314:F:100", []),
+            # 規則による検査 (日付・種別・長さ)
+            ("XJPX:NK:20250230:F", []),
+            ("XJPX:N225O:20250314:C", []),
+            ("XJPX:" + "A" * 98, []),
+            # 正規化は行わない
+            ("xjpx:7203", []),
+        ],
+    )
+    def test_boundaries_and_rules(self, text: str, expected: list[str]) -> None:
+        """境界の判定と parse_symbol の規則による検査."""
+        assert _found(text) == expected
+
+    def test_matches_parse_symbol(self) -> None:
+        """検出したシンボルは元の文字列の parse_symbol の結果と一致する."""
+        text = _log(5000)
+        matches = find_symbols(text)
+        assert matches
+        assert all(parse_symbol(text[m.start : m.end]) == m.symbol for m in matches)
+
+    def test_exchanges(self) -> None:
+        """exchanges を指定した場合はその MIC の候補のみを検出する."""
+        text = "HTTP:200 from XJPX:7203 and XOSE:6758"
+        assert _found(text) == ["HTTP:200", "XJPX:7203", "XOSE:6758"]
+        assert _found(text, exchanges=["XJPX", "XOSE"]) == ["XJPX:7203", "XOSE:6758"]
+        assert _found(text, exchanges=[]) == []
+
+    def test_invalid_exchanges(self) -> None:
+        """exchanges に MIC の形式でない値がある場合は ValueError."""
+        with pytest.raises(ValueError, match="Invalid MIC"):
+            find_symbols("XJPX:7203", exchanges=["XJP|"])
+
+
+class TestIterSymbols:
+    """チャンクのイテラブルからの検出."""
+
+    @pytest.mark.parametrize("size", [1, 7, 101, 102, 103, 4096])
+    def test_chunk_boundaries(self, size: int) -> None:
+        """チャンクの分割によらず連結したテキストと同じ結果となる."""
+        text = _log(3000, seed=size)
+        chunks = (text[i : i + size] for i in range(0, len(text), size))
+        assert list(iter_symbols(chunks)) == find_symbols(text)
+
+    def test_file_lines(self) -> None:
+        """ファイルオブジェクト (行のイテラブル) の文字位置は連結したテキストでの位置."""
+        text = "a XJPX:7203\nb\nXJPX:NK:20250314:F end\n"
+        matches = list(iter_symbols(io.StringIO(text)))
+        assert [text[m.start : m.end] for m in matches] == [
+            "XJPX:7203",
+            "XJPX:NK:20250314:F",
+        ]
+
+    def test_lazy(self) -> None:
+        """先頭のシンボルは残りのチャンクを読み込む前に返す."""
+        consumed: list[str] = []
+
+        def chunks() -> Iterator[str]:
+            for chunk in ["XJPX:7203 " + " " * 200, "XOSE:6758"]:
+                consumed.append(chunk)
+                yield chunk
+
+        matches = iter_symbols(chunks())
+        assert next(matches).symbol == parse_symbol("XJPX:7203")
+        assert len(consumed) == 1
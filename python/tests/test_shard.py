@@ -0,0 +1,162 @@
+"""shard モジュール (フィンガープリント・シャード分割) のテスト."""
+
+import os
+import subprocess
+import sys
+from collections import Counter
+from hashlib import blake2b
+from pathlib import Path
+
+import pytest
+
+import marketsymbol
+from marketsymbol import (
+    ShardPartitioner,
+    SymbolParseError,
+    parse_symbol,
+    symbol_fingerprint,
+)
+from marketsymbol.bench.query import synthetic_symbols
+from marketsymbol.shard import _jump_hash
+
+# 参照実装 (C++) で求めた jump consistent hash の値 (key, バケット数, 結果)
+_JUMP_VECTORS = [
+    (0, 1_000, 0),
+    (1, 10, 6),
+    (1, 1_000, 549),
+    (1, 1 << 30, 262_355_607),
+    (2**64 - 1, 2, 1),
+    (2**64 - 1, 65_536, 18_311),
+    (123_456_789, 1_000, 294),
+]
+
+
+class TestFingerprint:
+    """symbol_fingerprint の値とプロセス間での安定性."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("XJPX:7203", 0x5486523BC8CB8F15),
+            ("XJPX:N225O:20250314:C:42000", 0x47E2B259EB361696),
+        ],
+    )
+    def test_vectors(self, raw: str, expected: int) -> None:
+        """公開した手順 (BLAKE2b digest_size=8, little endian) の値と一致する."""
+        assert symbol_fingerprint(raw) == expected
+        assert symbol_fingerprint(parse_symbol(raw)) == expected
+
+    def test_canonical(self) -> None:
+        """正規化前のシンボル文字列も正規の文字列表現の値となる."""
+        assert symbol_fingerprint(" xjpx:n225o:20250314:c:042000 ") == (
+            symbol_fingerprint("XJPX:N225O:20250314:C:42000")
+        )
+        assert symbol_fingerprint("XJPX:7203") != symbol_fingerprint("XOSE:7203")
+
+    def test_independent_of_hash_seed(self) -> None:
+        """PYTHONHASHSEED が異なるプロセスでも同じ値となる."""
+        code = (
+            "from marketsymbol import symbol_fingerprint\n"
+            "print(symbol_fingerprint('XJPX:N225O:20250314:P:38000'))\n"
+        )
+        source_root = str(Path(marketsymbol.__file__).resolve().parent.parent)
+        values = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONPATH": source_root, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert values == {str(symbol_fingerprint("XJPX:N225O:20250314:P:38000"))}
+
+    def test_invalid(self) -> None:
+        """無効なシンボル文字列・Symbol/str 以外は例外."""
+        with pytest.raises(SymbolParseError):
+            symbol_fingerprint("XJPX")
+        with pytest.raises(TypeError, match="Expected Symbol or str"):
+            symbol_fingerprint(7203)  # type: ignore[arg-type]
+
+
+class TestJumpHash:
+    """jump consistent hash の参照実装との一致と移動の最小性."""
+
+    @pytest.mark.parametrize(("key", "buckets", "expected"), _JUMP_VECTORS)
+    def test_reference_vectors(self, key: int, buckets: int, expected: int) -> None:
+        """参照実装と同じバケットを返す."""
+        assert _jump_hash(key, buckets) == expected
+
+    def test_minimal_movement(self) -> None:
+        """バケットを1つ増やすと、移動するキーは新しいバケットのみに移る."""
+        keys = [symbol_fingerprint(s) for s in synthetic_symbols(5_000)]
+        before = [_jump_hash(key, 10) for key in keys]
+        after = [_jump_hash(key, 11) for key in keys]
+        moved = [b for a, b in zip(before, after, strict=True) if a != b]
+        assert set(moved) == {10}
+        assert 0.05 < len(moved) / len(keys) < 0.13
+
+
+class TestShardPartitioner:
+    """ShardPartitioner の割り当てとグループ."""
+
+    def test_balanced(self) -> None:
+        """シンボルはシャードにほぼ均等に割り当てる."""
+        partitioner = ShardPartitioner(8)
+        counts = Counter(map(partitioner.shard, synthetic_symbols(8_000)))
+        assert sorted(counts) == list(range(8))
+        assert max(counts.values()) < 1.2 * min(counts.values())
+
+    def test_chain_group(self) -> None:
+        """group="chain" は同じ exchange:code:expiry を同じシャードに割り当てる."""
+        partitioner = ShardPartitioner(32, group="chain")
+        chain = [
+            "XJPX:N225O:20250314:O",
+            *(f"XJPX:N225O:20250314:{t}:{k}" for t in "CP" for k in range(1, 200)),
+        ]
+        assert len({partitioner.shard(raw) for raw in chain}) == 1
+        # グループのキーの文字列の BLAKE2b (digest_size=8) を jump hash に渡す
+        digest = blake2b(b"XJPX:N225O:20250314", digest_size=8).digest()
+        expected = _jump_hash(int.from_bytes(digest, "little"), 32)
+        assert partitioner.shard("XJPX:N225O:20250314:C:1") == expected
+        expiries = {
+            partitioner.shard(f"XJPX:N225O:2025{month:02d}14:C:42000")
+            for month in range(1, 13)
+        }
+        assert len(expiries) > 1
+
+    def test_product_group(self) -> None:
+        """group="product" は限月・種別によらず exchange:code ごとに割り当てる."""
+        partitioner = ShardPartitioner(16, group="product")
+        raws = ["XJPX:NK:20250314:F", "XJPX:NK:20250612:F", "XJPX:NK:20991231:F"]
+        assert len({partitioner.shard(raw) for raw in raws}) == 1
+        equity = ShardPartitioner(16, group="chain").shard("XJPX:7203")
+        assert equity == partitioner.shard("XJPX:7203")
+
+    def test_partition(self) -> None:
+        """partition はシャードごとに入力の順で Symbol を返す."""
+        partitioner = ShardPartitioner(4)
+        raws = [str(s) for s in synthetic_symbols(200)]
+        shards = partitioner.partition(raws)
+        assert len(shards) == 4
+        for number, symbols in enumerate(shards):
+            expected = [raw for raw in raws if partitioner.shard(raw) == number]
+            assert [str(s) for s in symbols] == expected
+
+    def test_single_shard_and_repr(self) -> None:
+        """シャード数が 1 の場合は全て 0 となる."""
+        partitioner = ShardPartitioner(1, group="chain")
+        assert partitioner.shard("XJPX:7203") == 0
+        assert partitioner.shard_count == 1
+        assert partitioner.group == "chain"
+        assert repr(partitioner) == "ShardPartitioner(1, group='chain')"
+
+    def test_invalid(self) -> None:
+        """不正なシャード数・グループは ValueError."""
+        with pytest.raises(ValueError, match="shard_count"):
+            ShardPartitioner(0)
+        with pytest.raises(ValueError, match="Unknown group"):
+            ShardPartitioner(4, group="expiry")
+        with pytest.raises(SymbolParseError):
+            ShardPartitioner(4).partition(["XJPX:7203", "XJPX"])
@@ -1,15 +1,19 @@
 """Symbol クラスのテスト.
 
 EquitySymbol, FutureSymbol, OptionSymbol の生成、str()、等価性、
-ハッシュ、pickle をテストする。
+ハッシュ、pickle、順序をテストする。
 """
 
+import dataclasses
 import pickle
+import random
+from operator import attrgetter
 
 import pytest
 
 from marketsymbol.enums import AssetClass, OptionType
 from marketsymbol.errors import ErrorCode, SymbolValidationError
+from marketsymbol.parser import parse_symbol
 from marketsymbol.symbol import (
     EquitySymbol,
     FutureSymbol,
@@ -552,3 +556,80 @@ class TestSymbolInequality:
         )
         symbol_set = {equity, future, option}
         assert len(symbol_set) == 3
+
+
+# 全順序で昇順に並べたシンボル
+_ORDERED = [
+    "XJPX:7203",
+    "XJPX:9000:20250314:F",
+    "XJPX:N",
+    "XJPX:N:20250314:F",
+    "XJPX:N0A",
+    "XJPX:N225O:20241213:P:42000",
+    "XJPX:N225O:20250314:C:9000",
+    "XJPX:N225O:20250314:C:42000",
+    f"XJPX:N225O:20250314:C:{2**70}",
+    f"XJPX:N225O:20250314:C:{2**70 + 1}",
+    "XJPX:N225O:20250314:P:100",
+    "XJPX:N225O:20250314:O",
+    "XJPX:NK:20250314:F",
+    "XJPX:NK:20250613:F",
+    "XJPX:NKM:20250314:F",
+    "XOSE:1301",
+]
+
+
+class TestSymbolOrdering:
+    """資産クラスをまたぐ全順序のテスト."""
+
+    def test_sorted(self) -> None:
+        """exchange, code, 資産クラス, 限月, 種別, 数値の strike の順に並ぶ."""
+        symbols = [parse_symbol(raw) for raw in _ORDERED]
+        shuffled = symbols[:]
+        random.Random(0).shuffle(shuffled)
+        assert sorted(shuffled) == symbols
+        # sort_key は strike の上限 (2**64 - 1) を超える値のみ区別しない
+        by_key = sorted(shuffled, key=attrgetter("sort_key"))
+        assert by_key[:8] == symbols[:8]
+        assert by_key[10:] == symbols[10:]
+
+    def test_operators(self) -> None:
+        """比較演算子は全順序となり、等価性と矛盾しない."""
+        symbols = [parse_symbol(raw) for raw in _ORDERED]
+        for i, a in enumerate(symbols):
+            for j, b in enumerate(symbols):
+                assert (a < b) == (i < j)
+                assert (a <= b) == (i <= j)
+                assert (a > b) == (i > j)
+                assert (a >= b) == (i >= j)
+        assert EquitySymbol(exchange="XJPX", code="7203") <= parse_symbol("XJPX:7203")
+
+    def test_not_comparable(self) -> None:
+        """Symbol 以外との大小比較は TypeError."""
+        with pytest.raises(TypeError):
+            assert EquitySymbol(exchange="XJPX", code="7203") < "XJPX:7203"
+
+    def test_cached_key(self) -> None:
+        """sort_key は等価性・ハッシュ・repr・pickle・dataclass のフィールドの対象外."""
+        symbol = parse_symbol("XJPX:N225O:20250314:C:42000")
+        fresh = parse_symbol("XJPX:N225O:20250314:C:42000")
+        assert not hasattr(fresh, "_sort_key")
+        assert symbol.sort_key == fresh.sort_key
+        assert symbol._sort_key == symbol.sort_key
+        assert [f.name for f in dataclasses.fields(symbol)] == [
+            "exchange",
+            "code",
+            "expiry",
+            "option_type",
+            "strike",
+        ]
+        assert "_sort_key" not in dataclasses.asdict(symbol)
+        assert isinstance(symbol, OptionSymbol)
+        replaced = dataclasses.replace(symbol, strike=43000)
+        assert replaced.sort_key == parse_symbol("XJPX:N225O:20250314:C:43000").sort_key
+        fresh = parse_symbol("XJPX:N225O:20250314:C:42000")
+        assert symbol == fresh
+        assert hash(symbol) == hash(fresh)
+        assert repr(symbol) == repr(fresh)
+        assert pickle.loads(pickle.dumps(symbol)).sort_key == symbol.sort_key
+        assert pickle.loads(pickle.dumps(fresh)) == fresh
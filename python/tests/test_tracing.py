@@ -0,0 +1,314 @@
+"""tracing モジュール (トレーシングフック) のテスト."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marketsymbol import (
+    AdapterRegistry,
+    AssetClass,
+    EquitySymbol,
+    ErrorCode,
+    SymbolParseError,
+    normalize_symbol,
+    parse_symbol,
+)
+from marketsymbol.adapter import BaseAdapter
+from marketsymbol.tracing import (
+    HISTOGRAM_BUCKETS,
+    TRACER,
+    HistogramHook,
+    LatencyHistogram,
+    SlowCallSampler,
+    TracedOperation,
+    TraceEvent,
+    Tracer,
+    add_trace_hook,
+    clear_trace_hooks,
+    remove_trace_hook,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from marketsymbol import Symbol
+
+
+class _SuffixAdapter(BaseAdapter):
+    """'7203.T' 形式のテスト用アダプター."""
+
+    @property
+    def supported_asset_classes(self) -> frozenset[AssetClass]:
+        return frozenset({AssetClass.EQUITY})
+
+    def to_symbol(self, vendor_symbol: str) -> Symbol:
+        code, suffix = vendor_symbol.split(".")
+        if suffix != "T":
+            msg = f"Unknown suffix: {suffix}"
+            raise ValueError(msg)
+        return EquitySymbol(exchange="XJPX", code=code)
+
+    def from_symbol(self, symbol: Symbol) -> str:
+        return f"{symbol.code}.T"
+
+
+@pytest.fixture
+def events() -> Iterator[list[TraceEvent]]:
+    """イベントを記録するフックを登録し、テスト後に解除する."""
+    recorded: list[TraceEvent] = []
+    clear_trace_hooks()
+    add_trace_hook(recorded.append)
+    yield recorded
+    clear_trace_hooks()
+
+
+class TestTracer:
+    """Tracer のフック管理のテスト."""
+
+    def test_active_follows_hooks(self) -> None:
+        """フックの有無に応じて active が切り替わる."""
+        tracer = Tracer()
+        assert not tracer.active
+
+        def hook(event: TraceEvent) -> None:
+            pass
+
+        tracer.add_hook(hook)
+        assert tracer.active
+        assert tracer.hooks == (hook,)
+        tracer.remove_hook(hook)
+        assert not tracer.active
+
+    def test_remove_unknown_hook(self) -> None:
+        """未登録のフックの解除は ValueError."""
+        with pytest.raises(ValueError, match="not in list"):
+            Tracer().remove_hook(print)
+
+    def test_hook_exception_propagates(self) -> None:
+        """フックの例外は呼び出し元に伝播する."""
+
+        def failing(event: TraceEvent) -> None:
+            raise RuntimeError(f"hook failed: {event.operation.value}")
+
+        add_trace_hook(failing)
+        try:
+            with pytest.raises(RuntimeError, match="hook failed"):
+                parse_symbol("XJPX:7203")
+        finally:
+            remove_trace_hook(failing)
+        assert not TRACER.active
+
+
+class TestParseTracing:
+    """parse_symbol のトレースのテスト."""
+
+    def test_success_event(self, events: list[TraceEvent]) -> None:
+        """成功時は資産クラスと全段階の時間を通知する."""
+        parse_symbol(" xjpx:nk:20250314:f ")
+        (event,) = events
+        assert event.operation is TracedOperation.PARSE_SYMBOL
+        assert event.raw == " xjpx:nk:20250314:f "
+        assert event.asset_class is AssetClass.FUTURE
+        assert not event.failed
+        assert event.error_code is None
+        assert event.stages is not None
+        assert None not in event.stages
+        assert sum(event.stages) == event.elapsed_ns  # type: ignore[arg-type]
+
+    def test_validation_failure_stages(self, events: list[TraceEvent]) -> None:
+        """検査で失敗した場合は生成段階が None."""
+        with pytest.raises(SymbolParseError):
+            parse_symbol("XX:7203")
+        (event,) = events
+        assert event.failed
+        assert event.error_code is ErrorCode.UNKNOWN_EXCHANGE
+        assert event.asset_class is None
+        assert event.stages is not None
+        assert event.stages.validate_ns is not None
+        assert event.stages.construct_ns is None
+
+    def test_split_failure_stages(self, events: list[TraceEvent]) -> None:
+        """空文字列は分割段階で失敗する."""
+        with pytest.raises(SymbolParseError):
+            parse_symbol("   ")
+        (event,) = events
+        assert event.stages is not None
+        assert event.stages.split_ns is not None
+        assert event.stages.validate_ns is None
+
+    def test_type_error_not_traced(self, events: list[TraceEvent]) -> None:
+        """TypeError は通知しない."""
+        with pytest.raises(TypeError):
+            parse_symbol(7203)  # type: ignore[arg-type]
+        assert events == []
+
+    def test_normalize_not_traced_inside_parse(self, events: list[TraceEvent]) -> None:
+        """parse_symbol 内部の正規化は normalize_symbol として通知しない."""
+        parse_symbol("XJPX:7203")
+        assert [e.operation for e in events] == [TracedOperation.PARSE_SYMBOL]
+
+    def test_normalize_symbol(self, events: list[TraceEvent]) -> None:
+        """normalize_symbol の呼び出しを通知する."""
+        assert normalize_symbol("xjpx:7203") == "XJPX:7203"
+        (event,) = events
+        assert event.operation is TracedOperation.NORMALIZE_SYMBOL
+        assert event.stages is None
+
+    def test_no_events_without_hooks(self) -> None:
+        """フック未登録時は通知しない."""
+        clear_trace_hooks()
+        assert parse_symbol("XJPX:7203") == EquitySymbol(exchange="XJPX", code="7203")
+
+
+class TestConversionTracing:
+    """AdapterRegistry 経由の変換のトレースのテスト."""
+
+    def test_conversion_events(self, events: list[TraceEvent]) -> None:
+        """ベンダー名と資産クラスを通知する."""
+        registry = AdapterRegistry()
+        registry.register("suffix", _SuffixAdapter())
+        symbol = registry.to_symbol("suffix", "7203.T")
+        registry.from_symbol("suffix", symbol)
+        to_event, from_event = events
+        assert to_event.operation is TracedOperation.TO_SYMBOL
+        assert to_event.raw == "7203.T"
+        assert from_event.operation is TracedOperation.FROM_SYMBOL
+        assert from_event.raw == symbol
+        for event in events:
+            assert event.vendor == "suffix"
+            assert event.asset_class is AssetClass.EQUITY
+            assert not event.failed
+
+    def test_conversion_failure(self, events: list[TraceEvent]) -> None:
+        """変換失敗を通知し、例外はそのまま送出する."""
+        registry = AdapterRegistry()
+        registry.register("suffix", _SuffixAdapter())
+        with pytest.raises(ValueError, match="suffix"):
+            registry.to_symbol("suffix", "7203.X")
+        (event,) = events
+        assert event.failed
+        assert event.asset_class is None
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram のテスト."""
+
+    def test_log2_buckets(self) -> None:
+        """観測値を bit_length のバケットに記録する."""
+        histogram = LatencyHistogram()
+        for value in (0, 1, 2, 3, 1000):
+            histogram.record(value)
+        counts = histogram.counts
+        assert counts[0] == 1
+        assert counts[1] == 1
+        assert counts[2] == 2
+        assert counts[10] == 1
+        assert histogram.count == 5
+        assert histogram.total_ns == 1006
+
+    def test_overflow_bucket(self) -> None:
+        """上限を超える観測値は最終バケットに記録する."""
+        histogram = LatencyHistogram()
+        histogram.record(1 << 60)
+        assert histogram.counts[-1] == 1
+        assert histogram.percentile(1.0) is None
+        assert LatencyHistogram.upper_bound_ns(HISTOGRAM_BUCKETS - 1) is None
+
+    def test_percentile(self) -> None:
+        """分位点を含むバケットの上限を返す."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(100)
+        histogram.record(5000)
+        assert histogram.percentile(0.5) == 128
+        assert histogram.percentile(0.99) == 128
+        assert histogram.percentile(1.0) == 8192
+        assert LatencyHistogram().percentile(0.5) is None
+        with pytest.raises(ValueError, match="q must be"):
+            histogram.percentile(0)
+
+    def test_to_dict(self) -> None:
+        """観測のあるバケットのみを出力する."""
+        histogram = LatencyHistogram()
+        histogram.record(100)
+        assert histogram.to_dict() == {
+            "count": 1,
+            "total_ns": 100,
+            "buckets": {"128": 1},
+        }
+
+
+class TestHistogramHook:
+    """HistogramHook のテスト."""
+
+    def test_keys_by_operation_and_asset_class(self) -> None:
+        """操作・資産クラス別に集計する."""
+        hook = HistogramHook()
+        add_trace_hook(hook)
+        try:
+            parse_symbol("XJPX:7203")
+            parse_symbol("XJPX:7203")
+            parse_symbol("XJPX:NK:20250314:F")
+            with pytest.raises(SymbolParseError):
+                parse_symbol("XJPX")
+        finally:
+            remove_trace_hook(hook)
+
+        parse = TracedOperation.PARSE_SYMBOL
+        assert hook.histogram(parse, AssetClass.EQUITY).count == 2
+        assert hook.histogram(parse, AssetClass.FUTURE).count == 1
+        assert hook.histogram(parse, None).count == 1
+        assert hook.histogram(parse, AssetClass.OPTION).count == 0
+        assert hook.total(parse).count == 4
+        data = hook.to_dict()
+        assert data["parse_symbol"]["equity"]["count"] == 2
+        assert data["parse_symbol"]["unknown"]["count"] == 1
+
+        hook.reset()
+        assert hook.snapshot() == {}
+
+
+class TestSlowCallSampler:
+    """SlowCallSampler のテスト."""
+
+    @staticmethod
+    def _event(elapsed_ns: int, operation: TracedOperation) -> TraceEvent:
+        return TraceEvent(operation, "XJPX:7203", elapsed_ns)
+
+    def test_threshold(self) -> None:
+        """しきい値以上の呼び出しのみ通知する."""
+        sampled: list[TraceEvent] = []
+        sampler = SlowCallSampler(1000, sampled.append)
+        sampler(self._event(999, TracedOperation.PARSE_SYMBOL))
+        sampler(self._event(1000, TracedOperation.PARSE_SYMBOL))
+        assert [e.elapsed_ns for e in sampled] == [1000]
+
+    def test_operations_filter(self) -> None:
+        """operations 指定時は対象の操作のみ通知する."""
+        sampled: list[TraceEvent] = []
+        sampler = SlowCallSampler(
+            0, sampled.append, operations=[TracedOperation.TO_SYMBOL]
+        )
+        sampler(self._event(10, TracedOperation.PARSE_SYMBOL))
+        sampler(self._event(10, TracedOperation.TO_SYMBOL))
+        assert [e.operation for e in sampled] == [TracedOperation.TO_SYMBOL]
+
+    def test_receives_raw_and_stages(self) -> None:
+        """遅い parse_symbol の入力と段階別時間を受け取る."""
+        sampled: list[TraceEvent] = []
+        sampler = SlowCallSampler(0, sampled.append)
+        add_trace_hook(sampler)
+        try:
+            parse_symbol("XJPX:N225O:20250314:C:42000")
+        finally:
+            remove_trace_hook(sampler)
+        (event,) = sampled
+        assert event.raw == "XJPX:N225O:20250314:C:42000"
+        assert event.stages is not None
+
+    def test_negative_threshold(self) -> None:
+        """負のしきい値は ValueError."""
+        with pytest.raises(ValueError, match="threshold_ns"):
+            SlowCallSampler(-1, print)
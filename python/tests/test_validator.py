@@ -7,6 +7,15 @@ import pytest
 
 from marketsymbol.errors import ErrorCode, SymbolValidationError
 from marketsymbol.validator import (
+    ValidationFailure,
+    check_code,
+    check_code_length,
+    check_exchange,
+    check_expiry,
+    check_known_code,
+    check_known_exchange,
+    check_option_type,
+    check_strike,
     validate_code,
     validate_exchange,
     validate_expiry,
@@ -243,3 +252,69 @@ class TestValidateStrike:
         with pytest.raises(SymbolValidationError) as exc_info:
             validate_strike(-100)
         assert exc_info.value.error_code == ErrorCode.INVALID_STRIKE_VALUE
+
+
+class TestCheckFunctions:
+    """例外を送出しない check_* 関数のテスト."""
+
+    def test_valid_values_return_none(self) -> None:
+        """有効な値は None を返す."""
+        assert check_exchange("XJPX") is None
+        assert check_code("7203") is None
+        assert check_expiry("20240229") is None
+        assert check_option_type("C") is None
+        assert check_strike(1) is None
+        assert check_code_length("NK", 2, 6) is None
+        assert check_known_exchange("XJPX", {"XJPX"}) is None
+        assert check_known_code("NK", {"NK"}) is None
+
+    @pytest.mark.parametrize(
+        ("failure", "error_code", "field_name"),
+        [
+            (check_exchange("XJP"), ErrorCode.UNKNOWN_EXCHANGE, "exchange"),
+            (check_code(""), ErrorCode.INVALID_CODE, "code"),
+            (check_code("72-03"), ErrorCode.INVALID_CODE, "code"),
+            (check_expiry("2025031"), ErrorCode.INVALID_EXPIRY_FORMAT, "expiry"),
+            (check_expiry("20251301"), ErrorCode.INVALID_DATE, "expiry"),
+            (check_expiry("20250229"), ErrorCode.INVALID_DATE, "expiry"),
+            (check_option_type("X"), ErrorCode.INVALID_OPTION_TYPE, "option_type"),
+            (check_strike(0), ErrorCode.INVALID_STRIKE_VALUE, "strike"),
+            (check_code_length("N", 2, 6), ErrorCode.INVALID_CODE, "code"),
+            (check_code_length("N-K", 2, 6), ErrorCode.INVALID_CODE, "code"),
+            (
+                check_known_exchange("XOSE", {"XJPX"}),
+                ErrorCode.UNKNOWN_EXCHANGE,
+                "exchange",
+            ),
+            (check_known_code("NKM", {"NK"}), ErrorCode.INVALID_CODE, "code"),
+        ],
+    )
+    def test_invalid_values_return_failure(
+        self,
+        failure: ValidationFailure | None,
+        error_code: ErrorCode,
+        field_name: str,
+    ) -> None:
+        """無効な値は ValidationFailure を返す."""
+        assert failure is not None
+        assert failure.error_code == error_code
+        assert failure.field_name == field_name
+
+    def test_failure_to_validation_error(self) -> None:
+        """ValidationFailure を SymbolValidationError に変換できる."""
+        failure = check_expiry("20250230")
+        assert failure is not None
+        error = failure.to_validation_error()
+        assert error.error_code == ErrorCode.INVALID_DATE
+        assert error.field_value == "20250230"
+        assert error.message == "Invalid date: '20250230' (invalid day: 30 for month 2)"
+
+    def test_failure_to_parse_error(self) -> None:
+        """ValidationFailure を SymbolParseError に変換できる."""
+        failure = check_exchange("XX")
+        assert failure is not None
+        error = failure.to_parse_error("XX:7203")
+        assert error.raw_symbol == "XX:7203"
+        assert str(error) == (
+            "[E007] Invalid exchange code: 'XX' (must be 4 uppercase letters)"
+        )
@@ -0,0 +1,179 @@
+"""view モジュール (SymbolView) のテスト."""
+
+import pytest
+
+from marketsymbol import (
+    AssetClass,
+    ErrorCode,
+    OptionSymbol,
+    OptionType,
+    SymbolParseError,
+    SymbolView,
+    parse_symbol,
+)
+from marketsymbol.symbol import Symbol
+from tests.test_bulk import _SEED_SYMBOLS, _mutations
+
+
+def _fields(view: SymbolView) -> tuple[object, ...]:
+    """parse_symbol と同じ順序でフィールドにアクセスし、値を返す."""
+    return (
+        view.exchange,
+        view.code,
+        view.expiry,
+        view.asset_class,
+        view.option_type,
+        view.strike,
+    )
+
+
+def _symbol_fields(symbol: Symbol) -> tuple[object, ...]:
+    """Symbol のフィールドを _fields と同じ形式で返す."""
+    return (
+        symbol.exchange,
+        symbol.code,
+        getattr(symbol, "expiry", None),
+        symbol.asset_class,
+        symbol.option_type if isinstance(symbol, OptionSymbol) else None,
+        symbol.strike if isinstance(symbol, OptionSymbol) else None,
+    )
+
+
+def _view_verdict(raw: str | bytes) -> object:
+    """SymbolView で全フィールドにアクセスした結果 (またはエラーコード) を返す."""
+    try:
+        return _fields(SymbolView(raw))
+    except SymbolParseError as e:
+        return e.error_code
+
+
+def _parse_verdict(raw: str) -> object:
+    """parse_symbol の結果を _view_verdict と同じ形式で返す."""
+    try:
+        return _symbol_fields(parse_symbol(raw))
+    except SymbolParseError as e:
+        return e.error_code
+
+
+def _materialize_verdict(raw: str | bytes) -> object:
+    """materialize() の結果 (またはエラーコード) を返す."""
+    try:
+        return SymbolView(raw).materialize()
+    except SymbolParseError as e:
+        return e.error_code
+
+
+class TestDifferential:
+    """parse_symbol との一致の検証."""
+
+    @pytest.mark.parametrize("raw", _SEED_SYMBOLS)
+    def test_seed_symbols(self, raw: str) -> None:
+        """代表的な入力で materialize() と parse_symbol の結果が一致する."""
+        try:
+            expected: object = parse_symbol(raw)
+        except SymbolParseError as e:
+            expected = e.error_code
+        assert _materialize_verdict(raw) == expected
+        assert _materialize_verdict(raw.encode()) == expected
+
+    def test_mutated_symbols(self) -> None:
+        """ランダムに変異させた入力でフィールドとエラーコードが一致する.
+
+        parse_symbol と同じ順序でアクセスした場合、最初に送出される
+        エラーは parse_symbol と同じになる。
+        """
+        mismatches = [
+            raw
+            for raw in _SEED_SYMBOLS + _mutations(5000)
+            if not (
+                _view_verdict(raw) == _view_verdict(raw.encode()) == _parse_verdict(raw)
+            )
+        ]
+        assert not mismatches
+
+
+class TestSymbolView:
+    """SymbolView の遅延検査のテスト."""
+
+    def test_fields(self) -> None:
+        """各フィールドの値."""
+        view = SymbolView("xjpx:n225o:20250314:c:42000")
+        assert view.exchange == "XJPX"
+        assert view.code == "N225O"
+        assert view.expiry == "20250314"
+        assert view.asset_class is AssetClass.OPTION
+        assert view.option_type is OptionType.CALL
+        assert view.strike == 42000
+        assert view.segment_count == 5
+
+    def test_equity_and_future(self) -> None:
+        """株式・先物に存在しないフィールドは None."""
+        equity = SymbolView(b"XJPX:7203")
+        assert equity.asset_class is AssetClass.EQUITY
+        assert (equity.expiry, equity.option_type, equity.strike) == (None, None, None)
+        future = SymbolView(b"XJPX:NK:20250314:F")
+        assert future.asset_class is AssetClass.FUTURE
+        assert (future.option_type, future.strike) == (None, None)
+
+    def test_unaccessed_fields_are_not_validated(self) -> None:
+        """アクセスしないフィールドは検査しない."""
+        view = SymbolView("XJPX:N225O:20251399:C:42000")
+        assert view.exchange == "XJPX"
+        assert view.asset_class is AssetClass.OPTION
+        with pytest.raises(SymbolParseError) as exc_info:
+            _ = view.expiry
+        assert exc_info.value.error_code is ErrorCode.INVALID_DATE
+
+    def test_field_errors(self) -> None:
+        """フィールドごとのエラーコードは parse_symbol と同じ."""
+        with pytest.raises(SymbolParseError) as exc_info:
+            _ = SymbolView("XX:7203").exchange
+        assert exc_info.value.error_code is ErrorCode.UNKNOWN_EXCHANGE
+        assert exc_info.value.raw_symbol == "XX:7203"
+        with pytest.raises(SymbolParseError) as exc_info:
+            _ = SymbolView("XJPX:NK:20250314:C").asset_class
+        assert exc_info.value.error_code is ErrorCode.OPTION_WITHOUT_STRIKE
+        with pytest.raises(SymbolParseError) as exc_info:
+            _ = SymbolView(b"XJPX:NK:20250314:F:100").strike
+        assert exc_info.value.error_code is ErrorCode.FUTURE_WITH_STRIKE
+
+    @pytest.mark.parametrize(
+        ("raw", "error_code"),
+        [
+            ("", ErrorCode.INVALID_SEGMENT_COUNT),
+            (b"  ", ErrorCode.INVALID_SEGMENT_COUNT),
+            ("XJPX:NK:20250314", ErrorCode.INVALID_SEGMENT_COUNT),
+            (b"XJPX:" + b"A" * 100, ErrorCode.SYMBOL_TOO_LONG),
+        ],
+    )
+    def test_structure_errors(self, raw: str | bytes, error_code: ErrorCode) -> None:
+        """長さ・空文字列・セグメント数は生成時に検査する."""
+        with pytest.raises(SymbolParseError) as exc_info:
+            SymbolView(raw)
+        assert exc_info.value.error_code is error_code
+
+    def test_materialize_is_cached(self) -> None:
+        """materialize() は同じインスタンスを返す."""
+        view = SymbolView("XJPX:7203")
+        assert view.materialize() is view.materialize()
+        assert view.materialize() == parse_symbol("XJPX:7203")
+
+    def test_bytes_whitespace(self) -> None:
+        """bytes でも str.strip() と同じ空白 (\\x1c-\\x1f を含む) を除去する."""
+        view = SymbolView(b"\x1c XJPX:7203\x1f\n")
+        assert view.materialize() == parse_symbol("\x1c XJPX:7203\x1f\n")
+
+    def test_non_ascii_bytes(self) -> None:
+        """ASCII 以外を含む bytes は UTF-8 としてデコードして正規化する."""
+        view = SymbolView("ＸＪＰＸ：７２０３".encode())  # noqa: RUF001
+        assert view.exchange == "XJPX"
+        assert view.code == "7203"
+
+    def test_type_error(self) -> None:
+        """str / bytes 以外は TypeError."""
+        with pytest.raises(TypeError, match="Expected str or bytes"):
+            SymbolView(7203)  # type: ignore[arg-type]
+
+    def test_repr(self) -> None:
+        """repr は元の値を含む."""
+        assert repr(SymbolView(b"XJPX:7203")) == "SymbolView(b'XJPX:7203')"